@@ -1,6 +1,6 @@
 """Audit domain - public exports."""
 
-from .enums import AuditEventType
+from .enums import AuditEventType, TrendResolution
 from .models import (
     AuditEvent,
     AuditEventList,
@@ -8,6 +8,7 @@ from .models import (
 
 __all__ = [
     "AuditEventType",
+    "TrendResolution",
     "AuditEvent",
     "AuditEventList",
 ]
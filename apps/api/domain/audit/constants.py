@@ -12,3 +12,17 @@ MAX_QUERY_LIMIT = 1000
 
 # Default offset for paginated queries
 DEFAULT_OFFSET = 0
+
+# Project-relative NDJSON logs
+AUDIT_EVENTS_LOG = "events/audit.ndjson"
+PROJECT_EVENTS_LOG = "events/events.ndjson"
+AUDIT_HISTORY_LOG = "audit/history.ndjson"
+
+# Derived trends, relative to the project's cache directory (not committed)
+AUDIT_TRENDS_FILE = "audit/trends.json"
+
+# Buckets retained per trend resolution (weekly buckets are kept forever)
+TREND_RETENTION = {
+    "hourly": 24 * 31,
+    "daily": 366 * 2,
+}
@@ -1,7 +1,7 @@
 """
 Audit domain enums.
 
-Contains audit event type enums for NDJSON storage.
+Contains audit event type enums for NDJSON storage and trend resolutions.
 """
 
 from enum import Enum
@@ -22,3 +22,11 @@ class AuditEventType(str, Enum):
     ARTIFACT_UPDATED = "artifact_updated"
     COMMAND_PROPOSED = "command_proposed"
     COMMAND_APPLIED = "command_applied"
+
+
+class TrendResolution(str, Enum):
+    """Bucket sizes for downsampled audit trend series."""
+
+    HOURLY = "hourly"
+    DAILY = "daily"
+    WEEKLY = "weekly"
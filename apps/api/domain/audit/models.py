@@ -37,3 +37,6 @@ class AuditEventList(BaseModel):
     limit: int
     offset: int
     filtered_by: Optional[Dict[str, Any]] = None
+    has_more: Optional[bool] = Field(
+        default=None, description="More matches exist (newest-first queries only)"
+    )
@@ -110,6 +110,7 @@ class CommandStatus(str, Enum):
     RUNNING = "running"
     SUCCESS = "success"
     FAILED = "failed"
+    CANCELLED = "cancelled"
 
 
 class CommandHistory(BaseModel):
@@ -158,3 +159,4 @@ class CommandHistoryList(BaseModel):
 
     commands: List[CommandHistory]
     total: int
+    next_cursor: Optional[str] = None
@@ -3,7 +3,7 @@
 from pydantic import BaseModel, Field, ConfigDict, model_validator
 from enum import Enum
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 
 
 class ProposalStatus(str, Enum):
@@ -36,6 +36,10 @@ class Proposal(BaseModel):
     change_type: ChangeType = Field(..., description="Type of change")
     diff: str = Field(..., description="Unified diff of proposed changes")
     rationale: str = Field(..., description="Justification for the change")
+    artifact_hash: Optional[str] = Field(
+        default=None,
+        description="SHA-256 of the artifact content the diff was generated against",
+    )
     status: ProposalStatus = Field(
         default=ProposalStatus.PENDING, description="Current proposal status"
     )
@@ -89,6 +93,11 @@ class ProposalCreate(BaseModel):
     diff: str = Field(..., description="Unified diff of proposed changes")
     rationale: str = Field(..., description="Justification for the change")
     author: str = Field(default="system", description="Proposal author")
+    artifact_hash: Optional[str] = Field(
+        default=None,
+        description="SHA-256 of the artifact content the diff was generated "
+        "against (defaults to the current content)",
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -102,3 +111,24 @@ class ProposalCreate(BaseModel):
             }
         }
     )
+
+
+class ProposalBatchApply(BaseModel):
+    """Request model for applying several proposals in one commit."""
+
+    proposal_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Proposals to apply (all or nothing)",
+    )
+    actor: str = Field(default="system", description="Who accepted the proposals")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "proposal_ids": ["prop-001", "prop-002"],
+                "actor": "reviewer@example.com",
+            }
+        }
+    )
@@ -5,8 +5,11 @@ Cross-cutting validation and utility functions used across multiple domains.
 """
 
 from .validators import validate_enum_value, validate_dict_structure
+from .schema_validators import SchemaValidatorCache, get_schema_validator_cache
 
 __all__ = [
     "validate_enum_value",
     "validate_dict_structure",
+    "SchemaValidatorCache",
+    "get_schema_validator_cache",
 ]
@@ -0,0 +1,114 @@
+"""
+Compiled JSON Schema validators.
+
+Building a validator checks the schema against the draft-07 meta-schema and
+resolves its keywords, which costs far more than validating one instance.
+Template schemas change rarely, so validators are built once per schema and
+kept in an LRU keyed by a hash of the canonical schema JSON. Template,
+blueprint and artifact generation paths share the same cache.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import jsonschema
+from jsonschema.exceptions import best_match
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+def schema_hash(schema: Dict[str, Any]) -> str:
+    """Hash the canonical JSON form of a schema."""
+    canonical = json.dumps(
+        schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class SchemaValidatorCache:
+    """Thread-safe LRU of Draft7Validator instances keyed by schema hash."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize schema validator cache.
+
+        Args:
+            max_entries: Validators kept (0 disables caching)
+        """
+        self.max_entries = max(0, max_entries)
+        self._entries: "OrderedDict[str, jsonschema.Draft7Validator]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, schema: Dict[str, Any]) -> jsonschema.Draft7Validator:
+        """
+        Return the validator for ``schema``, building it on a miss.
+
+        Args:
+            schema: JSON Schema (draft-07)
+
+        Returns:
+            Validator with format checking enabled
+
+        Raises:
+            jsonschema.SchemaError: If the schema is not a valid draft-07 schema
+        """
+        key = schema_hash(schema)
+        with self._lock:
+            validator = self._entries.get(key)
+            if validator is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return validator
+            self.misses += 1
+
+        jsonschema.Draft7Validator.check_schema(schema)
+        validator = jsonschema.Draft7Validator(
+            schema, format_checker=jsonschema.Draft7Validator.FORMAT_CHECKER
+        )
+        if self.max_entries:
+            with self._lock:
+                self._entries[key] = validator
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return validator
+
+    def validate(self, instance: Any, schema: Dict[str, Any]) -> None:
+        """
+        Validate ``instance`` against ``schema``.
+
+        Raises the most relevant error, as ``jsonschema.validate`` does.
+
+        Raises:
+            jsonschema.SchemaError: If the schema is invalid
+            jsonschema.ValidationError: If the instance does not match
+        """
+        error = best_match(self.get(schema).iter_errors(instance))
+        if error is not None:
+            raise error
+
+    def clear(self) -> None:
+        """Drop every validator and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_shared: Optional[SchemaValidatorCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_schema_validator_cache() -> SchemaValidatorCache:
+    """Return the process-wide validator cache."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = SchemaValidatorCache()
+        return _shared
@@ -8,6 +8,8 @@ Following DDD principles: validation layer, SRP, no infrastructure dependencies.
 import jsonschema
 from typing import Dict, Any, Optional
 
+from ..shared.schema_validators import get_schema_validator_cache
+
 
 class TemplateValidationError(Exception):
     """Raised when template validation fails."""
@@ -19,6 +21,9 @@ def validate_json_schema(schema: Dict[str, Any]) -> None:
     """
     Validate that a dictionary is a valid JSON Schema.
 
+    Schemas already compiled by the shared validator cache are not checked
+    against the meta-schema again.
+
     Args:
         schema: Dictionary to validate as JSON Schema
 
@@ -26,9 +31,8 @@ def validate_json_schema(schema: Dict[str, Any]) -> None:
         TemplateValidationError: If schema is invalid
     """
     try:
-        # Validate against JSON Schema meta-schema (draft-07)
-        validator = jsonschema.Draft7Validator
-        validator.check_schema(schema)
+        # Validate against JSON Schema meta-schema (draft-07) on a cache miss
+        get_schema_validator_cache().get(schema)
     except jsonschema.SchemaError as e:
         raise TemplateValidationError(f"Invalid JSON Schema: {e.message}") from e
 
@@ -98,7 +102,7 @@ class TemplateValidator:
             Error message if validation fails, None if successful
         """
         try:
-            jsonschema.validate(instance=data, schema=schema)
+            get_schema_validator_cache().validate(data, schema)
             return None
         except jsonschema.ValidationError as e:
             return str(e.message)
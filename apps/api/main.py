@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.routing import Match
 
 """Main FastAPI application for ISO 21500 Project Management AI Agent System."""
 
@@ -28,10 +29,14 @@ try:
     from .services.git_manager import GitManager
     from .services.llm_service import LLMService
     from .services.audit_service import AuditService
+    from .services.template_cache import get_template_cache
+    from .services.template_service import TemplateService
     from .services.monitoring_service import (
         MetricsCollector,
         REQUEST_IN_PROGRESS,
     )
+    from .services.ndjson import get_event_log_writer
+    from .services.tracing import get_tracer
 except ImportError:
     # Local execution from apps/api (e.g. `uvicorn main:app`)
     from routers import (
@@ -52,10 +57,14 @@ except ImportError:
     from services.git_manager import GitManager
     from services.llm_service import LLMService
     from services.audit_service import AuditService
+    from services.template_cache import get_template_cache
+    from services.template_service import TemplateService
     from services.monitoring_service import (
         MetricsCollector,
         REQUEST_IN_PROGRESS,
     )
+    from services.ndjson import get_event_log_writer
+    from services.tracing import get_tracer
 
 
 @asynccontextmanager
@@ -84,10 +93,43 @@ async def lifespan(app: FastAPI):
     app.state.llm_service = LLMService()
     app.state.audit_service = AuditService()
 
+    # Compile prompt and artifact templates before the first request needs them
+    try:
+        app.state.llm_service.warm_templates()
+        if app.state.git_manager is not None:
+            get_template_cache().warm(
+                TemplateService(app.state.git_manager).list_templates()
+            )
+    except Exception as e:
+        print(f"Warning: Template warm-up failed: {e}")
+
+    # Settle commands a previous process left pending or running
+    if app.state.git_manager is not None:
+        try:
+            app.state.command_queue = commands_global.CommandQueue.from_env(
+                commands_global.command_service
+            )
+            app.state.command_queue.recover(app.state.git_manager)
+        except Exception as e:
+            print(f"Warning: Command recovery failed: {e}")
+
+    # Probe LLM endpoints, git, disk and memory off the request path
+    app.state.health_prober = health.HealthProber.from_env(
+        app.state.llm_service, docs_path
+    )
+    app.state.health_prober.start()
+
     yield
 
-    # Cleanup if needed
-    pass
+    await app.state.health_prober.stop()
+
+    # Stop command workers; applying commands finish, waiting ones are cancelled
+    command_queue = getattr(app.state, "command_queue", None)
+    if command_queue is not None:
+        await command_queue.stop()
+
+    # Write any buffered audit/project events before exiting
+    get_event_log_writer().close()
 
 
 app = FastAPI(
@@ -109,20 +151,50 @@ app.add_middleware(
 # ============================================================================
 
 
+# Label for requests that match no route (404s, scanners); raw paths would
+# create one time series each
+UNMATCHED_ROUTE = "unmatched"
+
+# Attach the correlation id to request metrics as an OpenMetrics exemplar
+METRICS_EXEMPLARS = os.getenv("METRICS_EXEMPLARS", "").lower() in ("1", "true", "yes")
+
+
+def route_template(request: Request) -> str:
+    """Path template of the route serving ``request``, e.g. /api/v1/projects/{project_key}."""
+    route = request.scope.get("route")
+    if route is None:
+        # Not routed yet, or the request failed before routing completed
+        for candidate in request.app.router.routes:
+            match, _ = candidate.matches(request.scope)
+            if match == Match.FULL:
+                route = candidate
+                break
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
 @app.middleware("http")
 async def metrics_middleware(request: Request, call_next):
     """
     Middleware to collect request metrics.
 
     Tracks:
-    - Request count by method/endpoint/status
+    - Request count by method/route template/status
     - Request duration
     - Requests in progress
-    - Correlation ID for tracing
+    - Correlation ID for tracing (optionally as exemplar)
+    - Root span of sampled request traces
     """
     # Generate correlation ID
     correlation_id = str(uuid.uuid4())
     request.state.correlation_id = correlation_id
+    exemplar = {"correlation_id": correlation_id} if METRICS_EXEMPLARS else None
+
+    # Root span of the request trace (a no-op unless sampled)
+    root = get_tracer().start_trace(
+        correlation_id,
+        f"{request.method} {request.url.path}",
+        **{"http.method": request.method},
+    )
 
     # Track in-progress requests
     REQUEST_IN_PROGRESS.inc()
@@ -130,15 +202,21 @@ async def metrics_middleware(request: Request, call_next):
     start_time = time.time()
 
     try:
-        response = await call_next(request)
+        with root:
+            response = await call_next(request)
+            endpoint = route_template(request)
+            root.update_name(f"{request.method} {endpoint}")
+            root.set_attribute("http.route", endpoint)
+            root.set_attribute("http.status_code", response.status_code)
         duration = time.time() - start_time
 
         # Record metrics
         MetricsCollector.record_request(
             method=request.method,
-            endpoint=request.url.path,
+            endpoint=endpoint,
             status_code=response.status_code,
             duration=duration,
+            exemplar=exemplar,
         )
 
         # Add correlation ID to response headers
@@ -148,17 +226,19 @@ async def metrics_middleware(request: Request, call_next):
 
     except Exception as e:
         duration = time.time() - start_time
+        endpoint = route_template(request)
 
         # Record error metrics
         MetricsCollector.record_request(
             method=request.method,
-            endpoint=request.url.path,
+            endpoint=endpoint,
             status_code=500,
             duration=duration,
+            exemplar=exemplar,
         )
         MetricsCollector.record_error(
             error_type=type(e).__name__,
-            endpoint=request.url.path,
+            endpoint=endpoint,
         )
 
         raise
@@ -173,15 +253,20 @@ async def metrics_middleware(request: Request, call_next):
 
 
 @app.get("/metrics")
-async def metrics():
+async def metrics(request: Request):
     """
     Prometheus metrics endpoint.
 
-    Returns metrics in OpenMetrics format for Prometheus scraping.
+    Returns metrics in Prometheus text format, or in OpenMetrics format
+    (which carries exemplars) when exemplars are enabled and the scraper
+    accepts it.
     """
+    openmetrics = METRICS_EXEMPLARS and "application/openmetrics-text" in (
+        request.headers.get("accept", "")
+    )
     return Response(
-        content=MetricsCollector.generate_metrics(),
-        media_type=MetricsCollector.get_content_type(),
+        content=MetricsCollector.generate_metrics(openmetrics),
+        media_type=MetricsCollector.get_content_type(openmetrics),
     )
 
 
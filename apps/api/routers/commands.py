@@ -2,10 +2,14 @@
 Commands router for propose/apply flow.
 """
 
+import json
+
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from models import CommandPropose, CommandProposal, CommandApply, CommandApplyResult
 from services.command_service import CommandService
+from services.llm_concurrency import LLMOverloadedError
 
 router = APIRouter()
 
@@ -36,6 +40,12 @@ async def propose_command(
         )
 
         return CommandProposal(**proposal)
+    except LLMOverloadedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -44,6 +54,61 @@ async def propose_command(
         )
 
 
+@router.post("/propose/stream")
+async def propose_command_stream(
+    project_key: str, command_request: CommandPropose, request: Request
+):
+    """
+    Propose a command, streaming LLM output via Server-Sent Events.
+
+    Emits a ``token`` event per chunk of LLM output as it is generated, then
+    a ``proposal`` event with the stored proposal (same body as /propose),
+    or an ``error`` event if the proposal could not be generated (with
+    ``retry_after`` when the LLM is overloaded).
+    """
+    git_manager = request.app.state.git_manager
+    llm_service = request.app.state.llm_service
+
+    # Verify project exists
+    project_info = git_manager.read_project_json(project_key)
+    if not project_info:
+        raise HTTPException(status_code=404, detail=f"Project {project_key} not found")
+    if command_request.command not in command_service.handlers:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown command: {command_request.command}"
+        )
+
+    async def events():
+        stream = command_service.propose_command_stream(
+            project_key,
+            command_request.command,
+            command_request.params or {},
+            llm_service,
+            git_manager,
+        )
+        try:
+            async for event, data in stream:
+                if event == "token":
+                    payload = json.dumps({"text": data})
+                else:
+                    payload = CommandProposal(**data).model_dump_json()
+                yield f"event: {event}\ndata: {payload}\n\n"
+        except LLMOverloadedError as e:
+            payload = json.dumps({"detail": str(e), "retry_after": e.retry_after})
+            yield f"event: error\ndata: {payload}\n\n"
+        except Exception as e:
+            payload = json.dumps({"detail": f"Failed to propose command: {str(e)}"})
+            yield f"event: error\ndata: {payload}\n\n"
+        finally:
+            await stream.aclose()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/apply", response_model=CommandApplyResult)
 async def apply_command(
     project_key: str, apply_request: CommandApply, request: Request
@@ -1,12 +1,14 @@
 """
 Commands router - global command execution and history.
-Provides endpoints for executing commands globally and retrieving command history.
+Provides endpoints for queueing commands globally and retrieving command history.
 """
 
-from fastapi import APIRouter, HTTPException, Request, Query
+import asyncio
+import json
+
+from fastapi import APIRouter, HTTPException, Request, Response, Query
+from fastapi.responses import StreamingResponse
 from typing import Optional
-from datetime import datetime, timezone
-import uuid
 
 from models import (
     CommandHistory,
@@ -14,15 +16,40 @@ from models import (
     CommandHistoryList,
     CommandStatus,
 )
+from services.command_queue import (
+    TERMINAL_STATUSES,
+    CommandNotCancellableError,
+    CommandQueue,
+    QueueFullError,
+)
 from services.command_service import CommandService
 
 router = APIRouter()
 command_service = CommandService()
 
+# Event stream re-check interval for commands running in another process
+STATUS_POLL_SECONDS = 1.0
+
+
+def _command_queue(request: Request) -> CommandQueue:
+    """Return the app's command queue, creating it on first use."""
+    queue = getattr(request.app.state, "command_queue", None)
+    if queue is None:
+        queue = CommandQueue.from_env(command_service)
+        request.app.state.command_queue = queue
+    return queue
+
 
-@router.post("", response_model=CommandHistory, status_code=201)
-async def execute_command(command_request: CommandExecute, request: Request):
-    """Execute a command and return command history entry."""
+@router.post("", response_model=CommandHistory, status_code=202)
+async def execute_command(
+    command_request: CommandExecute, request: Request, response: Response
+):
+    """
+    Queue a command for background execution.
+
+    Returns the pending command history entry; poll ``GET /{id}`` or
+    subscribe to ``GET /{id}/events`` for progress.
+    """
     git_manager = request.app.state.git_manager
     llm_service = request.app.state.llm_service
 
@@ -33,65 +60,102 @@ async def execute_command(command_request: CommandExecute, request: Request):
             status_code=404, detail=f"Project '{command_request.project_key}' not found"
         )
 
-    command_id = str(uuid.uuid4())
-    now = datetime.now(timezone.utc).isoformat()
-
     try:
-        # Create command history entry
-        command_data = {
-            "id": command_id,
-            "project_key": command_request.project_key,
-            "command": command_request.command,
-            "params": command_request.params or {},
-            "status": CommandStatus.RUNNING,
-            "created_at": now,
-            "started_at": now,
-        }
-
-        # Log the command
-        command_service.log_command(command_data, git_manager)
-
-        # Execute the command (propose + apply flow)
-        try:
-            # Propose command
-            proposal_data = await command_service.propose_command(
-                command_request.project_key,
-                command_request.command,
-                command_request.params or {},
-                llm_service,
-                git_manager,
-            )
+        command_data = _command_queue(request).submit(
+            command_request.project_key,
+            command_request.command,
+            command_request.params or {},
+            git_manager,
+            llm_service,
+        )
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to queue command: {str(e)}"
+        )
 
-            proposal_id = proposal_data["proposal_id"]
+    response.headers["Location"] = f"{request.url.path}/{command_data['id']}"
+    return CommandHistory(**command_data)
 
-            # Apply command automatically (for global command execution)
-            result = await command_service.apply_proposal(
-                proposal_id, git_manager, log_content=False
-            )
 
-            # Update command status to completed
-            command_data["status"] = CommandStatus.COMPLETED
-            command_data["completed_at"] = datetime.now(timezone.utc).isoformat()
-            command_data["proposal_id"] = proposal_id
-            command_data["commit_hash"] = result["commit_hash"]
+@router.post("/{command_id}/cancel", response_model=CommandHistory)
+async def cancel_command(command_id: str, request: Request):
+    """Cancel a pending or running command."""
+    git_manager = request.app.state.git_manager
 
-        except Exception as e:
-            # Update command status to failed
-            command_data["status"] = CommandStatus.FAILED
-            command_data["completed_at"] = datetime.now(timezone.utc).isoformat()
-            command_data["error_message"] = str(e)
+    try:
+        cancelled = await _command_queue(request).cancel(command_id)
+    except CommandNotCancellableError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    command_data = command_service.load_command(command_id, git_manager)
+    if not command_data:
+        raise HTTPException(status_code=404, detail=f"Command '{command_id}' not found")
+    if not cancelled:
+        raise HTTPException(
+            status_code=409,
+            detail=(
+                f"Command {command_id} is {command_data.get('status')}: "
+                "not queued on this server"
+            ),
+        )
+    return CommandHistory(**command_data)
 
-        # Update the command log
-        command_service.update_command(command_id, command_data, git_manager)
 
-        return CommandHistory(**command_data)
+@router.get("/{command_id}/events")
+async def stream_command_events(command_id: str, request: Request):
+    """
+    Stream status changes of a command via Server-Sent Events.
 
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to execute command: {str(e)}"
-        )
+    Emits the current state first, then one ``status`` event per change, and
+    closes once the command has finished.
+    """
+    git_manager = request.app.state.git_manager
+    queue = _command_queue(request)
+
+    async def current():
+        # Commands of this server are in memory; others are read off the loop
+        command_data = queue.get(command_id)
+        if command_data is None:
+            command_data = await asyncio.to_thread(
+                command_service.load_command, command_id, git_manager
+            )
+        return command_data
+
+    if not await current():
+        raise HTTPException(status_code=404, detail=f"Command '{command_id}' not found")
+
+    async def events():
+        last_status = None
+        while not await request.is_disconnected():
+            command_data = await current()
+            if command_data is None:
+                payload = json.dumps({"detail": f"Command '{command_id}' not found"})
+                yield f"event: error\ndata: {payload}\n\n"
+                return
+            status = CommandStatus(command_data["status"])
+            if status != last_status:
+                last_status = status
+                payload = CommandHistory(**command_data).model_dump_json()
+                yield f"event: status\ndata: {payload}\n\n"
+            else:
+                yield ": keep-alive\n\n"
+            if status in TERMINAL_STATUSES:
+                return
+            await queue.wait_for_change(command_id, STATUS_POLL_SECONDS)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/{command_id}", response_model=CommandHistory)
@@ -115,20 +179,40 @@ async def get_command(command_id: str, request: Request):
 
 @router.get("", response_model=CommandHistoryList)
 async def list_commands(
-    request: Request, projectKey: Optional[str] = Query(None, alias="projectKey")
+    request: Request,
+    projectKey: Optional[str] = Query(None, alias="projectKey"),
+    command: Optional[str] = Query(None, description="Filter by command type"),
+    status: Optional[CommandStatus] = Query(None, description="Filter by status"),
+    limit: Optional[int] = Query(
+        None, ge=1, le=1000, description="Page size (all commands if omitted)"
+    ),
+    cursor: Optional[str] = Query(None, description="next_cursor of previous page"),
 ):
-    """List all commands, optionally filtered by project key."""
+    """
+    List commands across projects (newest first), optionally filtered.
+
+    With ``limit`` the result is one page; ``next_cursor`` is set when more
+    commands match. ``total`` counts the commands returned.
+    """
     git_manager = request.app.state.git_manager
 
     try:
-        # Load commands with optional project key filter
-        commands_data = command_service.load_all_commands(
-            git_manager, project_key_filter=projectKey
+        commands_data, next_cursor = command_service.list_commands_page(
+            git_manager,
+            limit=limit,
+            cursor=cursor,
+            project_key=projectKey,
+            command=command,
+            status=status,
         )
 
         commands = [CommandHistory(**c) for c in commands_data]
 
-        return CommandHistoryList(commands=commands, total=len(commands))
+        return CommandHistoryList(
+            commands=commands, total=len(commands), next_cursor=next_cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to load commands: {str(e)}"
@@ -7,16 +7,39 @@ Provides comprehensive health status including:
 - LLM service availability
 - Disk space
 - Memory usage
+
+The checks run in a background HealthProber started by the application
+lifespan, so health requests return the latest results without waiting on
+the LLM endpoints or the filesystem.
+
+Configuration (environment):
+    HEALTH_PROBE_INTERVAL_SECONDS  seconds between background probes (default: 15,
+                                   at least 1)
 """
 
+import asyncio
+import logging
 import os
+import time
 import psutil
 import httpx
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from fastapi import APIRouter, Request
 from datetime import datetime
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROBE_INTERVAL = 15.0
+
+# Shortest interval between background probes (seconds)
+MIN_PROBE_INTERVAL = 1.0
+
+# Longest wait of a health request for the first probe to finish (seconds)
+FIRST_PROBE_WAIT = 5.0
+
+# Longest wait for an LLM endpoint to answer /models (seconds)
+LLM_PROBE_TIMEOUT = 2.0
 
 
 def check_git_repository(docs_path: str) -> Dict[str, Any]:
@@ -63,8 +86,37 @@ def check_git_repository(docs_path: str) -> Dict[str, Any]:
         }
 
 
-def check_llm_service(llm_service) -> Dict[str, Any]:
-    """Check LLM service availability."""
+async def _probe_llm_endpoint(
+    client: httpx.AsyncClient, base_url: str, api_key: str, timeout: float
+) -> Dict[str, Any]:
+    """Check whether one OpenAI-compatible endpoint answers /models."""
+    headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+    status = {"base_url": base_url, "reachable": False, "message": ""}
+    try:
+        response = await client.get(
+            f"{base_url}/models", headers=headers, timeout=timeout
+        )
+        status["status_code"] = response.status_code
+        if response.status_code == 200:
+            status["reachable"] = True
+            status["message"] = "LLM service is reachable"
+        else:
+            status["message"] = (
+                f"LLM service returned status {response.status_code} (using templates fallback)"
+            )
+    except httpx.TimeoutException:
+        status["message"] = "LLM service timeout (using templates fallback)"
+    except Exception as e:
+        status["message"] = (
+            f"Cannot reach LLM service (using templates fallback): {str(e)}"
+        )
+    return status
+
+
+async def check_llm_service(
+    llm_service, timeout: float = LLM_PROBE_TIMEOUT
+) -> Dict[str, Any]:
+    """Check LLM service availability, probing every configured endpoint."""
     try:
         # LLM service is optional - system can work with templates
         # Just check if the service object exists and has config
@@ -82,34 +134,46 @@ def check_llm_service(llm_service) -> Dict[str, Any]:
             }
 
         config = llm_service.config
-        base_url = config.get("base_url", "")
+        endpoints = list(getattr(llm_service, "endpoints", None) or [])
 
         status = {
             "healthy": True,  # Default to healthy since LLM is optional
-            "endpoint_configured": bool(base_url),
+            "endpoint_configured": bool(
+                config.get("base_url", "") or any(e.base_url for e in endpoints)
+            ),
             "message": "",
         }
 
-        if base_url:
-            # Try a quick connectivity check (timeout 2s)
-            try:
-                response = httpx.get(f"{base_url}/models", timeout=2.0)
-                # LLM is optional - always healthy regardless of response
-                if response.status_code == 200:
-                    status["message"] = "LLM service is reachable"
-                else:
-                    status["message"] = (
-                        f"LLM service returned status {response.status_code} (using templates fallback)"
-                    )
-            except httpx.TimeoutException:
-                status["message"] = "LLM service timeout (using templates fallback)"
-            except Exception as e:
-                status["message"] = (
-                    f"Cannot reach LLM service (using templates fallback): {str(e)}"
-                )
-        else:
+        if not status["endpoint_configured"]:
             status["message"] = "LLM endpoint not configured (using templates)"
+            return status
 
+        if endpoints:
+            results = await asyncio.gather(
+                *(
+                    _probe_llm_endpoint(e.client, e.base_url, e.api_key, timeout)
+                    for e in endpoints
+                )
+            )
+            for endpoint, result in zip(endpoints, results):
+                result["name"] = endpoint.name
+        else:
+            async with httpx.AsyncClient() as client:
+                results = [
+                    await _probe_llm_endpoint(
+                        client, config["base_url"], config.get("api_key", ""), timeout
+                    )
+                ]
+
+        # LLM is optional - always healthy regardless of response
+        status["endpoints"] = list(results)
+        reachable = sum(1 for r in results if r["reachable"])
+        if len(results) == 1:
+            status["message"] = results[0]["message"]
+        elif reachable:
+            status["message"] = f"{reachable}/{len(results)} LLM endpoints reachable"
+        else:
+            status["message"] = "No LLM endpoint reachable (using templates fallback)"
         return status
 
     except Exception as e:
@@ -178,14 +242,167 @@ def check_memory(min_free_percent: float = 10.0) -> Dict[str, Any]:
         }
 
 
+async def run_health_checks(docs_path: str, llm_service) -> Dict[str, Dict[str, Any]]:
+    """Run every component check; blocking checks run in worker threads."""
+    git_status, llm_status, disk_status, memory_status = await asyncio.gather(
+        asyncio.to_thread(check_git_repository, docs_path),
+        check_llm_service(llm_service),
+        asyncio.to_thread(check_disk_space, docs_path),
+        asyncio.to_thread(check_memory),
+    )
+    return {
+        "git_repository": git_status,
+        "llm_service": llm_status,
+        "disk_space": disk_status,
+        "memory": memory_status,
+    }
+
+
+def overall_status(checks: Dict[str, Dict[str, Any]]) -> str:
+    """Combine component checks into healthy/degraded/unhealthy."""
+    critical_checks = [
+        checks["git_repository"]["healthy"],
+        checks["disk_space"]["healthy"],
+        checks["memory"]["healthy"],
+    ]
+    non_critical_checks = [checks["llm_service"]["healthy"]]
+
+    if all(critical_checks):
+        if all(non_critical_checks):
+            return "healthy"
+        return "degraded"
+    return "unhealthy"
+
+
+class HealthProber:
+    """Runs the health checks on an interval and keeps the latest results."""
+
+    def __init__(
+        self,
+        llm_service,
+        docs_path: str,
+        interval: float = DEFAULT_PROBE_INTERVAL,
+    ):
+        """
+        Initialize health prober.
+
+        Args:
+            llm_service: LLMService whose endpoints are probed
+            docs_path: Project docs path checked for git, disk space
+            interval: Seconds between probes
+        """
+        self.llm_service = llm_service
+        self.docs_path = docs_path
+        self.interval = interval
+        self._checks: Optional[Dict[str, Dict[str, Any]]] = None
+        self._checked_at: Optional[datetime] = None
+        self._checked_monotonic = 0.0
+        self._last_error: Optional[str] = None
+        self._ready = asyncio.Event()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @classmethod
+    def from_env(cls, llm_service, docs_path: str) -> "HealthProber":
+        """
+        Build a prober from HEALTH_PROBE_INTERVAL_SECONDS.
+
+        Invalid values fall back to the default; the interval is at least
+        MIN_PROBE_INTERVAL.
+        """
+        try:
+            interval = float(
+                os.getenv("HEALTH_PROBE_INTERVAL_SECONDS", str(DEFAULT_PROBE_INTERVAL))
+            )
+        except ValueError:
+            logger.warning(
+                "Ignoring invalid HEALTH_PROBE_INTERVAL_SECONDS; using %gs",
+                DEFAULT_PROBE_INTERVAL,
+            )
+            interval = DEFAULT_PROBE_INTERVAL
+        if not interval >= MIN_PROBE_INTERVAL:  # also catches nan
+            interval = MIN_PROBE_INTERVAL
+        return cls(llm_service, docs_path, interval=interval)
+
+    def start(self) -> None:
+        """Start probing in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop probing."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def has_results(self) -> bool:
+        """Whether a probe has completed."""
+        return self._checks is not None
+
+    async def probe(self) -> None:
+        """Run every check once and store the results."""
+        self._checks = await run_health_checks(self.docs_path, self.llm_service)
+        self._checked_at = datetime.utcnow()
+        self._checked_monotonic = time.monotonic()
+        self._last_error = None
+        self._ready.set()
+
+    async def snapshot(self, timeout: float = FIRST_PROBE_WAIT) -> Dict[str, Any]:
+        """
+        Latest results with their age.
+
+        Waits up to ``timeout`` seconds for the first probe if none has
+        completed yet. If it still has not, ``checks`` is None and
+        ``probe_status`` says whether the probe is pending or failing.
+        """
+        if self._checks is None:
+            try:
+                if self._task is None:
+                    await asyncio.wait_for(self.probe(), timeout)
+                else:
+                    await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            except Exception as e:
+                logger.warning("Health probe failed", exc_info=True)
+                self._last_error = f"{type(e).__name__}: {e}"
+        if self._checks is None:
+            return {
+                "checks": None,
+                "checked_at": None,
+                "age_seconds": None,
+                "probe_status": "failed" if self._last_error else "pending",
+                "message": self._last_error or "Health probe has not completed yet",
+            }
+        return {
+            "checks": self._checks,
+            "checked_at": self._checked_at.isoformat() + "Z",
+            "age_seconds": round(time.monotonic() - self._checked_monotonic, 3),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.probe()
+            except Exception as e:
+                logger.warning("Health probe failed", exc_info=True)
+                self._last_error = f"{type(e).__name__}: {e}"
+            await asyncio.sleep(self.interval)
+
+
 @router.get("/health")
-async def health_check_simple():
+async def health_check_simple(request: Request):
     """
     Simple health check (backward compatible).
 
     Always returns 200 OK if API is running, even if some components are degraded.
     This ensures infrastructure health checks pass while detailed status is available
-    at /api/v1/health for monitoring.
+    at /api/v1/health for monitoring. Once the background prober has run, its
+    cached overall status and the age of that result are included.
     """
     docs_path = os.getenv("PROJECT_DOCS_PATH", "/projectDocs")
     docs_exists = os.path.exists(docs_path)
@@ -193,7 +410,7 @@ async def health_check_simple():
         os.path.exists(os.path.join(docs_path, ".git")) if docs_exists else False
     )
 
-    return {
+    payload = {
         "status": "healthy",  # Always healthy if API responds
         "docs_path": docs_path,
         "docs_exists": docs_exists,
@@ -203,49 +420,55 @@ async def health_check_simple():
         ),
     }
 
+    prober = getattr(request.app.state, "health_prober", None)
+    if prober is not None and prober.has_results:
+        snapshot = await prober.snapshot()
+        payload["checks_status"] = overall_status(snapshot["checks"])
+        payload["checked_at"] = snapshot["checked_at"]
+        payload["age_seconds"] = snapshot["age_seconds"]
+
+    return payload
+
 
 @router.get("/api/v1/health")
 async def health_check_detailed(request: Request):
     """
     Detailed health check with comprehensive system status.
 
+    Served from the background prober's latest results; without a prober the
+    checks run for this request.
+
     Returns:
     - overall status: healthy/degraded/unhealthy
     - component health: git, llm, disk, memory
-    - timestamp
-    """
-    docs_path = os.getenv("PROJECT_DOCS_PATH", "/projectDocs")
-
-    # Run all health checks
-    git_status = check_git_repository(docs_path)
-    llm_status = check_llm_service(request.app.state.llm_service)
-    disk_status = check_disk_space(docs_path)
-    memory_status = check_memory()
+    - timestamp, and when the checks ran (checked_at, age_seconds)
 
-    # Determine overall status
-    critical_checks = [
-        git_status["healthy"],
-        disk_status["healthy"],
-        memory_status["healthy"],
-    ]
-    non_critical_checks = [llm_status["healthy"]]
-
-    if all(critical_checks):
-        if all(non_critical_checks):
-            overall_status = "healthy"
-        else:
-            overall_status = "degraded"
-    else:
-        overall_status = "unhealthy"
+    Until the first probe completes, status is "pending" (or "failed" if it
+    raised) and checks is empty.
+    """
+    prober = getattr(request.app.state, "health_prober", None)
+    if prober is None:
+        prober = HealthProber(
+            getattr(request.app.state, "llm_service", None),
+            os.getenv("PROJECT_DOCS_PATH", "/projectDocs"),
+        )
+    snapshot = await prober.snapshot()
+    if snapshot["checks"] is None:
+        return {
+            "status": snapshot["probe_status"],
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "checked_at": None,
+            "age_seconds": None,
+            "api_version": "v1",
+            "message": snapshot["message"],
+            "checks": {},
+        }
 
     return {
-        "status": overall_status,
+        "status": overall_status(snapshot["checks"]),
         "timestamp": datetime.utcnow().isoformat() + "Z",
+        "checked_at": snapshot["checked_at"],
+        "age_seconds": snapshot["age_seconds"],
         "api_version": "v1",
-        "checks": {
-            "git_repository": git_status,
-            "llm_service": llm_status,
-            "disk_space": disk_status,
-            "memory": memory_status,
-        },
+        "checks": snapshot["checks"],
     }
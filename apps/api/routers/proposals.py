@@ -3,16 +3,22 @@ Proposals router - REST API for proposal lifecycle management.
 Delegates to ProposalService for all business logic.
 """
 
-from fastapi import APIRouter, HTTPException, Request, Query
+from fastapi import APIRouter, HTTPException, Request, Response, Query
 from typing import Optional
 
 from domain.proposals.models import (
     Proposal,
+    ProposalBatchApply,
     ProposalCreate,
     ProposalStatus,
     ChangeType,
 )
-from services.proposal_service import ProposalService
+from services.proposal_service import (
+    BatchApplyError,
+    ConflictError,
+    MergeConflictError,
+    ProposalService,
+)
 
 router = APIRouter()
 
@@ -55,15 +61,27 @@ async def create_proposal(
 async def list_proposals(
     project_key: str,
     request: Request,
+    response: Response,
     status_filter: Optional[ProposalStatus] = Query(
         None, description="Filter by status", alias="status_filter"
     ),
     change_type: Optional[ChangeType] = Query(
         None, description="Filter by change type"
     ),
+    target_artifact: Optional[str] = Query(
+        None, description="Filter by target artifact path"
+    ),
+    author: Optional[str] = Query(None, description="Filter by author"),
+    limit: Optional[int] = Query(
+        None, ge=1, le=1000, description="Page size (all proposals if omitted)"
+    ),
+    cursor: Optional[str] = Query(None, description="Cursor from X-Next-Cursor"),
 ):
     """
-    List all proposals for a project with optional filters.
+    List proposals for a project with optional filters (newest first).
+
+    With ``limit`` the result is one page; the ``X-Next-Cursor`` response
+    header carries the cursor for the next page when more proposals match.
 
     Returns: List of proposals matching filters
     """
@@ -79,16 +97,67 @@ async def list_proposals(
 
     try:
         service = ProposalService(git_manager, audit_service)
-        proposals = service.list_proposals(
-            project_key, status=status_filter, change_type=change_type
+        proposals, next_cursor = service.list_proposals_page(
+            project_key,
+            status=status_filter,
+            change_type=change_type,
+            target_artifact=target_artifact,
+            author=author,
+            limit=limit,
+            cursor=cursor,
         )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         return proposals
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to list proposals: {str(e)}"
         )
 
 
+@router.post("/batch-apply", response_model=dict)
+async def apply_proposals(
+    project_key: str,
+    batch: ProposalBatchApply,
+    request: Request,
+):
+    """
+    Apply several proposals in a single atomic commit.
+
+    Either every proposal is applied or none is. On failure the response is
+    409 (a proposal conflicts) or 400 (a proposal is unknown or not pending)
+    and ``detail.results`` reports the outcome of each proposal.
+
+    Returns: Commit hash and per-proposal results
+    """
+    git_manager = request.app.state.git_manager
+    audit_service = request.app.state.audit_service
+
+    # Verify project exists
+    project_info = git_manager.read_project_json(project_key)
+    if not project_info:
+        raise HTTPException(
+            status_code=404, detail=f"Project '{project_key}' not found"
+        )
+
+    try:
+        service = ProposalService(git_manager, audit_service)
+        return service.apply_proposals(
+            project_key, batch.proposal_ids, actor=batch.actor
+        )
+    except BatchApplyError as e:
+        raise HTTPException(
+            status_code=409 if e.has_conflicts else 400,
+            detail={"message": str(e), "results": e.results},
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to apply proposals: {str(e)}"
+        )
+
+
 @router.get("/{proposal_id}", response_model=Proposal)
 async def get_proposal(
     project_key: str,
@@ -151,6 +220,18 @@ async def apply_proposal(
         service = ProposalService(git_manager, audit_service)
         result = service.apply_proposal(project_key, proposal_id)
         return result
+    except MergeConflictError as e:
+        # Overlapping edits: return the merge with conflict markers
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "message": str(e),
+                "conflicts": e.conflicts,
+                "merged_content": e.merged_content,
+            },
+        )
+    except ConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         # Handle already-applied, not found, etc.
         if "not found" in str(e).lower():
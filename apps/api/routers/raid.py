@@ -17,6 +17,7 @@ from models import (
 )
 from services.avatar_service import infer_owner_avatar_url
 from services.raid_service import RAIDService
+from services.tracing import span
 
 router = APIRouter()
 
@@ -64,16 +65,17 @@ async def list_raid_items(
         priority=priority.value if priority else None,
     )
 
-    return RAIDItemList(
-        items=[RAIDItem(**_enrich_owner_avatar(item)) for item in filtered_items],
-        total=len(filtered_items),
-        filtered_by={
-            "type": type.value if type else None,
-            "status": status.value if status else None,
-            "owner": owner,
-            "priority": priority.value if priority else None,
-        },
-    )
+    with span("response.model", model="RAIDItemList", items=len(filtered_items)):
+        return RAIDItemList(
+            items=[RAIDItem(**_enrich_owner_avatar(item)) for item in filtered_items],
+            total=len(filtered_items),
+            filtered_by={
+                "type": type.value if type else None,
+                "status": status.value if status else None,
+                "owner": owner,
+                "priority": priority.value if priority else None,
+            },
+        )
 
 
 @router.get("/{raid_id}", response_model=RAIDItem)
@@ -201,8 +203,9 @@ async def get_raid_items_by_decision(
         project_key, decision_id, git_manager
     )
 
-    return RAIDItemList(
-        items=[RAIDItem(**_enrich_owner_avatar(item)) for item in items],
-        total=len(items),
-        filtered_by={"decision_id": decision_id},
-    )
+    with span("response.model", model="RAIDItemList", items=len(items)):
+        return RAIDItemList(
+            items=[RAIDItem(**_enrich_owner_avatar(item)) for item in items],
+            total=len(items),
+            filtered_by={"decision_id": decision_id},
+        )
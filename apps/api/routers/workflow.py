@@ -3,9 +3,12 @@ Workflow router for managing project workflow state transitions and audit events
 Aligned with ISO 21500 standards.
 """
 
-from fastapi import APIRouter, HTTPException, Request, Query
-from typing import Optional
+from fastapi import APIRouter, HTTPException, Request, Query, Header
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from typing import List, Optional
 
+from domain.audit.enums import TrendResolution
 from domain.workflow.constants import (
     DEFAULT_EVENT_LIMIT,
     MIN_EVENT_LIMIT,
@@ -18,12 +21,18 @@ from models import (
 )
 from services.workflow_service import WorkflowService
 from services.audit_service import AuditService
+from services.audit.event_stream import (
+    AuditEventStreamer,
+    InvalidCursorError,
+    STREAM_FILES,
+)
 
 router = APIRouter()
 
 # Service instances
 workflow_service = WorkflowService()
 audit_service = AuditService()
+event_streamer = AuditEventStreamer()
 
 
 # ============================================================================
@@ -125,6 +134,9 @@ async def get_audit_events(
         description="Maximum number of events",
     ),
     offset: int = Query(0, ge=0, description="Number of events to skip"),
+    newest_first: bool = Query(
+        False, description="Return newest events first (reverse scan from EOF)"
+    ),
 ):
     """
     Retrieve audit events for a project.
@@ -149,6 +161,7 @@ async def get_audit_events(
             until=until,
             limit=limit,
             offset=offset,
+            newest_first=newest_first,
         )
 
         return AuditEventList(**result)
@@ -159,6 +172,106 @@ async def get_audit_events(
         )
 
 
+def _event_stream_response(
+    request: Request,
+    project_key: Optional[str],
+    streams: Optional[List[str]],
+    event_type: Optional[str],
+    actor: Optional[str],
+    cursor: Optional[str],
+    last_event_id: Optional[str],
+    follow: bool,
+) -> StreamingResponse:
+    """Build an SSE response tailing the requested event logs."""
+    git_manager = request.app.state.git_manager
+
+    unknown = [s for s in streams or [] if s not in STREAM_FILES]
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown event stream(s): {', '.join(unknown)}"
+        )
+
+    # Explicit cursor wins over the reconnect header sent by EventSource
+    token = cursor or last_event_id
+    try:
+        start = (
+            event_streamer.decode_cursor(token)
+            if token
+            else event_streamer.initial_cursor(git_manager, project_key, streams)
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        event_streamer.stream(
+            request,
+            git_manager,
+            start,
+            project_key=project_key,
+            streams=streams,
+            event_type=event_type,
+            actor=actor,
+            follow=follow,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/audit-events/stream")
+async def stream_all_audit_events(
+    request: Request,
+    stream: Optional[List[str]] = Query(
+        None, description="Streams to follow: audit, events (default: both)"
+    ),
+    event_type: Optional[str] = Query(None, description="Filter by event type"),
+    actor: Optional[str] = Query(None, description="Filter by actor"),
+    cursor: Optional[str] = Query(None, description="Resume from cursor"),
+    follow: bool = Query(True, description="Keep streaming new events"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Stream audit and project events for all projects via Server-Sent Events.
+
+    Without a cursor the stream starts at the current end of every log.
+    Each event's ``id`` is a resume cursor.
+    """
+    return _event_stream_response(
+        request, None, stream, event_type, actor, cursor, last_event_id, follow
+    )
+
+
+@router.get("/{project_key}/audit-events/stream")
+async def stream_audit_events(
+    project_key: str,
+    request: Request,
+    stream: Optional[List[str]] = Query(
+        None, description="Streams to follow: audit, events (default: both)"
+    ),
+    event_type: Optional[str] = Query(None, description="Filter by event type"),
+    actor: Optional[str] = Query(None, description="Filter by actor"),
+    cursor: Optional[str] = Query(None, description="Resume from cursor"),
+    follow: bool = Query(True, description="Keep streaming new events"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Stream audit and project events for one project via Server-Sent Events.
+
+    Without a cursor the stream starts at the current end of the logs.
+    Each event's ``id`` is a resume cursor.
+    """
+    git_manager = request.app.state.git_manager
+
+    # Verify project exists
+    project_info = git_manager.read_project_json(project_key)
+    if not project_info:
+        raise HTTPException(status_code=404, detail=f"Project {project_key} not found")
+
+    return _event_stream_response(
+        request, project_key, stream, event_type, actor, cursor, last_event_id, follow
+    )
+
+
 @router.post("/{project_key}/audit")
 async def run_audit_rules(
     project_key: str,
@@ -310,3 +423,84 @@ async def get_audit_history(
         raise HTTPException(
             status_code=500, detail=f"Failed to retrieve audit history: {str(e)}"
         )
+
+
+@router.get("/audit/trends")
+async def get_portfolio_audit_trends(
+    request: Request,
+    resolution: TrendResolution = Query(
+        TrendResolution.DAILY, description="Bucket size: hourly, daily or weekly"
+    ),
+    since: Optional[datetime] = Query(None, description="Start of the window"),
+    until: Optional[datetime] = Query(None, description="End of the window"),
+):
+    """
+    Retrieve audit trends merged across all projects.
+
+    Served from precomputed per-project buckets (oldest first).
+    """
+    git_manager = request.app.state.git_manager
+
+    try:
+        trends = audit_service.get_audit_trends(
+            project_key=None,
+            git_manager=git_manager,
+            resolution=resolution,
+            since=since,
+            until=until,
+        )
+
+        return {
+            "resolution": resolution.value,
+            "trends": trends,
+            "count": len(trends),
+        }
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to retrieve audit trends: {str(e)}"
+        )
+
+
+@router.get("/{project_key}/audit/trends")
+async def get_audit_trends(
+    project_key: str,
+    request: Request,
+    resolution: TrendResolution = Query(
+        TrendResolution.DAILY, description="Bucket size: hourly, daily or weekly"
+    ),
+    since: Optional[datetime] = Query(None, description="Start of the window"),
+    until: Optional[datetime] = Query(None, description="End of the window"),
+):
+    """
+    Retrieve audit trends for a project.
+
+    Served from precomputed buckets (oldest first) instead of the raw history.
+    """
+    git_manager = request.app.state.git_manager
+
+    # Verify project exists
+    project_info = git_manager.read_project_json(project_key)
+    if not project_info:
+        raise HTTPException(status_code=404, detail=f"Project {project_key} not found")
+
+    try:
+        trends = audit_service.get_audit_trends(
+            project_key=project_key,
+            git_manager=git_manager,
+            resolution=resolution,
+            since=since,
+            until=until,
+        )
+
+        return {
+            "project_key": project_key,
+            "resolution": resolution.value,
+            "trends": trends,
+            "count": len(trends),
+        }
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to retrieve audit trends: {str(e)}"
+        )
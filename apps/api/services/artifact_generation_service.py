@@ -7,21 +7,46 @@ Following DDD architecture:
 - Delegates persistence to GitManager
 - Delegates template access to TemplateService
 - Delegates blueprint access to BlueprintService
+
+Blueprint generation loads all templates first, validates and renders them
+on a thread pool, writes the artifacts and commits them in a single commit.
+
+Configuration (environment):
+    ARTIFACT_RENDER_WORKERS  templates of a blueprint rendered concurrently (default: 8)
 """
 
 import jsonschema
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, Any, List
-from jinja2 import Environment, select_autoescape
+from typing import Dict, Any, List, Optional
 
 try:
     from .template_service import TemplateService
     from .blueprint_service import BlueprintService
     from .git_manager import GitManager
+    from .template_cache import CompiledTemplateCache, get_template_cache
+    from ..domain.shared.schema_validators import get_schema_validator_cache
 except ImportError:
     from services.template_service import TemplateService
     from services.blueprint_service import BlueprintService
     from services.git_manager import GitManager
+    from services.template_cache import CompiledTemplateCache, get_template_cache
+    from domain.shared.schema_validators import get_schema_validator_cache
+
+
+# Templates of one blueprint validated and rendered concurrently
+DEFAULT_RENDER_WORKERS = 8
+
+
+def _render_workers_from_env() -> int:
+    """Resolve the configured number of render workers."""
+    try:
+        workers = int(os.getenv("ARTIFACT_RENDER_WORKERS", DEFAULT_RENDER_WORKERS))
+    except ValueError:
+        return DEFAULT_RENDER_WORKERS
+    return max(1, workers)
 
 
 class ArtifactGenerationError(Exception):
@@ -50,6 +75,7 @@ class ArtifactGenerationService:
         template_service: TemplateService,
         blueprint_service: BlueprintService,
         git_manager: GitManager,
+        template_cache: Optional[CompiledTemplateCache] = None,
     ):
         """
         Initialize artifact generation service.
@@ -58,17 +84,16 @@ class ArtifactGenerationService:
             template_service: Service for template access
             blueprint_service: Service for blueprint access
             git_manager: GitManager for persistence
+            template_cache: Compiled templates (defaults to the process-wide cache)
         """
         self.template_service = template_service
         self.blueprint_service = blueprint_service
         self.git_manager = git_manager
 
-        # Configure Jinja2 environment with sandboxing
-        self.jinja_env = Environment(
-            autoescape=select_autoescape(["html", "xml"]),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        # Compiled templates outlive the request that created this service
+        self.template_cache = template_cache or get_template_cache()
+        self.jinja_env = self.template_cache.environment
+        self.render_workers = _render_workers_from_env()
 
     def generate_from_template(
         self, template_id: str, project_key: str, context: Dict[str, Any]
@@ -89,42 +114,22 @@ class ArtifactGenerationService:
             TemplateRenderingError: If rendering fails
             ValidationError: If context validation fails
         """
-        # Load template
-        template = self.template_service.get_template(template_id)
-        if not template:
-            raise ArtifactGenerationError(f"Template not found: {template_id}")
-
-        # Sanitize and enrich context
-        sanitized_context = self._sanitize_context(context)
-        enriched_context = self._enrich_context(sanitized_context, project_key)
-
-        # Validate context against schema
-        try:
-            jsonschema.validate(sanitized_context, template.schema)
-        except jsonschema.ValidationError as e:
-            raise ValidationError(f"Context validation failed: {e.message}") from e
-
-        # Render markdown with Jinja2
-        try:
-            jinja_template = self.jinja_env.from_string(template.markdown_template)
-            rendered = jinja_template.render(**enriched_context)
-        except Exception as e:
-            raise TemplateRenderingError(f"Template rendering failed: {str(e)}") from e
+        result = self._render_artifact(
+            template_id,
+            self.template_service.get_template(template_id),
+            project_key,
+            context,
+        )
 
         # Persist to projectDocs/{project}/artifacts/{artifact_type}.md
-        artifact_path = f"artifacts/{template.artifact_type}.md"
-        self.git_manager.write_file(project_key, artifact_path, rendered)
+        artifact_path = result["artifact_path"]
+        self.git_manager.write_file(project_key, artifact_path, result["content"])
 
         # Commit the artifact
-        commit_message = f"[{project_key}] Generated {template.artifact_type} from template {template_id}"
+        commit_message = f"[{project_key}] Generated {result['artifact_type']} from template {template_id}"
         self.git_manager.commit_changes(project_key, commit_message, [artifact_path])
 
-        return {
-            "artifact_path": artifact_path,
-            "content": rendered,
-            "template_id": template_id,
-            "artifact_type": template.artifact_type,
-        }
+        return result
 
     def generate_from_blueprint(
         self, blueprint_id: str, project_key: str, base_context: Dict[str, Any] = None
@@ -138,7 +143,8 @@ class ArtifactGenerationService:
             base_context: Optional base context for all templates
 
         Returns:
-            List of generated artifact results
+            List of generated artifact results in blueprint order, each with
+            the time spent loading, validating and rendering it (duration_ms)
 
         Raises:
             ArtifactGenerationError: If blueprint not found
@@ -151,20 +157,107 @@ class ArtifactGenerationService:
         # Use base context or empty dict
         context = base_context if base_context else {}
 
-        # Generate all required artifacts
-        results = []
+        # Load every template before rendering any of them
+        loaded = []
         for template_id in blueprint.required_templates:
+            start = time.perf_counter()
+            template = self.template_service.get_template(template_id)
+            loaded.append((template_id, template, time.perf_counter() - start))
+
+        def render(item) -> Dict[str, Any]:
+            template_id, template, load_seconds = item
+            start = time.perf_counter()
             try:
-                result = self.generate_from_template(template_id, project_key, context)
-                results.append(result)
-            except ArtifactGenerationError as e:
-                # Log error but continue with other artifacts
-                results.append(
-                    {"template_id": template_id, "error": str(e), "success": False}
+                result = self._render_artifact(
+                    template_id, template, project_key, context
                 )
+            except ArtifactGenerationError as e:
+                # Report the error but continue with other artifacts
+                result = {"template_id": template_id, "error": str(e), "success": False}
+            result["duration_ms"] = round(
+                (load_seconds + time.perf_counter() - start) * 1000, 3
+            )
+            return result
+
+        # Validate and render concurrently; results keep blueprint order
+        workers = min(self.render_workers, len(loaded)) or 1
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="artifact-render"
+        ) as pool:
+            results = list(pool.map(render, loaded))
+
+        # Write every artifact, then commit them together
+        artifact_paths = []
+        for result in results:
+            if "error" in result:
+                continue
+            self.git_manager.write_file(
+                project_key, result["artifact_path"], result["content"]
+            )
+            if result["artifact_path"] not in artifact_paths:
+                artifact_paths.append(result["artifact_path"])
+        if artifact_paths:
+            commit_message = (
+                f"[{project_key}] Generated {len(artifact_paths)} artifacts "
+                f"from blueprint {blueprint_id}"
+            )
+            self.git_manager.commit_changes(project_key, commit_message, artifact_paths)
 
         return results
 
+    def _render_artifact(
+        self,
+        template_id: str,
+        template: Optional[Any],
+        project_key: str,
+        context: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Validate context and render one artifact without persisting it.
+
+        Args:
+            template_id: ID of the template
+            template: Loaded template, or None if it does not exist
+            project_key: Project key for artifact storage
+            context: Context variables for template rendering
+
+        Returns:
+            Dict with artifact_path, content, template_id and artifact_type
+
+        Raises:
+            ArtifactGenerationError: If template not found
+            TemplateRenderingError: If rendering fails
+            ValidationError: If context validation fails
+        """
+        if not template:
+            raise ArtifactGenerationError(f"Template not found: {template_id}")
+
+        # Sanitize and enrich context
+        sanitized_context = self._sanitize_context(context)
+        enriched_context = self._enrich_context(sanitized_context, project_key)
+
+        # Validate context against schema
+        try:
+            get_schema_validator_cache().validate(sanitized_context, template.schema)
+        except jsonschema.ValidationError as e:
+            raise ValidationError(f"Context validation failed: {e.message}") from e
+
+        # Render markdown with Jinja2
+        try:
+            jinja_template = self.template_cache.get(
+                template_id, template.markdown_template
+            )
+            rendered = jinja_template.render(**enriched_context)
+        except Exception as e:
+            raise TemplateRenderingError(f"Template rendering failed: {str(e)}") from e
+
+        return {
+            "artifact_path": f"artifacts/{template.artifact_type}.md",
+            "content": rendered,
+            "template_id": template_id,
+            "artifact_type": template.artifact_type,
+        }
+
     def _sanitize_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Sanitize context variables to prevent template injection.
@@ -5,5 +5,14 @@ Audit package - focused services following SRP.
 from .event_logger import AuditEventLogger
 from .rules_engine import AuditRulesEngine
 from .orchestrator import AuditOrchestrator
+from .event_stream import AuditEventStreamer, InvalidCursorError
+from .trends import AuditTrendService
 
-__all__ = ["AuditEventLogger", "AuditRulesEngine", "AuditOrchestrator"]
+__all__ = [
+    "AuditEventLogger",
+    "AuditRulesEngine",
+    "AuditOrchestrator",
+    "AuditEventStreamer",
+    "InvalidCursorError",
+    "AuditTrendService",
+]
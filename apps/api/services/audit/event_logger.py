@@ -3,12 +3,12 @@ Audit Event Logger - handles event persistence in NDJSON format.
 Single Responsibility: Event logging and retrieval with filtering.
 """
 
-import json
 import uuid
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone
 
-from domain.audit.constants import DEFAULT_QUERY_LIMIT
+from domain.audit.constants import DEFAULT_QUERY_LIMIT, AUDIT_EVENTS_LOG
+from ..ndjson import get_event_log_writer
 
 
 class AuditEventLogger:
@@ -57,15 +57,10 @@ class AuditEventLogger:
             "resource_hash": resource_hash,
         }
 
-        # Append to NDJSON file
-        events_path = (
-            git_manager.get_project_path(project_key) / "events" / "audit.ndjson"
+        # Append to segmented NDJSON log (buffered per durability policy)
+        get_event_log_writer().append(
+            git_manager.open_log(project_key, AUDIT_EVENTS_LOG), event
         )
-        events_path.parent.mkdir(parents=True, exist_ok=True)
-
-        event_line = json.dumps(event)
-        with events_path.open("a") as f:
-            f.write(event_line + "\n")
 
         return event
 
@@ -79,10 +74,17 @@ class AuditEventLogger:
         until: Optional[str] = None,
         limit: int = DEFAULT_QUERY_LIMIT,
         offset: int = 0,
+        newest_first: bool = False,
     ) -> Dict[str, Any]:
         """
         Retrieve audit events with optional filtering and pagination.
 
+        Newest-first queries read the log backwards from EOF and stop as soon
+        as the requested page is filled (or events older than ``since`` are
+        reached), so their cost does not grow with the size of the log. In
+        that mode ``total`` counts the matches seen while scanning and is
+        exact only when ``has_more`` is False.
+
         Args:
             project_key: Project key
             git_manager: Git manager instance
@@ -92,15 +94,16 @@ class AuditEventLogger:
             until: Filter events until timestamp (ISO 8601)
             limit: Maximum number of events to return
             offset: Number of events to skip
+            newest_first: Return newest events first using a reverse scan
 
         Returns:
             Dictionary with events list and metadata
         """
-        events_path = (
-            git_manager.get_project_path(project_key) / "events" / "audit.ndjson"
-        )
+        events_log = git_manager.open_log(project_key, AUDIT_EVENTS_LOG)
+        # Make buffered events visible to this read
+        get_event_log_writer().flush(events_log.path)
 
-        if not events_path.exists():
+        if not events_log.path.exists() and not events_log.manifest_path.exists():
             return {
                 "events": [],
                 "total": 0,
@@ -111,17 +114,13 @@ class AuditEventLogger:
                 ),
             }
 
-        # Read all events from NDJSON
-        events = []
-        with events_path.open("r") as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        event = json.loads(line)
-                        events.append(event)
-                    except json.JSONDecodeError:
-                        # Skip malformed lines
-                        continue
+        if newest_first:
+            return self._get_events_newest_first(
+                events_log, event_type, actor, since, until, limit, offset
+            )
+
+        # Read events, skipping sealed segments outside the time window
+        events = list(events_log.iter_records(since=since, until=until))
 
         # Apply filters
         filtered_events = self._filter_events(events, event_type, actor, since, until)
@@ -138,6 +137,67 @@ class AuditEventLogger:
             "filtered_by": self._build_filter_summary(event_type, actor, since, until),
         }
 
+    def _get_events_newest_first(
+        self,
+        events_log,
+        event_type: Optional[str],
+        actor: Optional[str],
+        since: Optional[str],
+        until: Optional[str],
+        limit: int,
+        offset: int,
+    ) -> Dict[str, Any]:
+        """Collect one page of matching events scanning backwards from EOF."""
+        page = []
+        matched = 0
+        has_more = False
+
+        for event in events_log.iter_reversed(since=since):
+            timestamp = event.get("timestamp")
+            if since and not (isinstance(timestamp, str) and timestamp):
+                # No time to compare; it cannot match a since filter
+                continue
+            # Log is append-only, so everything further back is older still
+            if since and timestamp < since:
+                break
+            if not self._matches(event, event_type, actor, since, until):
+                continue
+
+            if matched >= offset + limit:
+                has_more = True
+                break
+            if matched >= offset:
+                page.append(event)
+            matched += 1
+
+        return {
+            "events": page,
+            "total": matched,
+            "limit": limit,
+            "offset": offset,
+            "filtered_by": self._build_filter_summary(event_type, actor, since, until),
+            "has_more": has_more,
+        }
+
+    def _matches(
+        self,
+        event: Dict[str, Any],
+        event_type: Optional[str] = None,
+        actor: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> bool:
+        """Check whether a single event satisfies all filters."""
+        if event_type and event.get("event_type") != event_type:
+            return False
+        if actor and event.get("actor") != actor:
+            return False
+        if since and event.get("timestamp", "") < since:
+            return False
+        if until and event.get("timestamp", "") > until:
+            return False
+        return True
+
     def _filter_events(
         self,
         events: List[Dict[str, Any]],
@@ -147,24 +207,7 @@ class AuditEventLogger:
         until: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Apply filters to events list."""
-        filtered = events
-
-        # Filter by event type
-        if event_type:
-            filtered = [e for e in filtered if e.get("event_type") == event_type]
-
-        # Filter by actor
-        if actor:
-            filtered = [e for e in filtered if e.get("actor") == actor]
-
-        # Filter by time range
-        if since:
-            filtered = [e for e in filtered if e.get("timestamp", "") >= since]
-
-        if until:
-            filtered = [e for e in filtered if e.get("timestamp", "") <= until]
-
-        return filtered
+        return [e for e in events if self._matches(e, event_type, actor, since, until)]
 
     def _build_filter_summary(
         self,
@@ -0,0 +1,223 @@
+"""
+Audit Event Stream - live tailing of project event logs for Server-Sent Events.
+Single Responsibility: Follow events/audit.ndjson and events/events.ndjson and
+emit new records as SSE frames with resumable cursors.
+"""
+
+import asyncio
+import base64
+import json
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from domain.audit.constants import AUDIT_EVENTS_LOG, PROJECT_EVENTS_LOG
+
+# Stream name -> log file relative to the project directory
+STREAM_FILES = {
+    "audit": AUDIT_EVENTS_LOG,
+    "events": PROJECT_EVENTS_LOG,
+}
+
+# Cursor: {"<project>/<stream>": [segment id, offset]}
+Cursor = Dict[str, List[int]]
+
+DEFAULT_POLL_INTERVAL = 0.5
+DEFAULT_HEARTBEAT_INTERVAL = 15.0
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a stream cursor cannot be decoded."""
+
+    pass
+
+
+class AuditEventStreamer:
+    """Service for tailing audit and project event logs."""
+
+    def __init__(
+        self,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL,
+    ):
+        """
+        Initialize audit event streamer.
+
+        Args:
+            poll_interval: Seconds between checks for appended records
+            heartbeat_interval: Seconds between SSE keep-alive comments
+        """
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+
+    # Cursor handling
+
+    @staticmethod
+    def encode_cursor(cursor: Cursor) -> str:
+        """Encode a {"<project>/<stream>": [segment, offset]} map as a token."""
+        raw = json.dumps(cursor, sort_keys=True, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(token: str) -> Cursor:
+        """
+        Decode a cursor token produced by encode_cursor.
+
+        Raises:
+            InvalidCursorError: If the token is malformed
+        """
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        except Exception as e:
+            raise InvalidCursorError(f"Invalid stream cursor: {token}") from e
+        if not isinstance(cursor, dict) or not all(
+            isinstance(v, list)
+            and len(v) == 2
+            and all(isinstance(n, int) and n >= 0 for n in v)
+            for v in cursor.values()
+        ):
+            raise InvalidCursorError(f"Invalid stream cursor: {token}")
+        return cursor
+
+    def initial_cursor(
+        self,
+        git_manager,
+        project_key: Optional[str] = None,
+        streams: Optional[Iterable[str]] = None,
+    ) -> Cursor:
+        """Build a cursor positioned at the current end of every log."""
+        return {
+            key: list(log.end_position())
+            for key, log in self._logs(git_manager, project_key, streams)
+        }
+
+    # Polling
+
+    def poll(
+        self,
+        git_manager,
+        cursor: Cursor,
+        project_key: Optional[str] = None,
+        streams: Optional[Iterable[str]] = None,
+        event_type: Optional[str] = None,
+        actor: Optional[str] = None,
+    ) -> List[Tuple[str, Dict[str, Any], Cursor]]:
+        """
+        Collect records appended since the cursor, advancing it in place.
+
+        Logs that are not yet present in the cursor (e.g. projects created
+        after the stream started) are read from the beginning. Segment
+        rotation is followed, so records sealed since the last poll are
+        not skipped.
+
+        Args:
+            git_manager: Git manager instance
+            cursor: Offsets already consumed, updated in place
+            project_key: Single project to follow (all projects if None)
+            streams: Stream names to follow (all if None)
+            event_type: Filter by event type
+            actor: Filter by actor
+
+        Returns:
+            List of (stream, record, cursor snapshot after the record)
+        """
+        emitted = []
+        for key, log in self._logs(git_manager, project_key, streams):
+            records, new_position = log.read_since(tuple(cursor.get(key, (1, 0))))
+            project, stream = key.rsplit("/", 1)
+            for record, position in records:
+                cursor[key] = list(position)
+                if event_type and record.get("event_type") != event_type:
+                    continue
+                if actor and record.get("actor") != actor:
+                    continue
+                record.setdefault("project_key", project)
+                emitted.append((stream, record, dict(cursor)))
+            cursor[key] = list(new_position)
+        return emitted
+
+    async def stream(
+        self,
+        request,
+        git_manager,
+        cursor: Cursor,
+        project_key: Optional[str] = None,
+        streams: Optional[Iterable[str]] = None,
+        event_type: Optional[str] = None,
+        actor: Optional[str] = None,
+        follow: bool = True,
+    ) -> AsyncIterator[str]:
+        """
+        Yield SSE frames for new records until the client disconnects.
+
+        Each frame carries the resume cursor as its ``id`` so clients can
+        reconnect with ``Last-Event-ID`` without missing or repeating events.
+
+        Args:
+            request: Incoming request (used for disconnect detection)
+            git_manager: Git manager instance
+            cursor: Starting cursor
+            project_key: Single project to follow (all projects if None)
+            streams: Stream names to follow (all if None)
+            event_type: Filter by event type
+            actor: Filter by actor
+            follow: Keep the connection open for new events (False drains
+                the backlog after the cursor and closes)
+        """
+        streams = list(streams) if streams else None
+        last_sent = time.monotonic()
+
+        yield f"retry: {int(self.poll_interval * 2000)}\n\n"
+
+        while True:
+            # Log scans do file I/O; keep them off the event loop
+            records = await asyncio.to_thread(
+                self.poll, git_manager, cursor, project_key, streams, event_type, actor
+            )
+            for stream, record, snapshot in records:
+                yield self.format_event(stream, record, snapshot)
+                last_sent = time.monotonic()
+
+            if not follow or await request.is_disconnected():
+                break
+
+            if time.monotonic() - last_sent >= self.heartbeat_interval:
+                yield ": keep-alive\n\n"
+                last_sent = time.monotonic()
+
+            await asyncio.sleep(self.poll_interval)
+
+    def format_event(self, stream: str, record: Dict[str, Any], cursor: Cursor) -> str:
+        """Format a record as an SSE frame."""
+        return (
+            f"id: {self.encode_cursor(cursor)}\n"
+            f"event: {stream}\n"
+            f"data: {json.dumps(record)}\n\n"
+        )
+
+    # Private helper methods
+
+    def _logs(
+        self,
+        git_manager,
+        project_key: Optional[str],
+        streams: Optional[Iterable[str]],
+    ) -> List[Tuple[str, Any]]:
+        """Resolve (cursor key, segmented log) pairs for the followed logs."""
+        names = [s for s in (streams or STREAM_FILES) if s in STREAM_FILES]
+
+        if project_key:
+            project_keys = [project_key]
+        else:
+            base_path = Path(git_manager.base_path)
+            project_keys = sorted(
+                p.name
+                for p in base_path.iterdir()
+                if p.is_dir() and not p.name.startswith(".")
+            )
+
+        return [
+            (f"{key}/{name}", git_manager.open_log(key, STREAM_FILES[name]))
+            for key in project_keys
+            for name in names
+        ]
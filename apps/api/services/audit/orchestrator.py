@@ -1,15 +1,16 @@
 """
 Audit Orchestrator - coordinates audit operations and history.
-Single Responsibility: Coordinate event logging, rule execution, and history tracking.
+Single Responsibility: Coordinate event logging, rule execution, history and trend tracking.
 """
 
-import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 
-from domain.audit.constants import DEFAULT_QUERY_LIMIT
+from domain.audit.constants import DEFAULT_QUERY_LIMIT, AUDIT_HISTORY_LOG
+from domain.audit.enums import TrendResolution
 from .event_logger import AuditEventLogger
 from .rules_engine import AuditRulesEngine
+from .trends import AuditTrendService
 
 
 class AuditOrchestrator:
@@ -19,6 +20,7 @@ class AuditOrchestrator:
         self,
         event_logger: AuditEventLogger = None,
         rules_engine: AuditRulesEngine = None,
+        trend_service: AuditTrendService = None,
     ):
         """
         Initialize audit orchestrator.
@@ -26,9 +28,11 @@ class AuditOrchestrator:
         Args:
             event_logger: Event logger instance (creates new if None)
             rules_engine: Rules engine instance (creates new if None)
+            trend_service: Trend service instance (creates new if None)
         """
         self.event_logger = event_logger or AuditEventLogger()
         self.rules_engine = rules_engine or AuditRulesEngine()
+        self.trend_service = trend_service or AuditTrendService()
 
     def save_audit_history(
         self,
@@ -37,17 +41,13 @@ class AuditOrchestrator:
         git_manager,
     ) -> None:
         """
-        Save audit result to history.
+        Save audit result to history and fold it into the trend series.
 
         Args:
             project_key: Project key
             audit_result: Audit result dictionary
             git_manager: Git manager instance
         """
-        project_path = git_manager.get_project_path(project_key)
-        history_path = project_path / "audit" / "history.ndjson"
-        history_path.parent.mkdir(parents=True, exist_ok=True)
-
         entry = {
             "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
             "total_issues": audit_result.get("total_issues", 0),
@@ -55,9 +55,8 @@ class AuditOrchestrator:
             "rule_violations": audit_result.get("rule_violations", {}),
         }
 
-        entry_line = json.dumps(entry)
-        with history_path.open("a") as f:
-            f.write(entry_line + "\n")
+        git_manager.open_log(project_key, AUDIT_HISTORY_LOG).append(entry)
+        self.trend_service.update(project_key, entry, git_manager)
 
     def get_audit_history(
         self,
@@ -76,21 +75,34 @@ class AuditOrchestrator:
         Returns:
             List of audit history entries (newest first)
         """
-        project_path = git_manager.get_project_path(project_key)
-        history_path = project_path / "audit" / "history.ndjson"
+        # Read backwards from EOF so cost scales with limit, not history size
+        return git_manager.open_log(project_key, AUDIT_HISTORY_LOG).tail(limit)
 
-        if not history_path.exists():
-            return []
+    def get_audit_trends(
+        self,
+        project_key: Optional[str],
+        git_manager,
+        resolution: TrendResolution = TrendResolution.DAILY,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve downsampled audit trends.
 
-        entries = []
-        with history_path.open("r") as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        entry = json.loads(line)
-                        entries.append(entry)
-                    except json.JSONDecodeError:
-                        continue
+        Args:
+            project_key: Project key (all projects merged if None)
+            git_manager: Git manager instance
+            resolution: Bucket size
+            since: Only buckets containing or after this time
+            until: Only buckets starting at or before this time
 
-        entries.reverse()
-        return entries[:limit]
+        Returns:
+            List of trend points (oldest bucket first)
+        """
+        if project_key is None:
+            return self.trend_service.get_portfolio_trends(
+                git_manager, resolution, since, until
+            )
+        return self.trend_service.get_trends(
+            project_key, git_manager, resolution, since, until
+        )
@@ -0,0 +1,360 @@
+"""
+Audit Trends - precomputed, downsampled audit history series.
+Single Responsibility: Maintain hourly/daily/weekly aggregates of audit runs
+so trend queries never rescan the raw history log.
+
+Aggregates live in ``audit/trends.json`` under the project's cache directory
+(``.cache/<project>/``, excluded from git by GitManager) and are updated
+incrementally each time an audit result is saved. Each bucket keeps run
+counts plus sum/min/max of the completeness score, total issues and per-rule
+violation counts, so averages can be derived and buckets from several
+projects can be merged for portfolio views. A run without violations of a
+rule counts as 0 for that rule, so a rule's min and avg both cover every run
+of the bucket. If the file is missing it is rebuilt from
+``audit/history.ndjson``.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from domain.audit.constants import (
+    AUDIT_HISTORY_LOG,
+    AUDIT_TRENDS_FILE,
+    TREND_RETENTION,
+)
+from domain.audit.enums import TrendResolution
+from ..ndjson import file_lock
+
+logger = logging.getLogger(__name__)
+
+TRENDS_VERSION = 2
+
+# Bucket = {"runs": int, "completeness_score": Stat, "total_issues": Stat,
+#           "rule_violations": {rule: Stat}}; Stat = {"sum", "min", "max"}
+Bucket = Dict[str, Any]
+
+
+def bucket_start(timestamp: datetime, resolution: TrendResolution) -> str:
+    """
+    Return the ISO key of the bucket containing a timestamp.
+
+    Weekly buckets start on Monday (ISO weeks). Naive timestamps are UTC.
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    ts = timestamp.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    if resolution != TrendResolution.HOURLY:
+        ts = ts.replace(hour=0)
+    if resolution == TrendResolution.WEEKLY:
+        ts -= timedelta(days=ts.weekday())
+    return ts.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    try:
+        ts = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def _add_stat(stat: Optional[Dict[str, float]], value: float) -> Dict[str, float]:
+    if stat is None:
+        return {"sum": value, "min": value, "max": value}
+    stat["sum"] += value
+    stat["min"] = min(stat["min"], value)
+    stat["max"] = max(stat["max"], value)
+    return stat
+
+
+def _merge_stat(
+    stat: Optional[Dict[str, float]], other: Dict[str, float]
+) -> Dict[str, float]:
+    if stat is None:
+        return dict(other)
+    stat["sum"] += other["sum"]
+    stat["min"] = min(stat["min"], other["min"])
+    stat["max"] = max(stat["max"], other["max"])
+    return stat
+
+
+def _include_zero(stat: Dict[str, float]) -> Dict[str, float]:
+    """Account for runs without violations of a rule in its stat."""
+    stat["min"] = min(stat["min"], 0.0)
+    return stat
+
+
+def add_entry(bucket: Bucket, entry: Dict[str, Any]) -> Bucket:
+    """Fold one audit history entry into a bucket (in place)."""
+    runs = bucket.get("runs", 0)
+    bucket["runs"] = runs + 1
+    for field in ("completeness_score", "total_issues"):
+        bucket[field] = _add_stat(bucket.get(field), float(entry.get(field) or 0))
+    rules = bucket.setdefault("rule_violations", {})
+    counts = entry.get("rule_violations") or {}
+    for rule, stat in rules.items():
+        if rule not in counts:
+            _include_zero(stat)
+    for rule, count in counts.items():
+        stat = rules.get(rule)
+        rules[rule] = _add_stat(stat, float(count or 0))
+        if stat is None and runs:
+            # Earlier runs of the bucket had no violations of this rule
+            _include_zero(rules[rule])
+    return bucket
+
+
+def merge_buckets(bucket: Bucket, other: Bucket) -> Bucket:
+    """Fold another bucket into a bucket (in place)."""
+    runs = bucket.get("runs", 0)
+    bucket["runs"] = runs + other.get("runs", 0)
+    for field in ("completeness_score", "total_issues"):
+        if field in other:
+            bucket[field] = _merge_stat(bucket.get(field), other[field])
+    rules = bucket.setdefault("rule_violations", {})
+    other_rules = other.get("rule_violations", {})
+    for rule, stat in rules.items():
+        if rule not in other_rules and other.get("runs"):
+            _include_zero(stat)
+    for rule, stat in other_rules.items():
+        merged = _merge_stat(rules.get(rule), stat)
+        if rule not in rules and runs:
+            _include_zero(merged)
+        rules[rule] = merged
+    return bucket
+
+
+def summarize_bucket(key: str, bucket: Bucket) -> Dict[str, Any]:
+    """Convert a stored bucket into an API trend point."""
+    runs = bucket.get("runs", 0) or 1
+
+    def summary(stat: Dict[str, float]) -> Dict[str, float]:
+        return {
+            "avg": round(stat["sum"] / runs, 4),
+            "min": stat["min"],
+            "max": stat["max"],
+        }
+
+    return {
+        "bucket": key,
+        "runs": bucket.get("runs", 0),
+        "completeness_score": summary(bucket["completeness_score"]),
+        "total_issues": summary(bucket["total_issues"]),
+        "rule_violations": {
+            rule: summary(stat)
+            for rule, stat in sorted(bucket.get("rule_violations", {}).items())
+        },
+    }
+
+
+class AuditTrendService:
+    """Service for maintaining and querying downsampled audit trends."""
+
+    def update(self, project_key: str, entry: Dict[str, Any], git_manager) -> None:
+        """
+        Fold a newly saved audit history entry into the project's trends.
+
+        Args:
+            project_key: Project key
+            entry: History entry (already appended to the history log)
+            git_manager: Git manager instance
+        """
+        timestamp = _parse_timestamp(entry.get("timestamp", ""))
+        if timestamp is None:
+            return
+
+        path = self._trends_path(project_key, git_manager)
+        with self._locked(path):
+            trends = self._read(path)
+            if trends is None:
+                # The history log already holds this entry
+                trends = self._build(self._history(project_key, git_manager))
+            else:
+                self._add(trends, entry, timestamp)
+            self._write(path, trends)
+
+    def get_trends(
+        self,
+        project_key: str,
+        git_manager,
+        resolution: TrendResolution = TrendResolution.DAILY,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return a project's trend series (oldest bucket first).
+
+        Args:
+            project_key: Project key
+            git_manager: Git manager instance
+            resolution: Bucket size
+            since: Only buckets containing or after this time
+            until: Only buckets starting at or before this time
+
+        Returns:
+            List of trend points
+        """
+        buckets = self._load(project_key, git_manager)[resolution.value]
+        return [
+            summarize_bucket(key, buckets[key])
+            for key in self._select(buckets, resolution, since, until)
+        ]
+
+    def get_portfolio_trends(
+        self,
+        git_manager,
+        resolution: TrendResolution = TrendResolution.DAILY,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        project_keys: Optional[Iterable[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return a trend series merged across projects (oldest bucket first).
+
+        Args:
+            git_manager: Git manager instance
+            resolution: Bucket size
+            since: Only buckets containing or after this time
+            until: Only buckets starting at or before this time
+            project_keys: Projects to include (all projects if None)
+
+        Returns:
+            List of trend points; ``projects`` counts contributing projects
+        """
+        if project_keys is None:
+            project_keys = self._project_keys(git_manager)
+
+        merged: Dict[str, Bucket] = {}
+        contributors: Dict[str, int] = {}
+        for project_key in project_keys:
+            buckets = self._load(project_key, git_manager)[resolution.value]
+            for key in self._select(buckets, resolution, since, until):
+                merge_buckets(merged.setdefault(key, {}), buckets[key])
+                contributors[key] = contributors.get(key, 0) + 1
+
+        return [
+            {**summarize_bucket(key, merged[key]), "projects": contributors[key]}
+            for key in sorted(merged)
+        ]
+
+    # Private helper methods
+
+    def _trends_path(self, project_key: str, git_manager) -> Path:
+        return git_manager.get_cache_path(project_key) / AUDIT_TRENDS_FILE
+
+    def _history(self, project_key: str, git_manager) -> Iterable[Dict[str, Any]]:
+        return git_manager.open_log(project_key, AUDIT_HISTORY_LOG).iter_records()
+
+    def _project_keys(self, git_manager) -> List[str]:
+        base_path = Path(git_manager.base_path)
+        if not base_path.exists():
+            return []
+        return sorted(
+            p.name
+            for p in base_path.iterdir()
+            if p.is_dir()
+            and not p.name.startswith(".")
+            and (p / AUDIT_HISTORY_LOG).parent.exists()
+        )
+
+    def _load(self, project_key: str, git_manager) -> Dict[str, Any]:
+        """Read trends, rebuilding them from history when missing."""
+        path = self._trends_path(project_key, git_manager)
+        trends = self._read(path)
+        if trends is not None:
+            return trends
+        history_dir = (
+            git_manager.get_project_path(project_key) / AUDIT_HISTORY_LOG
+        ).parent
+        if not history_dir.exists():
+            return self._empty()
+
+        with self._locked(path):
+            trends = self._read(path)
+            if trends is None:
+                trends = self._build(self._history(project_key, git_manager))
+                if any(trends[r.value] for r in TrendResolution):
+                    self._write(path, trends)
+        return trends
+
+    def _empty(self) -> Dict[str, Any]:
+        trends: Dict[str, Any] = {"version": TRENDS_VERSION}
+        for resolution in TrendResolution:
+            trends[resolution.value] = {}
+        return trends
+
+    def _build(self, entries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        trends = self._empty()
+        for entry in entries:
+            timestamp = _parse_timestamp(entry.get("timestamp", ""))
+            if timestamp is not None:
+                self._add(trends, entry, timestamp, prune=False)
+        for resolution in TrendResolution:
+            self._prune(trends[resolution.value], resolution)
+        return trends
+
+    def _add(
+        self,
+        trends: Dict[str, Any],
+        entry: Dict[str, Any],
+        timestamp: datetime,
+        prune: bool = True,
+    ) -> None:
+        for resolution in TrendResolution:
+            buckets = trends.setdefault(resolution.value, {})
+            add_entry(
+                buckets.setdefault(bucket_start(timestamp, resolution), {}), entry
+            )
+            if prune:
+                self._prune(buckets, resolution)
+
+    def _prune(self, buckets: Dict[str, Bucket], resolution: TrendResolution) -> None:
+        """Drop the oldest buckets beyond the resolution's retention."""
+        limit = TREND_RETENTION.get(resolution.value)
+        if limit is None or len(buckets) <= limit:
+            return
+        for key in sorted(buckets)[: len(buckets) - limit]:
+            del buckets[key]
+
+    def _select(
+        self,
+        buckets: Dict[str, Bucket],
+        resolution: TrendResolution,
+        since: Optional[datetime],
+        until: Optional[datetime],
+    ) -> List[str]:
+        # Keys are fixed-width ISO strings, so they compare chronologically
+        low = bucket_start(since, resolution) if since else None
+        high = bucket_start(until, resolution) if until else None
+        return [
+            key
+            for key in sorted(buckets)
+            if (low is None or key >= low) and (high is None or key <= high)
+        ]
+
+    def _read(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                trends = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Discarding unreadable audit trends at %s", path)
+            return None
+        if trends.get("version") != TRENDS_VERSION:
+            return None
+        return trends
+
+    def _write(self, path: Path, trends: Dict[str, Any]) -> None:
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(trends, f, separators=(",", ":"), sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def _locked(self, path: Path):
+        """Serialize read-modify-write of the trends file across processes."""
+        return file_lock(path.with_name(f".{path.name}.lock"))
@@ -8,9 +8,11 @@ DEPRECATED FACADE: Prefer using focused services directly for new code:
 - AuditOrchestrator for history and coordination
 """
 
+from datetime import datetime
 from typing import Dict, Any, Optional, List
 
 from domain.audit.constants import DEFAULT_QUERY_LIMIT
+from domain.audit.enums import TrendResolution
 from .audit.event_logger import AuditEventLogger
 from .audit.rules_engine import AuditRulesEngine
 from .audit.orchestrator import AuditOrchestrator
@@ -61,6 +63,7 @@ class AuditService:
         until: Optional[str] = None,
         limit: int = DEFAULT_QUERY_LIMIT,
         offset: int = 0,
+        newest_first: bool = False,
     ) -> Dict[str, Any]:
         """Delegate to AuditEventLogger."""
         return self.event_logger.get_audit_events(
@@ -72,6 +75,7 @@ class AuditService:
             until=until,
             limit=limit,
             offset=offset,
+            newest_first=newest_first,
         )
 
     def run_audit_rules(
@@ -117,6 +121,23 @@ class AuditService:
             limit=limit,
         )
 
+    def get_audit_trends(
+        self,
+        project_key: Optional[str],
+        git_manager,
+        resolution: TrendResolution = TrendResolution.DAILY,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Delegate to AuditOrchestrator."""
+        return self.orchestrator.get_audit_trends(
+            project_key=project_key,
+            git_manager=git_manager,
+            resolution=resolution,
+            since=since,
+            until=until,
+        )
+
     def _calculate_completeness_score(self, project_key: str, git_manager) -> float:
         """Delegate to AuditRulesEngine (for backward compatibility with tests)."""
         return self.rules_engine._calculate_completeness_score(
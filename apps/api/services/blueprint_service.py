@@ -5,6 +5,7 @@ Implements CRUD operations following DDD architecture:
 - Business logic and validation in service layer
 - Persistence delegated to GitManager (repository pattern)
 - Storage format: JSON files in .blueprints/{blueprint_id}.json
+- Reads are served from an in-memory registry of that directory
 """
 
 import json
@@ -19,6 +20,7 @@ try:
     )
     from ..domain.errors import not_found, reference_not_found
     from .git_manager import GitManager
+    from .registry_cache import JsonRegistry, get_registry
     from .template_service import TemplateService
 except ImportError:
     from domain.blueprints.models import (
@@ -28,6 +30,7 @@ except ImportError:
     )
     from domain.errors import not_found, reference_not_found
     from services.git_manager import GitManager
+    from services.registry_cache import JsonRegistry, get_registry
     from services.template_service import TemplateService
 
 
@@ -112,24 +115,7 @@ class BlueprintService:
         Returns:
             List of all blueprints (empty list if none exist)
         """
-        docs_path = Path(self.git_manager.base_path)
-        blueprint_path = docs_path / self.blueprint_dir
-
-        if not blueprint_path.exists():
-            return []
-
-        blueprints = []
-        for file_path in blueprint_path.glob("*.json"):
-            try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
-                    blueprint = Blueprint(**data)
-                    blueprints.append(blueprint)
-            except (json.JSONDecodeError, ValueError):
-                # Skip invalid files
-                continue
-
-        return blueprints
+        return self._registry().all()
 
     def update_blueprint(
         self, blueprint_id: str, blueprint_update: BlueprintUpdate
@@ -207,6 +193,7 @@ class BlueprintService:
         docs_path = Path(self.git_manager.base_path)
         file_path = docs_path / self.blueprint_dir / f"{blueprint_id}.json"
         file_path.unlink()
+        self._registry().invalidate()
 
         # Commit to git
         relative_path = f"{self.blueprint_dir}/{blueprint_id}.json"
@@ -216,20 +203,15 @@ class BlueprintService:
             [relative_path],
         )
 
+    def _registry(self) -> JsonRegistry[Blueprint]:
+        """Registry of the blueprint directory."""
+        return get_registry(
+            Path(self.git_manager.base_path) / self.blueprint_dir, Blueprint
+        )
+
     def _get_blueprint_by_id(self, blueprint_id: str) -> Optional[Blueprint]:
         """Internal helper to retrieve blueprint by ID."""
-        docs_path = Path(self.git_manager.base_path)
-        file_path = docs_path / self.blueprint_dir / f"{blueprint_id}.json"
-
-        if not file_path.exists():
-            return None
-
-        try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-                return Blueprint(**data)
-        except (json.JSONDecodeError, ValueError):
-            return None
+        return self._registry().get(blueprint_id)
 
     def _save_blueprint(self, blueprint: Blueprint) -> None:
         """Internal helper to save blueprint to disk."""
@@ -240,6 +222,7 @@ class BlueprintService:
         file_path = blueprint_path / f"{blueprint.id}.json"
         with open(file_path, "w") as f:
             json.dump(blueprint.model_dump(), f, indent=2)
+        self._registry().invalidate()
 
     def _validate_template_references(self, template_ids: List[str]) -> None:
         """
@@ -251,7 +234,7 @@ class BlueprintService:
         Raises:
             ValueError: If any template doesn't exist
         """
+        templates = self.template_service.get_templates(template_ids)
         for template_id in template_ids:
-            template = self.template_service.get_template(template_id)
-            if not template:
+            if template_id not in templates:
                 raise ValueError(reference_not_found("template", template_id))
@@ -0,0 +1,235 @@
+"""
+Command history index - global, time-ordered index of command executions.
+Single Responsibility: Page through command history across all projects
+without loading every project's command log.
+
+Every logged command appends a small row (id, project, command, status,
+created_at) to ``.cache/commands.index.ndjson`` under the documents root, and
+status changes append update records. Listing scans the index newest first
+from a cursor, so a page costs O(page size) - plus any rows skipped by
+filters - no matter how many commands have ever run. Full command records
+are then fetched by id from the per-project command logs.
+
+The index is derived data: it is not committed (GitManager excludes
+``.cache/`` from git), it is never compacted (so cursor positions stay
+valid), and it is rebuilt from the project command logs the first time it
+is needed.
+"""
+
+import base64
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .ndjson import (
+    LogPosition,
+    SegmentedLog,
+    file_lock,
+    get_indexed_store,
+    merge_records,
+)
+from .ndjson.indexed_store import UPDATE_FIELD
+
+# Per-project command log (relative to the project directory)
+COMMANDS_LOG = "commands/commands.ndjson"
+
+# Global index (relative to the documents root)
+INDEX_LOG = ".cache/commands.index.ndjson"
+
+# Command fields copied into index rows; only status changes afterwards
+INDEX_FIELDS = ("id", "project_key", "command", "status", "created_at")
+MUTABLE_FIELDS = ("status",)
+
+# Rows resolved per batch when a status filter may reject candidates
+SCAN_BATCH = 64
+
+
+def index_row(command_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the index row for a command record."""
+    return {
+        field: _plain(command_data.get(field))
+        for field in INDEX_FIELDS
+        if field in command_data
+    }
+
+
+def _plain(value: Any) -> Any:
+    """Store enum members (e.g. CommandStatus) by value."""
+    return getattr(value, "value", value)
+
+
+class CommandHistoryIndex:
+    """Global command history index with cursor pagination."""
+
+    def __init__(self, git_manager):
+        """
+        Initialize command history index.
+
+        Args:
+            git_manager: Git manager whose documents root holds the index
+        """
+        self.git_manager = git_manager
+        self.base_path = Path(git_manager.base_path)
+        self.store = get_indexed_store(
+            SegmentedLog(self.base_path / INDEX_LOG, time_field="created_at")
+        )
+
+    def record(self, command_data: Dict[str, Any]) -> None:
+        """
+        Add a command to the index.
+
+        Call before the command is written to its project log, so that a
+        first-time rebuild never indexes it twice.
+        """
+        self._ensure_built()
+        self.store.put(index_row(command_data))
+
+    def update(self, command_id: str, fields: Dict[str, Any]) -> None:
+        """Record changes to a command's indexed fields (e.g. status)."""
+        changed = {
+            field: _plain(fields[field]) for field in MUTABLE_FIELDS if field in fields
+        }
+        if not changed:
+            return
+        self._ensure_built()
+        self.store.update(command_id, changed)
+
+    def get(self, command_id: str) -> Optional[Dict[str, Any]]:
+        """Return the index row of a command (with its current status), or None."""
+        self._ensure_built()
+        return self.store.get(command_id)
+
+    def page(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        project_key: Optional[str] = None,
+        command: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Return index rows (newest first) matching exact-match filters.
+
+        Args:
+            limit: Maximum rows to return (all if None)
+            cursor: Resume after the position encoded by a previous call
+            project_key: Only commands of this project
+            command: Only commands of this type
+            status: Only commands currently in this status
+
+        Returns:
+            Tuple of (rows, next cursor or None when exhausted)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        before = self.decode_cursor(cursor) if cursor else None
+        status = _plain(status)
+        self._ensure_built()
+
+        # Without a status filter every candidate matches; read one extra to
+        # learn whether another page exists
+        batch_size = SCAN_BATCH if status else (limit + 1 if limit else SCAN_BATCH)
+
+        page: List[Tuple[Dict[str, Any], LogPosition]] = []
+        seen = set()
+        batch: List[Tuple[Dict[str, Any], LogPosition]] = []
+        scan = self.store.log.iter_reversed_spans(before)
+        try:
+            for row, position in scan:
+                if UPDATE_FIELD in row or row.get("id") in seen:
+                    continue
+                if project_key is not None and row.get("project_key") != project_key:
+                    continue
+                if command is not None and row.get("command") != command:
+                    continue
+                seen.add(row.get("id"))
+                batch.append((row, position))
+                if len(batch) >= batch_size:
+                    page.extend(self._resolve(batch, status))
+                    batch = []
+                    if limit is not None and len(page) > limit:
+                        break
+            else:
+                page.extend(self._resolve(batch, status))
+        finally:
+            scan.close()
+
+        if limit is not None and len(page) > limit:
+            return [row for row, _ in page[:limit]], self.encode_cursor(
+                page[limit - 1][1]
+            )
+        return [row for row, _ in page], None
+
+    # Cursor handling
+
+    @staticmethod
+    def encode_cursor(position: LogPosition) -> str:
+        """Encode an index position as an opaque token."""
+        raw = json.dumps(list(position), separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(token: str) -> LogPosition:
+        """
+        Decode a cursor produced by encode_cursor.
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            segment_id, offset = json.loads(base64.urlsafe_b64decode(token.encode()))
+            return int(segment_id), int(offset)
+        except Exception as e:
+            raise ValueError(f"Invalid command cursor: {token}") from e
+
+    # Private helper methods
+
+    def _resolve(
+        self, batch: List[Tuple[Dict[str, Any], LogPosition]], status: Optional[str]
+    ) -> List[Tuple[Dict[str, Any], LogPosition]]:
+        """Merge status updates into a batch of rows and apply the status filter."""
+        if not batch:
+            return []
+        current = self.store.get_many(row["id"] for row, _ in batch)
+        resolved = []
+        for row, position in batch:
+            row = current.get(row["id"], row)
+            if status is None or row.get("status") == status:
+                resolved.append((row, position))
+        return resolved
+
+    def _is_built(self) -> bool:
+        log = self.store.log
+        return log.path.exists() or log.manifest_path.exists()
+
+    def _ensure_built(self) -> None:
+        if self._is_built():
+            return
+        with self._build_lock():
+            if not self._is_built():
+                self._build()
+
+    def _build(self) -> int:
+        """Index every command in the project logs (build lock held)."""
+        commands: List[Dict[str, Any]] = []
+        if self.base_path.exists():
+            for project_dir in sorted(self.base_path.iterdir()):
+                if not project_dir.is_dir() or project_dir.name.startswith("."):
+                    continue
+                log = SegmentedLog(project_dir / COMMANDS_LOG, time_field="created_at")
+                if log.path.exists() or log.manifest_path.exists():
+                    commands.extend(merge_records(log.iter_records()))
+
+        commands.sort(key=lambda c: str(c.get("created_at") or ""))
+        log = self.store.log
+        log.path.parent.mkdir(parents=True, exist_ok=True)
+        log.append_many(index_row(c) for c in commands)
+        # An empty file marks the index as built
+        log.path.touch()
+        return len(commands)
+
+    def _build_lock(self):
+        """Serialize index builds across processes."""
+        path = self.store.log.path
+        return file_lock(path.with_name(f".{path.name}.build.lock"))
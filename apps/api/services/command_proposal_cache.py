@@ -0,0 +1,276 @@
+"""
+Command proposal cache - bounded, durable storage for pending command proposals.
+Single Responsibility: Keep proposals between propose and apply, across
+restarts and across worker processes on one host.
+
+Proposals are written through to a SQLite database (WAL mode, so several
+uvicorn workers can share it) and kept in a small LRU memory tier that saves
+re-parsing them. SQLite is the authority: a memory hit is only served while
+its row still exists, and ``pop`` claims a proposal atomically, so a proposal
+applied by one worker cannot be applied again by another. Both tiers honour a
+TTL, so abandoned proposals expire instead of accumulating.
+
+Configuration (environment):
+    COMMAND_PROPOSAL_DB           SQLite file (default: $PROJECT_DOCS_PATH/.cache/command_proposals.sqlite3,
+                                  excluded from git by GitManager)
+    COMMAND_PROPOSAL_TTL_SECONDS  proposal lifetime in seconds (default: 86400)
+    COMMAND_PROPOSAL_CACHE_SIZE   proposals kept in memory (default: 256)
+
+If the database cannot be opened the cache logs a warning and runs
+memory-only, matching the previous in-process behaviour.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MEMORY_ENTRIES = 256
+
+# Expired rows are purged at most this often (seconds)
+PURGE_INTERVAL = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS command_proposals (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS command_proposals_expires_at
+    ON command_proposals (expires_at);
+"""
+
+
+class CommandProposalCache:
+    """TTL + LRU memory tier in front of a shared SQLite store."""
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+    ):
+        """
+        Initialize command proposal cache.
+
+        Args:
+            path: SQLite database file (memory-only if None)
+            ttl_seconds: Lifetime of a proposal after it is stored
+            max_memory_entries: Proposals kept in the memory tier
+        """
+        self.path = Path(path) if path is not None else None
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max(0, max_memory_entries)
+        self._memory: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._store_failed = False
+        self._last_purge = 0.0
+
+    @classmethod
+    def from_env(cls) -> "CommandProposalCache":
+        """Build a cache from COMMAND_PROPOSAL_* environment variables."""
+        path = os.getenv("COMMAND_PROPOSAL_DB") or (
+            Path(os.getenv("PROJECT_DOCS_PATH", "/projectDocs"))
+            / ".cache"
+            / "command_proposals.sqlite3"
+        )
+        return cls(
+            path=path,
+            ttl_seconds=float(
+                os.getenv("COMMAND_PROPOSAL_TTL_SECONDS", str(DEFAULT_TTL_SECONDS))
+            ),
+            max_memory_entries=int(
+                os.getenv("COMMAND_PROPOSAL_CACHE_SIZE", str(DEFAULT_MEMORY_ENTRIES))
+            ),
+        )
+
+    def get(self, proposal_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a stored proposal, or None if unknown or expired.
+
+        Args:
+            proposal_id: Proposal ID
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            cached = self._memory.get(proposal_id)
+            if cached is not None:
+                if cached[1] > now and (
+                    conn is None or self._stored(conn, proposal_id, now)
+                ):
+                    self._memory.move_to_end(proposal_id)
+                    return cached[0]
+                # Expired, or applied/removed by another worker
+                del self._memory[proposal_id]
+
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT data, expires_at FROM command_proposals "
+                "WHERE id = ? AND expires_at > ?",
+                (proposal_id, now),
+            ).fetchone()
+            if row is None:
+                return None
+
+            proposal = json.loads(row[0])
+            self._remember(proposal_id, proposal, row[1])
+            return proposal
+
+    def put(self, proposal_id: str, proposal: Dict[str, Any]) -> None:
+        """
+        Store a proposal in both tiers.
+
+        Args:
+            proposal_id: Proposal ID
+            proposal: Proposal data (must be JSON serializable)
+        """
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        with self._lock:
+            conn = self._connection()
+            if conn is not None:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO command_proposals (id, data, expires_at) "
+                        "VALUES (?, ?, ?)",
+                        (proposal_id, json.dumps(proposal), expires_at),
+                    )
+            self._purge_expired(conn, now)
+            self._remember(proposal_id, proposal, expires_at)
+
+    def pop(self, proposal_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Remove a proposal from both tiers.
+
+        With a store the removal is an atomic claim: when several workers pop
+        the same proposal, only one of them gets it back.
+
+        Args:
+            proposal_id: Proposal ID
+
+        Returns:
+            The removed proposal, or None if it was not stored or expired
+        """
+        now = time.time()
+        with self._lock:
+            cached = self._memory.pop(proposal_id, None)
+            conn = self._connection()
+            if conn is None:
+                if cached is None or cached[1] <= now:
+                    return None
+                return cached[0]
+            with conn:
+                row = conn.execute(
+                    "DELETE FROM command_proposals WHERE id = ? "
+                    "RETURNING data, expires_at",
+                    (proposal_id,),
+                ).fetchone()
+            if row is None or row[1] <= now:
+                return None
+            return json.loads(row[0])
+
+    def clear(self) -> None:
+        """Remove every proposal from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            conn = self._connection()
+            if conn is not None:
+                with conn:
+                    conn.execute("DELETE FROM command_proposals")
+
+    def close(self) -> None:
+        """Close the database connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def memory_size(self) -> int:
+        """Number of proposals currently held in memory."""
+        with self._lock:
+            return len(self._memory)
+
+    # Mapping-style access (CommandService.proposals used to be a dict)
+
+    def __contains__(self, proposal_id: str) -> bool:
+        return self.get(proposal_id) is not None
+
+    def __getitem__(self, proposal_id: str) -> Dict[str, Any]:
+        proposal = self.get(proposal_id)
+        if proposal is None:
+            raise KeyError(proposal_id)
+        return proposal
+
+    def __setitem__(self, proposal_id: str, proposal: Dict[str, Any]) -> None:
+        self.put(proposal_id, proposal)
+
+    def __delitem__(self, proposal_id: str) -> None:
+        if self.pop(proposal_id) is None:
+            raise KeyError(proposal_id)
+
+    # Private helper methods
+
+    def _remember(
+        self, proposal_id: str, proposal: Dict[str, Any], expires_at: float
+    ) -> None:
+        # Memory-only mode has nowhere to spill to, so it only expires by TTL
+        durable = self._conn is not None
+        if durable and not self.max_memory_entries:
+            return
+        self._memory[proposal_id] = (proposal, expires_at)
+        self._memory.move_to_end(proposal_id)
+        if durable:
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    @staticmethod
+    def _stored(conn: sqlite3.Connection, proposal_id: str, now: float) -> bool:
+        row = conn.execute(
+            "SELECT 1 FROM command_proposals WHERE id = ? AND expires_at > ?",
+            (proposal_id, now),
+        ).fetchone()
+        return row is not None
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite store on first use; None when running memory-only."""
+        if self._conn is not None or self.path is None or self._store_failed:
+            return self._conn
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error):
+            logger.warning(
+                "Command proposal store %s unavailable; keeping proposals in memory",
+                self.path,
+                exc_info=True,
+            )
+            self._store_failed = True
+            return None
+        self._conn = conn
+        return conn
+
+    def _purge_expired(self, conn: Optional[sqlite3.Connection], now: float) -> None:
+        if now - self._last_purge < PURGE_INTERVAL:
+            return
+        self._last_purge = now
+        if conn is not None:
+            with conn:
+                conn.execute(
+                    "DELETE FROM command_proposals WHERE expires_at <= ?", (now,)
+                )
+        for proposal_id in [k for k, (_, exp) in self._memory.items() if exp <= now]:
+            del self._memory[proposal_id]
@@ -0,0 +1,449 @@
+"""
+Command queue - background execution of global commands.
+Single Responsibility: Run propose/apply jobs on a bounded worker pool,
+outside the HTTP request that submitted them.
+
+``POST /api/v1/commands`` enqueues a job and returns 202 straight away. A
+pool of asyncio workers then runs the jobs. Jobs for one project run one at
+a time, in submission order, because they write to the same project tree.
+Jobs for different projects run in parallel, up to the pool size. Once
+``max_depth`` jobs are waiting, new submissions are rejected. Pending and
+running jobs can be cancelled. Every status change is written to the command
+history log, so clients can poll ``GET /api/v1/commands/{id}`` or subscribe
+to its event stream.
+
+On shutdown, waiting jobs are recorded as cancelled and jobs that are
+already applying are allowed to commit. Every record names the process that
+owns it, so at startup ``recover`` can mark commands left pending or running
+by a process that is gone (e.g. after a crash) as failed.
+
+Configuration (environment):
+    COMMAND_WORKERS          jobs executed concurrently (default: 4)
+    COMMAND_QUEUE_MAX_DEPTH  waiting jobs before submissions are rejected (default: 100)
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from domain.commands.models import CommandStatus
+
+try:
+    from .monitoring_service import MetricsCollector
+except ImportError:
+    from monitoring_service import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_DEPTH = 100
+
+# Suggested client back-off when the queue is full (seconds)
+RETRY_AFTER_SECONDS = 5
+
+TERMINAL_STATUSES = (
+    CommandStatus.SUCCESS,
+    CommandStatus.FAILED,
+    CommandStatus.CANCELLED,
+)
+
+
+class QueueFullError(Exception):
+    """Raised when a command is submitted to a full queue."""
+
+    def __init__(self, depth: int, retry_after: int = RETRY_AFTER_SECONDS):
+        super().__init__(f"Command queue is full ({depth} waiting): retry later")
+        self.depth = depth
+        self.retry_after = retry_after
+
+
+class CommandNotCancellableError(Exception):
+    """Raised when a command can no longer be cancelled."""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _worker_id() -> str:
+    """Owner of commands submitted by this process."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _owner_alive(owner: Optional[str]) -> bool:
+    """Whether the process that owns a command may still be running it."""
+    if not owner:
+        return False
+    host, _, pid = owner.rpartition(":")
+    if host != socket.gethostname():
+        # Cannot tell from here; the owning host recovers its own commands
+        return True
+    try:
+        pid_number = int(pid)
+    except ValueError:
+        return False
+    if pid_number == os.getpid():
+        # A previous process that had our pid
+        return False
+    try:
+        os.kill(pid_number, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class CommandJob:
+    """A queued command execution."""
+
+    def __init__(
+        self, record: Dict[str, Any], git_manager, llm_service, enqueued_at: float
+    ):
+        self.record = record
+        self.git_manager = git_manager
+        self.llm_service = llm_service
+        self.enqueued_at = enqueued_at
+        self.task: Optional[asyncio.Task] = None
+        self.applying = False
+        self.changed = asyncio.Event()
+
+    @property
+    def command_id(self) -> str:
+        return self.record["id"]
+
+    @property
+    def project_key(self) -> str:
+        return self.record["project_key"]
+
+
+class CommandQueue:
+    """Bounded, per-project ordered command queue with an asyncio worker pool."""
+
+    def __init__(
+        self,
+        command_service,
+        max_workers: int = DEFAULT_WORKERS,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+    ):
+        """
+        Initialize command queue.
+
+        Args:
+            command_service: CommandService executing propose/apply
+            max_workers: Jobs executed concurrently
+            max_depth: Waiting jobs before submissions are rejected
+        """
+        self.command_service = command_service
+        self.max_workers = max(1, max_workers)
+        self.max_depth = max(1, max_depth)
+
+        # Waiting jobs per project, oldest first
+        self._pending: Dict[str, Deque[CommandJob]] = {}
+        # Waiting and running jobs by command id
+        self._jobs: Dict[str, CommandJob] = {}
+        # Projects with a running job / projects waiting in the ready queue
+        self._busy: Set[str] = set()
+        self._scheduled: Set[str] = set()
+
+        self._ready: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def from_env(cls, command_service) -> "CommandQueue":
+        """Build a queue from COMMAND_* environment variables."""
+        return cls(
+            command_service,
+            max_workers=int(os.getenv("COMMAND_WORKERS", str(DEFAULT_WORKERS))),
+            max_depth=int(os.getenv("COMMAND_QUEUE_MAX_DEPTH", str(DEFAULT_MAX_DEPTH))),
+        )
+
+    def submit(
+        self,
+        project_key: str,
+        command: str,
+        params: Dict[str, Any],
+        git_manager,
+        llm_service,
+    ) -> Dict[str, Any]:
+        """
+        Log a command as pending and queue it for execution.
+
+        Must be called from the event loop the workers should run on.
+
+        Returns:
+            The command history record
+
+        Raises:
+            ValueError: If the command is unknown
+            QueueFullError: If ``max_depth`` jobs are already waiting
+        """
+        if command not in self.command_service.handlers:
+            raise ValueError(f"Unknown command: {command}")
+        self._ensure_started()
+
+        depth = self.depth()
+        if depth >= self.max_depth:
+            MetricsCollector.record_command_job(command, "rejected")
+            raise QueueFullError(depth)
+
+        record = {
+            "id": str(uuid.uuid4()),
+            "project_key": project_key,
+            "command": command,
+            "params": params,
+            "status": CommandStatus.PENDING,
+            "created_at": _now(),
+            "worker": _worker_id(),
+        }
+        self.command_service.log_command(record, git_manager)
+
+        job = CommandJob(record, git_manager, llm_service, time.monotonic())
+        self._jobs[job.command_id] = job
+        self._pending.setdefault(project_key, deque()).append(job)
+        self._schedule(project_key)
+        self._update_metrics()
+        return dict(record)
+
+    async def cancel(self, command_id: str) -> bool:
+        """
+        Cancel a waiting or running command.
+
+        Running commands are interrupted at their next await (typically the
+        LLM call) and this returns once the cancellation is recorded.
+
+        Returns:
+            True if cancelled, False if the command is not queued here
+
+        Raises:
+            CommandNotCancellableError: If the command is already applying
+        """
+        job = self._jobs.get(command_id)
+        if job is None:
+            return False
+
+        if job.task is None:
+            self._pending[job.project_key].remove(job)
+            if not self._pending[job.project_key]:
+                del self._pending[job.project_key]
+            self._finish(job, CommandStatus.CANCELLED, completed_at=_now())
+            MetricsCollector.record_command_job(job.record["command"], "cancelled")
+            return True
+
+        if job.applying:
+            raise CommandNotCancellableError(
+                f"Command {command_id} is applying: changes are being committed"
+            )
+        job.task.cancel()
+        await asyncio.wait([job.task])
+        return True
+
+    def get(self, command_id: str) -> Optional[Dict[str, Any]]:
+        """Return the live record of a queued or running command."""
+        job = self._jobs.get(command_id)
+        return dict(job.record) if job is not None else None
+
+    async def wait_for_change(self, command_id: str, timeout: float) -> None:
+        """Wait until a local command changes status, or ``timeout`` passes."""
+        job = self._jobs.get(command_id)
+        if job is None:
+            await asyncio.sleep(timeout)
+            return
+        try:
+            await asyncio.wait_for(job.changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def depth(self) -> int:
+        """Number of waiting jobs."""
+        return sum(len(jobs) for jobs in self._pending.values())
+
+    def running(self) -> int:
+        """Number of running jobs."""
+        return len(self._busy)
+
+    def recover(self, git_manager) -> int:
+        """
+        Fail commands left pending or running by a process that is gone.
+
+        Call at startup. Commands owned by a live process (another API
+        worker) or by another host are left alone.
+
+        Returns:
+            Number of commands marked as failed
+        """
+        recovered = 0
+        for status in (CommandStatus.PENDING, CommandStatus.RUNNING):
+            records, _ = self.command_service.list_commands_page(
+                git_manager, status=status.value
+            )
+            for record in records:
+                if record["id"] in self._jobs or _owner_alive(record.get("worker")):
+                    continue
+                try:
+                    self.command_service.update_command(
+                        record["id"],
+                        {
+                            "project_key": record["project_key"],
+                            "status": CommandStatus.FAILED,
+                            "completed_at": _now(),
+                            "error_message": "Interrupted by a server restart",
+                        },
+                        git_manager,
+                    )
+                except Exception:
+                    logger.exception("Failed to recover command %s", record["id"])
+                    continue
+                recovered += 1
+        if recovered:
+            logger.warning("Marked %d interrupted command(s) as failed", recovered)
+        return recovered
+
+    async def stop(self) -> None:
+        """
+        Stop the workers.
+
+        Waiting jobs are recorded as cancelled. Jobs that are applying run to
+        completion, so files they wrote are committed; other running jobs are
+        cancelled at their next await.
+        """
+        for jobs in list(self._pending.values()):
+            for job in jobs:
+                self._finish(
+                    job,
+                    CommandStatus.CANCELLED,
+                    completed_at=_now(),
+                    error_message="Cancelled by server shutdown",
+                )
+                MetricsCollector.record_command_job(job.record["command"], "cancelled")
+        self._pending.clear()
+
+        running = [job for job in self._jobs.values() if job.task is not None]
+        for job in running:
+            if not job.applying:
+                job.task.cancel()
+        if running:
+            await asyncio.wait([job.task for job in running])
+
+        for task in self._workers:
+            task.cancel()
+        if self._workers:
+            await asyncio.wait(self._workers)
+        self._workers = []
+        self._loop = None
+
+    # Private helper methods
+
+    def _ensure_started(self) -> None:
+        """Start workers on the running loop (again, if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._workers:
+            return
+        self._loop = loop
+        self._ready = asyncio.Queue()
+        # Jobs that were running on a previous loop are gone with it
+        self._busy.clear()
+        self._scheduled.clear()
+        for project_key in list(self._pending):
+            self._schedule(project_key)
+        self._workers = [
+            loop.create_task(self._worker()) for _ in range(self.max_workers)
+        ]
+
+    def _schedule(self, project_key: str) -> None:
+        """Make a project runnable unless it is running or already scheduled."""
+        if project_key in self._busy or project_key in self._scheduled:
+            return
+        if self._pending.get(project_key):
+            self._scheduled.add(project_key)
+            self._ready.put_nowait(project_key)
+
+    async def _worker(self) -> None:
+        while True:
+            project_key = await self._ready.get()
+            self._scheduled.discard(project_key)
+            jobs = self._pending.get(project_key)
+            if not jobs:
+                continue
+            job = jobs.popleft()
+            if not jobs:
+                del self._pending[project_key]
+
+            self._busy.add(project_key)
+            self._update_metrics()
+            try:
+                job.task = asyncio.ensure_future(self._run(job))
+                # wait() does not propagate the job's own cancellation
+                await asyncio.wait([job.task])
+                if job.command_id in self._jobs:
+                    # Cancelled before it started running
+                    self._finish(job, CommandStatus.CANCELLED, completed_at=_now())
+            finally:
+                self._busy.discard(project_key)
+                self._schedule(project_key)
+                self._update_metrics()
+
+    async def _run(self, job: CommandJob) -> None:
+        started = time.monotonic()
+        MetricsCollector.record_command_queue_wait(started - job.enqueued_at)
+        self._set_status(job, CommandStatus.RUNNING, started_at=_now())
+
+        try:
+            proposal = await self.command_service.propose_command(
+                job.project_key,
+                job.record["command"],
+                job.record["params"],
+                job.llm_service,
+                job.git_manager,
+            )
+            job.applying = True
+            result = await self.command_service.apply_proposal(
+                proposal["proposal_id"], job.git_manager, log_content=False
+            )
+        except asyncio.CancelledError:
+            status = CommandStatus.CANCELLED
+            self._finish(job, status, completed_at=_now())
+        except Exception as e:
+            logger.warning("Command %s failed: %s", job.command_id, e)
+            status = CommandStatus.FAILED
+            self._finish(job, status, completed_at=_now(), error_message=str(e))
+        else:
+            status = CommandStatus.SUCCESS
+            self._finish(
+                job,
+                status,
+                completed_at=_now(),
+                proposal_id=proposal["proposal_id"],
+                commit_hash=result["commit_hash"],
+            )
+        MetricsCollector.record_command_job(
+            job.record["command"], status.value, time.monotonic() - started
+        )
+
+    def _set_status(
+        self, job: CommandJob, status: CommandStatus, **fields: Any
+    ) -> None:
+        """Persist a status change and wake subscribers."""
+        fields = {"project_key": job.project_key, "status": status, **fields}
+        job.record.update(fields)
+        try:
+            self.command_service.update_command(job.command_id, fields, job.git_manager)
+        except Exception:
+            logger.exception("Failed to record status of command %s", job.command_id)
+        job.changed.set()
+        job.changed = asyncio.Event()
+
+    def _finish(self, job: CommandJob, status: CommandStatus, **fields: Any) -> None:
+        self._jobs.pop(job.command_id, None)
+        self._set_status(job, status, **fields)
+        self._update_metrics()
+
+    def _update_metrics(self) -> None:
+        MetricsCollector.set_command_queue_state(self.depth(), self.running())
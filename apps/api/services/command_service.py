@@ -2,11 +2,15 @@
 Command service for handling project commands with propose/apply flow.
 """
 
+import asyncio
 import uuid
 import hashlib
-import json
 from pathlib import Path
-from typing import Dict, Any, List, Optional, TYPE_CHECKING
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple, TYPE_CHECKING
+from .command_index import COMMANDS_LOG, CommandHistoryIndex
+from .command_proposal_cache import CommandProposalCache
+from .llm_service import TokenRelay
+from .ndjson import fold_updates, get_indexed_store
 from .commands import (
     AssessGapsHandler,
     GenerateArtifactHandler,
@@ -20,10 +24,15 @@ if TYPE_CHECKING:
 class CommandService:
     """Service for handling project commands."""
 
-    def __init__(self):
-        """Initialize command service."""
-        # Store proposals in memory (in production, use Redis or similar)
-        self.proposals: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, proposals: Optional[CommandProposalCache] = None):
+        """
+        Initialize command service.
+
+        Args:
+            proposals: Pending proposal cache (defaults to the environment cache)
+        """
+        # Bounded memory tier over a SQLite store shared by all workers
+        self.proposals = proposals or CommandProposalCache.from_env()
 
         # Initialize command handlers (Strategy pattern)
         self.handlers = {
@@ -69,31 +78,73 @@ class CommandService:
 
         return proposal_data
 
+    async def propose_command_stream(
+        self,
+        project_key: str,
+        command: str,
+        params: Dict[str, Any],
+        llm_service,
+        git_manager,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Generate a proposal while streaming the LLM output.
+
+        Yields ``("token", chunk)`` for each chunk of LLM output as it
+        arrives, then ``("proposal", proposal_data)`` once the proposal has
+        been assembled and stored exactly as propose_command does. Errors of
+        propose_command are raised after the tokens seen so far.
+        """
+        relay = TokenRelay(llm_service)
+        task = asyncio.ensure_future(
+            self.propose_command(project_key, command, params, relay, git_manager)
+        )
+        try:
+            while True:
+                token = asyncio.ensure_future(relay.tokens.get())
+                await asyncio.wait({token, task}, return_when=asyncio.FIRST_COMPLETED)
+                if not token.done():
+                    token.cancel()
+                    break
+                yield "token", token.result()
+            while not relay.tokens.empty():
+                yield "token", relay.tokens.get_nowait()
+            yield "proposal", task.result()
+        finally:
+            # Client went away mid-stream: stop generating
+            if not task.done():
+                task.cancel()
+
     async def apply_proposal(
         self, proposal_id: str, git_manager, log_content: bool = False
     ) -> Dict[str, Any]:
         """Apply a previously proposed command."""
-        if proposal_id not in self.proposals:
+        # Claim the proposal so no other worker applies it concurrently
+        proposal = self.proposals.pop(proposal_id)
+        if proposal is None:
             from domain.errors import not_found
 
             raise ValueError(not_found("Proposal", proposal_id))
 
-        proposal = self.proposals[proposal_id]
         project_key = proposal["project_key"]
 
-        # Write all files
-        changed_files = []
-        for file_change in proposal["file_changes"]:
-            path = file_change["path"]
-            content = file_change.get("content", "")
-
-            git_manager.write_file(project_key, path, content)
-            changed_files.append(path)
-
-        # Commit changes
-        commit_hash = git_manager.commit_changes(
-            project_key, proposal["draft_commit_message"], changed_files
-        )
+        try:
+            # Write all files
+            changed_files = []
+            for file_change in proposal["file_changes"]:
+                path = file_change["path"]
+                content = file_change.get("content", "")
+
+                git_manager.write_file(project_key, path, content)
+                changed_files.append(path)
+
+            # Commit changes
+            commit_hash = git_manager.commit_changes(
+                project_key, proposal["draft_commit_message"], changed_files
+            )
+        except BaseException:
+            # Not applied; keep it available for a retry
+            self.proposals.put(proposal_id, proposal)
+            raise
 
         # Log event
         event_data = {
@@ -119,9 +170,6 @@ class CommandService:
 
         git_manager.log_event(project_key, event_data)
 
-        # Clean up proposal
-        del self.proposals[proposal_id]
-
         return {
             "commit_hash": commit_hash,
             "changed_files": changed_files,
@@ -131,43 +179,20 @@ class CommandService:
     def persist_proposal(
         self, project_key: str, proposal_data: Dict[str, Any], git_manager: "GitManager"
     ) -> None:
-        """Persist proposal to NDJSON file."""
-        proposals_dir = Path(git_manager.base_path) / project_key / "proposals"
-        proposals_dir.mkdir(parents=True, exist_ok=True)
-        proposals_file = proposals_dir / "proposals.ndjson"
-
-        # Append proposal as NDJSON line
-        with open(proposals_file, "a") as f:
-            f.write(json.dumps(proposal_data) + "\n")
+        """Persist proposal to the proposals NDJSON log."""
+        self._proposals_store(project_key, git_manager).put(proposal_data)
 
     def load_proposals(
         self, project_key: str, git_manager: "GitManager"
     ) -> List[Dict[str, Any]]:
-        """Load all proposals for a project from NDJSON file."""
-        proposals_file = (
-            Path(git_manager.base_path) / project_key / "proposals" / "proposals.ndjson"
-        )
-
-        if not proposals_file.exists():
-            return []
-
-        proposals = []
-        with open(proposals_file, "r") as f:
-            for line in f:
-                if line.strip():
-                    proposals.append(json.loads(line))
-
-        return proposals
+        """Load all proposals for a project (updates merged)."""
+        return self._proposals_store(project_key, git_manager).load_all()
 
     def load_proposal(
         self, project_key: str, proposal_id: str, git_manager: "GitManager"
     ) -> Optional[Dict[str, Any]]:
-        """Load a specific proposal by ID."""
-        proposals = self.load_proposals(project_key, git_manager)
-        for proposal in proposals:
-            if proposal.get("id") == proposal_id:
-                return proposal
-        return None
+        """Load a specific proposal by ID via the proposal index."""
+        return self._proposals_store(project_key, git_manager).get(proposal_id)
 
     def update_proposal(
         self,
@@ -176,72 +201,26 @@ class CommandService:
         updated_data: Dict[str, Any],
         git_manager: "GitManager",
     ) -> None:
-        """Update a proposal in NDJSON file."""
-        import fcntl
-
-        proposals_file = (
-            Path(git_manager.base_path) / project_key / "proposals" / "proposals.ndjson"
-        )
-
-        if not proposals_file.exists():
+        """Append an update record for a proposal (no file rewrite)."""
+        store = self._proposals_store(project_key, git_manager)
+        if not store.contains(proposal_id):
             return
-
-        # Read all proposals with file locking to prevent race conditions
-        with open(proposals_file, "r+") as f:
-            # Acquire exclusive lock
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-            try:
-                proposals = []
-                for line in f:
-                    if line.strip():
-                        proposals.append(json.loads(line))
-
-                # Update the specific proposal
-                for i, proposal in enumerate(proposals):
-                    if proposal.get("id") == proposal_id:
-                        proposals[i] = updated_data
-                        break
-
-                # Write all proposals back
-                f.seek(0)
-                f.truncate()
-                for proposal in proposals:
-                    f.write(json.dumps(proposal) + "\n")
-            finally:
-                # Release lock
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        store.update(proposal_id, updated_data)
 
     def log_command(
         self, command_data: Dict[str, Any], git_manager: "GitManager"
     ) -> None:
-        """Log a command execution to NDJSON file."""
+        """Log a command execution to the segmented commands log."""
         project_key = command_data.get("project_key")
-        commands_dir = Path(git_manager.base_path) / project_key / "commands"
-        commands_dir.mkdir(parents=True, exist_ok=True)
-        commands_file = commands_dir / "commands.ndjson"
-
-        # Append command as NDJSON line
-        with open(commands_file, "a") as f:
-            f.write(json.dumps(command_data) + "\n")
+        # Index first: a first-time index build must not see it twice
+        CommandHistoryIndex(git_manager).record(command_data)
+        self._commands_store(project_key, git_manager).put(command_data)
 
     def load_commands(
         self, project_key: str, git_manager: "GitManager"
     ) -> List[Dict[str, Any]]:
-        """Load all commands for a project from NDJSON file."""
-        commands_file = (
-            Path(git_manager.base_path) / project_key / "commands" / "commands.ndjson"
-        )
-
-        if not commands_file.exists():
-            return []
-
-        commands = []
-        with open(commands_file, "r") as f:
-            for line in f:
-                if line.strip():
-                    commands.append(json.loads(line))
-
-        return commands
+        """Load all commands for a project (updates merged)."""
+        return self._commands_store(project_key, git_manager).load_all()
 
     def load_all_commands(
         self, git_manager: "GitManager", project_key_filter: Optional[str] = None
@@ -259,60 +238,106 @@ class CommandService:
             if project_key_filter and project_dir.name != project_key_filter:
                 continue
 
-            commands_file = project_dir / "commands" / "commands.ndjson"
-            if commands_file.exists():
-                with open(commands_file, "r") as f:
-                    for line in f:
-                        if line.strip():
-                            all_commands.append(json.loads(line))
+            all_commands.extend(self.load_commands(project_dir.name, git_manager))
 
         return all_commands
 
     def load_command(
         self, command_id: str, git_manager: "GitManager"
     ) -> Optional[Dict[str, Any]]:
-        """Load a specific command by ID across all projects."""
-        all_commands = self.load_all_commands(git_manager)
-        for command in all_commands:
-            if command.get("id") == command_id:
-                return command
-        return None
+        """
+        Load a specific command by ID via the command index.
+
+        The index row names the command's project, so only that project's
+        command log is read.
+        """
+        row = CommandHistoryIndex(git_manager).get(command_id)
+        if row is None:
+            return None
+        return self._commands_store(row["project_key"], git_manager).get(command_id)
 
     def update_command(
         self, command_id: str, updated_data: Dict[str, Any], git_manager: "GitManager"
     ) -> None:
-        """Update a command in NDJSON file."""
-        import fcntl
+        """
+        Update a command in the commands log.
 
+        Appends an update record that readers merge into the command, so the
+        cost does not grow with the size of the log. Updates are folded into
+        their commands when the active segment is sealed.
+        """
         project_key = updated_data.get("project_key")
-        commands_file = (
-            Path(git_manager.base_path) / project_key / "commands" / "commands.ndjson"
+        store = self._commands_store(project_key, git_manager)
+        if not store.contains(command_id):
+            return
+        store.update(command_id, updated_data)
+        CommandHistoryIndex(git_manager).update(command_id, updated_data)
+
+    def list_commands_page(
+        self,
+        git_manager: "GitManager",
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        project_key: Optional[str] = None,
+        command: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        List commands across projects (newest first) via the global index.
+
+        Only the commands on the requested page are read from their project
+        logs, so the cost depends on the page size, not on history length.
+
+        Args:
+            git_manager: Git manager instance
+            limit: Page size (all matching commands if None)
+            cursor: Cursor returned with the previous page
+            project_key: Filter by project
+            command: Filter by command type
+            status: Filter by current status
+
+        Returns:
+            Tuple of (commands, next cursor or None when exhausted)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        rows, next_cursor = CommandHistoryIndex(git_manager).page(
+            limit=limit,
+            cursor=cursor,
+            project_key=project_key,
+            command=command,
+            status=status,
         )
 
-        if not commands_file.exists():
-            return
+        by_project: Dict[str, List[str]] = {}
+        for row in rows:
+            by_project.setdefault(row["project_key"], []).append(row["id"])
+        loaded: Dict[str, Dict[str, Any]] = {}
+        for key, ids in by_project.items():
+            loaded.update(self._commands_store(key, git_manager).get_many(ids))
+
+        # Fall back to the index row if the project log lacks the command
+        return [loaded.get(row["id"], row) for row in rows], next_cursor
+
+    def _commands_store(self, project_key: str, git_manager: "GitManager"):
+        """Open the indexed commands log for a project."""
+        return get_indexed_store(
+            git_manager.open_log(
+                project_key,
+                COMMANDS_LOG,
+                time_field="created_at",
+                compact=fold_updates,
+            )
+        )
 
-        # Read all commands with file locking to prevent race conditions
-        with open(commands_file, "r+") as f:
-            # Acquire exclusive lock
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-            try:
-                commands = []
-                for line in f:
-                    if line.strip():
-                        commands.append(json.loads(line))
-
-                # Update the specific command
-                for i, command in enumerate(commands):
-                    if command.get("id") == command_id:
-                        commands[i] = updated_data
-                        break
-
-                # Write all commands back
-                f.seek(0)
-                f.truncate()
-                for command in commands:
-                    f.write(json.dumps(command) + "\n")
-            finally:
-                # Release lock
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    def _proposals_store(self, project_key: str, git_manager: "GitManager"):
+        """Open the indexed proposals log for a project."""
+        return get_indexed_store(
+            git_manager.open_log(
+                project_key,
+                "proposals/proposals.ndjson",
+                time_field="created_at",
+                compact=fold_updates,
+            )
+        )
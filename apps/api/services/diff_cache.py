@@ -0,0 +1,131 @@
+"""
+Diff cache - content-addressed cache of rendered diffs.
+Single Responsibility: Avoid recomputing the same diff for the same pair of
+contents.
+
+A proposal's diff is computed when the proposal is created, again when its
+preview is verified, again whenever a client re-requests it, and again on
+apply. Entries are keyed by (old content hash, new content hash,
+context_lines, normalize flag), so any caller diffing the same contents gets
+the cached result regardless of where the contents came from.
+
+Entries hold the diff hunks (without the ``---``/``+++`` file headers, which
+callers choose) and the added/removed counts. The cache is an LRU bounded by
+the memory its entries occupy rather than by entry count, because one large
+artifact diff can outweigh thousands of small ones.
+
+Configuration (environment):
+    DIFF_CACHE_MAX_BYTES  memory budget in bytes, 0 disables (default: 16 MiB)
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from .monitoring_service import MetricsCollector
+except ImportError:
+    from monitoring_service import MetricsCollector
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+# Approximate per-entry cost of the key, stats tuple and LRU bookkeeping
+ENTRY_OVERHEAD = 512
+
+# (old hash, new hash, context_lines, normalize_whitespace)
+DiffKey = Tuple[str, str, int, bool]
+
+
+class DiffCache:
+    """Thread-safe LRU of rendered diffs bounded by approximate memory size."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize diff cache.
+
+        Args:
+            max_bytes: Memory budget for cached entries (0 disables caching)
+        """
+        self.max_bytes = max(0, max_bytes)
+        self._entries: "OrderedDict[DiffKey, Tuple[Dict[str, Any], int]]" = (
+            OrderedDict()
+        )
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "DiffCache":
+        """Build a cache from DIFF_CACHE_* environment variables."""
+        try:
+            max_bytes = int(os.getenv("DIFF_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES)))
+        except ValueError:
+            max_bytes = DEFAULT_MAX_BYTES
+        return cls(max_bytes=max_bytes)
+
+    def get(self, key: DiffKey) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of the cached entry for ``key``, or None on a miss.
+
+        Entries contain ``body``, ``added``, ``removed`` and ``summarized``.
+        """
+        if not self.max_bytes:
+            return None
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+        MetricsCollector.record_diff_cache_lookup(cached is not None)
+        return dict(cached[0]) if cached is not None else None
+
+    def put(self, key: DiffKey, entry: Dict[str, Any]) -> None:
+        """Store an entry, evicting least recently used entries to fit."""
+        size = sys.getsizeof(entry["body"]) + ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (dict(entry), size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+            entries, size = len(self._entries), self._size
+        MetricsCollector.set_diff_cache_size(entries, size)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = 0
+        MetricsCollector.set_diff_cache_size(0, 0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate memory held by cached entries."""
+        return self._size
+
+
+_shared: Optional[DiffCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_diff_cache() -> DiffCache:
+    """Return the process-wide diff cache shared by DiffService instances."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = DiffCache.from_env()
+        return _shared
@@ -0,0 +1,417 @@
+"""
+Diff engine - fast unified diffs for small and large documents.
+Single Responsibility: Compute line opcodes between two texts and render them
+in ``difflib.unified_diff`` format.
+
+``difflib`` compares whole line lists with a quadratic worst case, even when
+most of a document is unchanged. This engine:
+
+- drops the common prefix and suffix before matching, since most edits
+  touch a small region of a document;
+- interns lines as integers so comparisons are cheap;
+- uses ``difflib.SequenceMatcher`` for small documents and small changed
+  regions, so everyday edits produce the same diff as before;
+- uses patience diff for large regions: lines that are unique in both
+  versions act as anchors, and the gaps between anchors are diffed
+  recursively;
+- replaces the whole changed region with a single hunk when it exceeds a
+  line budget. The diff stays exact and applicable, but it is not minimal.
+
+Rendering matches ``difflib.unified_diff(..., lineterm="")`` byte for byte
+for the same opcodes.
+
+``merge3`` combines two edits of a common base (diff3 style): changes that
+touch different base lines merge cleanly, overlapping changes become
+conflict regions.
+"""
+
+import difflib
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# (tag, i1, i2, j1, j2) as produced by SequenceMatcher.get_opcodes()
+Opcode = Tuple[str, int, int, int, int]
+
+# Documents / changed regions (old + new lines) above this skip plain difflib
+PATIENCE_THRESHOLD = 2000
+
+# Largest len(a) * len(b) handed to SequenceMatcher inside patience gaps
+MATCHER_BUDGET = 1_000_000
+
+
+def diff_opcodes(
+    old_lines: Sequence[str],
+    new_lines: Sequence[str],
+    max_lines: Optional[int] = None,
+) -> Tuple[List[Opcode], bool]:
+    """
+    Compute opcodes turning ``old_lines`` into ``new_lines``.
+
+    Args:
+        old_lines: Original lines
+        new_lines: Modified lines
+        max_lines: Budget for the changed region (old + new lines) of large
+            documents; larger regions become a single replace opcode
+
+    Returns:
+        Tuple of (opcodes, summarized) where ``summarized`` is True when the
+        budget forced the single-replace fallback
+    """
+    n_old, n_new = len(old_lines), len(new_lines)
+    if n_old + n_new <= PATIENCE_THRESHOLD:
+        # Small documents: exactly what difflib.unified_diff would produce
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+        return matcher.get_opcodes(), False
+
+    prefix = 0
+    limit = min(n_old, n_new)
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while (
+        suffix < limit
+        and old_lines[n_old - 1 - suffix] == new_lines[n_new - 1 - suffix]
+    ):
+        suffix += 1
+
+    old_mid = old_lines[prefix : n_old - suffix]
+    new_mid = new_lines[prefix : n_new - suffix]
+    summarized = False
+
+    if not old_mid and not new_mid:
+        middle: List[Opcode] = []
+    elif not old_mid:
+        middle = [("insert", 0, 0, 0, len(new_mid))]
+    elif not new_mid:
+        middle = [("delete", 0, len(old_mid), 0, 0)]
+    elif max_lines is not None and len(old_mid) + len(new_mid) > max_lines:
+        middle = [("replace", 0, len(old_mid), 0, len(new_mid))]
+        summarized = True
+    elif len(old_mid) + len(new_mid) <= PATIENCE_THRESHOLD:
+        middle = difflib.SequenceMatcher(None, old_mid, new_mid).get_opcodes()
+    else:
+        a, b = _intern(old_mid, new_mid)
+        middle = _opcodes_from_pairs(_patience_pairs(a, b), len(a), len(b))
+
+    opcodes: List[Opcode] = []
+    if prefix:
+        opcodes.append(("equal", 0, prefix, 0, prefix))
+    for tag, i1, i2, j1, j2 in middle:
+        _append(opcodes, (tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+    if suffix:
+        _append(opcodes, ("equal", n_old - suffix, n_old, n_new - suffix, n_new))
+    return opcodes, summarized
+
+
+def group_opcodes(opcodes: List[Opcode], n: int = 3) -> Iterator[List[Opcode]]:
+    """Group opcodes into hunks with ``n`` context lines (as difflib does)."""
+    codes = list(opcodes) or [("equal", 0, 1, 0, 1)]
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    nn = n + n
+    group: List[Opcode] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > nn:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def render_unified(
+    old_lines: Sequence[str],
+    new_lines: Sequence[str],
+    opcodes: List[Opcode],
+    fromfile: str = "",
+    tofile: str = "",
+    n: int = 3,
+) -> Iterator[str]:
+    """Render opcodes as unified diff lines (without line terminators)."""
+    started = False
+    for group in group_opcodes(opcodes, n):
+        if not started:
+            started = True
+            yield f"--- {fromfile}"
+            yield f"+++ {tofile}"
+
+        first, last = group[0], group[-1]
+        old_range = _format_range(first[1], last[2])
+        new_range = _format_range(first[3], last[4])
+        yield f"@@ -{old_range} +{new_range} @@"
+
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in old_lines[i1:i2]:
+                    yield " " + line
+                continue
+            if tag in ("replace", "delete"):
+                for line in old_lines[i1:i2]:
+                    yield "-" + line
+            if tag in ("replace", "insert"):
+                for line in new_lines[j1:j2]:
+                    yield "+" + line
+
+
+def merge3(
+    base_lines: Sequence[str],
+    ours_lines: Sequence[str],
+    theirs_lines: Sequence[str],
+    ours_label: str = "ours",
+    theirs_label: str = "theirs",
+) -> Tuple[List[str], int]:
+    """
+    Three-way merge of two edits of ``base_lines``.
+
+    Changes from both sides are located in base coordinates. Changes that
+    overlap - or an insertion at the edge of another change, whose order
+    would be ambiguous - form one region; if both sides changed a region
+    differently it is emitted between conflict markers.
+
+    Args:
+        base_lines: Common ancestor
+        ours_lines: First edit (kept above the ``=======`` marker)
+        theirs_lines: Second edit
+        ours_label: Label after ``<<<<<<<``
+        theirs_label: Label after ``>>>>>>>``
+
+    Returns:
+        Tuple of (merged lines, number of conflict regions)
+    """
+    hunks = [
+        (i1, i2, j1, j2, side)
+        for side, lines in ((0, ours_lines), (1, theirs_lines))
+        for tag, i1, i2, j1, j2 in diff_opcodes(base_lines, lines)[0]
+        if tag != "equal"
+    ]
+    hunks.sort(key=lambda hunk: (hunk[0], hunk[1]))
+
+    merged: List[str] = []
+    conflicts = 0
+    position = 0
+    for region in _overlapping(hunks):
+        lo = min(hunk[0] for hunk in region)
+        hi = max(hunk[1] for hunk in region)
+        merged.extend(base_lines[position:lo])
+        position = hi
+
+        versions = []
+        for side, lines in ((0, ours_lines), (1, theirs_lines)):
+            own = [hunk for hunk in region if hunk[4] == side]
+            if not own:
+                versions.append(None)
+                continue
+            # Outside its own hunks a side equals the base
+            start = own[0][2] - (own[0][0] - lo)
+            stop = own[-1][3] + (hi - own[-1][1])
+            versions.append(list(lines[start:stop]))
+
+        ours, theirs = versions
+        if theirs is None or ours == theirs:
+            merged.extend(ours)
+        elif ours is None:
+            merged.extend(theirs)
+        else:
+            conflicts += 1
+            merged.append(f"<<<<<<< {ours_label}")
+            merged.extend(ours)
+            merged.append("=======")
+            merged.extend(theirs)
+            merged.append(f">>>>>>> {theirs_label}")
+    merged.extend(base_lines[position:])
+    return merged, conflicts
+
+
+# Private helpers
+
+
+def _overlapping(
+    hunks: List[Tuple[int, int, int, int, int]],
+) -> Iterator[List[Tuple[int, int, int, int, int]]]:
+    """Group hunks (sorted by base start) whose base ranges collide."""
+    region: List[Tuple[int, int, int, int, int]] = []
+    end = 0
+    insert_at_end = False
+    for hunk in hunks:
+        i1, i2 = hunk[0], hunk[1]
+        if region and (i1 < end or (i1 == end and (i1 == i2 or insert_at_end))):
+            region.append(hunk)
+            if i2 > end:
+                end, insert_at_end = i2, False
+            insert_at_end = insert_at_end or i1 == i2 == end
+            continue
+        if region:
+            yield region
+        region, end, insert_at_end = [hunk], i2, i1 == i2
+    if region:
+        yield region
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Convert a range to the "ed" format used in unified diff headers."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _append(opcodes: List[Opcode], opcode: Opcode) -> None:
+    """Append an opcode, merging adjacent equal runs."""
+    if opcodes and opcodes[-1][0] == "equal" and opcode[0] == "equal":
+        _, i1, _, j1, _ = opcodes[-1]
+        opcodes[-1] = ("equal", i1, opcode[2], j1, opcode[4])
+    elif opcode[1] != opcode[2] or opcode[3] != opcode[4]:
+        opcodes.append(opcode)
+
+
+def _intern(
+    old_lines: Sequence[str], new_lines: Sequence[str]
+) -> Tuple[List[int], List[int]]:
+    """Map lines to small integers so comparisons and hashing are cheap."""
+    ids: Dict[str, int] = {}
+    a = [ids.setdefault(line, len(ids)) for line in old_lines]
+    b = [ids.setdefault(line, len(ids)) for line in new_lines]
+    return a, b
+
+
+def _patience_pairs(a: List[int], b: List[int]) -> List[Tuple[int, int]]:
+    """Return matched (i, j) line pairs using patience diff."""
+    pairs: List[Tuple[int, int]] = []
+    # Work items, processed last-in first-out: a list of pairs to emit, or a
+    # (alo, ahi, blo, bhi) region still to match. An explicit stack avoids
+    # deep recursion on pathological inputs.
+    stack: List[object] = [(0, len(a), 0, len(b))]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            pairs.extend(item)
+            continue
+        alo, ahi, blo, bhi = item
+
+        head: List[Tuple[int, int]] = []
+        while alo < ahi and blo < bhi and a[alo] == b[blo]:
+            head.append((alo, blo))
+            alo += 1
+            blo += 1
+        tail: List[Tuple[int, int]] = []
+        while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+            ahi -= 1
+            bhi -= 1
+            tail.append((ahi, bhi))
+        tail.reverse()
+
+        anchors = _unique_anchors(a, b, alo, ahi, blo, bhi)
+        if not anchors:
+            pairs.extend(head)
+            pairs.extend(_fallback_pairs(a, b, alo, ahi, blo, bhi))
+            pairs.extend(tail)
+            continue
+
+        pairs.extend(head)
+        work: List[object] = []
+        matched: List[Tuple[int, int]] = []
+        prev_i, prev_j = alo, blo
+        for i, j in anchors:
+            # Gaps empty on either side cannot contain further matches
+            if prev_i < i and prev_j < j:
+                work.extend([matched, (prev_i, i, prev_j, j)])
+                matched = []
+            matched.append((i, j))
+            prev_i, prev_j = i + 1, j + 1
+        work.append(matched)
+        if prev_i < ahi and prev_j < bhi:
+            work.append((prev_i, ahi, prev_j, bhi))
+        work.append(tail)
+        stack.extend(reversed(work))
+    return pairs
+
+
+def _unique_anchors(
+    a: List[int], b: List[int], alo: int, ahi: int, blo: int, bhi: int
+) -> List[Tuple[int, int]]:
+    """
+    Longest increasing run of lines unique in both regions.
+
+    Returns (i, j) pairs ordered by i (and j).
+    """
+    count_a = Counter(a[alo:ahi])
+    count_b = Counter(b[blo:bhi])
+    position_b = {
+        line: j
+        for j, line in enumerate(b[blo:bhi], blo)
+        if count_b[line] == 1 and count_a.get(line) == 1
+    }
+    candidates = [
+        (i, position_b[line])
+        for i, line in enumerate(a[alo:ahi], alo)
+        if line in position_b
+    ]
+    if not candidates:
+        return []
+
+    # Patience sorting: longest subsequence increasing in j
+    tops: List[int] = []  # j of the top card per pile
+    top_index: List[int] = []  # candidate index of the top card per pile
+    back: List[int] = [-1] * len(candidates)
+    for index, (_, j) in enumerate(candidates):
+        pile = bisect_left(tops, j)
+        if pile == len(tops):
+            tops.append(j)
+            top_index.append(index)
+        else:
+            tops[pile] = j
+            top_index[pile] = index
+        back[index] = top_index[pile - 1] if pile else -1
+
+    anchors: List[Tuple[int, int]] = []
+    index = top_index[-1]
+    while index >= 0:
+        anchors.append(candidates[index])
+        index = back[index]
+    anchors.reverse()
+    return anchors
+
+
+def _fallback_pairs(
+    a: List[int], b: List[int], alo: int, ahi: int, blo: int, bhi: int
+) -> List[Tuple[int, int]]:
+    """Match a region without unique anchors; bounded to stay near-linear."""
+    if alo == ahi or blo == bhi or (ahi - alo) * (bhi - blo) > MATCHER_BUDGET:
+        return []
+    matcher = difflib.SequenceMatcher(None, a[alo:ahi], b[blo:bhi], autojunk=False)
+    return [
+        (alo + i + k, blo + j + k)
+        for i, j, size in matcher.get_matching_blocks()
+        for k in range(size)
+    ]
+
+
+def _opcodes_from_pairs(
+    pairs: List[Tuple[int, int]], n_old: int, n_new: int
+) -> List[Opcode]:
+    """Convert sorted matched line pairs into SequenceMatcher-style opcodes."""
+    opcodes: List[Opcode] = []
+    i = j = 0
+    for mi, mj in pairs + [(n_old, n_new)]:
+        if i < mi and j < mj:
+            opcodes.append(("replace", i, mi, j, mj))
+        elif i < mi:
+            opcodes.append(("delete", i, mi, j, j))
+        elif j < mj:
+            opcodes.append(("insert", i, i, j, mj))
+        if mi < n_old:
+            _append(opcodes, ("equal", mi, mi + 1, mj, mj + 1))
+        i, j = mi + 1, mj + 1
+    return opcodes
@@ -1,19 +1,55 @@
 """
 Diff service for generating deterministic, stable diffs.
 Handles conflict detection and ensures diff preview accuracy.
+
+Diffs are computed by ``diff_engine``: identical content short-circuits on
+its hash, large documents are diffed around their common prefix/suffix with
+patience diff, and changed regions beyond ``DIFF_MAX_LINES`` lines fall back
+to a single replace hunk (exact, but summarized rather than minimal).
+Rendered diffs are cached by content hash in the shared ``DiffCache``.
 """
 
-import difflib
 import hashlib
+import os
 from typing import Dict, Any, List, Optional, Tuple
 
+try:
+    from .diff_cache import DiffCache, get_diff_cache
+    from .diff_engine import diff_opcodes, merge3, render_unified
+except ImportError:
+    from diff_cache import DiffCache, get_diff_cache
+    from diff_engine import diff_opcodes, merge3, render_unified
+
+# Changed lines (old + new) diffed line by line before summarizing
+DEFAULT_MAX_DIFF_LINES = 200_000
+
+
+def _max_diff_lines_from_env() -> int:
+    """Resolve the configured diff size budget."""
+    try:
+        return int(os.getenv("DIFF_MAX_LINES", DEFAULT_MAX_DIFF_LINES))
+    except ValueError:
+        return DEFAULT_MAX_DIFF_LINES
+
 
 class DiffService:
     """Service for deterministic diff generation and conflict detection."""
 
-    def __init__(self):
-        """Initialize diff service."""
-        pass
+    def __init__(
+        self,
+        max_diff_lines: Optional[int] = None,
+        cache: Optional[DiffCache] = None,
+    ):
+        """
+        Initialize diff service.
+
+        Args:
+            max_diff_lines: Size budget for the changed region of a diff
+                (defaults to ``DIFF_MAX_LINES``)
+            cache: Rendered diff cache (defaults to the process-wide cache)
+        """
+        self.max_diff_lines = max_diff_lines or _max_diff_lines_from_env()
+        self.cache = cache if cache is not None else get_diff_cache()
 
     def generate_diff(
         self,
@@ -21,6 +57,8 @@ class DiffService:
         new_content: str,
         context_lines: int = 3,
         normalize_whitespace: bool = True,
+        fromfile: str = "a/artifact",
+        tofile: str = "b/artifact",
     ) -> str:
         """
         Generate deterministic unified diff between two content versions.
@@ -30,30 +68,62 @@ class DiffService:
             new_content: Modified content
             context_lines: Number of context lines (default 3)
             normalize_whitespace: Strip trailing whitespace (default True)
+            fromfile: Old file name in the diff header
+            tofile: New file name in the diff header
 
         Returns:
             Unified diff string (deterministic)
         """
-        # Normalize whitespace if requested (prevents diff noise)
-        if normalize_whitespace:
-            old_content = self._normalize_whitespace(old_content)
-            new_content = self._normalize_whitespace(new_content)
+        return self.compute_diff(
+            old_content,
+            new_content,
+            context_lines=context_lines,
+            normalize_whitespace=normalize_whitespace,
+            fromfile=fromfile,
+            tofile=tofile,
+        )["diff"]
+
+    def compute_diff(
+        self,
+        old_content: str,
+        new_content: str,
+        context_lines: int = 3,
+        normalize_whitespace: bool = True,
+        fromfile: str = "a/artifact",
+        tofile: str = "b/artifact",
+    ) -> Dict[str, Any]:
+        """
+        Generate a unified diff together with its statistics.
 
-        # Generate unified diff with consistent parameters
-        # Use keepends=False to avoid newline issues
-        old_lines = old_content.splitlines(keepends=False)
-        new_lines = new_content.splitlines(keepends=False)
+        Args:
+            old_content: Original content
+            new_content: Modified content
+            context_lines: Number of context lines (default 3)
+            normalize_whitespace: Strip trailing whitespace (default True)
+            fromfile: Old file name in the diff header
+            tofile: New file name in the diff header
 
-        diff = difflib.unified_diff(
-            old_lines,
-            new_lines,
-            fromfile="a/artifact",
-            tofile="b/artifact",
-            lineterm="",  # Don't add extra lineterm
-            n=context_lines,
-        )
+        Returns:
+            Dictionary with ``diff``, ``added`` and ``removed`` line counts,
+            and ``summarized`` (True if the size budget replaced the changed
+            region with a single hunk)
+        """
+        old_hash = self.compute_content_hash(old_content)
+        new_hash = self.compute_content_hash(new_content)
+        if old_hash == new_hash:
+            return {"diff": "", "added": 0, "removed": 0, "summarized": False}
+
+        key = (old_hash, new_hash, context_lines, normalize_whitespace)
+        entry = self.cache.get(key)
+        if entry is None:
+            entry = self._diff_body(
+                old_content, new_content, context_lines, normalize_whitespace
+            )
+            self.cache.put(key, entry)
 
-        return "\n".join(diff)
+        body = entry.pop("body")
+        entry["diff"] = f"--- {fromfile}\n+++ {tofile}\n{body}" if body else ""
+        return entry
 
     def generate_proposal_diff(
         self,
@@ -208,6 +278,40 @@ class DiffService:
             return "\n".join(result_lines) + "\n"
         return ""
 
+    def merge(
+        self,
+        base_content: str,
+        ours_content: str,
+        theirs_content: str,
+        ours_label: str = "current",
+        theirs_label: str = "proposed",
+    ) -> Dict[str, Any]:
+        """
+        Three-way merge two edits of the same base content.
+
+        Args:
+            base_content: Common ancestor
+            ours_content: Current content
+            theirs_content: Content with the proposed change applied
+            ours_label: Conflict marker label for the current side
+            theirs_label: Conflict marker label for the proposed side
+
+        Returns:
+            Dictionary with merged ``content`` (containing conflict markers
+            if any) and the number of ``conflicts``
+        """
+        merged, conflicts = merge3(
+            base_content.splitlines(keepends=False),
+            ours_content.splitlines(keepends=False),
+            theirs_content.splitlines(keepends=False),
+            ours_label=ours_label,
+            theirs_label=theirs_label,
+        )
+        return {
+            "content": "\n".join(merged) + "\n" if merged else "",
+            "conflicts": conflicts,
+        }
+
     def compute_content_hash(self, content: str) -> str:
         """
         Compute SHA-256 hash of content for conflict detection.
@@ -277,6 +381,49 @@ class DiffService:
                 "error": str(e),
             }
 
+    def _diff_body(
+        self,
+        old_content: str,
+        new_content: str,
+        context_lines: int,
+        normalize_whitespace: bool,
+    ) -> Dict[str, Any]:
+        """
+        Compute a diff's hunks (without file headers) and statistics.
+
+        Returns:
+            Dictionary with ``body``, ``added``, ``removed`` and ``summarized``
+        """
+        entry: Dict[str, Any] = {
+            "body": "",
+            "added": 0,
+            "removed": 0,
+            "summarized": False,
+        }
+
+        # Normalize whitespace if requested (prevents diff noise)
+        if normalize_whitespace:
+            old_content = self._normalize_whitespace(old_content)
+            new_content = self._normalize_whitespace(new_content)
+            if old_content == new_content:
+                return entry
+
+        # Use keepends=False to avoid newline issues
+        old_lines = old_content.splitlines(keepends=False)
+        new_lines = new_content.splitlines(keepends=False)
+
+        opcodes, summarized = diff_opcodes(old_lines, new_lines, self.max_diff_lines)
+        for tag, i1, i2, j1, j2 in opcodes:
+            if tag in ("replace", "delete"):
+                entry["removed"] += i2 - i1
+            if tag in ("replace", "insert"):
+                entry["added"] += j2 - j1
+        entry["summarized"] = summarized
+        # Skip the "---"/"+++" headers; compute_diff adds the caller's names
+        lines = render_unified(old_lines, new_lines, opcodes, n=context_lines)
+        entry["body"] = "\n".join(line for i, line in enumerate(lines) if i >= 2)
+        return entry
+
     def _normalize_whitespace(self, content: str) -> str:
         """
         Normalize whitespace in content to prevent diff noise.
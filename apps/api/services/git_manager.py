@@ -6,15 +6,45 @@ import json
 import git
 import subprocess
 import logging
+import threading
 import time
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 
 try:
+    from .diff_service import DiffService
     from .monitoring_service import MetricsCollector
+    from .ndjson import SegmentedLog, get_event_log_writer
+    from .tracing import span, traced
 except ImportError:
+    from diff_service import DiffService
     from monitoring_service import MetricsCollector
+    from ndjson import SegmentedLog, get_event_log_writer
+    from tracing import span, traced
+
+# Local caches (proposal store, command index, LLM responses, traces) live
+# under this directory of the documents root and are never committed.
+CACHE_DIR = ".cache"
+
+# Host-local files kept out of git status: the cache directory and the
+# flock files of the project logs (e.g. events/.audit.ndjson.lock)
+LOCAL_EXCLUDES = (f"/{CACHE_DIR}/", ".*.lock")
+
+# GitPython index updates are not thread-safe; one lock per repository is
+# shared by every GitManager (and the event log flusher) working on it.
+_repo_locks: Dict[str, threading.RLock] = {}
+_repo_locks_lock = threading.Lock()
+
+
+def _repo_lock(base_path: Path) -> threading.RLock:
+    """Return the process-wide lock guarding the repository at base_path."""
+    key = str(base_path.resolve())
+    with _repo_locks_lock:
+        lock = _repo_locks.get(key)
+        if lock is None:
+            lock = _repo_locks[key] = threading.RLock()
+        return lock
 
 
 class GitManager:
@@ -24,6 +54,9 @@ class GitManager:
         """Initialize git manager with base path."""
         self.base_path = Path(base_path)
         self.repo: Optional[git.Repo] = None
+        self.diff_service = DiffService()
+        # Held around every index change (add/remove + commit)
+        self.repo_lock = _repo_lock(self.base_path)
 
     def ensure_repository(self):
         """Ensure the base path is a git repository, initialize if needed."""
@@ -59,8 +92,9 @@ class GitManager:
                     "# Project Documents\n\nThis repository contains project management documents.\n"
                 )
                 try:
-                    self.repo.index.add(["README.md"])
-                    self.repo.index.commit("Initial commit")
+                    with self.repo_lock:
+                        self.repo.index.add(["README.md"])
+                        self.repo.index.commit("Initial commit")
                 except Exception:
                     logger.exception(
                         "Initial commit failed in new repo at %s", self.base_path
@@ -85,8 +119,9 @@ class GitManager:
                         readme_path.write_text(
                             "# Project Documents\n\nThis repository contains project management documents.\n"
                         )
-                        self.repo.index.add(["README.md"])
-                        self.repo.index.commit("Initial commit")
+                        with self.repo_lock:
+                            self.repo.index.add(["README.md"])
+                            self.repo.index.commit("Initial commit")
                         logger.warning(
                             "Reinitialized repository at %s, moved old .git to %s",
                             self.base_path,
@@ -126,8 +161,9 @@ class GitManager:
                             "# Project Documents\n\nThis repository contains project management documents.\n"
                         )
                     try:
-                        self.repo.index.add(["README.md"])
-                        self.repo.index.commit("Initial commit")
+                        with self.repo_lock:
+                            self.repo.index.add(["README.md"])
+                            self.repo.index.commit("Initial commit")
                     except Exception:
                         logger.exception(
                             "Initial commit failed after reinit at %s", self.base_path
@@ -137,6 +173,29 @@ class GitManager:
                     logger.exception(
                         "Failed to reinitialize repository at %s", self.base_path
                     )
+
+        if self.repo is not None:
+            self._exclude_local_files()
+
+    def _exclude_local_files(self):
+        """Keep LOCAL_EXCLUDES out of git status via the repo-local exclude file."""
+        exclude_path = Path(self.repo.git_dir) / "info" / "exclude"
+        try:
+            existing = exclude_path.read_text() if exclude_path.exists() else ""
+            lines = existing.splitlines()
+            missing = [pattern for pattern in LOCAL_EXCLUDES if pattern not in lines]
+            if not missing:
+                return
+            exclude_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(exclude_path, "a") as f:
+                if existing and not existing.endswith("\n"):
+                    f.write("\n")
+                f.write("".join(pattern + "\n" for pattern in missing))
+        except OSError:
+            logging.getLogger(__name__).warning(
+                "Could not exclude local files from git status in %s", self.base_path
+            )
+
     def get_sync_status(self) -> Dict[str, Any]:
         """Get the current synchronization status of the repository."""
         self.ensure_repository()
@@ -207,6 +266,11 @@ class GitManager:
         """Get the path for a specific project."""
         return self.base_path / project_key
 
+    def get_cache_path(self, project_key: str) -> Path:
+        """Get the host-local (uncommitted) cache directory of a project."""
+        return self.base_path / CACHE_DIR / project_key
+
+    @traced("git.create_project")
     def create_project(
         self, project_key: str, project_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -238,8 +302,9 @@ class GitManager:
             project_json_path.write_text(json.dumps(project_info, indent=2))
 
             # Commit
-            self.repo.index.add([str(project_json_path.relative_to(self.base_path))])
-            self.repo.index.commit(f"Create project {project_key}")
+            with self.repo_lock:
+                self.repo.index.add([str(project_json_path.relative_to(self.base_path))])
+                self.repo.index.commit(f"Create project {project_key}")
 
             # Record successful metrics
             duration = time.time() - start_time
@@ -254,6 +319,7 @@ class GitManager:
             MetricsCollector.record_git_operation("create_project", duration, status)
             raise
 
+    @traced("git.read_project_json")
     def read_project_json(self, project_key: str) -> Optional[Dict[str, Any]]:
         """Read project.json for a project."""
         project_json_path = self.get_project_path(project_key) / "project.json"
@@ -263,18 +329,21 @@ class GitManager:
 
     def write_file(self, project_key: str, relative_path: str, content: str):
         """Write a file within a project."""
-        project_path = self.get_project_path(project_key)
-        file_path = project_path / relative_path
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(content)
+        with span("fs.write", path=relative_path, bytes=len(content)):
+            project_path = self.get_project_path(project_key)
+            file_path = project_path / relative_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(content)
 
     def read_file(self, project_key: str, relative_path: str) -> Optional[str]:
         """Read a file within a project."""
-        file_path = self.get_project_path(project_key) / relative_path
-        if not file_path.exists():
-            return None
-        return file_path.read_text()
+        with span("fs.read", path=relative_path):
+            file_path = self.get_project_path(project_key) / relative_path
+            if not file_path.exists():
+                return None
+            return file_path.read_text()
 
+    @traced("git.commit_changes")
     def commit_changes(self, project_key: str, message: str, files: List[str]) -> str:
         """Stage and commit changes for a project."""
         start_time = time.time()
@@ -291,8 +360,11 @@ class GitManager:
                     relative_files.append(str(full_path.relative_to(self.base_path)))
 
             if relative_files:
-                self.repo.index.add(relative_files)
-                commit = self.repo.index.commit(message)
+                with self.repo_lock:
+                    with span("git.index.add", files=len(relative_files)):
+                        self.repo.index.add(relative_files)
+                    with span("git.index.commit"):
+                        commit = self.repo.index.commit(message)
                 result = commit.hexsha
             else:
                 result = ""
@@ -310,6 +382,26 @@ class GitManager:
             MetricsCollector.record_git_operation("commit", duration, status)
             raise
 
+    def iter_file_versions(
+        self, project_key: str, relative_path: str, max_count: int = 50
+    ) -> Iterator[str]:
+        """Yield committed contents of a project file, newest first."""
+        repo_path = (self.get_project_path(project_key) / relative_path).relative_to(
+            self.base_path
+        ).as_posix()
+        try:
+            commits = self.repo.iter_commits(paths=repo_path, max_count=max_count)
+            for commit in commits:
+                try:
+                    blob = commit.tree / repo_path
+                except KeyError:
+                    # Deleted in this commit
+                    continue
+                yield blob.data_stream.read().decode("utf-8")
+        except (git.GitCommandError, ValueError):
+            return
+
+    @traced("git.get_diff")
     def get_diff(self, project_key: str, file_path: str, content: str) -> str:
         """Generate unified diff for proposed changes."""
         project_path = self.get_project_path(project_key)
@@ -317,44 +409,21 @@ class GitManager:
 
         if not full_path.exists():
             # New file
-            lines = content.split("\n")
-            diff_lines = [
-                "--- /dev/null",
-                f"+++ b/{project_key}/{file_path}",
-                "@@ -0,0 +1," + str(len(lines)) + " @@",
-            ]
-            diff_lines.extend([f"+{line}" for line in lines])
-            return "\n".join(diff_lines)
+            old_content, fromfile = "", "/dev/null"
         else:
             # Modified file
             old_content = full_path.read_text()
-            old_lines = old_content.split("\n")
-            new_lines = content.split("\n")
-
-            # Simple diff generation (in production, use difflib)
-            diff_lines = [
-                f"--- a/{project_key}/{file_path}",
-                f"+++ b/{project_key}/{file_path}",
-                f"@@ -1,{len(old_lines)} +1,{len(new_lines)} @@",
-            ]
-
-            # Show a simplified diff
-            max_lines = min(len(old_lines), len(new_lines))
-            for i in range(max_lines):
-                if old_lines[i] != new_lines[i]:
-                    diff_lines.append(f"-{old_lines[i]}")
-                    diff_lines.append(f"+{new_lines[i]}")
-
-            # Add remaining lines
-            if len(old_lines) > max_lines:
-                for i in range(max_lines, len(old_lines)):
-                    diff_lines.append(f"-{old_lines[i]}")
-            if len(new_lines) > max_lines:
-                for i in range(max_lines, len(new_lines)):
-                    diff_lines.append(f"+{new_lines[i]}")
-
-            return "\n".join(diff_lines)
+            fromfile = f"a/{project_key}/{file_path}"
+
+        return self.diff_service.generate_diff(
+            old_content,
+            content,
+            normalize_whitespace=False,
+            fromfile=fromfile,
+            tofile=f"b/{project_key}/{file_path}",
+        )
 
+    @traced("git.list_artifacts")
     def list_artifacts(self, project_key: str) -> List[Dict[str, Any]]:
         """List artifacts in project with basic version info."""
         artifacts_path = self.get_project_path(project_key) / "artifacts"
@@ -376,6 +445,7 @@ class GitManager:
                 )
         return artifacts
 
+    @traced("git.get_last_commit")
     def get_last_commit(self, project_key: str) -> Optional[Dict[str, Any]]:
         """Get last commit info for a project."""
         try:
@@ -395,19 +465,59 @@ class GitManager:
             pass
         return None
 
-    def log_event(self, project_key: str, event_data: Dict[str, Any]):
-        """Append event to NDJSON audit log."""
-        events_path = self.get_project_path(project_key) / "events" / "events.ndjson"
-        events_path.parent.mkdir(parents=True, exist_ok=True)
+    def open_log(
+        self,
+        project_key: str,
+        relative_path: str,
+        time_field: str = "timestamp",
+        compact=None,
+    ) -> SegmentedLog:
+        """
+        Open a segmented NDJSON log within a project.
+
+        Sealed segments and the manifest are committed once when a segment
+        is sealed; the active segment is left uncommitted. ``compact`` is
+        passed through to the log as its seal-time compaction hook.
+        """
+        project_path = self.get_project_path(project_key)
 
-        event_line = json.dumps(
+        def commit_sealed(files: List[Path]):
+            try:
+                self.commit_changes(
+                    project_key,
+                    f"Seal {relative_path} segment",
+                    [str(f.relative_to(project_path)) for f in files],
+                )
+            except Exception:
+                logging.getLogger(__name__).exception(
+                    "Failed to commit sealed segment of %s/%s",
+                    project_key,
+                    relative_path,
+                )
+
+        return SegmentedLog(
+            project_path / relative_path,
+            time_field=time_field,
+            on_seal=commit_sealed,
+            compact=compact,
+        )
+
+    @traced("events.append")
+    def log_event(self, project_key: str, event_data: Dict[str, Any]):
+        """Append event to NDJSON audit log (buffered per durability policy)."""
+        get_event_log_writer().append(
+            self.open_log(project_key, "events/events.ndjson"),
             {
                 **event_data,
                 "timestamp": datetime.now(timezone.utc)
                 .isoformat()
                 .replace("+00:00", "Z"),
-            }
+            },
         )
 
-        with events_path.open("a") as f:
-            f.write(event_line + "\n")
+    @traced("events.read")
+    def read_events(self, project_key: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Read the most recent events from the NDJSON event log (newest first)."""
+        events_log = self.open_log(project_key, "events/events.ndjson")
+        get_event_log_writer().flush(events_log.path)
+        return events_log.tail(limit)
@@ -0,0 +1,299 @@
+"""
+LLM response cache - content-addressed cache of chat completion results.
+Single Responsibility: Serve byte-identical LLM requests without calling the
+LLM again.
+
+Gap assessments and plan generations often send the same prompt for the same
+project state. Responses are keyed by a hash of (model, messages,
+temperature, max_tokens), using the model of the endpoint that answered, and
+kept in a small LRU memory tier in front of a SQLite store (WAL mode, shared
+by uvicorn workers on one host). The store is bounded by the size of the
+responses it holds: once it grows past ``max_bytes`` the least recently used
+responses are evicted. Both tiers honour a TTL.
+
+Configuration (environment):
+    LLM_CACHE_ENABLED         cache responses (default: false)
+    LLM_CACHE_DB              SQLite file (default: $PROJECT_DOCS_PATH/.cache/llm_responses.sqlite3,
+                              excluded from git by GitManager)
+    LLM_CACHE_TTL_SECONDS     response lifetime in seconds (default: 86400)
+    LLM_CACHE_MAX_BYTES       size budget of the SQLite tier (default: 256 MiB)
+    LLM_CACHE_MEMORY_ENTRIES  responses kept in memory (default: 256)
+
+The cache is off by default: sampled completions (temperature > 0) differ
+between calls, and reusing them is a choice the deployment has to make. If
+the database cannot be opened the cache logs a warning and runs memory-only.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MEMORY_ENTRIES = 256
+
+# Expired rows are purged and the size budget enforced at most this often
+MAINTENANCE_INTERVAL = 60.0
+
+# Responses starting with this are fallbacks, never real completions
+FALLBACK_PREFIX = "[LLM unavailable"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    duration REAL NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS llm_responses_last_used
+    ON llm_responses (last_used);
+"""
+
+
+def cache_key(
+    model: str,
+    messages: List[Dict[str, str]],
+    temperature: Optional[float],
+    max_tokens: Optional[int],
+) -> str:
+    """Hash the parts of a chat completion request that determine its result."""
+    request = json.dumps(
+        {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """TTL + LRU memory tier in front of a size-bounded SQLite store."""
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        enabled: bool = True,
+    ):
+        """
+        Initialize LLM response cache.
+
+        Args:
+            path: SQLite database file (memory-only if None)
+            ttl_seconds: Lifetime of a response after it is stored
+            max_bytes: Size budget for responses in the SQLite store
+            max_memory_entries: Responses kept in the memory tier
+            enabled: Whether lookups and stores do anything
+        """
+        self.path = Path(path) if path is not None else None
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max(0, max_bytes)
+        self.max_memory_entries = max(0, max_memory_entries)
+        self.enabled = enabled
+        self._memory: "OrderedDict[str, Tuple[str, float, float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._store_failed = False
+        self._last_maintenance = 0.0
+        # Upper bound on stored bytes since the last exact measurement
+        self._disk_bytes = 0
+
+    @classmethod
+    def from_env(cls) -> "LLMResponseCache":
+        """Build a cache from LLM_CACHE_* environment variables."""
+        path = os.getenv("LLM_CACHE_DB") or (
+            Path(os.getenv("PROJECT_DOCS_PATH", "/projectDocs"))
+            / ".cache"
+            / "llm_responses.sqlite3"
+        )
+        return cls(
+            path=path,
+            ttl_seconds=float(
+                os.getenv("LLM_CACHE_TTL_SECONDS", str(DEFAULT_TTL_SECONDS))
+            ),
+            max_bytes=int(os.getenv("LLM_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES))),
+            max_memory_entries=int(
+                os.getenv("LLM_CACHE_MEMORY_ENTRIES", str(DEFAULT_MEMORY_ENTRIES))
+            ),
+            enabled=os.getenv("LLM_CACHE_ENABLED", "false").lower()
+            in ("1", "true", "yes"),
+        )
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """
+        Return a cached response, or None if unknown or expired.
+
+        Args:
+            key: Key from cache_key()
+
+        Returns:
+            Tuple of (response, duration of the original LLM call)
+        """
+        if not self.enabled:
+            return None
+        now = time.time()
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                if cached[2] > now:
+                    self._memory.move_to_end(key)
+                    return cached[0], cached[1]
+                del self._memory[key]
+
+            conn = self._connection()
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT response, duration, expires_at FROM llm_responses "
+                "WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            with conn:
+                conn.execute(
+                    "UPDATE llm_responses SET last_used = ? WHERE key = ?", (now, key)
+                )
+
+            self._remember(key, row[0], row[1], row[2])
+            return row[0], row[1]
+
+    def put(self, key: str, response: str, duration: float) -> bool:
+        """
+        Store a response in both tiers.
+
+        Fallback responses are never stored.
+
+        Args:
+            key: Key from cache_key()
+            response: LLM response content
+            duration: Duration of the LLM call that produced it (seconds)
+
+        Returns:
+            True if the response was stored
+        """
+        if not self.enabled or response.startswith(FALLBACK_PREFIX):
+            return False
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            conn = self._connection()
+            if conn is not None and size <= self.max_bytes:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO llm_responses "
+                        "(key, response, duration, size, expires_at, last_used) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, response, duration, size, expires_at, now),
+                    )
+                self._disk_bytes += size
+                self._maintain(conn, now)
+            self._remember(key, response, duration, expires_at)
+        return True
+
+    def clear(self) -> None:
+        """Remove every response from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            conn = self._connection()
+            if conn is not None:
+                with conn:
+                    conn.execute("DELETE FROM llm_responses")
+                self._disk_bytes = 0
+
+    def close(self) -> None:
+        """Close the database connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def disk_size(self) -> int:
+        """Bytes of responses currently held in the SQLite store."""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return 0
+            return conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM llm_responses"
+            ).fetchone()[0]
+
+    def memory_size(self) -> int:
+        """Number of responses currently held in memory."""
+        with self._lock:
+            return len(self._memory)
+
+    # Private helper methods
+
+    def _remember(
+        self, key: str, response: str, duration: float, expires_at: float
+    ) -> None:
+        if not self.max_memory_entries:
+            return
+        self._memory[key] = (response, duration, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite store on first use; None when running memory-only."""
+        if self._conn is not None or self.path is None or self._store_failed:
+            return self._conn
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error):
+            logger.warning(
+                "LLM response store %s unavailable; caching responses in memory",
+                self.path,
+                exc_info=True,
+            )
+            self._store_failed = True
+            return None
+        self._conn = conn
+        return conn
+
+    def _maintain(self, conn: sqlite3.Connection, now: float) -> None:
+        """Purge expired rows and evict least recently used ones over budget."""
+        recent = now - self._last_maintenance < MAINTENANCE_INTERVAL
+        if recent and self._disk_bytes <= self.max_bytes:
+            return
+        self._last_maintenance = now
+        with conn:
+            conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (now,))
+            # Keep the most recently used responses that fit the budget
+            conn.execute(
+                "DELETE FROM llm_responses WHERE key IN ("
+                " SELECT key FROM ("
+                "  SELECT key, SUM(size) OVER ("
+                "   ORDER BY last_used DESC, key ROWS UNBOUNDED PRECEDING"
+                "  ) AS running FROM llm_responses"
+                " ) WHERE running > ?"
+                ")",
+                (self.max_bytes,),
+            )
+        self._disk_bytes = self.disk_size()
+        for key in [k for k, (_, _, exp) in self._memory.items() if exp <= now]:
+            del self._memory[key]
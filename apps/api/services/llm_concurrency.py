@@ -0,0 +1,258 @@
+"""
+LLM concurrency control - request coalescing and admission limits.
+Single Responsibility: Keep the number of requests sent to the LLM endpoint
+within what it can serve.
+
+When several users trigger the same command on the same project at once,
+they send identical chat completion requests. ``SingleFlight`` lets
+concurrent identical requests share one upstream call. ``ConcurrencyLimiter``
+bounds the requests in flight, globally and per model. Requests beyond the
+limit wait in a bounded FIFO queue, and a new request never takes a slot
+ahead of one already waiting for it. When the queue is full, or a request has
+waited longer than the queue timeout, it is rejected straight away with
+``LLMOverloadedError``. The API maps that to 503 with Retry-After, so
+overload does not pile up as client timeouts.
+
+Configuration (environment):
+    LLM_MAX_CONCURRENCY            requests in flight across models, 0 = unlimited (default: 4)
+    LLM_MAX_CONCURRENCY_PER_MODEL  requests in flight per model, 0 = unlimited (default: 0)
+    LLM_MODEL_CONCURRENCY          per-model overrides, e.g. "local-model=2,big-model=1"
+    LLM_QUEUE_MAX_DEPTH            requests waiting before new ones are rejected (default: 32)
+    LLM_QUEUE_TIMEOUT_SECONDS      longest wait for a slot before rejection (default: 60)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+try:
+    from .monitoring_service import MetricsCollector
+except ImportError:
+    from monitoring_service import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_QUEUE = 32
+DEFAULT_QUEUE_TIMEOUT = 60.0
+
+# Suggested client back-off when the LLM is overloaded (seconds)
+RETRY_AFTER_SECONDS = 10
+
+
+class LLMOverloadedError(Exception):
+    """Raised when an LLM request cannot be admitted."""
+
+    def __init__(self, message: str, retry_after: int = RETRY_AFTER_SECONDS):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class SingleFlight:
+    """Share one in-flight call among concurrent callers with the same key."""
+
+    def __init__(self):
+        self._calls: Dict[str, "asyncio.Future[Any]"] = {}
+
+    async def do(
+        self, key: str, func: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """
+        Run ``func`` unless a call with ``key`` is already in flight.
+
+        A caller that is cancelled does not cancel the shared call for the
+        others.
+
+        Returns:
+            Tuple of (result, whether an in-flight call was shared)
+        """
+        call = self._calls.get(key)
+        shared = call is not None
+        if call is None:
+            call = asyncio.ensure_future(func())
+            self._calls[key] = call
+            call.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(call), shared
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def _forget(self, key: str, call: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.cancelled():
+            # Retrieve the exception even if every caller went away
+            call.exception()
+
+
+class ConcurrencyLimiter:
+    """Global and per-model limit on concurrent LLM requests with a wait queue."""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_per_model: int = 0,
+        model_limits: Optional[Dict[str, int]] = None,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        queue_timeout: float = DEFAULT_QUEUE_TIMEOUT,
+        retry_after: int = RETRY_AFTER_SECONDS,
+    ):
+        """
+        Initialize concurrency limiter.
+
+        Args:
+            max_concurrency: Requests in flight across all models (0 = unlimited)
+            max_per_model: Requests in flight per model (0 = unlimited)
+            model_limits: Per-model overrides of ``max_per_model``
+            max_queue: Requests allowed to wait for a slot
+            queue_timeout: Seconds a request may wait before it is rejected
+            retry_after: Back-off suggested to rejected clients (seconds)
+        """
+        self.max_concurrency = max(0, max_concurrency)
+        self.max_per_model = max(0, max_per_model)
+        self.model_limits = dict(model_limits or {})
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._active = 0
+        self._active_by_model: Dict[str, int] = {}
+        self._waiters: Deque[Tuple[str, "asyncio.Future[None]"]] = deque()
+
+    @classmethod
+    def from_env(cls) -> "ConcurrencyLimiter":
+        """Build a limiter from LLM_* concurrency environment variables."""
+        model_limits = {}
+        for item in os.getenv("LLM_MODEL_CONCURRENCY", "").split(","):
+            model, _, limit = item.rpartition("=")
+            if not model.strip():
+                continue
+            try:
+                model_limits[model.strip()] = int(limit)
+            except ValueError:
+                logger.warning("Ignoring invalid LLM_MODEL_CONCURRENCY entry %r", item)
+        return cls(
+            max_concurrency=int(
+                os.getenv("LLM_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY))
+            ),
+            max_per_model=int(os.getenv("LLM_MAX_CONCURRENCY_PER_MODEL", "0")),
+            model_limits=model_limits,
+            max_queue=int(os.getenv("LLM_QUEUE_MAX_DEPTH", str(DEFAULT_MAX_QUEUE))),
+            queue_timeout=float(
+                os.getenv("LLM_QUEUE_TIMEOUT_SECONDS", str(DEFAULT_QUEUE_TIMEOUT))
+            ),
+        )
+
+    @asynccontextmanager
+    async def slot(self, model: str) -> AsyncIterator[None]:
+        """Hold a request slot for ``model`` for the duration of the block."""
+        await self.acquire(model)
+        try:
+            yield
+        finally:
+            self.release(model)
+
+    async def acquire(self, model: str) -> None:
+        """
+        Wait for a request slot for ``model``.
+
+        Raises:
+            LLMOverloadedError: If the wait queue is full or the wait timed out
+        """
+        if not self._waiters and self._has_capacity(model):
+            self._take(model)
+            MetricsCollector.record_llm_queue_wait(model, 0.0)
+            return
+        if len(self._waiters) >= self.max_queue:
+            MetricsCollector.record_llm_rejection(model, "queue_full")
+            raise LLMOverloadedError(
+                f"LLM is overloaded ({len(self._waiters)} requests waiting): "
+                "retry later",
+                self.retry_after,
+            )
+
+        granted: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        entry = (model, granted)
+        self._waiters.append(entry)
+        # Requests queued earlier are served first; this one is admitted
+        # straight away only if a slot is left over once they have theirs
+        self._dispatch()
+        if granted.done():
+            MetricsCollector.record_llm_queue_wait(model, 0.0)
+            return
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(granted, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._drop(entry)
+            MetricsCollector.record_llm_rejection(model, "queue_timeout")
+            raise LLMOverloadedError(
+                f"LLM is overloaded: no slot within {self.queue_timeout:g}s, "
+                "retry later",
+                self.retry_after,
+            )
+        except BaseException:
+            if granted.done() and not granted.cancelled():
+                self.release(model)
+            else:
+                self._drop(entry)
+            raise
+        MetricsCollector.record_llm_queue_wait(model, time.monotonic() - start)
+
+    def release(self, model: str) -> None:
+        """Return a slot and admit waiting requests that now fit."""
+        self._active -= 1
+        self._active_by_model[model] -= 1
+        MetricsCollector.set_llm_in_flight(model, self._active_by_model[model])
+        self._dispatch()
+
+    def limit_for(self, model: str) -> int:
+        """Concurrency limit of ``model`` (0 = unlimited)."""
+        return self.model_limits.get(model, self.max_per_model)
+
+    def in_flight(self, model: Optional[str] = None) -> int:
+        """Requests holding a slot, for one model or in total."""
+        if model is None:
+            return self._active
+        return self._active_by_model.get(model, 0)
+
+    def waiting(self) -> int:
+        """Requests waiting for a slot."""
+        return len(self._waiters)
+
+    # Private helper methods
+
+    def _has_capacity(self, model: str) -> bool:
+        if self.max_concurrency and self._active >= self.max_concurrency:
+            return False
+        limit = self.limit_for(model)
+        return not limit or self._active_by_model.get(model, 0) < limit
+
+    def _take(self, model: str) -> None:
+        self._active += 1
+        self._active_by_model[model] = self._active_by_model.get(model, 0) + 1
+        MetricsCollector.set_llm_in_flight(model, self._active_by_model[model])
+
+    def _dispatch(self) -> None:
+        """Grant slots to waiters in arrival order, skipping saturated models."""
+        for entry in list(self._waiters):
+            model, granted = entry
+            if granted.done():
+                self._waiters.remove(entry)
+            elif self._has_capacity(model):
+                self._waiters.remove(entry)
+                self._take(model)
+                granted.set_result(None)
+            elif self.max_concurrency and self._active >= self.max_concurrency:
+                break
+        MetricsCollector.set_llm_queue_depth(len(self._waiters))
+
+    def _drop(self, entry: Tuple[str, "asyncio.Future[None]"]) -> None:
+        try:
+            self._waiters.remove(entry)
+        except ValueError:
+            pass
+        MetricsCollector.set_llm_queue_depth(len(self._waiters))
@@ -1,15 +1,18 @@
 """
 LLM service with HTTP adapter for OpenAI-compatible endpoints.
-Includes circuit breaker pattern for resilient external API handling.
+Includes circuit breaker pattern for resilient external API handling, an
+optional response cache for byte-identical requests (see llm_cache), and
+request coalescing plus concurrency limits (see llm_concurrency).
 """
 
+import asyncio
 import os
 import json
 import httpx
 import time
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 from jinja2 import Environment, FileSystemLoader
 from tenacity import (
     retry,
@@ -19,9 +22,17 @@ from tenacity import (
 )
 
 try:
+    from .llm_cache import LLMResponseCache, cache_key
+    from .llm_concurrency import ConcurrencyLimiter, SingleFlight
     from .monitoring_service import MetricsCollector
+    from .template_cache import bytecode_cache_from_env
+    from .tracing import span, traced
 except ImportError:
+    from llm_cache import LLMResponseCache, cache_key
+    from llm_concurrency import ConcurrencyLimiter, SingleFlight
     from monitoring_service import MetricsCollector
+    from template_cache import bytecode_cache_from_env
+    from tracing import span, traced
 
 
 class CircuitState(Enum):
@@ -77,37 +88,47 @@ class CircuitBreaker:
         """Decorator to wrap function with circuit breaker logic."""
 
         async def wrapper(*args, **kwargs):
-            # Check if circuit should transition from OPEN to HALF_OPEN
-            if self.state == CircuitState.OPEN:
-                if self._should_attempt_reset():
-                    self.state = CircuitState.HALF_OPEN
-                else:
-                    # Circuit still open, raise exception immediately
-                    raise CircuitBreakerOpenError(
-                        f"Circuit breaker is OPEN. "
-                        f"Last failure: {self.last_failure_time}. "
-                        f"Wait {self.recovery_timeout}s before retry."
-                    )
+            self.check()
 
             # Attempt the call
             try:
                 result = await func(*args, **kwargs)
-                self._on_success()
+                self.record_success()
                 return result
             except self.expected_exception as e:
-                self._on_failure()
+                self.record_failure()
                 raise e
 
         return wrapper
 
+    def check(self):
+        """
+        Raise if requests are currently rejected.
+
+        Moves an OPEN circuit to HALF_OPEN once the recovery timeout passed.
+
+        Raises:
+            CircuitBreakerOpenError: If the circuit is open
+        """
+        if self.state == CircuitState.OPEN:
+            if self._should_attempt_reset():
+                self.state = CircuitState.HALF_OPEN
+            else:
+                # Circuit still open, raise exception immediately
+                raise CircuitBreakerOpenError(
+                    f"Circuit breaker is OPEN. "
+                    f"Last failure: {self.last_failure_time}. "
+                    f"Wait {self.recovery_timeout}s before retry."
+                )
+
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset."""
         if self.last_failure_time is None:
             return False
         return (time.time() - self.last_failure_time) >= self.recovery_timeout
 
-    def _on_success(self):
-        """Handle successful call."""
+    def record_success(self):
+        """Record a successful request, closing a HALF_OPEN circuit."""
         self.success_count += 1
         self.last_success_time = time.time()
 
@@ -116,13 +137,16 @@ class CircuitBreaker:
         if self.state == CircuitState.HALF_OPEN:
             self.state = CircuitState.CLOSED
 
-    def _on_failure(self):
-        """Handle failed call."""
+    def record_failure(self):
+        """Record a failed request, opening the circuit when it must trip."""
         self.failure_count += 1
         self.last_failure_time = time.time()
 
-        # Open circuit if threshold exceeded
-        if self.failure_count >= self.failure_threshold:
+        # A failed test request reopens at once; otherwise open at threshold
+        if (
+            self.state == CircuitState.HALF_OPEN
+            or self.failure_count >= self.failure_threshold
+        ):
             self.state = CircuitState.OPEN
 
     def get_metrics(self) -> Dict[str, Any]:
@@ -144,20 +168,208 @@ class CircuitBreakerOpenError(Exception):
     pass
 
 
-class LLMService:
-    """Service for interacting with LLM via HTTP with circuit breaker protection."""
+# Endpoint selection: fewest outstanding requests per unit of weight, or
+# additionally scaled by each endpoint's latency EWMA
+ROUTING_STRATEGIES = ("least_outstanding", "ewma")
+
+# Weight of the newest sample in an endpoint's latency EWMA
+EWMA_ALPHA = 0.3
+
+# Circuit states as exported to Prometheus
+_CIRCUIT_STATE_VALUES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
 
-    def __init__(self):
-        """Initialize LLM service with config and circuit breaker."""
-        self.config = self._load_config()
-        self.client = httpx.AsyncClient(timeout=self.config.get("timeout", 120))
 
-        # Initialize circuit breaker
+class LLMEndpoint:
+    """One upstream endpoint with its own HTTP client and circuit breaker."""
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        api_key: str,
+        model: str,
+        weight: float = 1.0,
+        timeout: float = 120,
+    ):
+        """
+        Initialize LLM endpoint.
+
+        Args:
+            name: Label used in metrics and health output
+            base_url: OpenAI-compatible API base URL
+            api_key: Bearer token for the endpoint
+            model: Model name sent to the endpoint
+            weight: Relative share of requests the endpoint should receive
+            timeout: HTTP timeout in seconds
+        """
+        self.name = name
+        self.base_url = base_url
+        self.api_key = api_key
+        self.model = model
+        self.weight = weight if weight > 0 else 1.0
+        self.client = httpx.AsyncClient(timeout=timeout)
         self.circuit_breaker = CircuitBreaker(
             failure_threshold=5,
             recovery_timeout=60,
             expected_exception=Exception,
         )
+        self.outstanding = 0
+        self.requests = 0
+        self.latency_ewma: Optional[float] = None
+
+    def available(self) -> bool:
+        """Whether the circuit breaker would let a request through."""
+        breaker = self.circuit_breaker
+        return breaker.state != CircuitState.OPEN or breaker._should_attempt_reset()
+
+    def score(self, strategy: str) -> Tuple[float, float]:
+        """Sort key for routing; lower is better."""
+        if strategy == "ewma":
+            # Expected latency of one more request
+            load = (self.latency_ewma or 0.0) * (self.outstanding + 1) / self.weight
+        else:
+            load = self.outstanding / self.weight
+        # Ties go to the endpoint furthest behind its share of requests
+        return load, self.requests / self.weight
+
+    def begin(self) -> None:
+        """Count a request sent to the endpoint."""
+        self.outstanding += 1
+        self.requests += 1
+        self._export()
+
+    def finish(self, status: str, duration: float) -> None:
+        """Record the outcome of a request started with begin()."""
+        self.outstanding -= 1
+        if status == "success":
+            if self.latency_ewma is None:
+                self.latency_ewma = duration
+            else:
+                self.latency_ewma += EWMA_ALPHA * (duration - self.latency_ewma)
+        MetricsCollector.record_llm_endpoint_request(self.name, duration, status)
+        self._export()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get routing state and circuit breaker metrics."""
+        return {
+            "name": self.name,
+            "base_url": self.base_url,
+            "model": self.model,
+            "weight": self.weight,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "latency_ewma": self.latency_ewma,
+            "circuit_breaker": self.circuit_breaker.get_metrics(),
+        }
+
+    def _export(self) -> None:
+        MetricsCollector.set_llm_endpoint_state(
+            self.name,
+            self.outstanding,
+            self.latency_ewma,
+            _CIRCUIT_STATE_VALUES[self.circuit_breaker.state],
+        )
+
+
+class LLMEndpointPool:
+    """Weighted set of interchangeable endpoints ranked per request."""
+
+    def __init__(
+        self, endpoints: List[LLMEndpoint], strategy: str = "least_outstanding"
+    ):
+        """
+        Initialize endpoint pool.
+
+        Args:
+            endpoints: Endpoints serving the same model; the first is primary
+            strategy: One of ROUTING_STRATEGIES
+
+        Raises:
+            ValueError: If there are no endpoints or the strategy is unknown
+        """
+        if not endpoints:
+            raise ValueError("At least one LLM endpoint is required")
+        if strategy not in ROUTING_STRATEGIES:
+            raise ValueError(f"Unknown LLM routing strategy: {strategy}")
+        self.endpoints = endpoints
+        self.strategy = strategy
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "LLMEndpointPool":
+        """
+        Build a pool from LLM config.
+
+        ``endpoints`` is an optional list of objects with ``base_url`` and
+        optional ``name``, ``weight``, ``api_key``, ``model`` and ``timeout``;
+        missing fields are taken from the top-level config. Without it the
+        top-level ``base_url`` is the only endpoint. ``routing`` selects the
+        strategy.
+        """
+        endpoints = []
+        for entry in config.get("endpoints") or [{}]:
+            base_url = entry.get("base_url", config["base_url"])
+            endpoints.append(
+                LLMEndpoint(
+                    name=entry.get("name") or base_url,
+                    base_url=base_url,
+                    api_key=entry.get("api_key", config["api_key"]),
+                    model=entry.get("model", config["model"]),
+                    weight=float(entry.get("weight", 1.0)),
+                    timeout=entry.get("timeout", config.get("timeout", 120)),
+                )
+            )
+        return cls(endpoints, config.get("routing", "least_outstanding"))
+
+    @property
+    def primary(self) -> LLMEndpoint:
+        """First configured endpoint."""
+        return self.endpoints[0]
+
+    def ranked(self) -> List[LLMEndpoint]:
+        """Endpoints in the order to try them: available ones best first."""
+        available = [e for e in self.endpoints if e.available()]
+        available.sort(key=lambda e: e.score(self.strategy))
+        return available + [e for e in self.endpoints if e not in available]
+
+    async def close(self) -> None:
+        """Close every endpoint's HTTP client."""
+        for endpoint in self.endpoints:
+            await endpoint.client.aclose()
+
+    def __iter__(self):
+        return iter(self.endpoints)
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+
+class LLMService:
+    """Service for interacting with LLM via HTTP with circuit breaker protection."""
+
+    def __init__(
+        self,
+        cache: Optional[LLMResponseCache] = None,
+        limiter: Optional[ConcurrencyLimiter] = None,
+    ):
+        """
+        Initialize LLM service with config and circuit breaker.
+
+        Args:
+            cache: Response cache (defaults to one configured by LLM_CACHE_*)
+            limiter: Concurrency limiter (defaults to one configured by the
+                LLM_* concurrency variables)
+        """
+        self.config = self._load_config()
+        self.cache = cache if cache is not None else LLMResponseCache.from_env()
+        self.limiter = limiter if limiter is not None else ConcurrencyLimiter.from_env()
+        self.in_flight = SingleFlight()
+
+        # Upstream endpoints, each with its own client and circuit breaker
+        self.endpoints = LLMEndpointPool.from_config(self.config)
 
         # Set up Jinja2 for prompt templates
         # Resolve templates relative to the installed app layout inside container.
@@ -170,7 +382,9 @@ class LLMService:
                 Path(__file__).resolve().parent.parent.parent.parent / "templates"
             )
         self.jinja_env = Environment(
-            loader=FileSystemLoader(str(template_path)), autoescape=True
+            loader=FileSystemLoader(str(template_path)),
+            autoescape=True,
+            bytecode_cache=bytecode_cache_from_env(),
         )
 
     def _load_config(self) -> Dict[str, Any]:
@@ -203,6 +417,16 @@ class LLMService:
 
         return default_config
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client of the primary endpoint."""
+        return self.endpoints.primary.client
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Circuit breaker of the primary endpoint."""
+        return self.endpoints.primary.circuit_breaker
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=4),
@@ -211,6 +435,7 @@ class LLMService:
     )
     async def _chat_completion_with_retry(
         self,
+        endpoint: LLMEndpoint,
         messages: List[Dict[str, str]],
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
@@ -221,79 +446,325 @@ class LLMService:
         Retries 3 times with exponential backoff: 1s, 2s, 4s.
         Only retries on HTTP errors and timeouts.
         """
-        url = f"{self.config['base_url']}/chat/completions"
-
-        payload = {
-            "model": self.config["model"],
-            "messages": messages,
-            "temperature": temperature or self.config["temperature"],
-            "max_tokens": max_tokens or self.config["max_tokens"],
-        }
+        return await self._chat_completion_once(
+            endpoint, messages, temperature, max_tokens
+        )
 
-        headers = {
-            "Authorization": f"Bearer {self.config['api_key']}",
-            "Content-Type": "application/json",
-        }
+    async def _chat_completion_once(
+        self,
+        endpoint: LLMEndpoint,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """Make a single chat completion request to ``endpoint``."""
+        url, payload, headers = self._build_request(
+            messages, temperature, max_tokens, endpoint
+        )
 
-        response = await self.client.post(url, json=payload, headers=headers)
+        response = await endpoint.client.post(url, json=payload, headers=headers)
         response.raise_for_status()
         data = response.json()
         return data["choices"][0]["message"]["content"]
 
+    @traced("llm.chat_completion")
     async def chat_completion(
         self,
         messages: List[Dict[str, str]],
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        use_cache: bool = True,
     ) -> str:
         """
         Make a chat completion request to the LLM with circuit breaker protection.
 
         Features:
-        - Retry logic: 3 attempts with exponential backoff (1s, 2s, 4s)
-        - Circuit breaker: Opens after 5 consecutive failures
-        - Graceful degradation: Returns fallback message if circuit open
+        - Response cache: identical requests are served from the cache when
+          it is enabled (fallback messages are never cached)
+        - Coalescing: concurrent identical requests share one upstream call
+        - Concurrency limit: requests wait for a slot in a bounded queue
+        - Load balancing: requests go to the best ranked endpoint and fail
+          over to the next one on error
+        - Retry logic: 3 attempts with exponential backoff (1s, 2s, 4s) on
+          the last available endpoint
+        - Circuit breaker: Each endpoint opens after 5 consecutive failures
+        - Graceful degradation: Returns fallback message if all endpoints fail
 
         Args:
             messages: List of message dicts with 'role' and 'content'
             temperature: Optional temperature override
             max_tokens: Optional max tokens override
+            use_cache: Set to False to bypass the response cache
 
         Returns:
             LLM response content or fallback message
+
+        Raises:
+            LLMOverloadedError: If no concurrency slot is available
         """
         start_time = time.time()
         provider = self.config.get("model", "unknown")
-        status = "success"
 
-        try:
-            # Wrap with circuit breaker
-            protected_call = self.circuit_breaker.call(self._chat_completion_with_retry)
-            result = await protected_call(messages, temperature, max_tokens)
+        # Responses are cached per model; look up the one routed to first
+        key = self._cache_key(
+            self.endpoints.ranked()[0], messages, temperature, max_tokens
+        )
+        cache_result = None
+        if self.cache.enabled:
+            cache_result = "bypass"
+            if use_cache:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    response, saved = cached
+                    MetricsCollector.record_llm_call(
+                        provider,
+                        time.time() - start_time,
+                        "cache_hit",
+                        cache="hit",
+                        saved_seconds=saved,
+                    )
+                    return response
+                cache_result = "miss"
+
+        result, shared = await self.in_flight.do(
+            key,
+            lambda: self._chat_completion_upstream(
+                messages, temperature, max_tokens, cache_result
+            ),
+        )
+        if shared:
+            MetricsCollector.record_llm_coalesced(provider)
+        return result
 
-            # Record successful metrics
-            duration = time.time() - start_time
-            MetricsCollector.record_llm_call(provider, duration, status)
+    async def _chat_completion_upstream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        cache_result: Optional[str],
+    ) -> str:
+        """Make one upstream request once a concurrency slot is free."""
+        provider = self.config.get("model", "unknown")
 
-            return result
+        async with self.limiter.slot(self.config["model"]):
+            start_time = time.time()
+            ranked = self.endpoints.ranked()
+            last_available = sum(1 for e in ranked if e.available()) - 1
+            error: Optional[Exception] = None
+            for index, endpoint in enumerate(ranked):
+                # Fail over quickly; only the last resort retries
+                request = (
+                    self._chat_completion_with_retry
+                    if index >= last_available
+                    else self._chat_completion_once
+                )
+                try:
+                    result = await self._call_endpoint(
+                        endpoint, request, messages, temperature, max_tokens
+                    )
+                except CircuitBreakerOpenError as e:
+                    error = error or e
+                    continue
+                except Exception as e:
+                    error = e
+                    if index < len(ranked) - 1:
+                        MetricsCollector.record_llm_endpoint_failover(endpoint.name)
+                    continue
+
+                # Record successful metrics
+                duration = time.time() - start_time
+                MetricsCollector.record_llm_call(
+                    provider, duration, "success", cache=cache_result
+                )
+
+                if cache_result == "miss":
+                    # Keyed by the model that actually answered
+                    self.cache.put(
+                        self._cache_key(endpoint, messages, temperature, max_tokens),
+                        result,
+                        duration,
+                    )
+                return result
 
-        except CircuitBreakerOpenError as e:
-            # Circuit is open, return fallback immediately
             duration = time.time() - start_time
-            status = "circuit_breaker_open"
-            MetricsCollector.record_llm_call(provider, duration, status)
+            if isinstance(error, CircuitBreakerOpenError):
+                # Every circuit is open, return fallback immediately
+                MetricsCollector.record_llm_call(
+                    provider, duration, "circuit_breaker_open", cache=cache_result
+                )
 
-            print(f"Circuit breaker OPEN: {e}")
-            return f"[LLM unavailable - circuit breaker open: {str(e)}]"
+                print(f"Circuit breaker OPEN: {error}")
+                return f"[LLM unavailable - circuit breaker open: {str(error)}]"
 
-        except Exception as e:
             # Other errors (after retries exhausted)
-            duration = time.time() - start_time
-            status = "error"
-            MetricsCollector.record_llm_call(provider, duration, status)
+            MetricsCollector.record_llm_call(
+                provider, duration, "error", cache=cache_result
+            )
+
+            print(f"LLM request failed after retries: {error}")
+            return f"[LLM unavailable: {str(error)}]"
+
+    async def _call_endpoint(
+        self,
+        endpoint: LLMEndpoint,
+        request,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> str:
+        """Run ``request`` against ``endpoint`` through its circuit breaker."""
+        protected_call = endpoint.circuit_breaker.call(request)
+        start_time = time.time()
+        endpoint.begin()
+        status = "error"
+        with span(
+            "llm.endpoint", endpoint=endpoint.name, model=endpoint.model
+        ) as endpoint_span:
+            try:
+                result = await protected_call(
+                    endpoint, messages, temperature, max_tokens
+                )
+                status = "success"
+                return result
+            except CircuitBreakerOpenError:
+                status = "rejected"
+                raise
+            except asyncio.CancelledError:
+                status = "cancelled"
+                raise
+            finally:
+                endpoint_span.set_attribute("status", status)
+                endpoint.finish(status, time.time() - start_time)
+
+    async def chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion as it is generated (``stream=True``).
 
-            print(f"LLM request failed after retries: {e}")
-            return f"[LLM unavailable: {str(e)}]"
+        Shares endpoints, circuit breakers, the concurrency limiter and the
+        response cache with chat_completion; a cached response is yielded as
+        one chunk. A request failing before any output fails over to the
+        next endpoint; if all fail, the fallback message is yielded instead,
+        as chat_completion would return it. Streams are not retried.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Optional temperature override
+            max_tokens: Optional max tokens override
+            use_cache: Set to False to bypass the response cache
+
+        Yields:
+            Chunks of response content
+
+        Raises:
+            LLMOverloadedError: If no concurrency slot is available
+            Exception: If the stream fails after output was yielded
+        """
+        start_time = time.time()
+        provider = self.config.get("model", "unknown")
+
+        cache_result = None
+        if self.cache.enabled:
+            cache_result = "bypass"
+            if use_cache:
+                key = self._cache_key(
+                    self.endpoints.ranked()[0], messages, temperature, max_tokens
+                )
+                cached = self.cache.get(key)
+                if cached is not None:
+                    response, saved = cached
+                    MetricsCollector.record_llm_call(
+                        provider,
+                        time.time() - start_time,
+                        "cache_hit",
+                        cache="hit",
+                        saved_seconds=saved,
+                    )
+                    yield response
+                    return
+                cache_result = "miss"
+
+        async with self.limiter.slot(self.config["model"]):
+            start_time = time.time()
+            parts: List[str] = []
+            error: Optional[Exception] = None
+            ranked = self.endpoints.ranked()
+            for index, endpoint in enumerate(ranked):
+                try:
+                    endpoint.circuit_breaker.check()
+                except CircuitBreakerOpenError as e:
+                    error = error or e
+                    continue
+
+                url, payload, headers = self._build_request(
+                    messages, temperature, max_tokens, endpoint
+                )
+                payload["stream"] = True
+                attempt_start = time.time()
+                endpoint.begin()
+                try:
+                    async with endpoint.client.stream(
+                        "POST", url, json=payload, headers=headers
+                    ) as response:
+                        response.raise_for_status()
+                        async for line in response.aiter_lines():
+                            done, chunk = _parse_stream_line(line)
+                            if done:
+                                break
+                            if chunk:
+                                parts.append(chunk)
+                                yield chunk
+                except (asyncio.CancelledError, GeneratorExit):
+                    endpoint.finish("cancelled", time.time() - attempt_start)
+                    raise
+                except Exception as e:
+                    endpoint.circuit_breaker.record_failure()
+                    endpoint.finish("error", time.time() - attempt_start)
+                    if parts:
+                        MetricsCollector.record_llm_call(
+                            provider,
+                            time.time() - start_time,
+                            "error",
+                            cache=cache_result,
+                        )
+                        raise
+                    error = e
+                    if index < len(ranked) - 1:
+                        MetricsCollector.record_llm_endpoint_failover(endpoint.name)
+                    continue
+
+                endpoint.circuit_breaker.record_success()
+                endpoint.finish("success", time.time() - attempt_start)
+                duration = time.time() - start_time
+                MetricsCollector.record_llm_call(
+                    provider, duration, "success", cache=cache_result
+                )
+                if cache_result == "miss":
+                    self.cache.put(
+                        self._cache_key(endpoint, messages, temperature, max_tokens),
+                        "".join(parts),
+                        duration,
+                    )
+                return
+
+            duration = time.time() - start_time
+            if isinstance(error, CircuitBreakerOpenError):
+                MetricsCollector.record_llm_call(
+                    provider, duration, "circuit_breaker_open", cache=cache_result
+                )
+                yield f"[LLM unavailable - circuit breaker open: {str(error)}]"
+                return
+
+            MetricsCollector.record_llm_call(
+                provider, duration, "error", cache=cache_result
+            )
+            print(f"LLM stream failed: {error}")
+            yield f"[LLM unavailable: {str(error)}]"
 
     def render_prompt(self, template_name: str, context: Dict[str, Any]) -> str:
         """Render a prompt template with given context."""
@@ -305,6 +776,20 @@ class LLMService:
         template = self.jinja_env.get_template(f"output/iso21500/{template_name}")
         return template.render(**context)
 
+    def warm_templates(self) -> int:
+        """
+        Load every prompt and output template so first requests skip compiling.
+
+        Returns:
+            Number of templates loaded
+        """
+        names = self.jinja_env.list_templates(
+            filter_func=lambda name: name.startswith(("prompts/", "output/"))
+        )
+        for name in names:
+            self.jinja_env.get_template(name)
+        return len(names)
+
     def get_circuit_breaker_metrics(self) -> Dict[str, Any]:
         """
         Get circuit breaker metrics for monitoring.
@@ -314,6 +799,114 @@ class LLMService:
         """
         return self.circuit_breaker.get_metrics()
 
+    def get_endpoint_metrics(self) -> List[Dict[str, Any]]:
+        """
+        Get routing state and circuit breaker metrics of every endpoint.
+
+        Returns:
+            List of dicts, primary endpoint first
+        """
+        return [endpoint.get_metrics() for endpoint in self.endpoints]
+
     async def close(self):
-        """Close HTTP client."""
-        await self.client.aclose()
+        """Close HTTP clients."""
+        await self.endpoints.close()
+
+    def _cache_key(
+        self,
+        endpoint: LLMEndpoint,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> str:
+        """Response cache key of a request answered by ``endpoint``'s model."""
+        return cache_key(
+            endpoint.model,
+            messages,
+            temperature or self.config["temperature"],
+            max_tokens or self.config["max_tokens"],
+        )
+
+    def _build_request(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        endpoint: Optional[LLMEndpoint] = None,
+    ) -> Tuple[str, Dict[str, Any], Dict[str, str]]:
+        """Build URL, payload and headers of a chat completion request."""
+        endpoint = endpoint or self.endpoints.primary
+        url = f"{endpoint.base_url}/chat/completions"
+
+        payload = {
+            "model": endpoint.model,
+            "messages": messages,
+            "temperature": temperature or self.config["temperature"],
+            "max_tokens": max_tokens or self.config["max_tokens"],
+        }
+
+        headers = {
+            "Authorization": f"Bearer {endpoint.api_key}",
+            "Content-Type": "application/json",
+        }
+        return url, payload, headers
+
+
+class TokenRelay:
+    """
+    LLM service proxy that streams completions while returning them whole.
+
+    Command handlers call ``chat_completion`` and use the full response as
+    before; every chunk is also put on ``tokens`` as it arrives, so callers
+    can forward partial output. Other attributes (prompt rendering, etc.) are
+    delegated to the wrapped service.
+    """
+
+    def __init__(self, llm_service: LLMService):
+        """
+        Initialize token relay.
+
+        Args:
+            llm_service: Service performing the streaming requests
+        """
+        self.llm_service = llm_service
+        self.tokens: "asyncio.Queue[str]" = asyncio.Queue()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.llm_service, name)
+
+    async def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> str:
+        """Stream a completion to ``tokens`` and return the full content."""
+        parts = []
+        async for chunk in self.llm_service.chat_completion_stream(
+            messages, temperature, max_tokens, use_cache=use_cache
+        ):
+            parts.append(chunk)
+            self.tokens.put_nowait(chunk)
+        return "".join(parts)
+
+
+def _parse_stream_line(line: str) -> Tuple[bool, str]:
+    """
+    Parse one line of an OpenAI-compatible SSE completion stream.
+
+    Returns:
+        Tuple of (stream finished, content delta or "")
+    """
+    if not line.startswith("data:"):
+        return False, ""
+    data = line[len("data:") :].strip()
+    if data == "[DONE]":
+        return True, ""
+    try:
+        choices = json.loads(data).get("choices") or [{}]
+    except ValueError:
+        return False, ""
+    delta = choices[0].get("delta") or {}
+    return False, delta.get("content") or ""
@@ -10,7 +10,7 @@ Provides centralized metrics for:
 
 import time
 import psutil
-from typing import Optional
+from typing import Dict, Optional
 from prometheus_client import (
     Counter,
     Histogram,
@@ -19,6 +19,7 @@ from prometheus_client import (
     CONTENT_TYPE_LATEST,
     REGISTRY,
 )
+from prometheus_client.openmetrics import exposition as openmetrics_exposition
 
 
 # Module-level cache to store metrics instances
@@ -134,6 +135,105 @@ LLM_TOKEN_COUNT = _get_or_create_metric(
     ["provider", "type"],  # type: prompt, completion
 )
 
+LLM_CACHE_REQUESTS = _get_or_create_metric(
+    Counter,
+    "llm_cache_requests_total",
+    "Total LLM response cache lookups",
+    ["provider", "result"],  # result: hit, miss, bypass
+)
+
+LLM_CACHE_SAVED_SECONDS = _get_or_create_metric(
+    Counter,
+    "llm_cache_saved_seconds_total",
+    "LLM call latency avoided by serving cached responses",
+    ["provider"],
+)
+
+LLM_IN_FLIGHT = _get_or_create_metric(
+    Gauge,
+    "llm_requests_in_flight",
+    "LLM requests currently holding a concurrency slot",
+    ["model"],
+)
+
+LLM_QUEUE_DEPTH = _get_or_create_metric(
+    Gauge,
+    "llm_queue_depth",
+    "LLM requests waiting for a concurrency slot",
+)
+
+LLM_QUEUE_WAIT = _get_or_create_metric(
+    Histogram,
+    "llm_queue_wait_seconds",
+    "Time LLM requests wait for a concurrency slot",
+    ["model"],
+    buckets=(0.0, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+LLM_REJECTED = _get_or_create_metric(
+    Counter,
+    "llm_requests_rejected_total",
+    "LLM requests rejected because the LLM is overloaded",
+    ["model", "reason"],  # reason: queue_full, queue_timeout
+)
+
+LLM_COALESCED = _get_or_create_metric(
+    Counter,
+    "llm_requests_coalesced_total",
+    "LLM requests served by sharing an identical in-flight request",
+    ["model"],
+)
+
+LLM_ENDPOINT_REQUESTS = _get_or_create_metric(
+    Counter,
+    "llm_endpoint_requests_total",
+    "Requests sent to each LLM endpoint",
+    ["endpoint", "status"],  # status: success, error, rejected, cancelled
+)
+
+LLM_ENDPOINT_DURATION = _get_or_create_metric(
+    Histogram,
+    "llm_endpoint_request_duration_seconds",
+    "LLM endpoint request duration in seconds",
+    ["endpoint"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0, 30.0, 60.0),
+)
+
+LLM_ENDPOINT_OUTSTANDING = _get_or_create_metric(
+    Gauge,
+    "llm_endpoint_outstanding_requests",
+    "Requests currently in progress on each LLM endpoint",
+    ["endpoint"],
+)
+
+LLM_ENDPOINT_LATENCY_EWMA = _get_or_create_metric(
+    Gauge,
+    "llm_endpoint_latency_ewma_seconds",
+    "Exponentially weighted moving average of successful request latency",
+    ["endpoint"],
+)
+
+LLM_ENDPOINT_CIRCUIT_STATE = _get_or_create_metric(
+    Gauge,
+    "llm_endpoint_circuit_state",
+    "Circuit breaker state of each LLM endpoint (0=closed, 1=half-open, 2=open)",
+    ["endpoint"],
+)
+
+LLM_ENDPOINT_FAILOVERS = _get_or_create_metric(
+    Counter,
+    "llm_endpoint_failovers_total",
+    "Failed LLM requests retried on another endpoint",
+    ["endpoint"],
+)
+
+TEMPLATE_CACHE_REQUESTS = _get_or_create_metric(
+    Counter,
+    "template_cache_requests_total",
+    "Total compiled template cache lookups",
+    ["result"],  # result: hit, miss
+)
+
 # ============================================================================
 # Git Operations Metrics
 # ============================================================================
@@ -153,6 +253,90 @@ GIT_OPERATION_DURATION = _get_or_create_metric(
     buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
 )
 
+# ============================================================================
+# Event Log Metrics
+# ============================================================================
+
+EVENT_LOG_BUFFERED_RECORDS = _get_or_create_metric(
+    Gauge,
+    "event_log_buffered_records",
+    "Number of event log records buffered and not yet written",
+)
+
+EVENT_LOG_FLUSH_DURATION = _get_or_create_metric(
+    Histogram,
+    "event_log_flush_duration_seconds",
+    "Event log buffer flush duration in seconds",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+
+EVENT_LOG_FLUSHED_RECORDS = _get_or_create_metric(
+    Counter,
+    "event_log_flushed_records_total",
+    "Total event log records written by buffer flushes",
+)
+
+# ============================================================================
+# Command Queue Metrics
+# ============================================================================
+
+COMMAND_QUEUE_DEPTH = _get_or_create_metric(
+    Gauge,
+    "command_queue_depth",
+    "Number of queued commands waiting for a worker",
+)
+
+COMMAND_QUEUE_RUNNING = _get_or_create_metric(
+    Gauge,
+    "command_queue_running",
+    "Number of queued commands currently executing",
+)
+
+COMMAND_QUEUE_WAIT = _get_or_create_metric(
+    Histogram,
+    "command_queue_wait_seconds",
+    "Time commands spend queued before execution starts",
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+
+COMMAND_JOB_COUNT = _get_or_create_metric(
+    Counter,
+    "command_jobs_total",
+    "Total queued commands by outcome",
+    ["command", "status"],  # status: success, failed, cancelled, rejected
+)
+
+COMMAND_JOB_DURATION = _get_or_create_metric(
+    Histogram,
+    "command_job_duration_seconds",
+    "Queued command execution duration in seconds",
+    ["command"],
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+
+# ============================================================================
+# Diff Cache Metrics
+# ============================================================================
+
+DIFF_CACHE_REQUESTS = _get_or_create_metric(
+    Counter,
+    "diff_cache_requests_total",
+    "Total diff cache lookups",
+    ["result"],  # hit, miss
+)
+
+DIFF_CACHE_ENTRIES = _get_or_create_metric(
+    Gauge,
+    "diff_cache_entries",
+    "Number of rendered diffs held in the diff cache",
+)
+
+DIFF_CACHE_BYTES = _get_or_create_metric(
+    Gauge,
+    "diff_cache_bytes",
+    "Approximate memory held by the diff cache in bytes",
+)
+
 # ============================================================================
 # System Resource Metrics
 # ============================================================================
@@ -209,12 +393,27 @@ class MetricsCollector:
     """Helper class for collecting and updating metrics."""
 
     @staticmethod
-    def record_request(method: str, endpoint: str, status_code: int, duration: float):
-        """Record API request metrics."""
+    def record_request(
+        method: str,
+        endpoint: str,
+        status_code: int,
+        duration: float,
+        exemplar: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Record API request metrics.
+
+        ``endpoint`` must be a route template, not the request path, to keep
+        the number of series bounded. ``exemplar`` labels (e.g. the
+        correlation id) are attached to the samples and exposed in
+        OpenMetrics format.
+        """
         REQUEST_COUNT.labels(
             method=method, endpoint=endpoint, status_code=status_code
-        ).inc()
-        REQUEST_DURATION.labels(method=method, endpoint=endpoint).observe(duration)
+        ).inc(exemplar=exemplar)
+        REQUEST_DURATION.labels(method=method, endpoint=endpoint).observe(
+            duration, exemplar=exemplar
+        )
 
         # Track slow requests (>1s)
         if duration > 1.0:
@@ -224,10 +423,27 @@ class MetricsCollector:
 
     @staticmethod
     def record_llm_call(
-        provider: str, duration: float, status: str, tokens: Optional[dict] = None
+        provider: str,
+        duration: float,
+        status: str,
+        tokens: Optional[dict] = None,
+        cache: Optional[str] = None,
+        saved_seconds: Optional[float] = None,
     ):
-        """Record LLM service call metrics."""
+        """
+        Record LLM service call metrics.
+
+        ``cache`` is the response cache outcome (hit, miss or bypass). Cache
+        hits count the latency of the original call as ``saved_seconds``
+        instead of observing the call duration.
+        """
         LLM_CALL_COUNT.labels(provider=provider, status=status).inc()
+        if cache is not None:
+            LLM_CACHE_REQUESTS.labels(provider=provider, result=cache).inc()
+        if cache == "hit":
+            if saved_seconds:
+                LLM_CACHE_SAVED_SECONDS.labels(provider=provider).inc(saved_seconds)
+            return
         LLM_CALL_DURATION.labels(provider=provider).observe(duration)
 
         if tokens:
@@ -258,6 +474,98 @@ class MetricsCollector:
                 operation=f"git_{operation}", threshold="1s"
             ).inc()
 
+    @staticmethod
+    def record_event_log_flush(duration: float, records: int):
+        """Record a buffered event log flush."""
+        EVENT_LOG_FLUSH_DURATION.observe(duration)
+        EVENT_LOG_FLUSHED_RECORDS.inc(records)
+
+    @staticmethod
+    def set_event_log_buffer_depth(depth: int):
+        """Update the number of buffered event log records."""
+        EVENT_LOG_BUFFERED_RECORDS.set(depth)
+
+    @staticmethod
+    def set_command_queue_state(depth: int, running: int):
+        """Update the number of waiting and running queued commands."""
+        COMMAND_QUEUE_DEPTH.set(depth)
+        COMMAND_QUEUE_RUNNING.set(running)
+
+    @staticmethod
+    def record_command_queue_wait(duration: float):
+        """Record how long a command waited for a worker."""
+        COMMAND_QUEUE_WAIT.observe(duration)
+
+    @staticmethod
+    def record_command_job(command: str, status: str, duration: Optional[float] = None):
+        """Record the outcome of a queued command."""
+        COMMAND_JOB_COUNT.labels(command=command, status=status).inc()
+        if duration is not None:
+            COMMAND_JOB_DURATION.labels(command=command).observe(duration)
+
+    @staticmethod
+    def set_llm_in_flight(model: str, count: int):
+        """Update the number of LLM requests in flight for a model."""
+        LLM_IN_FLIGHT.labels(model=model).set(count)
+
+    @staticmethod
+    def set_llm_queue_depth(depth: int):
+        """Update the number of LLM requests waiting for a slot."""
+        LLM_QUEUE_DEPTH.set(depth)
+
+    @staticmethod
+    def record_llm_queue_wait(model: str, duration: float):
+        """Record how long an LLM request waited for a slot."""
+        LLM_QUEUE_WAIT.labels(model=model).observe(duration)
+
+    @staticmethod
+    def record_llm_rejection(model: str, reason: str):
+        """Record an LLM request rejected for overload."""
+        LLM_REJECTED.labels(model=model, reason=reason).inc()
+
+    @staticmethod
+    def record_llm_coalesced(model: str):
+        """Record an LLM request that shared an identical in-flight request."""
+        LLM_COALESCED.labels(model=model).inc()
+
+    @staticmethod
+    def record_llm_endpoint_request(endpoint: str, duration: float, status: str):
+        """Record a request sent to an LLM endpoint."""
+        LLM_ENDPOINT_REQUESTS.labels(endpoint=endpoint, status=status).inc()
+        if status in ("success", "error"):
+            LLM_ENDPOINT_DURATION.labels(endpoint=endpoint).observe(duration)
+
+    @staticmethod
+    def set_llm_endpoint_state(
+        endpoint: str, outstanding: int, latency_ewma: Optional[float], circuit: int
+    ):
+        """Update routing state and circuit state of an LLM endpoint."""
+        LLM_ENDPOINT_OUTSTANDING.labels(endpoint=endpoint).set(outstanding)
+        if latency_ewma is not None:
+            LLM_ENDPOINT_LATENCY_EWMA.labels(endpoint=endpoint).set(latency_ewma)
+        LLM_ENDPOINT_CIRCUIT_STATE.labels(endpoint=endpoint).set(circuit)
+
+    @staticmethod
+    def record_llm_endpoint_failover(endpoint: str):
+        """Record a failed request that moves on to another endpoint."""
+        LLM_ENDPOINT_FAILOVERS.labels(endpoint=endpoint).inc()
+
+    @staticmethod
+    def record_template_cache_lookup(hit: bool):
+        """Record a compiled template cache hit or miss."""
+        TEMPLATE_CACHE_REQUESTS.labels(result="hit" if hit else "miss").inc()
+
+    @staticmethod
+    def record_diff_cache_lookup(hit: bool):
+        """Record a diff cache hit or miss."""
+        DIFF_CACHE_REQUESTS.labels(result="hit" if hit else "miss").inc()
+
+    @staticmethod
+    def set_diff_cache_size(entries: int, size_bytes: int):
+        """Update the diff cache occupancy."""
+        DIFF_CACHE_ENTRIES.set(entries)
+        DIFF_CACHE_BYTES.set(size_bytes)
+
     @staticmethod
     def record_error(error_type: str, endpoint: str):
         """Record error metrics."""
@@ -281,13 +589,17 @@ class MetricsCollector:
         DISK_USAGE_PERCENT.labels(path=path).set(usage.percent)
 
     @staticmethod
-    def generate_metrics() -> bytes:
-        """Generate Prometheus metrics in text format."""
+    def generate_metrics(openmetrics: bool = False) -> bytes:
+        """Generate metrics in Prometheus text format, or OpenMetrics (with exemplars)."""
+        if openmetrics:
+            return openmetrics_exposition.generate_latest(REGISTRY)
         return generate_latest()
 
     @staticmethod
-    def get_content_type() -> str:
-        """Get Prometheus metrics content type."""
+    def get_content_type(openmetrics: bool = False) -> str:
+        """Get Prometheus or OpenMetrics content type."""
+        if openmetrics:
+            return openmetrics_exposition.CONTENT_TYPE_LATEST
         return CONTENT_TYPE_LATEST
 
 
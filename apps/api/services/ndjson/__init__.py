@@ -0,0 +1,28 @@
+"""NDJSON log utilities shared by audit, event and command persistence."""
+
+from .locking import file_lock
+from .segmented_log import SegmentedLog, LogPosition
+from .indexed_store import (
+    IndexedRecordStore,
+    fold_updates,
+    get_indexed_store,
+    merge_records,
+)
+from .buffered_writer import (
+    BufferedLogWriter,
+    DurabilityPolicy,
+    get_event_log_writer,
+)
+
+__all__ = [
+    "file_lock",
+    "SegmentedLog",
+    "LogPosition",
+    "IndexedRecordStore",
+    "fold_updates",
+    "get_indexed_store",
+    "merge_records",
+    "BufferedLogWriter",
+    "DurabilityPolicy",
+    "get_event_log_writer",
+]
@@ -0,0 +1,245 @@
+"""
+Buffered log writer - batches event log appends under a durability policy.
+Single Responsibility: Decide when buffered records reach the segmented logs.
+
+With the default ``immediate`` policy every record is written synchronously,
+as before. The ``buffered`` policy keeps records in memory per log and writes
+them in one append when ``batch_size`` records are pending or every
+``interval_ms`` from a background flusher thread, trading a bounded window of
+unflushed records for far fewer syscalls under bursty traffic.
+
+Configuration (environment):
+    EVENT_LOG_DURABILITY         immediate | buffered (default: immediate)
+    EVENT_LOG_FLUSH_INTERVAL_MS  flusher period in ms (default: 200)
+    EVENT_LOG_BATCH_SIZE         records per log that force a flush (default: 100)
+    EVENT_LOG_FSYNC              fsync after each write (default: false)
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .segmented_log import SegmentedLog
+
+try:
+    from ..monitoring_service import MetricsCollector
+except ImportError:
+    from monitoring_service import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_MS = 200
+DEFAULT_BATCH_SIZE = 100
+
+
+def _int_from_env(name: str, default: int) -> int:
+    """Read an integer setting, falling back to ``default`` if malformed."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r; using %d", name, value, default)
+        return default
+
+
+class DurabilityPolicy:
+    """When and how buffered event log records are written."""
+
+    IMMEDIATE = "immediate"
+    BUFFERED = "buffered"
+
+    def __init__(
+        self,
+        mode: str = IMMEDIATE,
+        interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        fsync: bool = False,
+    ):
+        """
+        Initialize durability policy.
+
+        Args:
+            mode: ``immediate`` (write-through) or ``buffered``
+            interval_ms: Background flush period for buffered mode
+            batch_size: Pending records per log that trigger a flush
+            fsync: Force writes to stable storage
+        """
+        if mode not in (self.IMMEDIATE, self.BUFFERED):
+            raise ValueError(f"Unknown event log durability mode: {mode}")
+        self.mode = mode
+        self.interval_ms = max(1, interval_ms)
+        self.batch_size = max(1, batch_size)
+        self.fsync = fsync
+
+    @property
+    def buffered(self) -> bool:
+        """Whether records are buffered before writing."""
+        return self.mode == self.BUFFERED
+
+    @classmethod
+    def from_env(cls) -> "DurabilityPolicy":
+        """
+        Build a policy from EVENT_LOG_* environment variables.
+
+        Malformed values fall back to the defaults with a warning, so a bad
+        setting cannot break every event write.
+        """
+        mode = os.getenv("EVENT_LOG_DURABILITY", cls.IMMEDIATE).lower()
+        if mode not in (cls.IMMEDIATE, cls.BUFFERED):
+            logger.warning(
+                "Ignoring invalid EVENT_LOG_DURABILITY=%r; using %s",
+                mode,
+                cls.IMMEDIATE,
+            )
+            mode = cls.IMMEDIATE
+        return cls(
+            mode=mode,
+            interval_ms=_int_from_env(
+                "EVENT_LOG_FLUSH_INTERVAL_MS", DEFAULT_FLUSH_INTERVAL_MS
+            ),
+            batch_size=_int_from_env("EVENT_LOG_BATCH_SIZE", DEFAULT_BATCH_SIZE),
+            fsync=os.getenv("EVENT_LOG_FSYNC", "false").lower() in ("1", "true", "yes"),
+        )
+
+
+class BufferedLogWriter:
+    """Per-log write buffer with a background flusher."""
+
+    def __init__(self, policy: Optional[DurabilityPolicy] = None):
+        """
+        Initialize buffered log writer.
+
+        Args:
+            policy: Durability policy (defaults to the environment policy)
+        """
+        self.policy = policy or DurabilityPolicy.from_env()
+        self._buffers: Dict[Path, Tuple[SegmentedLog, List[Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def append(self, log: SegmentedLog, record: Dict[str, Any]) -> None:
+        """
+        Write or buffer a record according to the durability policy.
+
+        Args:
+            log: Target log
+            record: Record to append
+        """
+        if not self.policy.buffered:
+            log.append_many([record], fsync=self.policy.fsync)
+            return
+
+        with self._lock:
+            _, pending = self._buffers.setdefault(log.path, (log, []))
+            pending.append(record)
+            full = len(pending) >= self.policy.batch_size
+            depth = self._depth_locked()
+
+        MetricsCollector.set_event_log_buffer_depth(depth)
+        self._ensure_flusher()
+
+        if full:
+            self.flush(log.path)
+
+    def flush(self, path: Optional[Union[str, Path]] = None) -> int:
+        """
+        Write buffered records.
+
+        Args:
+            path: Only flush this log (all logs if None)
+
+        Returns:
+            Number of records written
+        """
+        with self._flush_lock:
+            with self._lock:
+                if path is None:
+                    batches = list(self._buffers.values())
+                    self._buffers.clear()
+                else:
+                    batch = self._buffers.pop(Path(path), None)
+                    batches = [batch] if batch else []
+
+            if not batches:
+                return 0
+
+            start_time = time.time()
+            written = 0
+            try:
+                for index, (log, records) in enumerate(batches):
+                    log.append_many(records, fsync=self.policy.fsync)
+                    written += len(records)
+            except Exception:
+                # Put unwritten batches back in front of anything newer
+                self._requeue(batches[index:])
+                raise
+            finally:
+                if written:
+                    MetricsCollector.record_event_log_flush(
+                        time.time() - start_time, written
+                    )
+                MetricsCollector.set_event_log_buffer_depth(self.depth())
+
+            return written
+
+    def depth(self) -> int:
+        """Number of buffered records across all logs."""
+        with self._lock:
+            return self._depth_locked()
+
+    def close(self) -> None:
+        """Stop the background flusher and write everything still buffered."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+        self._stop.clear()
+
+    # Private helper methods
+
+    def _depth_locked(self) -> int:
+        return sum(len(records) for _, records in self._buffers.values())
+
+    def _requeue(self, batches: List[Tuple[SegmentedLog, List[Dict[str, Any]]]]):
+        with self._lock:
+            for log, records in batches:
+                _, pending = self._buffers.setdefault(log.path, (log, []))
+                pending[:0] = records
+
+    def _ensure_flusher(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="event-log-flusher", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        interval = self.policy.interval_ms / 1000
+        while not self._stop.wait(interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Background event log flush failed")
+
+
+_event_log_writer: Optional[BufferedLogWriter] = None
+
+
+def get_event_log_writer() -> BufferedLogWriter:
+    """Return the process-wide event log writer."""
+    global _event_log_writer
+    if _event_log_writer is None:
+        _event_log_writer = BufferedLogWriter()
+    return _event_log_writer
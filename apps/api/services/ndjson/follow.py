@@ -0,0 +1,44 @@
+"""
+Forward NDJSON parsing - records appended since an offset.
+Single Responsibility: Turn "bytes appended after offset N" into parsed records.
+
+Used by SegmentedLog for forward reads and live tailing (e.g. Server-Sent
+Events), where a reader remembers the position it has consumed up to and
+periodically asks for anything new.
+"""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+
+def parse_appended_spans(
+    data: bytes, offset: int
+) -> Tuple[List[Tuple[Dict[str, Any], int, int]], int]:
+    """
+    Parse complete NDJSON lines from a chunk that starts at ``offset``.
+
+    A trailing line without a newline is treated as still being written and
+    is left for the next call.
+
+    Args:
+        data: Raw bytes read from the log
+        offset: Byte offset of ``data`` within the log
+
+    Returns:
+        Tuple of ([(record, start_offset, end_offset), ...], offset after
+        last complete line)
+    """
+    records = []
+    position = offset
+    consumed = data.rfind(b"\n") + 1
+    for line in data[:consumed].split(b"\n")[:-1]:
+        start = position
+        position += len(line) + 1
+        if not line.strip():
+            continue
+        try:
+            records.append((json.loads(line), start, position))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+
+    return records, offset + consumed
@@ -0,0 +1,254 @@
+"""
+Indexed record store - keyed records with O(1) updates on a segmented log.
+Single Responsibility: Look up and update records by id without rewriting or
+rescanning the log.
+
+Records are stored in a SegmentedLog. Updating a record appends a small
+update record instead of rewriting the file::
+
+    {"id": "cmd-1", "status": "running", ...}           full record
+    {"_update": "cmd-1", "fields": {"status": "completed"}}   update record
+
+Readers merge update records into the record they refer to. Each process
+keeps an id -> positions index for every store it touches; it is built from
+the log on first use and then caught up with only the records appended
+since. When the active segment is sealed, update records whose base record
+is in the same segment are folded into it (compaction), so reads do not
+degrade as updates accumulate.
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .segmented_log import LogPosition, SegmentedLog
+
+UPDATE_FIELD = "_update"
+
+
+def update_record(record_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the append-only update record for ``record_id``."""
+    return {UPDATE_FIELD: record_id, "fields": fields}
+
+
+def merge_records(
+    records: Iterable[Dict[str, Any]], key: str = "id"
+) -> List[Dict[str, Any]]:
+    """
+    Merge update records into their base records.
+
+    Later full records with the same key replace earlier ones. Records keep
+    the order in which their key first appeared; updates without a base
+    record are dropped.
+    """
+    merged: Dict[Any, Dict[str, Any]] = {}
+    for record in records:
+        target = record.get(UPDATE_FIELD)
+        if target is None:
+            merged[record.get(key)] = dict(record)
+        elif target in merged:
+            merged[target].update(record.get("fields") or {})
+    return list(merged.values())
+
+
+def fold_updates(
+    records: List[Dict[str, Any]], key: str = "id"
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Compact one segment by folding updates into base records in that segment.
+
+    Updates whose base record lives in an older segment are kept. Suitable as
+    a SegmentedLog ``compact`` hook.
+
+    Returns:
+        Compacted records, or None if nothing could be folded
+    """
+    bases: Dict[Any, Dict[str, Any]] = {}
+    compacted: List[Dict[str, Any]] = []
+    folded = False
+    for record in records:
+        target = record.get(UPDATE_FIELD)
+        if target is None:
+            base = dict(record)
+            bases[record.get(key)] = base
+            compacted.append(base)
+        elif target in bases:
+            bases[target].update(record.get("fields") or {})
+            folded = True
+        else:
+            compacted.append(record)
+    return compacted if folded else None
+
+
+class IndexedRecordStore:
+    """Keyed records with append-only updates and an id -> position index."""
+
+    def __init__(self, log: SegmentedLog, key: str = "id"):
+        """
+        Initialize indexed record store.
+
+        Args:
+            log: Segmented log holding the records
+            key: Field identifying a record
+        """
+        self.log = log
+        self.key = key
+        self._lock = threading.Lock()
+        # id -> positions of the base record and its updates, oldest first
+        self._positions: Dict[Any, List[LogPosition]] = {}
+        # segment id -> ids with positions in that segment
+        self._segment_ids: Dict[int, Set[Any]] = {}
+        # Segments indexed while still active (may be compacted when sealed)
+        self._unsealed: Set[int] = set()
+        self._position: LogPosition = (1, 0)
+
+    def put(self, record: Dict[str, Any]) -> None:
+        """Append a full record."""
+        self.log.append(record)
+
+    def update(self, record_id: str, fields: Dict[str, Any]) -> None:
+        """
+        Append an update for a record; cost is independent of log length.
+
+        Args:
+            record_id: Key of the record to update
+            fields: Fields to set
+        """
+        fields = {k: v for k, v in fields.items() if k != self.key}
+        self.log.append(update_record(record_id, fields))
+
+    def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the merged record for an id, or None if unknown.
+
+        Reads only the records indexed for this id.
+        """
+        for _ in range(2):
+            with self._lock:
+                self._catch_up()
+                positions = list(self._positions.get(record_id, ()))
+            if not positions:
+                return None
+
+            records = self.log.read_at(positions)
+            if all(self._belongs(record, record_id) for record in records):
+                merged = merge_records(records, self.key)
+                return merged[0] if merged else None
+
+            # The log was rewritten under us; rebuild the affected segments
+            with self._lock:
+                for segment_id in {segment_id for segment_id, _ in positions}:
+                    self._reindex_segment(segment_id)
+        return None
+
+    def get_many(self, record_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Return merged records for several ids in one read.
+
+        Unknown ids are omitted. Each sealed segment involved is decompressed
+        at most once.
+        """
+        record_ids = list(dict.fromkeys(record_ids))
+        with self._lock:
+            self._catch_up()
+            wanted = [(rid, list(self._positions.get(rid, ()))) for rid in record_ids]
+
+        flat = [position for _, positions in wanted for position in positions]
+        records = iter(self.log.read_at(flat))
+        found: Dict[str, Dict[str, Any]] = {}
+        for record_id, positions in wanted:
+            chunk = [next(records) for _ in positions]
+            if not chunk:
+                continue
+            if all(self._belongs(record, record_id) for record in chunk):
+                merged = merge_records(chunk, self.key)
+                if merged:
+                    found[record_id] = merged[0]
+            else:
+                # Rewritten under us; fall back to the self-healing lookup
+                record = self.get(record_id)
+                if record is not None:
+                    found[record_id] = record
+        return found
+
+    def contains(self, record_id: str) -> bool:
+        """Whether a record with this id has been stored."""
+        with self._lock:
+            self._catch_up()
+            return record_id in self._positions
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        """Return every record with its updates merged (full scan)."""
+        return merge_records(self.log.iter_records(), self.key)
+
+    # Private helper methods
+
+    def _belongs(self, record: Optional[Dict[str, Any]], record_id: str) -> bool:
+        if record is None:
+            return False
+        return record.get(UPDATE_FIELD, record.get(self.key)) == record_id
+
+    def _catch_up(self) -> None:
+        """Index records appended since the last call (lock held)."""
+        previous_segment = self._position[0]
+        spans, self._position = self.log.read_spans_since(self._position)
+        for record, start, _ in spans:
+            self._add(record, start)
+
+        if self._position[0] != previous_segment:
+            # Segments indexed while active were sealed, possibly compacted
+            sealed = {
+                segment["id"]: segment for segment in self.log.manifest()["segments"]
+            }
+            for segment_id in sorted(self._unsealed & set(sealed)):
+                self._unsealed.discard(segment_id)
+                if sealed[segment_id].get("compacted"):
+                    self._reindex_segment(segment_id)
+
+        if spans and spans[-1][1][0] == self._position[0]:
+            self._unsealed.add(self._position[0])
+
+    def _add(self, record: Dict[str, Any], start: LogPosition) -> None:
+        record_id = record.get(UPDATE_FIELD, record.get(self.key))
+        if record_id is None:
+            return
+        if UPDATE_FIELD in record and record_id not in self._positions:
+            return
+        self._positions.setdefault(record_id, []).append(start)
+        self._segment_ids.setdefault(start[0], set()).add(record_id)
+
+    def _reindex_segment(self, segment_id: int) -> None:
+        """Drop and rebuild index entries pointing into one segment."""
+        for record_id in self._segment_ids.pop(segment_id, set()):
+            remaining = [
+                p for p in self._positions.get(record_id, []) if p[0] != segment_id
+            ]
+            if remaining:
+                self._positions[record_id] = remaining
+            else:
+                self._positions.pop(record_id, None)
+
+        spans, _ = self.log.read_spans_since((segment_id, 0), single_segment=True)
+        touched = set()
+        for record, start, _ in spans:
+            self._add(record, start)
+            touched.add(record.get(UPDATE_FIELD, record.get(self.key)))
+        for record_id in touched:
+            if record_id in self._positions:
+                self._positions[record_id].sort()
+
+
+_stores: Dict[Tuple[Path, str], IndexedRecordStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_indexed_store(log: SegmentedLog, key: str = "id") -> IndexedRecordStore:
+    """Return the process-wide store (and index) for a log."""
+    with _stores_lock:
+        store = _stores.get((log.path, key))
+        if store is None:
+            store = _stores[(log.path, key)] = IndexedRecordStore(log, key)
+        else:
+            # Pick up the caller's hooks (seal callback, compaction)
+            store.log = log
+        return store
@@ -0,0 +1,71 @@
+"""
+File locks - advisory inter-process locks held on sidecar lock files.
+Single Responsibility: Serialize writers (and readers) of shared files across
+worker processes.
+
+Uses ``fcntl.flock`` where available. On Windows, where ``fcntl`` does not
+exist, ``msvcrt.locking`` is used instead; it has no shared mode, so shared
+locks are taken exclusively there. Without either module the lock is a no-op
+and only the callers' in-process locking applies.
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+@contextmanager
+def file_lock(path: Union[str, Path], exclusive: bool = True) -> Iterator[None]:
+    """
+    Hold a lock on ``path`` (created if missing) for the duration of the block.
+
+    Args:
+        path: Lock file; its parent directory is created when missing
+        exclusive: Take an exclusive rather than a shared lock
+    """
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o644)
+    except FileNotFoundError:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        _acquire(fd, exclusive)
+        try:
+            yield
+        finally:
+            _release(fd)
+    finally:
+        os.close(fd)
+
+
+def _acquire(fd: int, exclusive: bool) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+    elif msvcrt is not None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                # LK_LOCK retries for about 10 seconds before giving up
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+
+def _release(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    elif msvcrt is not None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
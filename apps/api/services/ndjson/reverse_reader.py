@@ -0,0 +1,78 @@
+"""
+Reverse NDJSON reader - newest-first access to append-only logs.
+Single Responsibility: Yield lines from the end of a file without reading all of it.
+
+Append-only logs (audit history, audit events, project events) are written
+oldest-first, while most queries want the newest entries. Reading backwards
+from EOF makes "last N entries" cost proportional to N, not to file size.
+"""
+
+import json
+import mmap
+from typing import Any, BinaryIO, Dict, Iterable, Iterator
+
+# Block size for the non-mmap fallback reader
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+
+def iter_file_lines_reversed(
+    f: BinaryIO, size: int, block_size: int = DEFAULT_BLOCK_SIZE
+) -> Iterator[bytes]:
+    """
+    Yield non-empty lines of an open binary file, last line first.
+
+    Only the first ``size`` bytes are considered, so callers can pin a
+    consistent snapshot of a file that is still being appended to.
+
+    Args:
+        f: File opened in binary mode
+        size: Number of bytes to consider
+        block_size: Read size for the block-wise fallback
+
+    Yields:
+        Raw line bytes without the trailing newline
+    """
+    if size == 0:
+        return
+
+    try:
+        mapped = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        yield from _iter_blocks_reversed(f, size, block_size)
+        return
+
+    with mapped:
+        end = size
+        while end > 0:
+            start = mapped.rfind(b"\n", 0, end) + 1
+            line = mapped[start:end]
+            if line.strip():
+                yield line
+            end = start - 1
+
+
+def _iter_blocks_reversed(f: BinaryIO, size: int, block_size: int) -> Iterator[bytes]:
+    """Block-wise reverse line reader used when mmap is unavailable."""
+    remainder = b""
+    position = size
+    while position > 0:
+        read_size = min(block_size, position)
+        position -= read_size
+        f.seek(position)
+        lines = (f.read(read_size) + remainder).split(b"\n")
+        # First fragment may continue in the previous block
+        remainder = lines[0]
+        for line in reversed(lines[1:]):
+            if line.strip():
+                yield line
+    if remainder.strip():
+        yield remainder
+
+
+def parse_ndjson_lines(lines: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    """Parse raw NDJSON lines, skipping malformed ones."""
+    for line in lines:
+        try:
+            yield json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
@@ -0,0 +1,497 @@
+"""
+Segmented NDJSON log - rotating, compressed append-only logs with a manifest.
+Single Responsibility: Persist and read an append-only record stream split into
+fixed-size segments.
+
+Layout for a log at ``events/audit.ndjson``::
+
+    events/audit.ndjson                         active (uncompressed) segment
+    events/audit.ndjson.segments/000001.ndjson.gz   sealed segments
+    events/audit.ndjson.manifest.json           per-segment counts/time ranges
+    events/.audit.ndjson.lock                   lock coordinating writers/readers
+
+The active segment keeps the original file name, so existing tooling that
+reads the plain NDJSON file keeps working for recent records. Once the active
+segment exceeds ``max_segment_bytes`` it is gzip-compressed into an immutable
+sealed segment and a fresh active segment is started. Sealed segments never
+change, so they are committed to git once; readers use the manifest's time
+ranges to skip segments outside a requested window. An optional ``compact``
+hook may rewrite the records of the active segment as it is sealed (e.g. to
+fold update records into the records they update); such segments are marked
+``compacted`` in the manifest. The lock file is host-local; GitManager
+excludes ``.*.lock`` files from git.
+"""
+
+import gzip
+import io
+import json
+import logging
+import mmap
+import os
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .locking import file_lock
+from .follow import parse_appended_spans
+from .reverse_reader import iter_file_lines_reversed, parse_ndjson_lines
+
+logger = logging.getLogger(__name__)
+
+# Default active segment size before it is sealed (override via env)
+DEFAULT_SEGMENT_BYTES = 4 * 1024 * 1024
+
+MANIFEST_VERSION = 1
+
+# Stream position: (segment id, byte offset within that segment)
+LogPosition = Tuple[int, int]
+
+
+def _iter_spans_reversed(
+    data: Union[bytes, mmap.mmap], end: int
+) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """Yield (record, start offset) for lines starting before ``end``, last first."""
+    if 0 < end < len(data) and data[end - 1 : end] != b"\n":
+        # ``end`` falls inside a line that starts before it; include that line
+        newline = data.find(b"\n", end)
+        end = newline if newline >= 0 else len(data)
+    while end > 0:
+        start = data.rfind(b"\n", 0, end) + 1
+        line = data[start:end]
+        if line.strip():
+            try:
+                record = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                record = None
+            if isinstance(record, dict):
+                yield record, start
+        end = start - 1
+
+
+def _segment_bytes_from_env() -> int:
+    """Resolve the configured segment size."""
+    try:
+        return int(os.getenv("EVENT_LOG_SEGMENT_BYTES", DEFAULT_SEGMENT_BYTES))
+    except ValueError:
+        return DEFAULT_SEGMENT_BYTES
+
+
+class SegmentedLog:
+    """Append-only NDJSON log stored as sealed gzip segments plus an active file."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        time_field: str = "timestamp",
+        max_segment_bytes: Optional[int] = None,
+        on_seal: Optional[Callable[[List[Path]], None]] = None,
+        compact: Optional[
+            Callable[[List[Dict[str, Any]]], Optional[List[Dict[str, Any]]]]
+        ] = None,
+    ):
+        """
+        Initialize segmented log.
+
+        Args:
+            path: Path of the active NDJSON segment
+            time_field: Record field used for manifest time ranges
+            max_segment_bytes: Active segment size that triggers sealing
+            on_seal: Callback receiving the files written by a seal
+                (sealed segment and manifest), e.g. to commit them
+            compact: Rewrites the active segment's records before sealing;
+                returns None to keep the segment unchanged
+        """
+        self.path = Path(path)
+        self.time_field = time_field
+        self.max_segment_bytes = max_segment_bytes or _segment_bytes_from_env()
+        self.on_seal = on_seal
+        self.compact = compact
+
+        self.segments_dir = self.path.with_name(self.path.name + ".segments")
+        self.manifest_path = self.path.with_name(self.path.name + ".manifest.json")
+        self.lock_path = self.path.with_name(f".{self.path.name}.lock")
+
+    # Writing
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append a single record."""
+        self.append_many([record])
+
+    def append_many(
+        self, records: Iterable[Dict[str, Any]], fsync: bool = False
+    ) -> None:
+        """
+        Append records in one write, sealing the active segment if it is full.
+
+        Args:
+            records: Records to append (in order)
+            fsync: Force the write to stable storage before returning
+        """
+        payload = "".join(json.dumps(record) + "\n" for record in records)
+        if not payload:
+            return
+
+        sealed_files = None
+        with self._locked(exclusive=True):
+            with self.path.open("a") as f:
+                f.write(payload)
+                size = f.tell()
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            if size >= self.max_segment_bytes:
+                sealed_files = self._seal()
+
+        if sealed_files and self.on_seal:
+            try:
+                self.on_seal(sealed_files)
+            except Exception:
+                logger.exception("Seal callback failed for %s", self.path)
+
+    # Reading
+
+    def iter_records(
+        self, since: Optional[str] = None, until: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield records oldest first, skipping sealed segments outside a window.
+
+        Records inside retained segments are not filtered individually;
+        callers still apply their own ``since``/``until`` checks.
+
+        Args:
+            since: Skip segments whose newest record is older than this
+            until: Skip segments whose oldest record is newer than this
+        """
+        with self._snapshot() as (segments, active, size):
+            for segment in segments:
+                if since and segment.get("last") and segment["last"] < since:
+                    continue
+                if until and segment.get("first") and segment["first"] > until:
+                    continue
+                yield from parse_ndjson_lines(self._read_segment(segment).split(b"\n"))
+            if active is not None:
+                active.seek(0)
+                yield from parse_ndjson_lines(active.read(size).split(b"\n"))
+
+    def iter_reversed(self, since: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield records newest first.
+
+        Args:
+            since: Stop before sealed segments whose newest record is older
+        """
+        with self._snapshot() as (segments, active, size):
+            if active is not None:
+                yield from parse_ndjson_lines(iter_file_lines_reversed(active, size))
+            for segment in reversed(segments):
+                if since and segment.get("last") and segment["last"] < since:
+                    break
+                lines = self._read_segment(segment).split(b"\n")
+                yield from parse_ndjson_lines(reversed(lines))
+
+    def iter_reversed_spans(
+        self, before: Optional[LogPosition] = None
+    ) -> Iterator[Tuple[Dict[str, Any], LogPosition]]:
+        """
+        Yield records newest first together with the position they start at.
+
+        Positions can be passed back as ``before`` to resume the scan, which
+        makes them usable as pagination cursors as long as the log is not
+        compacted.
+
+        Args:
+            before: Only yield records starting strictly before this position
+        """
+        with self._snapshot() as (segments, active, size):
+            active_id = self._active_id(segments)
+            before_id, before_offset = before or (active_id, size)
+
+            if active is not None and before_id >= active_id and size:
+                end = min(size, before_offset) if before_id == active_id else size
+                try:
+                    data = mmap.mmap(active.fileno(), size, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    active.seek(0)
+                    data = active.read(size)
+                try:
+                    for record, offset in _iter_spans_reversed(data, end):
+                        yield record, (active_id, offset)
+                finally:
+                    if isinstance(data, mmap.mmap):
+                        data.close()
+
+            for segment in reversed(segments):
+                if segment["id"] > before_id:
+                    continue
+                data = self._read_segment(segment)
+                end = before_offset if segment["id"] == before_id else len(data)
+                for record, offset in _iter_spans_reversed(data, end):
+                    yield record, (segment["id"], offset)
+
+    def tail(self, limit: int) -> List[Dict[str, Any]]:
+        """Return the last ``limit`` records, newest first."""
+        records = []
+        if limit <= 0:
+            return records
+        for record in self.iter_reversed():
+            records.append(record)
+            if len(records) >= limit:
+                break
+        return records
+
+    def end_position(self) -> LogPosition:
+        """Return the position just after the last complete record."""
+        with self._snapshot() as (segments, active, size):
+            return self._active_id(segments), size
+
+    def read_since(
+        self, position: LogPosition
+    ) -> Tuple[List[Tuple[Dict[str, Any], LogPosition]], LogPosition]:
+        """
+        Read records written after a position, following segment rotation.
+
+        Args:
+            position: (segment id, offset) already consumed
+
+        Returns:
+            Tuple of ([(record, position after record), ...], new position)
+        """
+        spans, new_position = self.read_spans_since(position)
+        return [(record, end) for record, _, end in spans], new_position
+
+    def read_spans_since(
+        self, position: LogPosition, single_segment: bool = False
+    ) -> Tuple[List[Tuple[Dict[str, Any], LogPosition, LogPosition]], LogPosition]:
+        """
+        Like read_since, but also report the position each record starts at.
+
+        Args:
+            position: (segment id, offset) already consumed
+            single_segment: Stop at the end of the position's segment
+
+        Returns:
+            Tuple of ([(record, start position, end position), ...],
+            new position)
+        """
+        segment_id, offset = position
+        results: List[Tuple[Dict[str, Any], LogPosition, LogPosition]] = []
+
+        with self._snapshot() as (segments, active, size):
+            active_id = self._active_id(segments)
+
+            if segment_id > active_id:
+                # Position from a log that has since been reset
+                segment_id, offset = active_id, 0
+
+            for segment in segments:
+                if segment["id"] < segment_id:
+                    continue
+                start = offset if segment["id"] == segment_id else 0
+                data = self._read_segment(segment)
+                records, _ = parse_appended_spans(data[start:], start)
+                results.extend(
+                    (record, (segment["id"], begin), (segment["id"], end))
+                    for record, begin, end in records
+                )
+                if single_segment:
+                    return results, (segment["id"], len(data))
+
+            start = offset if segment_id == active_id else 0
+            if start > size:
+                start = 0
+            if active is None or size == start:
+                return results, (active_id, start)
+
+            active.seek(start)
+            records, consumed = parse_appended_spans(active.read(size - start), start)
+            results.extend(
+                (record, (active_id, begin), (active_id, end))
+                for record, begin, end in records
+            )
+            return results, (active_id, consumed)
+
+    def read_at(
+        self, positions: Iterable[LogPosition]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Read the records starting at the given positions.
+
+        Each sealed segment involved is decompressed once, so the cost depends
+        on segment size rather than on the length of the log.
+
+        Args:
+            positions: Record start positions (e.g. from read_spans_since)
+
+        Returns:
+            Records in the same order; None where no record starts there
+        """
+        positions = list(positions)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(positions)
+        if not positions:
+            return results
+
+        with self._snapshot() as (segments, active, size):
+            active_id = self._active_id(segments)
+            sealed = {segment["id"]: segment for segment in segments}
+            decompressed: Dict[int, bytes] = {}
+
+            for i, (segment_id, offset) in enumerate(positions):
+                if segment_id == active_id:
+                    if active is None or offset >= size:
+                        continue
+                    active.seek(offset)
+                    line = active.readline(size - offset)
+                elif segment_id in sealed:
+                    if segment_id not in decompressed:
+                        decompressed[segment_id] = self._read_segment(
+                            sealed[segment_id]
+                        )
+                    data = decompressed[segment_id]
+                    end = data.find(b"\n", offset)
+                    line = data[offset : end if end >= 0 else len(data)]
+                else:
+                    continue
+                try:
+                    record = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                if isinstance(record, dict):
+                    results[i] = record
+        return results
+
+    def manifest(self) -> Dict[str, Any]:
+        """Return the manifest describing sealed segments."""
+        with self._locked(exclusive=False):
+            return self._read_manifest()
+
+    # Private helper methods
+
+    def _locked(self, exclusive: bool):
+        """Hold an flock on the log's lock file."""
+        return file_lock(self.lock_path, exclusive=exclusive)
+
+    @contextmanager
+    def _snapshot(
+        self,
+    ) -> Iterator[Tuple[List[Dict[str, Any]], Optional[BinaryIO], int]]:
+        """
+        Capture a consistent view of sealed segments and the active segment.
+
+        The lock is only held while the manifest is read and the active file
+        opened. Sealing replaces (never truncates) the active file, so the
+        open handle stays valid for the captured size afterwards.
+        """
+        if not self.path.exists() and not self.manifest_path.exists():
+            yield [], None, 0
+            return
+
+        with self._locked(exclusive=False):
+            segments = self._read_manifest()["segments"]
+            try:
+                active = self.path.open("rb")
+                size = os.fstat(active.fileno()).st_size
+            except FileNotFoundError:
+                active, size = None, 0
+
+        try:
+            yield segments, active, size
+        finally:
+            if active is not None:
+                active.close()
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        """Load the manifest (caller holds the lock)."""
+        if not self.manifest_path.exists():
+            return {
+                "version": MANIFEST_VERSION,
+                "log": self.path.name,
+                "time_field": self.time_field,
+                "segments": [],
+            }
+        return json.loads(self.manifest_path.read_text())
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Atomically write the manifest (caller holds the exclusive lock)."""
+        tmp_path = self.manifest_path.with_name(f".{self.manifest_path.name}.tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2))
+        os.replace(tmp_path, self.manifest_path)
+
+    def _active_id(self, segments: List[Dict[str, Any]]) -> int:
+        """Segment id the active segment will receive when sealed."""
+        return segments[-1]["id"] + 1 if segments else 1
+
+    def _read_segment(self, segment: Dict[str, Any]) -> bytes:
+        """Decompress a sealed segment."""
+        return gzip.decompress((self.path.parent / segment["file"]).read_bytes())
+
+    def _seal(self) -> List[Path]:
+        """
+        Compress the active segment into a sealed segment (exclusive lock held).
+
+        Returns:
+            Files written (sealed segment, manifest)
+        """
+        data = self.path.read_bytes()
+        records = list(parse_ndjson_lines(data.split(b"\n")))
+
+        compacted = None
+        if self.compact is not None:
+            try:
+                compacted = self.compact(records)
+            except Exception:
+                logger.exception("Compaction failed for %s; sealing as is", self.path)
+            if compacted is not None:
+                records = compacted
+                data = "".join(json.dumps(record) + "\n" for record in records)
+                data = data.encode("utf-8")
+
+        timestamps = [record.get(self.time_field) for record in records]
+        timestamps = [t for t in timestamps if isinstance(t, str)]
+
+        manifest = self._read_manifest()
+        segment_id = self._active_id(manifest["segments"])
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        segment_path = self.segments_dir / f"{segment_id:06d}.ndjson.gz"
+
+        # mtime=0 keeps sealed segments byte-identical for identical input
+        buffer = io.BytesIO()
+        with gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0) as gz:
+            gz.write(data)
+        tmp_path = segment_path.with_name(f".{segment_path.name}.tmp")
+        tmp_path.write_bytes(buffer.getvalue())
+        os.replace(tmp_path, segment_path)
+
+        manifest["segments"].append(
+            {
+                "id": segment_id,
+                "file": f"{self.segments_dir.name}/{segment_path.name}",
+                "count": len(records),
+                "first": min(timestamps) if timestamps else None,
+                "last": max(timestamps) if timestamps else None,
+                "bytes": len(data),
+                "compressed_bytes": len(buffer.getvalue()),
+                "compacted": compacted is not None,
+                "sealed_at": datetime.now(timezone.utc)
+                .isoformat()
+                .replace("+00:00", "Z"),
+            }
+        )
+        self._write_manifest(manifest)
+
+        # Unlink rather than truncate: readers holding the old file stay valid
+        os.unlink(self.path)
+
+        return [segment_path, self.manifest_path]
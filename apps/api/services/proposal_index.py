@@ -0,0 +1,280 @@
+"""
+Proposal index - per-project summary of proposals for fast listing.
+Single Responsibility: Maintain and query id/status/change_type/target/author/
+created_at rows so listing proposals never parses every proposal document.
+
+The index lives at ``proposals.index.json`` in the project's cache directory
+(``.cache/<project>/``, excluded from git by GitManager), together with its
+lock file. Writers update it inside ``transaction()``, which holds the lock
+while the proposal file and its index row are written together. Rows are kept in newest-first order so queries and
+cursors do not sort. The index records a signature of the proposal documents
+(name, mtime and size of each ``proposals/*.json``); if they are added,
+removed or edited behind its back (e.g. by a git pull) the mismatch triggers a
+rebuild. Other files in ``proposals/``, such as the command proposals log,
+do not affect the signature.
+"""
+
+import base64
+import bisect
+import hashlib
+import json
+import logging
+import os
+from contextlib import contextmanager
+from datetime import timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from domain.proposals.models import Proposal
+
+from .ndjson import file_lock
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "proposals.index.json"
+INDEX_VERSION = 2
+
+# Index row fields usable as exact-match filters
+FILTER_FIELDS = ("status", "change_type", "target_artifact", "author")
+
+
+def index_entry(proposal: Proposal) -> Dict[str, Any]:
+    """Build the index row for a proposal."""
+    created_at = proposal.created_at
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return {
+        "status": proposal.status.value,
+        "change_type": proposal.change_type.value,
+        "target_artifact": proposal.target_artifact,
+        "author": proposal.author,
+        "created_at": created_at.isoformat().replace("+00:00", "Z"),
+        # Numeric sort key (ISO strings with/without fractions don't sort)
+        "created_ts": created_at.timestamp(),
+    }
+
+
+def is_proposal_file(name: str) -> bool:
+    """Whether a file in ``proposals/`` is a proposal document."""
+    # The command proposals log keeps its manifest alongside
+    return name.endswith(".json") and not name.endswith(".manifest.json")
+
+
+class ProposalIndex:
+    """Per-project proposal index with cursor pagination."""
+
+    def __init__(self, git_manager):
+        """
+        Initialize proposal index.
+
+        Args:
+            git_manager: Git manager used to resolve project paths
+        """
+        self.git_manager = git_manager
+
+    @contextmanager
+    def transaction(self, project_key: str) -> Iterator[Dict[str, Dict[str, Any]]]:
+        """
+        Lock the index and yield its rows for modification.
+
+        Write proposal files inside the block and set ``rows[id]`` to the new
+        ``index_entry``; the index is saved when the block exits cleanly.
+        """
+        with self._locked(project_key):
+            index = self._read(project_key)
+            if index is None or not self._is_current(project_key, index):
+                index = self._build(project_key)
+            rows = index["entries"]
+            before = {
+                proposal_id: row["created_ts"] for proposal_id, row in rows.items()
+            }
+            yield rows
+            _reorder(index["order"], before, rows)
+            index["signature"] = self._signature(project_key)
+            self._write(project_key, index)
+
+    def query(
+        self,
+        project_key: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        **filters: Optional[str],
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        Return proposal ids (newest first) matching exact-match filters.
+
+        Args:
+            project_key: Project key
+            limit: Maximum ids to return (all if None)
+            cursor: Resume after the position encoded by a previous call
+            **filters: status, change_type, target_artifact and/or author
+
+        Returns:
+            Tuple of (proposal ids, next cursor or None when exhausted)
+
+        Raises:
+            ValueError: If the cursor or a filter name is invalid
+        """
+        unknown = set(filters) - set(FILTER_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown proposal filter: {', '.join(sorted(unknown))}")
+        wanted = {
+            k: getattr(v, "value", v) for k, v in filters.items() if v is not None
+        }
+        after = self.decode_cursor(cursor) if cursor else None
+
+        index = self._load(project_key)
+        entries, order = index["entries"], index["order"]
+        # ``order`` is ascending; walk back from just below the cursor
+        end = bisect.bisect_left(order, list(after)) if after else len(order)
+
+        page: List[Tuple[float, str]] = []
+        for i in range(end - 1, -1, -1):
+            position = tuple(order[i])
+            row = entries[position[1]]
+            if any(row.get(k) != v for k, v in wanted.items()):
+                continue
+            if limit is not None and len(page) == limit:
+                next_cursor = self.encode_cursor(page[-1]) if page else cursor
+                return [proposal_id for _, proposal_id in page], next_cursor
+            page.append(position)
+        return [proposal_id for _, proposal_id in page], None
+
+    def rebuild(self, project_key: str) -> int:
+        """
+        Rebuild the index from the proposal documents.
+
+        Returns:
+            Number of indexed proposals
+        """
+        with self._locked(project_key):
+            index = self._build(project_key)
+            self._write(project_key, index)
+        return len(index["entries"])
+
+    # Cursor handling
+
+    @staticmethod
+    def encode_cursor(position: Tuple[float, str]) -> str:
+        """Encode a (created_ts, id) position as an opaque token."""
+        raw = json.dumps(list(position), separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(token: str) -> Tuple[float, str]:
+        """
+        Decode a cursor produced by encode_cursor.
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            created_ts, proposal_id = json.loads(
+                base64.urlsafe_b64decode(token.encode("ascii"))
+            )
+            return float(created_ts), str(proposal_id)
+        except Exception as e:
+            raise ValueError(f"Invalid proposal cursor: {token}") from e
+
+    # Private helper methods
+
+    def _proposals_path(self, project_key: str) -> Path:
+        return self.git_manager.get_project_path(project_key) / "proposals"
+
+    def _index_path(self, project_key: str) -> Path:
+        return self.git_manager.get_cache_path(project_key) / INDEX_FILE
+
+    def _signature(self, project_key: str) -> Optional[str]:
+        """Fingerprint of the proposal documents (name, mtime, size)."""
+        files = []
+        try:
+            with os.scandir(self._proposals_path(project_key)) as it:
+                for entry in it:
+                    if is_proposal_file(entry.name):
+                        stat = entry.stat()
+                        files.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            return None
+        files.sort()
+        return hashlib.sha1(json.dumps(files).encode("utf-8")).hexdigest()
+
+    def _is_current(self, project_key: str, index: Dict[str, Any]) -> bool:
+        return index.get("signature") == self._signature(project_key)
+
+    def _load(self, project_key: str) -> Dict[str, Any]:
+        """Read the index, rebuilding it if missing or stale."""
+        index = self._read(project_key)
+        if index is not None and self._is_current(project_key, index):
+            return index
+        if not self._proposals_path(project_key).exists():
+            return {"version": INDEX_VERSION, "entries": {}, "order": []}
+
+        with self._locked(project_key):
+            index = self._read(project_key)
+            if index is None or not self._is_current(project_key, index):
+                index = self._build(project_key)
+                self._write(project_key, index)
+        return index
+
+    def _build(self, project_key: str) -> Dict[str, Any]:
+        proposals_path = self._proposals_path(project_key)
+        entries: Dict[str, Dict[str, Any]] = {}
+        if proposals_path.exists():
+            for proposal_file in proposals_path.glob("*.json"):
+                if not is_proposal_file(proposal_file.name):
+                    continue
+                try:
+                    proposal = Proposal(**json.loads(proposal_file.read_text()))
+                except Exception:
+                    logger.warning("Skipping unreadable proposal %s", proposal_file)
+                    continue
+                entries[proposal.id] = index_entry(proposal)
+        return {
+            "version": INDEX_VERSION,
+            "signature": self._signature(project_key),
+            "entries": entries,
+            "order": sorted(
+                [row["created_ts"], proposal_id] for proposal_id, row in entries.items()
+            ),
+        }
+
+    def _read(self, project_key: str) -> Optional[Dict[str, Any]]:
+        path = self._index_path(project_key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Discarding unreadable proposal index at %s", path)
+            return None
+        if index.get("version") != INDEX_VERSION:
+            return None
+        return index
+
+    def _write(self, project_key: str, index: Dict[str, Any]) -> None:
+        path = self._index_path(project_key)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, separators=(",", ":"), sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def _locked(self, project_key: str):
+        """Serialize proposal writes and index rebuilds across processes."""
+        path = self._index_path(project_key)
+        return file_lock(path.with_name(f".{path.name}.lock"))
+
+
+def _reorder(
+    order: List[List[Any]],
+    before: Dict[str, float],
+    entries: Dict[str, Dict[str, Any]],
+) -> None:
+    """Update the sorted ``[created_ts, id]`` list for rows changed in place."""
+    for proposal_id, created_ts in before.items():
+        row = entries.get(proposal_id)
+        if row is None or row["created_ts"] != created_ts:
+            del order[bisect.bisect_left(order, [created_ts, proposal_id])]
+    for proposal_id, row in entries.items():
+        if before.get(proposal_id) != row["created_ts"]:
+            bisect.insort(order, [row["created_ts"], proposal_id])
@@ -2,16 +2,26 @@
 Proposal service for managing proposal lifecycle.
 Handles CRUD operations, apply, and reject logic.
 Enhanced with conflict detection for concurrent proposals.
+
+UPDATE proposals record the hash of the artifact their diff was generated
+against. If the artifact has changed by the time a proposal is applied, the
+proposal is rebased with a three-way merge (base = the committed version
+with that hash, current = the artifact now, proposed = base with the diff
+applied) instead of being rejected. Only overlapping edits raise a conflict.
 """
 
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone
 
 from domain.proposals.models import Proposal, ProposalStatus, ChangeType
 from services.git_manager import GitManager
 from services.audit_service import AuditService
 from services.diff_service import DiffService
+from services.proposal_index import ProposalIndex, index_entry
+
+# Artifact revisions searched for a stale proposal's base content
+REBASE_MAX_REVISIONS = 50
 
 
 class ConflictError(Exception):
@@ -20,6 +30,46 @@ class ConflictError(Exception):
     pass
 
 
+class MergeConflictError(ConflictError):
+    """Raised when a stale proposal overlaps changes made since it was created."""
+
+    def __init__(self, message: str, merged_content: str, conflicts: int):
+        super().__init__(message)
+        self.merged_content = merged_content
+        self.conflicts = conflicts
+
+
+class BatchApplyError(Exception):
+    """Raised when a batch of proposals cannot be applied as a whole."""
+
+    def __init__(self, message: str, results: List[Dict[str, Any]]):
+        super().__init__(message)
+        self.results = results
+
+    @property
+    def has_conflicts(self) -> bool:
+        """Whether any proposal failed because of a conflict."""
+        return any(result.get("reason") == "conflict" for result in self.results)
+
+
+def _failed(
+    proposal_id: str,
+    reason: str,
+    error: str,
+    proposal: Optional[Proposal] = None,
+) -> Dict[str, Any]:
+    """Build the batch report entry for a proposal that was not applied."""
+    return {
+        "proposal_id": proposal_id,
+        "artifact": proposal.target_artifact if proposal else None,
+        "change_type": proposal.change_type.value if proposal else None,
+        "status": "failed",
+        "reason": reason,
+        "error": error,
+        "rebased": False,
+    }
+
+
 class ProposalService:
     """Service for managing proposal lifecycle with audit trail and conflict detection."""
 
@@ -40,6 +90,7 @@ class ProposalService:
         self.git_manager = git_manager
         self.audit_service = audit_service
         self.diff_service = diff_service or DiffService()
+        self.index = ProposalIndex(git_manager)
 
     def create_proposal(self, proposal: Proposal) -> Proposal:
         """
@@ -54,16 +105,28 @@ class ProposalService:
         Raises:
             ValueError: If proposal validation fails
         """
+        # Remember which artifact version the diff applies to
+        if proposal.change_type == ChangeType.UPDATE and not proposal.artifact_hash:
+            current_content = self.git_manager.read_file(
+                proposal.project_key, proposal.target_artifact
+            )
+            if current_content is not None:
+                proposal.artifact_hash = self.diff_service.compute_content_hash(
+                    current_content
+                )
+
         # Ensure proposals directory exists
         proposals_path = (
             self.git_manager.get_project_path(proposal.project_key) / "proposals"
         )
         proposals_path.mkdir(parents=True, exist_ok=True)
 
-        # Persist proposal to JSON
+        # Persist proposal to JSON together with its index row
         proposal_file = proposals_path / f"{proposal.id}.json"
         proposal_data = proposal.model_dump(mode="json")
-        proposal_file.write_text(json.dumps(proposal_data, indent=2))
+        with self.index.transaction(proposal.project_key) as rows:
+            proposal_file.write_text(json.dumps(proposal_data, indent=2))
+            rows[proposal.id] = index_entry(proposal)
 
         # Commit proposal
         relative_path = f"proposals/{proposal.id}.json"
@@ -116,6 +179,8 @@ class ProposalService:
         project_key: str,
         status: Optional[ProposalStatus] = None,
         change_type: Optional[ChangeType] = None,
+        target_artifact: Optional[str] = None,
+        author: Optional[str] = None,
     ) -> List[Proposal]:
         """
         List proposals with optional filtering.
@@ -124,31 +189,68 @@ class ProposalService:
             project_key: Project key
             status: Filter by status
             change_type: Filter by change type
+            target_artifact: Filter by target artifact path
+            author: Filter by author
 
         Returns:
-            List of proposals matching filters
+            List of proposals matching filters (newest first)
         """
-        proposals_path = self.git_manager.get_project_path(project_key) / "proposals"
+        proposals, _ = self.list_proposals_page(
+            project_key,
+            status=status,
+            change_type=change_type,
+            target_artifact=target_artifact,
+            author=author,
+        )
+        return proposals
 
-        if not proposals_path.exists():
-            return []
+    def list_proposals_page(
+        self,
+        project_key: str,
+        status: Optional[ProposalStatus] = None,
+        change_type: Optional[ChangeType] = None,
+        target_artifact: Optional[str] = None,
+        author: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Proposal], Optional[str]]:
+        """
+        List one page of proposals using the proposal index.
 
-        proposals = []
-        for proposal_file in proposals_path.glob("*.json"):
-            proposal_data = json.loads(proposal_file.read_text())
-            proposal = Proposal(**proposal_data)
+        Filtering and ordering run against the index; only proposals on the
+        returned page are loaded from disk.
 
-            # Apply filters
-            if status and proposal.status != status:
-                continue
-            if change_type and proposal.change_type != change_type:
-                continue
+        Args:
+            project_key: Project key
+            status: Filter by status
+            change_type: Filter by change type
+            target_artifact: Filter by target artifact path
+            author: Filter by author
+            limit: Page size (all matches if None)
+            cursor: Cursor returned by the previous page
 
-            proposals.append(proposal)
+        Returns:
+            Tuple of (proposals newest first, next page cursor or None)
 
-        # Sort by creation time (newest first)
-        proposals.sort(key=lambda p: p.created_at, reverse=True)
-        return proposals
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        proposal_ids, next_cursor = self.index.query(
+            project_key,
+            limit=limit,
+            cursor=cursor,
+            status=status,
+            change_type=change_type,
+            target_artifact=target_artifact,
+            author=author,
+        )
+
+        proposals = []
+        for proposal_id in proposal_ids:
+            proposal = self.get_proposal(project_key, proposal_id)
+            if proposal is not None:
+                proposals.append(proposal)
+        return proposals, next_cursor
 
     def apply_proposal(self, project_key: str, proposal_id: str) -> Dict[str, Any]:
         """
@@ -157,7 +259,9 @@ class ProposalService:
         This operation is atomic - all changes (artifact update, proposal status,
         audit event) are committed in a single transaction.
 
-        Includes conflict detection for concurrent proposals.
+        Includes conflict detection for concurrent proposals: if the artifact
+        changed after the proposal was created, the proposal is rebased onto
+        the current content with a three-way merge.
 
         Args:
             project_key: Project key
@@ -168,7 +272,9 @@ class ProposalService:
 
         Raises:
             ValueError: If proposal is invalid or cannot be applied
-            ConflictError: If artifact has changed since proposal was created (409)
+            ConflictError: If the artifact has changed since the proposal was
+                created and the proposal cannot be rebased (409)
+            MergeConflictError: If the rebase hits overlapping edits (409)
         """
         # Load proposal
         proposal = self.get_proposal(project_key, proposal_id)
@@ -182,6 +288,7 @@ class ProposalService:
 
         # Conflict detection for UPDATE operations
         artifact_path = proposal.target_artifact
+        rebased = False
         if proposal.change_type == ChangeType.UPDATE:
             current_content = self.git_manager.read_file(project_key, artifact_path)
             if current_content is None:
@@ -189,17 +296,7 @@ class ProposalService:
 
                 raise ValueError(not_found("Target artifact", artifact_path))
 
-            # Check if artifact has changed since proposal was created
-            expected_hash = getattr(proposal, "artifact_hash", None)
-            if expected_hash:
-                current_hash = self.diff_service.compute_content_hash(current_content)
-                if current_hash != expected_hash:
-                    # Conflict detected - artifact has changed
-                    raise ConflictError(
-                        f"Artifact {artifact_path} has changed since proposal was created. "
-                        f"Expected hash: {expected_hash}, current hash: {current_hash}. "
-                        f"Please review the proposal and regenerate if necessary."
-                    )
+            new_content, rebased = self._updated_content(proposal, current_content)
 
         # Handle change type
         files_to_commit = [f"proposals/{proposal_id}.json"]
@@ -214,15 +311,6 @@ class ProposalService:
             files_to_commit.append(artifact_path)
 
         elif proposal.change_type == ChangeType.UPDATE:
-            # Read existing artifact
-            old_content = self.git_manager.read_file(project_key, artifact_path)
-            if old_content is None:
-                from domain.errors import not_found
-
-                raise ValueError(not_found("Target artifact", artifact_path))
-
-            # Apply diff
-            new_content = self._apply_diff(old_content, proposal.diff)
             self.git_manager.write_file(
                 project_key=project_key,
                 relative_path=artifact_path,
@@ -246,7 +334,9 @@ class ProposalService:
             / f"{proposal_id}.json"
         )
         proposal_data = proposal.model_dump(mode="json")
-        proposal_file.write_text(json.dumps(proposal_data, indent=2))
+        with self.index.transaction(project_key) as rows:
+            proposal_file.write_text(json.dumps(proposal_data, indent=2))
+            rows[proposal_id] = index_entry(proposal)
 
         # Commit all changes atomically
         self.git_manager.commit_changes(
@@ -264,6 +354,7 @@ class ProposalService:
                 "proposal_id": proposal_id,
                 "target_artifact": artifact_path,
                 "change_type": proposal.change_type,
+                "rebased": rebased,
             },
             git_manager=self.git_manager,
         )
@@ -273,6 +364,161 @@ class ProposalService:
             "proposal_id": proposal_id,
             "artifact": artifact_path,
             "change_type": proposal.change_type.value,
+            "rebased": rebased,
+        }
+
+    def apply_proposals(
+        self, project_key: str, proposal_ids: List[str], actor: str = "system"
+    ) -> Dict[str, Any]:
+        """
+        Apply several proposals in one atomic commit.
+
+        Proposals are applied in memory first, per target artifact in
+        creation order, so later proposals build on earlier ones (stale
+        proposals are rebased as in apply_proposal). Only if every proposal
+        applies is anything written: each artifact once, every proposal
+        file, one commit and one summarized audit event.
+
+        Args:
+            project_key: Project key
+            proposal_ids: Proposals to apply
+            actor: Actor recorded in the audit event
+
+        Returns:
+            Result dictionary with the commit hash and a per-proposal report
+
+        Raises:
+            BatchApplyError: If any proposal cannot be applied; nothing is
+                written and the error carries the per-proposal report
+        """
+        proposal_ids = list(dict.fromkeys(proposal_ids))
+        proposals: List[Proposal] = []
+        report: Dict[str, Dict[str, Any]] = {}
+        for proposal_id in proposal_ids:
+            proposal = self.get_proposal(project_key, proposal_id)
+            if proposal is None:
+                report[proposal_id] = _failed(
+                    proposal_id, "invalid", f"Proposal {proposal_id} not found"
+                )
+            elif proposal.status != ProposalStatus.PENDING:
+                report[proposal_id] = _failed(
+                    proposal_id,
+                    "invalid",
+                    f"Proposal {proposal_id} is already {proposal.status.value}",
+                    proposal,
+                )
+            else:
+                proposals.append(proposal)
+
+        # Dependency order: per artifact, oldest proposal first
+        position = {proposal_id: i for i, proposal_id in enumerate(proposal_ids)}
+        by_artifact: Dict[str, List[Proposal]] = {}
+        for proposal in sorted(proposals, key=lambda p: (p.created_at, position[p.id])):
+            by_artifact.setdefault(proposal.target_artifact, []).append(proposal)
+
+        # Final content per artifact (None = delete)
+        contents: Dict[str, Optional[str]] = {}
+        for artifact_path, chain in by_artifact.items():
+            content = self.git_manager.read_file(project_key, artifact_path)
+            # Versions produced within this batch are valid rebase bases
+            versions: Dict[str, str] = {}
+            failed = None
+            for proposal in chain:
+                if failed is not None:
+                    report[proposal.id] = _failed(
+                        proposal.id,
+                        "blocked",
+                        f"Proposal {proposal.id} is blocked: {failed} "
+                        f"failed for {artifact_path}",
+                        proposal,
+                    )
+                    continue
+                if content is not None:
+                    versions[self.diff_service.compute_content_hash(content)] = content
+                try:
+                    content, rebased = self._next_content(proposal, content, versions)
+                except MergeConflictError as e:
+                    report[proposal.id] = _failed(
+                        proposal.id, "conflict", str(e), proposal
+                    )
+                    report[proposal.id]["conflicts"] = e.conflicts
+                    failed = proposal.id
+                except (ConflictError, ValueError) as e:
+                    reason = "conflict" if isinstance(e, ConflictError) else "invalid"
+                    report[proposal.id] = _failed(proposal.id, reason, str(e), proposal)
+                    failed = proposal.id
+                else:
+                    report[proposal.id] = {
+                        "proposal_id": proposal.id,
+                        "artifact": artifact_path,
+                        "change_type": proposal.change_type.value,
+                        "status": "applied",
+                        "rebased": rebased,
+                    }
+            contents[artifact_path] = content
+
+        results = [report[proposal_id] for proposal_id in proposal_ids]
+        if any(result["status"] != "applied" for result in results):
+            raise BatchApplyError(
+                f"Batch for project {project_key} is not applicable: "
+                f"{sum(r['status'] != 'applied' for r in results)} of "
+                f"{len(results)} proposal(s) failed, nothing was applied",
+                results,
+            )
+
+        # Everything applies: write each artifact once
+        project_path = self.git_manager.get_project_path(project_key)
+        files_to_commit = [f"proposals/{proposal.id}.json" for proposal in proposals]
+        for artifact_path, content in contents.items():
+            if content is None:
+                full_path = project_path / artifact_path
+                if not full_path.exists():
+                    continue
+                full_path.unlink()
+            else:
+                self.git_manager.write_file(
+                    project_key=project_key,
+                    relative_path=artifact_path,
+                    content=content,
+                )
+            files_to_commit.append(artifact_path)
+
+        applied_at = datetime.now(timezone.utc)
+        with self.index.transaction(project_key) as rows:
+            for proposal in proposals:
+                proposal.status = ProposalStatus.ACCEPTED
+                proposal.applied_at = applied_at
+                proposal_file = project_path / "proposals" / f"{proposal.id}.json"
+                proposal_file.write_text(
+                    json.dumps(proposal.model_dump(mode="json"), indent=2)
+                )
+                rows[proposal.id] = index_entry(proposal)
+
+        commit_hash = self.git_manager.commit_changes(
+            project_key=project_key,
+            message=f"Apply {len(proposals)} proposals: "
+            + ", ".join(proposal.id for proposal in proposals),
+            files=files_to_commit,
+        )
+
+        self.audit_service.log_audit_event(
+            project_key=project_key,
+            event_type="proposal.batch_accepted",
+            actor=actor,
+            payload_summary={
+                "proposal_ids": [proposal.id for proposal in proposals],
+                "artifacts": sorted(contents),
+                "rebased": [r["proposal_id"] for r in results if r["rebased"]],
+                "commit_hash": commit_hash,
+            },
+            git_manager=self.git_manager,
+        )
+
+        return {
+            "status": "success",
+            "applied": len(proposals),
+            "commit_hash": commit_hash,
+            "results": results,
         }
 
     def reject_proposal(
@@ -312,7 +558,9 @@ class ProposalService:
         proposal_data = proposal.model_dump(mode="json")
         # Store rejection reason in the proposal data
         proposal_data["rejection_reason"] = reason
-        proposal_file.write_text(json.dumps(proposal_data, indent=2))
+        with self.index.transaction(project_key) as rows:
+            proposal_file.write_text(json.dumps(proposal_data, indent=2))
+            rows[proposal_id] = index_entry(proposal)
 
         # Commit change
         self.git_manager.commit_changes(
@@ -339,6 +587,118 @@ class ProposalService:
             "reason": reason,
         }
 
+    def _next_content(
+        self,
+        proposal: Proposal,
+        content: Optional[str],
+        versions: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Optional[str], bool]:
+        """
+        Return an artifact's content after applying a proposal to it.
+
+        Args:
+            proposal: Proposal to apply
+            content: Current artifact content (None if it does not exist)
+            versions: Known artifact versions by content hash
+
+        Returns:
+            Tuple of (new content or None if deleted, whether it was rebased)
+        """
+        if proposal.change_type == ChangeType.CREATE:
+            # For CREATE, diff contains the full content
+            return proposal.diff, False
+        if proposal.change_type == ChangeType.DELETE:
+            return None, False
+        if content is None:
+            from domain.errors import not_found
+
+            raise ValueError(not_found("Target artifact", proposal.target_artifact))
+        return self._updated_content(proposal, content, versions)
+
+    def _updated_content(
+        self,
+        proposal: Proposal,
+        current_content: str,
+        versions: Optional[Dict[str, str]] = None,
+    ) -> Tuple[str, bool]:
+        """
+        Apply an UPDATE proposal, rebasing it if the artifact has changed.
+
+        Returns:
+            Tuple of (new content, whether the proposal was rebased)
+        """
+        expected_hash = proposal.artifact_hash
+        if expected_hash:
+            current_hash = self.diff_service.compute_content_hash(current_content)
+            if current_hash != expected_hash:
+                # Artifact has changed - merge the proposal into it
+                return self._rebase(proposal, current_content, versions), True
+        return self._apply_diff(current_content, proposal.diff), False
+
+    def _rebase(
+        self,
+        proposal: Proposal,
+        current_content: str,
+        versions: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """
+        Merge a stale UPDATE proposal into the current artifact content.
+
+        Args:
+            proposal: Proposal whose ``artifact_hash`` no longer matches
+            current_content: Current artifact content
+            versions: Uncommitted artifact versions by content hash, searched
+                before the artifact's history
+
+        Returns:
+            Merged artifact content
+
+        Raises:
+            ConflictError: If the proposal's base version cannot be found
+            MergeConflictError: If the proposal overlaps changes since its base
+        """
+        artifact_path = proposal.target_artifact
+        base_content = (versions or {}).get(proposal.artifact_hash)
+        if base_content is None:
+            base_content = self._find_base(
+                proposal.project_key, artifact_path, proposal.artifact_hash
+            )
+        if base_content is None:
+            raise ConflictError(
+                f"Proposal {proposal.id} is stale: artifact {artifact_path} has "
+                f"changed and base version {proposal.artifact_hash} is not in its "
+                f"history. Please review the proposal and regenerate if necessary."
+            )
+
+        proposed_content = self._apply_diff(base_content, proposal.diff)
+        result = self.diff_service.merge(
+            base_content,
+            current_content,
+            proposed_content,
+            ours_label="current",
+            theirs_label=f"proposal {proposal.id}",
+        )
+        if result["conflicts"]:
+            raise MergeConflictError(
+                f"Proposal {proposal.id} is conflicting: {result['conflicts']} "
+                f"region(s) of {artifact_path} were also changed since the "
+                f"proposal was created",
+                merged_content=result["content"],
+                conflicts=result["conflicts"],
+            )
+        return result["content"]
+
+    def _find_base(
+        self, project_key: str, artifact_path: str, content_hash: str
+    ) -> Optional[str]:
+        """Return the committed artifact version with the given content hash."""
+        for content in self.git_manager.iter_file_versions(
+            project_key, artifact_path, max_count=REBASE_MAX_REVISIONS
+        ):
+            if self.diff_service.compute_content_hash(content) == content_hash:
+                return content
+        return None
+
     def _generate_diff(self, old_content: str, new_content: str) -> str:
         """
         Generate unified diff between two content versions.
@@ -8,6 +8,11 @@ import json
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 
+try:
+    from .tracing import span
+except ImportError:
+    from tracing import span
+
 
 class RAIDService:
     """Service for handling RAID register items."""
@@ -26,7 +31,8 @@ class RAIDService:
         if content is None:
             return []
 
-        data = json.loads(content)
+        with span("json.parse", document="raid_register", bytes=len(content)):
+            data = json.loads(content)
         return data.get("items", [])
 
     def get_raid_item(
@@ -73,7 +79,8 @@ class RAIDService:
         items.append(raid_item)
 
         # Write RAID register
-        content = json.dumps({"items": items}, indent=2)
+        with span("json.serialize", document="raid_register"):
+            content = json.dumps({"items": items}, indent=2)
         git_manager.write_file(project_key, "governance/raid_register.json", content)
 
         # Commit changes
@@ -130,7 +137,8 @@ class RAIDService:
             raise ValueError(not_found("RAID item", raid_id))
 
         # Write updated RAID register
-        content = json.dumps({"items": items}, indent=2)
+        with span("json.serialize", document="raid_register"):
+            content = json.dumps({"items": items}, indent=2)
         git_manager.write_file(project_key, "governance/raid_register.json", content)
 
         # Commit changes
@@ -170,7 +178,8 @@ class RAIDService:
             return False
 
         # Write updated RAID register
-        content = json.dumps({"items": filtered_items}, indent=2)
+        with span("json.serialize", document="raid_register"):
+            content = json.dumps({"items": filtered_items}, indent=2)
         git_manager.write_file(project_key, "governance/raid_register.json", content)
 
         # Commit changes
@@ -243,7 +252,8 @@ class RAIDService:
             return False
 
         # Write updated RAID register
-        content = json.dumps({"items": items}, indent=2)
+        with span("json.serialize", document="raid_register"):
+            content = json.dumps({"items": items}, indent=2)
         git_manager.write_file(project_key, "governance/raid_register.json", content)
 
         # Commit changes
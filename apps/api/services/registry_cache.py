@@ -0,0 +1,155 @@
+"""
+Registry cache - in-memory view of the template and blueprint stores.
+Single Responsibility: Parse each JSON entity file once and serve lookups
+from memory while the store is unchanged.
+
+Templates (``.templates/*.json``) and blueprints (``.blueprints/*.json``) are
+read on most requests: listings, artifact generation and the template
+reference checks of every blueprint change. A ``JsonRegistry`` holds the
+parsed entities of one directory, keyed by id and optionally indexed by a
+field (``artifact_type`` for templates).
+
+On every access the registry stats the files of its directory and parses
+again only those added or whose mtime or size changed, so files added,
+removed, replaced or rewritten in place (by another worker, or a git
+checkout) are picked up without reading unchanged ones. A service also
+invalidates it after writing an entity. Files that cannot be parsed are
+skipped.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Generic, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+Entity = TypeVar("Entity", bound=BaseModel)
+
+# (mtime_ns, size) of an entity file
+FileSignature = Tuple[int, int]
+
+
+class JsonRegistry(Generic[Entity]):
+    """Thread-safe in-memory registry of the ``*.json`` entities in a directory."""
+
+    def __init__(
+        self,
+        directory: Path,
+        model: Type[Entity],
+        index_field: Optional[str] = None,
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            directory: Directory holding one ``{id}.json`` file per entity
+            model: Pydantic model the files are parsed into
+            index_field: Entity field to index for ``find_by``
+        """
+        self.directory = Path(directory)
+        self.model = model
+        self.index_field = index_field
+        self._lock = threading.Lock()
+        self._stale = True
+        self._files: Dict[str, Tuple[FileSignature, Optional[Entity]]] = {}
+        self._by_id: Dict[str, Entity] = {}
+        self._index: Dict[str, List[Entity]] = {}
+        self.loads = 0
+
+    def get(self, entity_id: str) -> Optional[Entity]:
+        """Return the entity with ``entity_id``, or None."""
+        with self._lock:
+            self._refresh()
+            return self._by_id.get(entity_id)
+
+    def all(self) -> List[Entity]:
+        """Return every entity, ordered by file name."""
+        with self._lock:
+            self._refresh()
+            return list(self._by_id.values())
+
+    def snapshot(self) -> Dict[str, Entity]:
+        """Return the entities by id."""
+        with self._lock:
+            self._refresh()
+            return dict(self._by_id)
+
+    def find_by(self, value: str) -> List[Entity]:
+        """Return the entities whose index field equals ``value``."""
+        with self._lock:
+            self._refresh()
+            return list(self._index.get(value, ()))
+
+    def invalidate(self) -> None:
+        """Parse every file again on next access."""
+        with self._lock:
+            self._stale = True
+            # An in-place rewrite may keep both mtime and size
+            self._files = {}
+
+    # Private helper methods
+
+    def _refresh(self) -> None:
+        try:
+            with os.scandir(self.directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            entries = []
+
+        changed = self._stale
+        files: Dict[str, Tuple[FileSignature, Optional[Entity]]] = {}
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            stat = entry.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = self._files.get(entry.name)
+            if cached is not None and cached[0] == signature:
+                files[entry.name] = cached
+            else:
+                files[entry.name] = (signature, self._load(Path(entry.path)))
+                changed = True
+        if not changed and files.keys() == self._files.keys():
+            return
+
+        self._files = files
+        self._by_id = {}
+        self._index = {}
+        for _, entity in files.values():
+            if entity is None:
+                continue
+            self._by_id[entity.id] = entity
+            if self.index_field:
+                key = getattr(entity, self.index_field)
+                self._index.setdefault(key, []).append(entity)
+        self._stale = False
+
+    def _load(self, path: Path) -> Optional[Entity]:
+        self.loads += 1
+        try:
+            return self.model(**json.loads(path.read_text()))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Skipping unreadable entity file %s: %s", path, e)
+            return None
+
+
+_registries: Dict[Tuple[str, Type[BaseModel]], JsonRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(
+    directory: Path, model: Type[Entity], index_field: Optional[str] = None
+) -> JsonRegistry[Entity]:
+    """Return the process-wide registry of ``directory``."""
+    key = (str(Path(directory).resolve()), model)
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = JsonRegistry(directory, model, index_field)
+            _registries[key] = registry
+        return registry
@@ -0,0 +1,198 @@
+"""
+Template cache - compiled Jinja2 templates shared across requests.
+Single Responsibility: Parse and compile each template source once per
+process, and once per deployment for the prompt/output templates.
+
+Artifact templates are stored as JSON and rendered from their
+``markdown_template`` source. Compiling that source costs far more than
+rendering it, and blueprint generation renders dozens of templates. Compiled
+templates are kept in an LRU keyed by (template id, content hash). Template
+edits do not necessarily bump the version, so the hash decides whether a
+compilation is current; older compilations of the same template are dropped.
+
+The prompt and output templates on disk are loaded by LLMService through a
+FileSystemLoader, which already keeps compiled templates in memory. A
+FileSystemBytecodeCache additionally keeps their bytecode between restarts
+and across workers.
+
+Configuration (environment):
+    TEMPLATE_CACHE_MAX_ENTRIES  compiled artifact templates kept, 0 disables (default: 256)
+    JINJA_BYTECODE_CACHE_DIR    bytecode cache directory for prompt/output templates
+                                (default: Jinja's per-user temp directory; "off" disables)
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    Template,
+    select_autoescape,
+)
+
+try:
+    from .monitoring_service import MetricsCollector
+except ImportError:
+    from monitoring_service import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+
+# (template id, sha256 of source)
+TemplateKey = Tuple[str, str]
+
+
+def create_artifact_environment() -> Environment:
+    """Create the Jinja2 environment used to render artifact templates."""
+    return Environment(
+        autoescape=select_autoescape(["html", "xml"]),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+
+def bytecode_cache_from_env() -> Optional[BytecodeCache]:
+    """
+    Build the bytecode cache for file-based templates from the environment.
+
+    Returns:
+        The cache, or None if disabled or its directory is unusable
+    """
+    directory = os.getenv("JINJA_BYTECODE_CACHE_DIR", "")
+    if directory.lower() in ("off", "false", "0"):
+        return None
+    try:
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            return FileSystemBytecodeCache(directory)
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        logger.warning(
+            "Jinja bytecode cache unavailable; compiling templates in memory only",
+            exc_info=True,
+        )
+        return None
+
+
+class CompiledTemplateCache:
+    """Thread-safe LRU of compiled artifact templates."""
+
+    def __init__(
+        self,
+        environment: Optional[Environment] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Initialize compiled template cache.
+
+        Args:
+            environment: Environment templates are compiled in
+            max_entries: Compiled templates kept (0 disables caching)
+        """
+        self.environment = environment or create_artifact_environment()
+        self.max_entries = max(0, max_entries)
+        self._entries: "OrderedDict[TemplateKey, Template]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "CompiledTemplateCache":
+        """Build a cache from TEMPLATE_CACHE_* environment variables."""
+        try:
+            max_entries = int(
+                os.getenv("TEMPLATE_CACHE_MAX_ENTRIES", str(DEFAULT_MAX_ENTRIES))
+            )
+        except ValueError:
+            max_entries = DEFAULT_MAX_ENTRIES
+        return cls(max_entries=max_entries)
+
+    def get(self, template_id: str, source: str) -> Template:
+        """
+        Return the compiled template for ``source``, compiling it on a miss.
+
+        Args:
+            template_id: Template identifier
+            source: Jinja2 template source
+
+        Returns:
+            Compiled template
+
+        Raises:
+            jinja2.TemplateSyntaxError: If the source does not compile
+        """
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        key = (template_id, digest)
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        MetricsCollector.record_template_cache_lookup(compiled is not None)
+        if compiled is not None:
+            return compiled
+
+        compiled = self.environment.from_string(source)
+        if self.max_entries:
+            with self._lock:
+                # Older versions of this template will not be asked for again
+                for stale in [k for k in self._entries if k[0] == template_id]:
+                    del self._entries[stale]
+                self._entries[key] = compiled
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return compiled
+
+    def warm(self, templates: Iterable) -> int:
+        """
+        Compile templates ahead of their first use.
+
+        Templates that do not compile are skipped; they fail when rendered.
+
+        Args:
+            templates: Template entities (id, markdown_template)
+
+        Returns:
+            Number of templates compiled
+        """
+        compiled = 0
+        for template in templates:
+            try:
+                self.get(template.id, template.markdown_template)
+                compiled += 1
+            except Exception:
+                logger.warning(
+                    "Template %s does not compile", template.id, exc_info=True
+                )
+        return compiled
+
+    def clear(self) -> None:
+        """Drop every compiled template and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_shared: Optional[CompiledTemplateCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_template_cache() -> CompiledTemplateCache:
+    """Return the process-wide cache shared by ArtifactGenerationService instances."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = CompiledTemplateCache.from_env()
+        return _shared
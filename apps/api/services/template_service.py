@@ -5,11 +5,12 @@ Implements CRUD operations following DDD architecture:
 - Business logic and validation in service layer
 - Persistence delegated to GitManager (repository pattern)
 - Storage format: JSON files in .templates/{template_id}.json
+- Reads are served from an in-memory registry of that directory
 """
 
 import json
 import uuid
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 try:
     from ..domain.templates.models import (
@@ -18,6 +19,7 @@ try:
         TemplateUpdate,
     )
     from .git_manager import GitManager
+    from .registry_cache import JsonRegistry, get_registry
 except ImportError:
     from domain.templates.models import (
         Template,
@@ -25,6 +27,7 @@ except ImportError:
         TemplateUpdate,
     )
     from services.git_manager import GitManager
+    from services.registry_cache import JsonRegistry, get_registry
 
 
 class TemplateService:
@@ -99,6 +102,23 @@ class TemplateService:
         """
         return self._get_template_by_id(template_id)
 
+    def get_templates(self, template_ids: Iterable[str]) -> Dict[str, Template]:
+        """
+        Retrieve the existing templates among ``template_ids``.
+
+        Args:
+            template_ids: Template identifiers
+
+        Returns:
+            Found templates by ID (missing IDs are left out)
+        """
+        templates = self._registry().snapshot()
+        return {
+            template_id: templates[template_id]
+            for template_id in template_ids
+            if template_id in templates
+        }
+
     def list_templates(self, artifact_type: Optional[str] = None) -> List[Template]:
         """
         List all templates, optionally filtered by artifact type.
@@ -109,24 +129,9 @@ class TemplateService:
         Returns:
             List of templates
         """
-        templates = []
-        template_dir_path = (
-            self.git_manager.get_project_path(self.project_key) / self.template_dir
-        )
-
-        if not template_dir_path.exists():
-            return []
-
-        for template_file in template_dir_path.glob("*.json"):
-            content = template_file.read_text()
-            template_data = json.loads(content)
-            template = Template(**template_data)
-
-            # Apply filter if specified
-            if artifact_type is None or template.artifact_type == artifact_type:
-                templates.append(template)
-
-        return templates
+        if artifact_type is None:
+            return self._registry().all()
+        return self._registry().find_by(artifact_type)
 
     def update_template(
         self, template_id: str, template_update: TemplateUpdate
@@ -183,30 +188,33 @@ class TemplateService:
 
         # Delete file from disk
         template_path.unlink()
+        self._registry().invalidate()
 
         # Stage deletion and commit using GitManager's approach
         # Since file is already deleted, we need to use git index directly
         if self.git_manager.repo:
             relative_path = str(template_path.relative_to(self.git_manager.base_path))
-            self.git_manager.repo.index.remove([relative_path])
-            self.git_manager.repo.index.commit(
-                f"[TEMPLATE] Delete template: {existing.name}"
-            )
+            with self.git_manager.repo_lock:
+                self.git_manager.repo.index.remove([relative_path])
+                self.git_manager.repo.index.commit(
+                    f"[TEMPLATE] Delete template: {existing.name}"
+                )
 
         return True
 
     # Private helper methods
 
-    def _get_template_by_id(self, template_id: str) -> Optional[Template]:
-        """Load template from storage by ID."""
-        content = self.git_manager.read_file(
-            self.project_key, f"{self.template_dir}/{template_id}.json"
+    def _registry(self) -> JsonRegistry[Template]:
+        """Registry of this project's template directory."""
+        return get_registry(
+            self.git_manager.get_project_path(self.project_key) / self.template_dir,
+            Template,
+            index_field="artifact_type",
         )
-        if content is None:
-            return None
 
-        template_data = json.loads(content)
-        return Template(**template_data)
+    def _get_template_by_id(self, template_id: str) -> Optional[Template]:
+        """Load template from storage by ID."""
+        return self._registry().get(template_id)
 
     def _save_template(self, template: Template):
         """Save template to storage."""
@@ -214,3 +222,4 @@ class TemplateService:
         self.git_manager.write_file(
             self.project_key, f"{self.template_dir}/{template.id}.json", content
         )
+        self._registry().invalidate()
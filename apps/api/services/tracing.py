@@ -0,0 +1,393 @@
+"""
+Tracing - lightweight in-process spans exported in OTLP JSON format.
+Single Responsibility: Record where the time of a sampled request goes.
+
+Request metrics show how long a request took, not which stage took the time
+(JSON parsing, file writes, ``index.add``, the commit, event appends, LLM
+calls, response model construction). ``span()`` and ``traced()`` record
+those stages as spans of the current request's trace. The trace id is the
+request's X-Correlation-ID without dashes, so traces can be found from the
+response header or from audit events.
+
+Only a sampled fraction of requests is traced. Outside a sampled trace
+``span()`` returns a shared no-op context manager, so instrumented code costs
+one context variable lookup. Finished traces are handed to a background
+thread and written as OTLP/JSON (one ExportTraceServiceRequest per line) to
+a local file, or posted to an OTLP/HTTP collector when one is configured.
+
+Configuration (environment):
+    TRACING_SAMPLE_RATE     fraction of requests traced, 0 disables (default: 0)
+    TRACING_EXPORT_PATH     OTLP JSON lines file
+                            (default: $PROJECT_DOCS_PATH/.cache/traces.jsonl,
+                            excluded from git by GitManager)
+    TRACING_OTLP_ENDPOINT   collector base URL; spans are POSTed to {url}/v1/traces
+    TRACING_SERVICE_NAME    service.name resource attribute (default: iso21500-api)
+"""
+
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import secrets
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SERVICE_NAME = "iso21500-api"
+
+# Finished traces waiting for export; more are dropped rather than queued
+MAX_PENDING_TRACES = 1024
+
+# OTLP status codes
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    """One timed stage of a trace."""
+
+    __slots__ = (
+        "trace",
+        "name",
+        "span_id",
+        "parent_id",
+        "attributes",
+        "start_ns",
+        "end_ns",
+        "error",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        trace: "Trace",
+        name: str,
+        parent_id: Optional[str],
+        attributes: Dict[str, Any],
+    ):
+        self.trace = trace
+        self.name = name
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+        self._token: Optional[contextvars.Token] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span."""
+        self.attributes[key] = value
+
+    def update_name(self, name: str) -> None:
+        """Rename the span, e.g. once the route of a request is known."""
+        self.name = name
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self.trace.tracer._finish(self)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Span in OTLP/JSON form."""
+        span = {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": (
+                {"code": STATUS_ERROR, "message": self.error}
+                if self.error
+                else {"code": STATUS_OK}
+            ),
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class Trace:
+    """Spans of one sampled request."""
+
+    def __init__(self, tracer: "Tracer", trace_id: str):
+        self.tracer = tracer
+        self.trace_id = trace_id
+        self.spans: List[Span] = []
+        self.finished = False
+
+
+class _NoopSpan:
+    """Stand-in for spans outside a sampled trace."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def update_name(self, name: str) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current_span: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar(
+    "tracing_current_span", default=None
+)
+
+
+class JsonFileSpanExporter:
+    """Append OTLP/JSON export requests to a local file, one per line."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def export(self, payload: Dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(payload, separators=(",", ":")) + "\n")
+
+
+class OTLPHttpSpanExporter:
+    """POST OTLP/JSON export requests to a collector."""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.timeout = timeout
+
+    def export(self, payload: Dict[str, Any]) -> None:
+        httpx.post(self.url, json=payload, timeout=self.timeout).raise_for_status()
+
+
+class Tracer:
+    """Samples requests and exports their spans from a background thread."""
+
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        exporter: Optional[Any] = None,
+        service_name: str = DEFAULT_SERVICE_NAME,
+    ):
+        """
+        Initialize tracer.
+
+        Args:
+            sample_rate: Fraction of requests traced (0 disables tracing)
+            exporter: Object with ``export(payload)``; None disables export
+            service_name: ``service.name`` resource attribute
+        """
+        self.sample_rate = min(1.0, max(0.0, sample_rate))
+        self.exporter = exporter
+        self.service_name = service_name
+        self._pending: "queue.Queue[List[Span]]" = queue.Queue(MAX_PENDING_TRACES)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    @classmethod
+    def from_env(cls) -> "Tracer":
+        """Build a tracer from TRACING_* environment variables."""
+        try:
+            sample_rate = float(os.getenv("TRACING_SAMPLE_RATE", "0"))
+        except ValueError:
+            sample_rate = 0.0
+        endpoint = os.getenv("TRACING_OTLP_ENDPOINT")
+        if endpoint:
+            exporter: Any = OTLPHttpSpanExporter(endpoint)
+        else:
+            exporter = JsonFileSpanExporter(
+                os.getenv("TRACING_EXPORT_PATH")
+                or Path(os.getenv("PROJECT_DOCS_PATH", "/projectDocs"))
+                / ".cache"
+                / "traces.jsonl"
+            )
+        return cls(
+            sample_rate=sample_rate,
+            exporter=exporter,
+            service_name=os.getenv("TRACING_SERVICE_NAME", DEFAULT_SERVICE_NAME),
+        )
+
+    def sampled(self, trace_id: str) -> bool:
+        """Whether the trace is recorded; the same id always gets the same answer."""
+        if self.sample_rate <= 0.0:
+            return False
+        if self.sample_rate >= 1.0:
+            return True
+        return int(trace_id[:8], 16) / 0x100000000 < self.sample_rate
+
+    def start_trace(
+        self, correlation_id: str, name: str, **attributes: Any
+    ) -> Union[Span, _NoopSpan]:
+        """
+        Open the root span of a request.
+
+        Use as a context manager; its exit ends the trace.
+
+        Args:
+            correlation_id: Request correlation id (a UUID)
+            name: Root span name
+            **attributes: Root span attributes
+        """
+        trace_id = correlation_id.replace("-", "")
+        if not self.sampled(trace_id):
+            return NOOP_SPAN
+        attributes["correlation_id"] = correlation_id
+        return Span(Trace(self, trace_id), name, None, attributes)
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Wait until queued traces have been exported."""
+        deadline = time.monotonic() + timeout
+        while self._pending.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def payload(self, spans: List[Span]) -> Dict[str, Any]:
+        """OTLP/JSON ExportTraceServiceRequest for ``spans``."""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": self.service_name},
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    # Private helper methods
+
+    def _finish(self, span: Span) -> None:
+        span.end_ns = time.time_ns()
+        trace = span.trace
+        if trace.finished:
+            # Outlived the request, e.g. inside a streamed response body
+            self._enqueue([span])
+            return
+        trace.spans.append(span)
+        if span.parent_id is None:
+            trace.finished = True
+            self._enqueue(trace.spans)
+
+    def _enqueue(self, spans: List[Span]) -> None:
+        if self.exporter is None:
+            return
+        try:
+            self._pending.put_nowait(spans)
+        except queue.Full:
+            self.dropped += 1
+            return
+        self._ensure_exporter()
+
+    def _ensure_exporter(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="trace-exporter", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            spans = self._pending.get()
+            try:
+                self.exporter.export(self.payload(spans))
+            except Exception:
+                logger.warning("Trace export failed", exc_info=True)
+            finally:
+                self._pending.task_done()
+
+
+def span(name: str, **attributes: Any) -> Union[Span, _NoopSpan]:
+    """
+    Time a stage of the current trace.
+
+    Returns a no-op context manager when the request is not sampled.
+
+    Args:
+        name: Span name, e.g. ``git.commit``
+        **attributes: Span attributes
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return NOOP_SPAN
+    return Span(parent.trace, name, parent.span_id, attributes)
+
+
+def traced(name: str) -> Callable[[Callable], Callable]:
+    """Decorator recording each call of a function as a span."""
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer."""
+    global _tracer
+    with _tracer_lock:
+        if _tracer is None:
+            _tracer = Tracer.from_env()
+        return _tracer
@@ -8,6 +8,7 @@ They are intentionally deterministic (no real network calls; psutil/httpx
 are mocked where needed).
 """
 
+import asyncio
 import os
 import sys
 import shutil
@@ -25,6 +26,57 @@ from main import app  # noqa: E402
 from routers import health as health_router  # noqa: E402
 
 
+def _async_result(result):
+    async def _check(*_args, **_kwargs):
+        return result
+
+    return _check
+
+
+def _patch_checks(monkeypatch, git_healthy=True):
+    monkeypatch.setattr(
+        health_router,
+        "check_git_repository",
+        lambda docs_path: {"healthy": git_healthy, "message": "ok"},
+    )
+    monkeypatch.setattr(
+        health_router,
+        "check_llm_service",
+        _async_result({"healthy": True, "message": "ok"}),
+    )
+    monkeypatch.setattr(
+        health_router,
+        "check_disk_space",
+        lambda path, min_free_gb=1.0: {"healthy": True, "message": "ok"},
+    )
+    monkeypatch.setattr(
+        health_router,
+        "check_memory",
+        lambda min_free_percent=10.0: {"healthy": True, "message": "ok"},
+    )
+
+
+class _FakeClient:
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.calls = []
+
+    async def get(self, url, **kwargs):
+        self.calls.append(url)
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return SimpleNamespace(status_code=self.outcome)
+
+
+def _endpoint(name, outcome):
+    return SimpleNamespace(
+        name=name,
+        base_url=f"http://{name}.invalid/v1",
+        api_key="k",
+        client=_FakeClient(outcome),
+    )
+
+
 @pytest.fixture
 def temp_docs_dir():
     temp_dir = tempfile.mkdtemp()
@@ -37,6 +89,7 @@ def client(monkeypatch, temp_docs_dir):
     # Avoid relying on lifespan initialization in tests (other integration tests
     # follow the same approach by setting app.state fields explicitly).
     app.state.llm_service = None
+    app.state.health_prober = None
     monkeypatch.setenv("PROJECT_DOCS_PATH", temp_docs_dir)
     return TestClient(app)
 
@@ -74,7 +127,7 @@ def test_health_check_detailed_overall_healthy(client, monkeypatch):
     monkeypatch.setattr(
         health_router,
         "check_llm_service",
-        lambda llm_service: {"healthy": True, "message": "ok"},
+        _async_result({"healthy": True, "message": "ok"}),
     )
     monkeypatch.setattr(
         health_router,
@@ -105,7 +158,7 @@ def test_health_check_detailed_overall_degraded_when_llm_unhealthy(client, monke
     monkeypatch.setattr(
         health_router,
         "check_llm_service",
-        lambda llm_service: {"healthy": False, "message": "down"},
+        _async_result({"healthy": False, "message": "down"}),
     )
     monkeypatch.setattr(
         health_router,
@@ -135,7 +188,7 @@ def test_health_check_detailed_overall_unhealthy_when_critical_unhealthy(
     monkeypatch.setattr(
         health_router,
         "check_llm_service",
-        lambda llm_service: {"healthy": True, "message": "ok"},
+        _async_result({"healthy": True, "message": "ok"}),
     )
     monkeypatch.setattr(
         health_router,
@@ -199,58 +252,158 @@ def test_check_git_repository_unwritable(tmp_path, monkeypatch):
     assert "not writable" in status["message"].lower()
 
 
-def test_check_llm_service_none_is_healthy():
-    status = health_router.check_llm_service(None)
+@pytest.mark.asyncio
+async def test_check_llm_service_none_is_healthy():
+    status = await health_router.check_llm_service(None)
 
     assert status["healthy"] is True
     assert "fallback" in status["message"].lower()
 
 
-def test_check_llm_service_object_without_config_is_healthy():
-    status = health_router.check_llm_service(object())
+@pytest.mark.asyncio
+async def test_check_llm_service_object_without_config_is_healthy():
+    status = await health_router.check_llm_service(object())
 
     assert status["healthy"] is True
     assert "config" in status["message"].lower()
 
 
-def test_check_llm_service_no_endpoint_configured_is_healthy():
+@pytest.mark.asyncio
+async def test_check_llm_service_no_endpoint_configured_is_healthy():
     llm = SimpleNamespace(config={})
 
-    status = health_router.check_llm_service(llm)
+    status = await health_router.check_llm_service(llm)
 
     assert status["healthy"] is True
     assert status["endpoint_configured"] is False
 
 
-def test_check_llm_service_reachable_marks_message(monkeypatch):
-    llm = SimpleNamespace(config={"base_url": "http://example.invalid"})
+@pytest.mark.asyncio
+async def test_check_llm_service_reachable_marks_message():
+    endpoint = _endpoint("primary", 200)
+    llm = SimpleNamespace(config={"base_url": endpoint.base_url}, endpoints=[endpoint])
 
-    class _Resp:
-        status_code = 200
-
-    monkeypatch.setattr(health_router.httpx, "get", lambda *_a, **_k: _Resp())
-
-    status = health_router.check_llm_service(llm)
+    status = await health_router.check_llm_service(llm)
 
     assert status["healthy"] is True
     assert status["endpoint_configured"] is True
     assert "reachable" in status["message"].lower()
+    assert endpoint.client.calls == ["http://primary.invalid/v1/models"]
 
 
-def test_check_llm_service_timeout_is_healthy(monkeypatch):
-    llm = SimpleNamespace(config={"base_url": "http://example.invalid"})
-
-    def _timeout(*_a, **_k):
-        raise health_router.httpx.TimeoutException("timeout")
-
-    monkeypatch.setattr(health_router.httpx, "get", _timeout)
+@pytest.mark.asyncio
+async def test_check_llm_service_timeout_is_healthy():
+    endpoint = _endpoint("primary", health_router.httpx.TimeoutException("timeout"))
+    llm = SimpleNamespace(config={"base_url": endpoint.base_url}, endpoints=[endpoint])
 
-    status = health_router.check_llm_service(llm)
+    status = await health_router.check_llm_service(llm)
 
     assert status["healthy"] is True
     assert "timeout" in status["message"].lower()
 
 
+@pytest.mark.asyncio
+async def test_check_llm_service_probes_every_endpoint():
+    endpoints = [_endpoint("a", 200), _endpoint("b", 503)]
+    llm = SimpleNamespace(
+        config={"base_url": "http://a.invalid/v1"}, endpoints=endpoints
+    )
+
+    status = await health_router.check_llm_service(llm)
+
+    assert status["message"] == "1/2 LLM endpoints reachable"
+    assert [(e["name"], e["reachable"]) for e in status["endpoints"]] == [
+        ("a", True),
+        ("b", False),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Background prober
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_prober_serves_cached_results(monkeypatch, tmp_path):
+    calls = []
+
+    async def _llm(llm_service, timeout=2.0):
+        calls.append(1)
+        return {"healthy": True, "message": "ok"}
+
+    _patch_checks(monkeypatch)
+    monkeypatch.setattr(health_router, "check_llm_service", _llm)
+    prober = health_router.HealthProber(None, str(tmp_path), interval=3600)
+
+    prober.start()
+    first = await prober.snapshot()
+    second = await prober.snapshot()
+    await prober.stop()
+
+    assert calls == [1]
+    assert first["checked_at"] == second["checked_at"]
+    assert second["age_seconds"] >= first["age_seconds"] >= 0
+    assert health_router.overall_status(second["checks"]) == "healthy"
+
+
+def test_health_endpoints_use_prober_snapshot(client, monkeypatch, tmp_path):
+    _patch_checks(monkeypatch, git_healthy=False)
+    prober = health_router.HealthProber(None, str(tmp_path))
+    app.state.health_prober = prober
+
+    detailed = client.get("/api/v1/health").json()
+    simple = client.get("/health").json()
+
+    assert detailed["status"] == "unhealthy"
+    assert detailed["age_seconds"] >= 0
+    assert simple["status"] == "healthy"
+    assert simple["checks_status"] == "unhealthy"
+    assert simple["checked_at"] == detailed["checked_at"]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("30", 30.0), ("soon", health_router.DEFAULT_PROBE_INTERVAL), ("0", 1.0)],
+)
+def test_prober_interval_from_env(monkeypatch, tmp_path, value, expected):
+    monkeypatch.setenv("HEALTH_PROBE_INTERVAL_SECONDS", value)
+
+    prober = health_router.HealthProber.from_env(None, str(tmp_path))
+
+    assert prober.interval == expected
+
+
+@pytest.mark.asyncio
+async def test_snapshot_does_not_wait_forever_on_failing_probe(monkeypatch, tmp_path):
+    async def _failing(*_args):
+        raise RuntimeError("probe broke")
+
+    monkeypatch.setattr(health_router, "run_health_checks", _failing)
+    prober = health_router.HealthProber(None, str(tmp_path), interval=3600)
+
+    prober.start()
+    await asyncio.sleep(0)
+    snapshot = await prober.snapshot(timeout=0.05)
+    await prober.stop()
+
+    assert snapshot["checks"] is None
+    assert snapshot["probe_status"] == "failed"
+    assert "probe broke" in snapshot["message"]
+
+
+def test_detailed_health_reports_failed_probe(client, monkeypatch):
+    async def _failing(*_args):
+        raise RuntimeError("probe broke")
+
+    monkeypatch.setattr(health_router, "run_health_checks", _failing)
+
+    response = client.get("/api/v1/health")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "failed"
+    assert response.json()["checks"] == {}
+
+
 def test_check_disk_space_healthy(monkeypatch, tmp_path):
     Usage = namedtuple("Usage", ["total", "used", "free", "percent"])
     monkeypatch.setattr(
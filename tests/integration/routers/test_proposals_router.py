@@ -224,6 +224,46 @@ def test_list_proposals_with_status_filter(
     assert data[0]["id"] == "prop-002"
 
 
+def test_list_proposals_paginated(client, test_project):
+    """Test cursor pagination via limit and X-Next-Cursor."""
+    project_key = test_project["key"]
+
+    for i in range(1, 4):
+        proposal = {
+            "id": f"prop-00{i}",
+            "target_artifact": f"artifacts/doc{i}.md",
+            "change_type": "create",
+            "diff": f"Content {i}",
+            "rationale": f"Reason {i}",
+        }
+        response = client.post(
+            f"/api/v1/projects/{project_key}/proposals", json=proposal
+        )
+        assert response.status_code == 201
+
+    response = client.get(f"/api/v1/projects/{project_key}/proposals?limit=2")
+    assert response.status_code == 200
+    first_page = [p["id"] for p in response.json()]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get(
+        f"/api/v1/projects/{project_key}/proposals?limit=2&cursor={cursor}"
+    )
+    assert response.status_code == 200
+    second_page = [p["id"] for p in response.json()]
+    assert "X-Next-Cursor" not in response.headers
+
+    assert first_page == ["prop-003", "prop-002"]
+    assert second_page == ["prop-001"]
+
+
+def test_list_proposals_invalid_cursor(client, test_project):
+    """Test a malformed cursor returns 400."""
+    project_key = test_project["key"]
+    response = client.get(f"/api/v1/projects/{project_key}/proposals?cursor=bogus")
+    assert response.status_code == 400
+
+
 # ============================================================================
 # GET /api/v1/projects/{key}/proposals/{id} - Get Proposal
 # ============================================================================
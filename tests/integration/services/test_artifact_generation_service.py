@@ -12,6 +12,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../../apps/api"))
 
 from services.artifact_generation_service import (  # noqa: E402
+    DEFAULT_RENDER_WORKERS,
     ArtifactGenerationService,
     ArtifactGenerationError,
     ValidationError,
@@ -19,7 +20,10 @@ from services.artifact_generation_service import (  # noqa: E402
 from apps.api.services.template_service import TemplateService  # noqa: E402
 from apps.api.services.blueprint_service import BlueprintService  # noqa: E402
 from apps.api.services.git_manager import GitManager  # noqa: E402
-from apps.api.domain.templates.models import TemplateCreate  # noqa: E402
+from apps.api.domain.templates.models import (  # noqa: E402
+    TemplateCreate,
+    TemplateUpdate,
+)
 from apps.api.domain.blueprints.models import BlueprintCreate  # noqa: E402
 
 
@@ -244,6 +248,25 @@ class TestGenerateFromTemplate:
         assert result["content"]
         assert "_private_key" not in result["content"]
 
+    def test_edited_template_is_recompiled(
+        self, artifact_service, template_service, pmp_template, test_project_key
+    ):
+        """Test compiled templates follow edits that keep the version."""
+        context = {"project_name": "My Project", "project_manager": "Jane"}
+        artifact_service.generate_from_template(
+            pmp_template.id, test_project_key, context
+        )
+        template_service.update_template(
+            pmp_template.id,
+            TemplateUpdate(markdown_template="# Edited {{ project_name }}"),
+        )
+
+        result = artifact_service.generate_from_template(
+            pmp_template.id, test_project_key, context
+        )
+
+        assert result["content"] == "# Edited My Project"
+
 
 class TestGenerateFromBlueprint:
     """Tests for generate_from_blueprint method."""
@@ -329,6 +352,27 @@ class TestGenerateFromBlueprint:
             # Expected behavior - error is raised
             pass
 
+    @pytest.mark.parametrize(
+        "value, expected", [("3", 3), ("0", 1), ("many", DEFAULT_RENDER_WORKERS)]
+    )
+    def test_render_workers_from_env(
+        self,
+        monkeypatch,
+        template_service,
+        blueprint_service,
+        git_manager,
+        value,
+        expected,
+    ):
+        """Test ARTIFACT_RENDER_WORKERS is clamped and invalid values fall back."""
+        monkeypatch.setenv("ARTIFACT_RENDER_WORKERS", value)
+
+        service = ArtifactGenerationService(
+            template_service, blueprint_service, git_manager
+        )
+
+        assert service.render_workers == expected
+
 
 class TestPerformance:
     """Performance tests."""
@@ -19,7 +19,12 @@ from apps.api.domain.proposals.models import (  # noqa: E402
     ProposalStatus,
     ChangeType,
 )
-from apps.api.services.proposal_service import ProposalService  # noqa: E402
+from apps.api.services.proposal_service import (  # noqa: E402
+    BatchApplyError,
+    ConflictError,
+    MergeConflictError,
+    ProposalService,
+)
 from apps.api.services.git_manager import GitManager  # noqa: E402
 from apps.api.services.audit_service import AuditService  # noqa: E402
 
@@ -241,6 +246,177 @@ class TestProposalServiceList:
         assert result[0].status == ProposalStatus.PENDING
 
 
+class TestProposalServiceIndex:
+    """Test index-backed filtering and cursor pagination."""
+
+    def _create(self, proposal_service, project_key, count, **overrides):
+        from datetime import datetime, timedelta, timezone
+
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for i in range(count):
+            proposal_service.create_proposal(
+                Proposal(
+                    id=f"prop-{i:03d}",
+                    project_key=project_key,
+                    target_artifact=f"artifacts/doc{i % 2}.md",
+                    change_type=ChangeType.CREATE,
+                    diff=f"# Doc {i}",
+                    rationale=f"Doc {i}",
+                    author="alice" if i % 2 else "bob",
+                    created_at=base + timedelta(minutes=i),
+                    **overrides,
+                )
+            )
+
+    def test_list_proposals_paginates_with_cursor(
+        self, proposal_service, git_manager, project_key
+    ):
+        """Test pages follow newest-first order without overlap."""
+        git_manager.create_project(project_key, {"name": "Test Project"})
+        self._create(proposal_service, project_key, 5)
+
+        page1, cursor = proposal_service.list_proposals_page(project_key, limit=2)
+        page2, cursor2 = proposal_service.list_proposals_page(
+            project_key, limit=2, cursor=cursor
+        )
+        page3, cursor3 = proposal_service.list_proposals_page(
+            project_key, limit=2, cursor=cursor2
+        )
+
+        assert [p.id for p in page1] == ["prop-004", "prop-003"]
+        assert [p.id for p in page2] == ["prop-002", "prop-001"]
+        assert [p.id for p in page3] == ["prop-000"]
+        assert cursor3 is None
+
+    def test_list_proposals_filters_by_index_fields(
+        self, proposal_service, git_manager, project_key
+    ):
+        """Test filters on author and target artifact use index rows."""
+        git_manager.create_project(project_key, {"name": "Test Project"})
+        self._create(proposal_service, project_key, 4)
+
+        result = proposal_service.list_proposals(project_key, author="alice")
+        assert [p.id for p in result] == ["prop-003", "prop-001"]
+
+        result = proposal_service.list_proposals(
+            project_key, target_artifact="artifacts/doc0.md"
+        )
+        assert [p.id for p in result] == ["prop-002", "prop-000"]
+
+    def test_index_tracks_status_changes(
+        self, proposal_service, git_manager, project_key
+    ):
+        """Test apply/reject update the indexed status."""
+        git_manager.create_project(project_key, {"name": "Test Project"})
+        self._create(proposal_service, project_key, 3)
+
+        proposal_service.apply_proposal(project_key, "prop-000")
+        proposal_service.reject_proposal(project_key, "prop-001", "Not needed")
+
+        pending = proposal_service.list_proposals(
+            project_key, status=ProposalStatus.PENDING
+        )
+        accepted = proposal_service.list_proposals(
+            project_key, status=ProposalStatus.ACCEPTED
+        )
+        rejected = proposal_service.list_proposals(
+            project_key, status=ProposalStatus.REJECTED
+        )
+        assert [p.id for p in pending] == ["prop-002"]
+        assert [p.id for p in accepted] == ["prop-000"]
+        assert [p.id for p in rejected] == ["prop-001"]
+
+    def test_index_rebuilt_when_files_change_externally(
+        self, proposal_service, git_manager, project_key
+    ):
+        """Test proposals written outside the service are picked up."""
+        git_manager.create_project(project_key, {"name": "Test Project"})
+        self._create(proposal_service, project_key, 1)
+
+        external = Proposal(
+            id="prop-external",
+            project_key=project_key,
+            target_artifact="artifacts/ext.md",
+            change_type=ChangeType.CREATE,
+            diff="# External",
+            rationale="Synced from remote",
+        )
+        proposal_file = (
+            git_manager.get_project_path(project_key)
+            / "proposals"
+            / "prop-external.json"
+        )
+        proposal_file.write_text(json.dumps(external.model_dump(mode="json")))
+
+        result = proposal_service.list_proposals(project_key)
+
+        assert {p.id for p in result} == {"prop-000", "prop-external"}
+
+    def test_other_files_in_proposals_dir_do_not_rebuild(
+        self, proposal_service, git_manager, project_key, monkeypatch
+    ):
+        """Test command proposal log writes leave the index current."""
+        git_manager.create_project(project_key, {"name": "Test Project"})
+        self._create(proposal_service, project_key, 3)
+        proposal_service.list_proposals(project_key)
+
+        log = git_manager.open_log(project_key, "proposals/proposals.ndjson")
+        log.append({"proposal_id": "cmd-1", "timestamp": "2026-01-01T00:00:00Z"})
+
+        def fail_build(project_key):
+            raise AssertionError("index rebuilt")
+
+        monkeypatch.setattr(proposal_service.index, "_build", fail_build)
+        page, _ = proposal_service.list_proposals_page(project_key, limit=2)
+        assert [p.id for p in page] == ["prop-002", "prop-001"]
+
+    def test_index_files_stay_out_of_git(
+        self, proposal_service, git_manager, project_key
+    ):
+        """Test the index and its lock live in the untracked cache directory."""
+        git_manager.create_project(project_key, {"name": "Test Project"})
+        self._create(proposal_service, project_key, 2)
+        proposal_service.list_proposals(project_key)
+
+        cache_path = git_manager.get_cache_path(project_key)
+        assert (cache_path / "proposals.index.json").exists()
+        assert not [f for f in git_manager.repo.untracked_files if "index" in f]
+
+    def test_index_order_follows_created_at_changes(
+        self, proposal_service, git_manager, project_key
+    ):
+        """Test rows stay sorted when proposals are added and re-dated."""
+        from datetime import datetime, timezone
+        from apps.api.services.proposal_index import index_entry
+
+        git_manager.create_project(project_key, {"name": "Test Project"})
+        self._create(proposal_service, project_key, 3)
+
+        moved = proposal_service.get_proposal(project_key, "prop-000")
+        moved.created_at = datetime(2027, 1, 1, tzinfo=timezone.utc)
+        with proposal_service.index.transaction(project_key) as rows:
+            git_manager.write_file(
+                project_key,
+                "proposals/prop-000.json",
+                json.dumps(moved.model_dump(mode="json")),
+            )
+            rows["prop-000"] = index_entry(moved)
+
+        ids, _ = proposal_service.index.query(project_key)
+        assert ids == ["prop-000", "prop-002", "prop-001"]
+        assert proposal_service.index.rebuild(project_key) == 3
+        assert proposal_service.index.query(project_key)[0] == ids
+
+    def test_list_proposals_invalid_cursor(
+        self, proposal_service, git_manager, project_key
+    ):
+        """Test a malformed cursor raises ValueError."""
+        git_manager.create_project(project_key, {"name": "Test Project"})
+
+        with pytest.raises(ValueError, match="cursor"):
+            proposal_service.list_proposals_page(project_key, cursor="not-a-cursor")
+
+
 class TestProposalServiceApply:
     """Test applying proposals."""
 
@@ -393,6 +569,214 @@ class TestProposalServiceApply:
         assert last_event["payload_summary"]["proposal_id"] == sample_create_proposal.id
 
 
+class TestProposalServiceRebase:
+    """Test applying proposals whose artifact changed after creation."""
+
+    ARTIFACT = "artifacts/plan.md"
+    BASE = "".join(f"Section {i}\n" for i in range(1, 11))
+
+    @pytest.fixture
+    def stale_proposal(self, proposal_service, git_manager, project_key):
+        """Proposal editing section 2, created against BASE."""
+        git_manager.create_project(project_key, {"name": "Test Project"})
+        git_manager.write_file(project_key, self.ARTIFACT, self.BASE)
+        git_manager.commit_changes(project_key, "Create plan", [self.ARTIFACT])
+
+        proposed = self.BASE.replace("Section 2\n", "Section 2 (revised)\n")
+        proposal = Proposal(
+            id="prop-stale-001",
+            project_key=project_key,
+            target_artifact=self.ARTIFACT,
+            change_type=ChangeType.UPDATE,
+            diff=proposal_service._generate_diff(self.BASE, proposed),
+            rationale="Revise section 2",
+        )
+        created = proposal_service.create_proposal(proposal)
+        assert (
+            created.artifact_hash
+            == proposal_service.diff_service.compute_content_hash(self.BASE)
+        )
+        return proposal
+
+    def _change_artifact(self, git_manager, project_key, old, new):
+        content = git_manager.read_file(project_key, self.ARTIFACT).replace(old, new)
+        git_manager.write_file(project_key, self.ARTIFACT, content)
+        git_manager.commit_changes(project_key, "Concurrent edit", [self.ARTIFACT])
+
+    def test_non_overlapping_changes_merge(
+        self, proposal_service, stale_proposal, git_manager, project_key
+    ):
+        """Test a stale proposal is rebased when edits do not overlap."""
+        self._change_artifact(git_manager, project_key, "Section 8\n", "Section 8!\n")
+
+        result = proposal_service.apply_proposal(project_key, stale_proposal.id)
+
+        assert result["rebased"] is True
+        content = git_manager.read_file(project_key, self.ARTIFACT)
+        assert "Section 2 (revised)\n" in content
+        assert "Section 8!\n" in content
+
+    def test_overlapping_changes_conflict(
+        self, proposal_service, stale_proposal, git_manager, project_key
+    ):
+        """Test overlapping edits raise a conflict with markers."""
+        self._change_artifact(git_manager, project_key, "Section 2\n", "Section II\n")
+
+        with pytest.raises(MergeConflictError) as exc:
+            proposal_service.apply_proposal(project_key, stale_proposal.id)
+
+        assert exc.value.conflicts == 1
+        assert "<<<<<<< current\nSection II\n=======" in exc.value.merged_content
+        assert ">>>>>>> proposal prop-stale-001" in exc.value.merged_content
+        proposal = proposal_service.get_proposal(project_key, stale_proposal.id)
+        assert proposal.status == ProposalStatus.PENDING
+
+    def test_unknown_base_conflicts(
+        self, proposal_service, stale_proposal, git_manager, project_key
+    ):
+        """Test a proposal whose base is not in history cannot be rebased."""
+        proposal_file = (
+            git_manager.get_project_path(project_key)
+            / "proposals"
+            / f"{stale_proposal.id}.json"
+        )
+        data = json.loads(proposal_file.read_text())
+        data["artifact_hash"] = "0" * 64
+        proposal_file.write_text(json.dumps(data))
+
+        with pytest.raises(ConflictError, match="is stale"):
+            proposal_service.apply_proposal(project_key, stale_proposal.id)
+
+
+class TestProposalServiceBatchApply:
+    """Test applying several proposals in one commit."""
+
+    ARTIFACT = "artifacts/plan.md"
+    BASE = "".join(f"Section {i}\n" for i in range(1, 11))
+
+    @pytest.fixture
+    def project(self, git_manager, project_key):
+        git_manager.create_project(project_key, {"name": "Test Project"})
+        git_manager.write_file(project_key, self.ARTIFACT, self.BASE)
+        git_manager.commit_changes(project_key, "Create plan", [self.ARTIFACT])
+        return project_key
+
+    def _propose(self, service, project_key, proposal_id, old, new, **fields):
+        content = self.BASE if old is None else old
+        proposal = Proposal(
+            id=proposal_id,
+            project_key=project_key,
+            target_artifact=fields.pop("target_artifact", self.ARTIFACT),
+            change_type=fields.pop("change_type", ChangeType.UPDATE),
+            diff=fields.pop("diff", None) or service._generate_diff(content, new),
+            rationale="Batch edit",
+            **fields,
+        )
+        return service.create_proposal(proposal)
+
+    def test_batch_applies_in_one_commit(self, proposal_service, git_manager, project):
+        """Test proposals on one artifact stack and are committed together."""
+        for n in (2, 5, 8):
+            self._propose(
+                proposal_service,
+                project,
+                f"prop-{n}",
+                None,
+                self.BASE.replace(f"Section {n}\n", f"Section {n}*\n"),
+            )
+        self._propose(
+            proposal_service,
+            project,
+            "prop-new",
+            None,
+            None,
+            target_artifact="artifacts/new.md",
+            change_type=ChangeType.CREATE,
+            diff="# New\n",
+        )
+        commits_before = len(list(git_manager.repo.iter_commits()))
+
+        result = proposal_service.apply_proposals(
+            project, ["prop-8", "prop-2", "prop-new", "prop-5"], actor="reviewer"
+        )
+
+        assert result["applied"] == 4
+        assert [r["proposal_id"] for r in result["results"]] == [
+            "prop-8",
+            "prop-2",
+            "prop-new",
+            "prop-5",
+        ]
+        # prop-2 applies directly; later proposals rebase onto the batch
+        rebased = {r["proposal_id"]: r["rebased"] for r in result["results"]}
+        assert rebased == {
+            "prop-2": False,
+            "prop-5": True,
+            "prop-8": True,
+            "prop-new": False,
+        }
+        content = git_manager.read_file(project, self.ARTIFACT)
+        for n in (2, 5, 8):
+            assert f"Section {n}*\n" in content
+        assert git_manager.read_file(project, "artifacts/new.md") == "# New\n"
+        assert len(list(git_manager.repo.iter_commits())) == commits_before + 1
+        assert git_manager.repo.head.commit.hexsha == result["commit_hash"]
+        assert not git_manager.repo.is_dirty()
+
+        events_path = git_manager.get_project_path(project) / "events" / "audit.ndjson"
+        last_event = json.loads(events_path.read_text().strip().split("\n")[-1])
+        assert last_event["event_type"] == "proposal.batch_accepted"
+        assert last_event["actor"] == "reviewer"
+        assert len(last_event["payload_summary"]["proposal_ids"]) == 4
+        for proposal_id in ("prop-2", "prop-5", "prop-8", "prop-new"):
+            proposal = proposal_service.get_proposal(project, proposal_id)
+            assert proposal.status == ProposalStatus.ACCEPTED
+
+    def test_batch_is_all_or_nothing(self, proposal_service, git_manager, project):
+        """Test one failing proposal leaves every artifact and proposal untouched."""
+        self._propose(
+            proposal_service,
+            project,
+            "prop-a",
+            None,
+            self.BASE.replace("Section 3\n", "Section 3 (A)\n"),
+        )
+        self._propose(
+            proposal_service,
+            project,
+            "prop-b",
+            None,
+            self.BASE.replace("Section 3\n", "Section 3 (B)\n"),
+        )
+        self._propose(
+            proposal_service,
+            project,
+            "prop-c",
+            None,
+            self.BASE.replace("Section 9\n", "Section 9 (C)\n"),
+        )
+        commits_before = len(list(git_manager.repo.iter_commits()))
+
+        with pytest.raises(BatchApplyError) as exc:
+            proposal_service.apply_proposals(
+                project, ["prop-a", "prop-b", "prop-c", "prop-missing"]
+            )
+
+        report = {r["proposal_id"]: r for r in exc.value.results}
+        assert report["prop-a"]["status"] == "applied"
+        assert report["prop-b"]["reason"] == "conflict"
+        assert report["prop-b"]["conflicts"] == 1
+        assert report["prop-c"]["reason"] == "blocked"
+        assert report["prop-missing"]["reason"] == "invalid"
+        assert exc.value.has_conflicts
+
+        assert git_manager.read_file(project, self.ARTIFACT) == self.BASE
+        assert len(list(git_manager.repo.iter_commits())) == commits_before
+        for proposal_id in ("prop-a", "prop-b", "prop-c"):
+            proposal = proposal_service.get_proposal(project, proposal_id)
+            assert proposal.status == ProposalStatus.PENDING
+
+
 class TestProposalServiceReject:
     """Test rejecting proposals."""
 
@@ -256,6 +256,92 @@ class TestProposalAPI:
         )
         assert response.status_code == 404
 
+    def test_apply_stale_proposals(self, client, test_project):
+        """Test stale proposals are rebased, and overlapping ones return 409."""
+        base = "/api/v1/projects/PROP001/proposals"
+
+        def propose(proposal_id, change_type, diff):
+            response = client.post(
+                base,
+                json={
+                    "id": proposal_id,
+                    "target_artifact": "artifacts/plan.md",
+                    "change_type": change_type,
+                    "diff": diff,
+                    "rationale": "Concurrent edit",
+                },
+            )
+            assert response.status_code == 201
+
+        def edit(target, replacement):
+            lines = ["Line 1", "Line 2", "Line 3"]
+            body = "\n".join(
+                f"-{line}\n+{replacement}" if line == target else f" {line}"
+                for line in lines
+            )
+            return f"--- a/plan.md\n+++ b/plan.md\n@@ -1,3 +1,3 @@\n{body}"
+
+        propose("prop-base", "create", "Line 1\nLine 2\nLine 3\n")
+        assert client.post(f"{base}/prop-base/apply").status_code == 200
+
+        propose("prop-a", "update", edit("Line 2", "Line 2 A"))
+        propose("prop-b", "update", edit("Line 2", "Line 2 B"))
+        propose("prop-c", "update", edit("Line 3", "Line 3 C"))
+
+        response = client.post(f"{base}/prop-a/apply")
+        assert response.status_code == 200
+        assert response.json()["rebased"] is False
+
+        response = client.post(f"{base}/prop-c/apply")
+        assert response.status_code == 200
+        assert response.json()["rebased"] is True
+
+        response = client.post(f"{base}/prop-b/apply")
+        assert response.status_code == 409
+        detail = response.json()["detail"]
+        assert detail["conflicts"] == 1
+        assert detail["merged_content"] == (
+            "Line 1\n<<<<<<< current\nLine 2 A\nLine 3 C\n=======\n"
+            "Line 2 B\nLine 3\n>>>>>>> proposal prop-b\n"
+        )
+
+    def test_batch_apply_proposals(self, client, test_project):
+        """Test POST /api/v1/projects/{key}/proposals/batch-apply."""
+        base = "/api/v1/projects/PROP001/proposals"
+        for n in (1, 2):
+            response = client.post(
+                base,
+                json={
+                    "id": f"prop-batch-{n}",
+                    "target_artifact": f"artifacts/doc-{n}.md",
+                    "change_type": "create",
+                    "diff": f"Document {n}\n",
+                    "rationale": "Batch create",
+                },
+            )
+            assert response.status_code == 201
+
+        response = client.post(
+            f"{base}/batch-apply",
+            json={"proposal_ids": ["prop-batch-1", "unknown-id"]},
+        )
+        assert response.status_code == 400
+        results = response.json()["detail"]["results"]
+        assert [r["status"] for r in results] == ["applied", "failed"]
+
+        response = client.post(
+            f"{base}/batch-apply",
+            json={"proposal_ids": ["prop-batch-1", "prop-batch-2"]},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["applied"] == 2
+        assert data["commit_hash"]
+        assert {r["status"] for r in data["results"]} == {"applied"}
+
+        response = client.post(f"{base}/batch-apply", json={"proposal_ids": []})
+        assert response.status_code == 422
+
     def test_proposal_endpoints_require_existing_project(self, client):
         """Test that proposal endpoints return 404 for nonexistent projects."""
         # POST proposal
@@ -305,7 +391,7 @@ class TestCommandHistoryAPI:
         return response.json()
 
     def test_execute_command(self, client, test_project):
-        """Test POST /api/v1/commands."""
+        """Test POST /api/v1/commands queues the command."""
         response = client.post(
             "/api/v1/commands",
             json={
@@ -315,17 +401,103 @@ class TestCommandHistoryAPI:
             },
         )
 
-        # May succeed or fail depending on LLM availability
-        if response.status_code == 201:
-            data = response.json()
-            assert "id" in data
-            assert data["project_key"] == "CMD001"
-            assert data["command"] == "assess_gaps"
-            assert data["status"] in ["running", "completed", "failed"]
-            assert "created_at" in data
-        else:
-            # LLM not available or other error
-            assert response.status_code in [400, 500]
+        assert response.status_code == 202
+        data = response.json()
+        assert "id" in data
+        assert data["project_key"] == "CMD001"
+        assert data["command"] == "assess_gaps"
+        assert data["status"] == "pending"
+        assert "created_at" in data
+        assert response.headers["Location"].endswith(f"/api/v1/commands/{data['id']}")
+
+        # The command is in the history while it runs in the background
+        response = client.get(f"/api/v1/commands/{data['id']}")
+        assert response.status_code == 200
+        assert response.json()["status"] in [
+            "pending",
+            "running",
+            "success",
+            "failed",
+        ]
+
+    def test_execute_unknown_command(self, client, test_project):
+        """Test POST /api/v1/commands rejects unknown commands up front."""
+        response = client.post(
+            "/api/v1/commands",
+            json={"project_key": "CMD001", "command": "bogus", "params": {}},
+        )
+        assert response.status_code == 400
+
+    def test_cancel_command_not_found(self, client):
+        """Test POST /api/v1/commands/{id}/cancel for nonexistent ID."""
+        response = client.post("/api/v1/commands/nonexistent-id/cancel")
+        assert response.status_code == 404
+
+    def test_cancel_finished_command_conflicts(self, client, test_project):
+        """Test finished commands cannot be cancelled."""
+        from routers.commands_global import command_service
+
+        command_service.log_command(
+            {
+                "id": "done-1",
+                "project_key": "CMD001",
+                "command": "assess_gaps",
+                "status": "success",
+                "created_at": "2026-01-01T00:00:00Z",
+            },
+            client.app.state.git_manager,
+        )
+        response = client.post("/api/v1/commands/done-1/cancel")
+        assert response.status_code == 409
+
+    def test_command_events_stream(self, client, test_project):
+        """Test GET /api/v1/commands/{id}/events ends with the final status."""
+        from routers.commands_global import command_service
+
+        command_service.log_command(
+            {
+                "id": "done-2",
+                "project_key": "CMD001",
+                "command": "assess_gaps",
+                "status": "failed",
+                "created_at": "2026-01-01T00:00:00Z",
+            },
+            client.app.state.git_manager,
+        )
+        response = client.get("/api/v1/commands/done-2/events")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text.startswith("event: status\ndata: ")
+        assert '"status":"failed"' in response.text
+
+        response = client.get("/api/v1/commands/nonexistent-id/events")
+        assert response.status_code == 404
+
+    def test_command_events_stream_ends_when_command_disappears(
+        self, client, test_project, monkeypatch
+    ):
+        """Test the stream emits an error event once the command is gone."""
+        from routers.commands_global import command_service
+
+        running = {
+            "id": "gone-1",
+            "project_key": "CMD001",
+            "command": "assess_gaps",
+            "status": "running",
+            "created_at": "2026-01-01T00:00:00Z",
+        }
+        lookups = iter([running, running, None])
+        monkeypatch.setattr(
+            command_service, "load_command", lambda *args: next(lookups)
+        )
+        monkeypatch.setattr("routers.commands_global.STATUS_POLL_SECONDS", 0.01)
+
+        response = client.get("/api/v1/commands/gone-1/events")
+
+        assert response.status_code == 200
+        assert response.text.startswith("event: status\ndata: ")
+        assert "event: error" in response.text
+        assert "not found" in response.text
 
     def test_execute_command_nonexistent_project(self, client):
         """Test POST /api/v1/commands for nonexistent project."""
@@ -358,6 +530,42 @@ class TestCommandHistoryAPI:
         for command in data["commands"]:
             assert command["project_key"] == "CMD001"
 
+    def test_list_commands_paginated_and_filtered(self, client, test_project):
+        """Test GET /api/v1/commands with limit, cursor and filters."""
+        from routers.commands_global import command_service
+
+        git_manager = client.app.state.git_manager
+        for i in range(5):
+            command_service.log_command(
+                {
+                    "id": f"cmd-{i}",
+                    "project_key": "CMD001",
+                    "command": "assess_gaps",
+                    "status": "failed" if i == 2 else "running",
+                    "created_at": f"2026-01-01T00:00:0{i}Z",
+                },
+                git_manager,
+            )
+
+        response = client.get("/api/v1/commands?limit=3")
+        assert response.status_code == 200
+        data = response.json()
+        assert [c["id"] for c in data["commands"]] == ["cmd-4", "cmd-3", "cmd-2"]
+        assert data["next_cursor"]
+
+        response = client.get(f"/api/v1/commands?limit=3&cursor={data['next_cursor']}")
+        data = response.json()
+        assert [c["id"] for c in data["commands"]] == ["cmd-1", "cmd-0"]
+        assert data["next_cursor"] is None
+
+        response = client.get("/api/v1/commands?status=failed&command=assess_gaps")
+        assert [c["id"] for c in response.json()["commands"]] == ["cmd-2"]
+
+    def test_list_commands_invalid_cursor(self, client):
+        """Test GET /api/v1/commands rejects malformed cursors."""
+        response = client.get("/api/v1/commands?limit=5&cursor=bogus")
+        assert response.status_code == 400
+
     def test_get_command_by_id_not_found(self, client):
         """Test GET /api/v1/commands/{id} for nonexistent ID."""
         response = client.get("/api/v1/commands/nonexistent-id")
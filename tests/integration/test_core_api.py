@@ -3,6 +3,7 @@ Integration tests for Core API endpoints.
 Tests the main API endpoints: health, projects, commands, and artifacts.
 """
 
+import json
 import pytest
 from fastapi.testclient import TestClient
 import tempfile
@@ -265,6 +266,69 @@ class TestCommandsAPI:
             assert "proposal_id" in data
             assert "file_changes" in data
 
+    def test_propose_stream_nonexistent_project(self, client):
+        """Test streaming a proposal for a nonexistent project."""
+        response = client.post(
+            "/projects/NONEXISTENT/commands/propose/stream",
+            json={"command": "assess_gaps", "params": {}},
+        )
+        assert response.status_code == 404
+
+    def test_propose_stream_unknown_command(self, client, test_project):
+        """Test streaming an unknown command fails before streaming."""
+        response = client.post(
+            "/projects/CMD001/commands/propose/stream",
+            json={"command": "unknown_command", "params": {}},
+        )
+        assert response.status_code == 400
+        assert "Unknown command" in response.json()["detail"]
+
+    def test_propose_stream_generate_plan(self, client, test_project):
+        """Test streaming ends with the stored proposal."""
+        response = client.post(
+            "/projects/CMD001/commands/propose/stream",
+            json={"command": "generate_plan", "params": {}},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        events = [
+            block.split("\n", 1)
+            for block in response.text.strip().split("\n\n")
+            if block.startswith("event:")
+        ]
+        names = [name for name, _ in events]
+        assert names[-1] == "event: proposal"
+        assert set(names[:-1]) <= {"event: token"}
+
+        proposal = json.loads(events[-1][1][len("data: ") :])
+        assert proposal["file_changes"][0]["path"] == "artifacts/schedule.md"
+        assert "draft_commit_message" in proposal
+
+        # The streamed proposal is applied like any other
+        response = client.post(
+            "/projects/CMD001/commands/apply",
+            json={"proposal_id": proposal["proposal_id"]},
+        )
+        assert response.status_code == 200
+
+    def test_propose_returns_503_when_llm_overloaded(self, client, test_project):
+        """Test overload fails fast with Retry-After instead of timing out."""
+        from services.llm_concurrency import ConcurrencyLimiter
+
+        llm_service = client.app.state.llm_service
+        limiter = ConcurrencyLimiter(max_concurrency=1, max_queue=0, retry_after=3)
+        limiter._take(llm_service.config["model"])
+        llm_service.limiter = limiter
+
+        response = client.post(
+            "/projects/CMD001/commands/propose",
+            json={"command": "assess_gaps", "params": {}},
+        )
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+        assert "overloaded" in response.json()["detail"]
+
     def test_apply_nonexistent_proposal(self, client, test_project):
         """Test applying nonexistent proposal."""
         response = client.post(
@@ -15,6 +15,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../apps/api"))
 
 from main import app  # noqa: E402
 import main as main_module  # noqa: E402
+from services.monitoring_service import REQUEST_COUNT  # noqa: E402
 
 
 def test_root_endpoint_has_correlation_id_header():
@@ -52,6 +53,59 @@ def test_metrics_endpoint_returns_prometheus_format():
     assert isinstance(res.content, (bytes, bytearray))
 
 
+def _request_samples(method, endpoint, status_code=None):
+    # The test conftest unregisters collectors, so read the metric directly
+    return [
+        sample
+        for sample in REQUEST_COUNT.collect()[0].samples
+        if sample.name == "api_requests_total"
+        and sample.labels["method"] == method
+        and sample.labels["endpoint"] == endpoint
+        and status_code in (None, int(sample.labels["status_code"]))
+    ]
+
+
+def _request_count(method, endpoint, status_code=None):
+    return sum(
+        sample.value for sample in _request_samples(method, endpoint, status_code)
+    )
+
+
+def test_metrics_are_labelled_by_route_template():
+    # Whether the handler succeeds depends on app state left by other tests
+    client = TestClient(app, raise_server_exceptions=False)
+    template = "/api/v1/projects/{project_key}/raid/{raid_id}"
+    before = _request_count("GET", template)
+
+    client.get("/api/v1/projects/NOPE1/raid/RAID-1")
+    client.get("/api/v1/projects/NOPE2/raid/RAID-2")
+
+    assert _request_count("GET", template) - before == 2
+    assert _request_count("GET", "/api/v1/projects/NOPE1/raid/RAID-1") == 0
+
+
+def test_unmatched_paths_share_one_label():
+    client = TestClient(app)
+    before = _request_count("GET", main_module.UNMATCHED_ROUTE, 404)
+
+    client.get("/no/such/path-1")
+    client.get("/no/such/path-2")
+
+    assert _request_count("GET", main_module.UNMATCHED_ROUTE, 404) - before == 2
+
+
+def test_correlation_id_exemplars(monkeypatch):
+    monkeypatch.setattr(main_module, "METRICS_EXEMPLARS", True)
+    client = TestClient(app)
+
+    correlation_id = client.get("/").headers["X-Correlation-ID"]
+    res = client.get("/metrics", headers={"Accept": "application/openmetrics-text"})
+
+    assert "application/openmetrics-text" in res.headers["content-type"]
+    (sample,) = _request_samples("GET", "/", 200)
+    assert sample.exemplar.labels == {"correlation_id": correlation_id}
+
+
 def test_lifespan_startup_initializes_services_successfully(monkeypatch, tmp_path):
     class DummyLLMService:
         pass
@@ -386,3 +386,135 @@ class TestWorkflowAuditIntegration:
             and e.get("correlation_id") == correlation_id
         ]
         assert len(state_events) >= 1
+
+
+class TestAuditEventStream:
+    """Test Server-Sent Events streaming of audit events."""
+
+    def _transition(self, client, to_state, actor="test_user"):
+        client.patch(
+            "/api/v1/projects/TEST001/workflow/state",
+            json={"to_state": to_state, "actor": actor},
+        )
+
+    def _parse_frames(self, body):
+        frames = []
+        for block in body.strip().split("\n\n"):
+            fields = dict(
+                line.split(": ", 1) for line in block.splitlines() if ": " in line
+            )
+            if "data" in fields:
+                fields["data"] = json.loads(fields["data"])
+                frames.append(fields)
+        return frames
+
+    def test_stream_backlog_from_cursor(self, client, test_project):
+        """Test draining events after a cursor with follow=false."""
+        response = client.get(
+            "/api/v1/projects/TEST001/audit-events/stream?follow=false"
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        start_frames = self._parse_frames(response.text)
+        assert start_frames == []
+
+        from routers.workflow import event_streamer
+
+        git_manager = client.app.state.git_manager
+        cursor = event_streamer.encode_cursor(
+            event_streamer.initial_cursor(git_manager, "TEST001")
+        )
+
+        self._transition(client, "planning", actor="alice")
+        self._transition(client, "executing", actor="bob")
+
+        response = client.get(
+            f"/api/v1/projects/TEST001/audit-events/stream?follow=false"
+            f"&stream=audit&actor=bob&cursor={cursor}"
+        )
+        frames = self._parse_frames(response.text)
+        assert len(frames) == 1
+        assert frames[0]["event"] == "audit"
+        assert frames[0]["data"]["actor"] == "bob"
+
+        # Resuming from the frame id yields nothing new
+        response = client.get(
+            "/api/v1/projects/TEST001/audit-events/stream?follow=false&stream=audit",
+            headers={"Last-Event-ID": frames[0]["id"]},
+        )
+        assert self._parse_frames(response.text) == []
+
+    def test_stream_invalid_cursor(self, client, test_project):
+        """Test an invalid cursor is rejected."""
+        response = client.get(
+            "/api/v1/projects/TEST001/audit-events/stream?cursor=not-a-cursor"
+        )
+        assert response.status_code == 400
+
+    def test_stream_unknown_stream_name(self, client, test_project):
+        """Test an unknown stream name is rejected."""
+        response = client.get(
+            "/api/v1/projects/TEST001/audit-events/stream?stream=bogus"
+        )
+        assert response.status_code == 400
+
+    def test_stream_nonexistent_project(self, client):
+        """Test streaming for a nonexistent project returns 404."""
+        response = client.get("/api/v1/projects/NONEXISTENT/audit-events/stream")
+        assert response.status_code == 404
+
+    def test_stream_all_projects(self, client, test_project):
+        """Test the portfolio-wide stream includes the project key."""
+        from routers.workflow import event_streamer
+
+        git_manager = client.app.state.git_manager
+        cursor = event_streamer.encode_cursor(
+            event_streamer.initial_cursor(git_manager)
+        )
+        self._transition(client, "planning")
+
+        response = client.get(
+            f"/api/v1/projects/audit-events/stream?follow=false&cursor={cursor}"
+            "&event_type=workflow_state_changed"
+        )
+        frames = self._parse_frames(response.text)
+        assert len(frames) == 1
+        assert frames[0]["data"]["project_key"] == "TEST001"
+
+
+class TestAuditTrendsAPI:
+    """Test audit trend endpoints."""
+
+    def test_get_audit_trends_after_audit(self, client, test_project):
+        """Test running an audit produces a trend point."""
+        response = client.post("/api/v1/projects/TEST001/audit")
+        assert response.status_code == 200
+
+        response = client.get("/api/v1/projects/TEST001/audit/trends?resolution=hourly")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["resolution"] == "hourly"
+        assert data["count"] == 1
+        assert data["trends"][0]["runs"] == 1
+
+    def test_get_portfolio_audit_trends(self, client, test_project):
+        """Test the portfolio trend endpoint merges projects."""
+        client.post("/api/v1/projects/TEST001/audit")
+
+        response = client.get("/api/v1/projects/audit/trends")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 1
+        assert data["trends"][0]["projects"] == 1
+
+    def test_get_audit_trends_invalid_resolution(self, client, test_project):
+        """Test an unknown resolution is rejected."""
+        response = client.get(
+            "/api/v1/projects/TEST001/audit/trends?resolution=monthly"
+        )
+        assert response.status_code == 422
+
+    def test_get_audit_trends_nonexistent_project(self, client):
+        """Test trends for a nonexistent project returns 404."""
+        response = client.get("/api/v1/projects/NONEXISTENT/audit/trends")
+        assert response.status_code == 404
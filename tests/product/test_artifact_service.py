@@ -95,19 +95,16 @@ def test_generate_from_blueprint_missing_blueprint_raises():
 
 def test_generate_from_blueprint_partial_failure_returns_error_entry():
     blueprint = SimpleNamespace(required_templates=["tpl-ok", "tpl-fail"])
-    service, _, _, _ = _build_service(blueprint=blueprint)
-
-    def _fake_generate(template_id, project_key, context):
-        if template_id == "tpl-fail":
-            raise ArtifactGenerationError("Template not found: tpl-fail")
-        return {
-            "artifact_path": "artifacts/pmp.md",
-            "template_id": template_id,
-            "artifact_type": "pmp",
-            "content": "ok",
-        }
-
-    service.generate_from_template = _fake_generate  # type: ignore[method-assign]
+    service, template_service, _, git_manager = _build_service(blueprint=blueprint)
+    template = SimpleNamespace(
+        id="tpl-ok",
+        artifact_type="pmp",
+        schema={"type": "object"},
+        markdown_template="ok",
+    )
+    template_service.get_template.side_effect = lambda template_id: (
+        template if template_id == "tpl-ok" else None
+    )
 
     results = service.generate_from_blueprint("bp-1", "TEST001", base_context={})
 
@@ -116,6 +113,29 @@ def test_generate_from_blueprint_partial_failure_returns_error_entry():
     failed = next(item for item in results if item.get("template_id") == "tpl-fail")
     assert failed["success"] is False
     assert "Template not found" in failed["error"]
+    git_manager.write_file.assert_called_once_with("TEST001", "artifacts/pmp.md", "ok")
+
+
+def test_generate_from_blueprint_commits_once_with_timings():
+    blueprint = SimpleNamespace(required_templates=["tpl-pmp", "tpl-raid"])
+    service, template_service, _, git_manager = _build_service(blueprint=blueprint)
+    template_service.get_template.side_effect = lambda template_id: SimpleNamespace(
+        id=template_id,
+        artifact_type=template_id.split("-")[1],
+        schema={"type": "object"},
+        markdown_template="# {{ project_key }}",
+    )
+
+    results = service.generate_from_blueprint("bp-1", "TEST001")
+
+    assert [r["artifact_type"] for r in results] == ["pmp", "raid"]
+    assert all(r["duration_ms"] >= 0 for r in results)
+    assert git_manager.write_file.call_count == 2
+    git_manager.commit_changes.assert_called_once_with(
+        "TEST001",
+        "[TEST001] Generated 2 artifacts from blueprint bp-1",
+        ["artifacts/pmp.md", "artifacts/raid.md"],
+    )
 
 
 def test_sanitize_context_strips_private_keys():
@@ -181,6 +181,64 @@ class TestAuditEventRetrieval:
         assert result2["total"] == 10
         assert result2["offset"] == 5
 
+    def test_get_audit_events_newest_first(
+        self, audit_service, git_manager, test_project
+    ):
+        """Test newest-first retrieval stops once the page is filled."""
+        for i in range(10):
+            audit_service.log_audit_event(
+                project_key=test_project,
+                event_type="test_event",
+                actor="test_user",
+                payload_summary={"seq": i},
+                git_manager=git_manager,
+            )
+
+        result = audit_service.get_audit_events(
+            project_key=test_project,
+            git_manager=git_manager,
+            limit=3,
+            offset=2,
+            newest_first=True,
+        )
+
+        assert [e["payload_summary"]["seq"] for e in result["events"]] == [7, 6, 5]
+        assert result["has_more"] is True
+
+        last_page = audit_service.get_audit_events(
+            project_key=test_project,
+            git_manager=git_manager,
+            limit=5,
+            offset=8,
+            newest_first=True,
+        )
+
+        assert [e["payload_summary"]["seq"] for e in last_page["events"]] == [1, 0]
+        assert last_page["total"] == 10
+        assert last_page["has_more"] is False
+
+    def test_newest_first_since_skips_events_without_timestamp(
+        self, audit_service, git_manager, test_project
+    ):
+        """Test an event with no timestamp does not end the scan early."""
+        log = git_manager.open_log(test_project, "events/audit.ndjson")
+        log.append({"event_type": "test_event", "timestamp": "2026-01-01T10:00:00Z"})
+        log.append({"event_type": "test_event", "timestamp": ""})
+        log.append({"event_type": "test_event"})
+        log.append({"event_type": "test_event", "timestamp": "2026-01-01T12:00:00Z"})
+
+        result = audit_service.get_audit_events(
+            project_key=test_project,
+            git_manager=git_manager,
+            since="2026-01-01T09:00:00Z",
+            newest_first=True,
+        )
+
+        assert [e["timestamp"] for e in result["events"]] == [
+            "2026-01-01T12:00:00Z",
+            "2026-01-01T10:00:00Z",
+        ]
+
 
 class TestAuditEventFiltering:
     """Test audit event filtering."""
@@ -577,3 +635,208 @@ class TestEnhancedAuditRules:
         assert "timestamp" in history[0]
         assert "total_issues" in history[0]
         assert "completeness_score" in history[0]
+
+
+class TestAuditTrends:
+    """Tests for precomputed audit trend series."""
+
+    def _entry(self, timestamp, score, issues, violations=None):
+        return {
+            "timestamp": timestamp,
+            "completeness_score": score,
+            "total_issues": issues,
+            "rule_violations": violations or {},
+        }
+
+    def _save(self, audit_service, git_manager, project_key, entry):
+        """Append a history entry with a fixed timestamp and update trends."""
+        orchestrator = audit_service.orchestrator
+        git_manager.open_log(project_key, "audit/history.ndjson").append(entry)
+        orchestrator.trend_service.update(project_key, entry, git_manager)
+
+    def test_save_audit_history_updates_trends(
+        self, audit_service, git_manager, test_project
+    ):
+        """Test saving audit history maintains the trends file incrementally."""
+        result = audit_service.run_audit_rules(
+            project_key=test_project, git_manager=git_manager
+        )
+        audit_service.save_audit_history(test_project, result, git_manager)
+        audit_service.save_audit_history(test_project, result, git_manager)
+
+        trends_path = git_manager.get_cache_path(test_project) / "audit/trends.json"
+        assert trends_path.exists()
+        assert not [f for f in git_manager.repo.untracked_files if "trends" in f]
+
+        trends = audit_service.get_audit_trends(test_project, git_manager)
+        assert len(trends) == 1
+        assert trends[0]["runs"] == 2
+        assert trends[0]["total_issues"]["avg"] == result["total_issues"]
+
+    def test_trends_downsample_by_resolution(
+        self, audit_service, git_manager, test_project
+    ):
+        """Test entries are aggregated into hourly, daily and weekly buckets."""
+        from apps.api.domain.audit.enums import TrendResolution
+
+        for timestamp, score, issues in [
+            ("2025-01-06T09:15:00Z", 50.0, 4),  # Monday
+            ("2025-01-06T09:45:00Z", 70.0, 2),
+            ("2025-01-07T10:00:00Z", 90.0, 0),
+        ]:
+            self._save(
+                audit_service,
+                git_manager,
+                test_project,
+                self._entry(timestamp, score, issues, {"date_consistency": issues}),
+            )
+
+        hourly = audit_service.get_audit_trends(
+            test_project, git_manager, resolution=TrendResolution.HOURLY
+        )
+        assert [p["bucket"] for p in hourly] == [
+            "2025-01-06T09:00:00Z",
+            "2025-01-07T10:00:00Z",
+        ]
+        assert hourly[0]["runs"] == 2
+        assert hourly[0]["completeness_score"] == {
+            "avg": 60.0,
+            "min": 50.0,
+            "max": 70.0,
+        }
+
+        daily = audit_service.get_audit_trends(test_project, git_manager)
+        assert [p["runs"] for p in daily] == [2, 1]
+
+        weekly = audit_service.get_audit_trends(
+            test_project, git_manager, resolution=TrendResolution.WEEKLY
+        )
+        assert len(weekly) == 1
+        assert weekly[0]["bucket"] == "2025-01-06T00:00:00Z"
+        assert weekly[0]["runs"] == 3
+        assert weekly[0]["rule_violations"]["date_consistency"]["max"] == 4
+
+    def test_trends_time_window(self, audit_service, git_manager, test_project):
+        """Test since/until select whole buckets."""
+        from datetime import datetime, timezone
+
+        for day in (1, 2, 3):
+            self._save(
+                audit_service,
+                git_manager,
+                test_project,
+                self._entry(f"2025-03-0{day}T12:00:00Z", 80.0, day),
+            )
+
+        trends = audit_service.get_audit_trends(
+            test_project,
+            git_manager,
+            since=datetime(2025, 3, 2, 18, tzinfo=timezone.utc),
+            until=datetime(2025, 3, 3, 0, tzinfo=timezone.utc),
+        )
+        assert [p["bucket"] for p in trends] == [
+            "2025-03-02T00:00:00Z",
+            "2025-03-03T00:00:00Z",
+        ]
+
+    def test_rule_stats_count_runs_without_the_rule(
+        self, audit_service, git_manager, test_project
+    ):
+        """Test runs that did not report a rule count as 0 towards min and avg."""
+        for timestamp, violations in [
+            ("2025-05-01T08:00:00Z", {}),
+            ("2025-05-01T09:00:00Z", {"date_consistency": 4}),
+            ("2025-05-01T10:00:00Z", {"date_consistency": 2, "missing_owner": 1}),
+        ]:
+            self._save(
+                audit_service,
+                git_manager,
+                test_project,
+                self._entry(timestamp, 80.0, 0, violations),
+            )
+
+        rules = audit_service.get_audit_trends(test_project, git_manager)[0][
+            "rule_violations"
+        ]
+
+        assert rules["date_consistency"] == {"avg": 2.0, "min": 0.0, "max": 4.0}
+        assert rules["missing_owner"] == {"avg": 0.3333, "min": 0.0, "max": 1.0}
+
+    def test_naive_window_bounds_are_utc(
+        self, audit_service, git_manager, test_project, monkeypatch
+    ):
+        """Test since/until without a timezone are read as UTC, not local time."""
+        import time
+        from datetime import datetime
+
+        from apps.api.domain.audit.enums import TrendResolution
+
+        for hour in (10, 11):
+            self._save(
+                audit_service,
+                git_manager,
+                test_project,
+                self._entry(f"2025-06-01T{hour}:00:00Z", 80.0, 0),
+            )
+
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            trends = audit_service.get_audit_trends(
+                test_project,
+                git_manager,
+                resolution=TrendResolution.HOURLY,
+                since=datetime(2025, 6, 1, 11),
+                until=datetime(2025, 6, 1, 11, 30),
+            )
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert [p["bucket"] for p in trends] == ["2025-06-01T11:00:00Z"]
+
+    def test_trends_rebuilt_from_history(
+        self, audit_service, git_manager, test_project
+    ):
+        """Test a missing trends file is rebuilt from the history log."""
+        history = git_manager.open_log(test_project, "audit/history.ndjson")
+        history.append(self._entry("2025-02-01T08:00:00Z", 40.0, 6))
+        history.append(self._entry("2025-02-01T20:00:00Z", 60.0, 2))
+
+        trends = audit_service.get_audit_trends(test_project, git_manager)
+
+        assert len(trends) == 1
+        assert trends[0]["runs"] == 2
+        assert trends[0]["total_issues"]["avg"] == 4.0
+        trends_path = git_manager.get_cache_path(test_project) / "audit/trends.json"
+        assert trends_path.exists()
+
+    def test_portfolio_trends_merge_projects(
+        self, audit_service, git_manager, test_project
+    ):
+        """Test portfolio trends merge buckets across projects."""
+        git_manager.create_project("TEST002", {"key": "TEST002", "name": "Second"})
+        self._save(
+            audit_service,
+            git_manager,
+            test_project,
+            self._entry("2025-04-01T10:00:00Z", 100.0, 0, {"date_consistency": 3}),
+        )
+        self._save(
+            audit_service,
+            git_manager,
+            "TEST002",
+            self._entry("2025-04-01T11:00:00Z", 50.0, 10),
+        )
+
+        trends = audit_service.get_audit_trends(None, git_manager)
+
+        assert len(trends) == 1
+        assert trends[0]["runs"] == 2
+        assert trends[0]["projects"] == 2
+        assert trends[0]["completeness_score"]["avg"] == 75.0
+        assert trends[0]["rule_violations"]["date_consistency"] == {
+            "avg": 1.5,
+            "min": 0.0,
+            "max": 3.0,
+        }
@@ -0,0 +1,223 @@
+"""
+Unit tests for the background command queue.
+"""
+
+import asyncio
+import os
+import socket
+
+import pytest
+from unittest.mock import Mock
+
+from apps.api.services.command_queue import (
+    CommandNotCancellableError,
+    CommandQueue,
+    QueueFullError,
+)
+
+
+class FakeCommandService:
+    """Command service whose proposals block until released."""
+
+    def __init__(self):
+        self.handlers = {"assess_gaps": None, "generate_plan": None}
+        self.records = {}
+        self.started = []
+        self.release = {}
+        self.fail = set()
+        self.applying = {}
+
+    def log_command(self, record, git_manager):
+        self.records[record["id"]] = dict(record)
+
+    def update_command(self, command_id, fields, git_manager):
+        self.records[command_id].update(fields)
+
+    async def propose_command(self, project_key, command, params, llm, git):
+        self.started.append(params["n"])
+        gate = self.release.setdefault(params["n"], asyncio.Event())
+        await gate.wait()
+        if params["n"] in self.fail:
+            raise RuntimeError("LLM unavailable")
+        return {"proposal_id": f"p{params['n']}"}
+
+    async def apply_proposal(self, proposal_id, git_manager, log_content=False):
+        gate = self.applying.get(proposal_id)
+        if gate is not None:
+            await gate.wait()
+        return {"commit_hash": f"c-{proposal_id}"}
+
+    def list_commands_page(self, git_manager, status=None):
+        return [r for r in self.records.values() if r["status"] == status], None
+
+    def finish(self, n):
+        self.release.setdefault(n, asyncio.Event()).set()
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def service():
+    return FakeCommandService()
+
+
+def _submit(queue, project_key, n, command="assess_gaps"):
+    return queue.submit(project_key, command, {"n": n}, Mock(), Mock())
+
+
+class TestCommandQueue:
+    """Test worker pool scheduling, limits and cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_runs_jobs_in_order_per_project(self, service):
+        """Test jobs of one project run sequentially, other projects in parallel."""
+        queue = CommandQueue(service, max_workers=4)
+        first = _submit(queue, "A", 1)
+        _submit(queue, "A", 2)
+        _submit(queue, "B", 3)
+        assert first["status"] == "pending"
+
+        await _settle()
+        assert sorted(service.started) == [1, 3]
+        assert queue.running() == 2 and queue.depth() == 1
+
+        service.finish(1)
+        await _settle()
+        assert service.started[-1] == 2
+        assert service.records[first["id"]]["status"] == "success"
+        assert service.records[first["id"]]["commit_hash"] == "c-p1"
+
+        service.finish(2)
+        service.finish(3)
+        await _settle()
+        assert queue.running() == 0
+        assert {r["status"] for r in service.records.values()} == {"success"}
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_worker_pool_bounds_concurrency(self, service):
+        """Test no more than max_workers jobs run at once."""
+        queue = CommandQueue(service, max_workers=2)
+        for n in range(4):
+            _submit(queue, f"P{n}", n)
+
+        await _settle()
+        assert len(service.started) == 2
+        assert queue.depth() == 2
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_is_full(self, service):
+        """Test submissions beyond max_depth waiting jobs are rejected."""
+        queue = CommandQueue(service, max_workers=1, max_depth=2)
+        _submit(queue, "A", 1)
+        _submit(queue, "A", 2)
+
+        with pytest.raises(QueueFullError) as exc:
+            _submit(queue, "A", 3)
+        assert exc.value.retry_after > 0
+        assert len(service.records) == 2
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_unknown_command_is_rejected(self, service):
+        """Test unknown commands fail at submission, not in a worker."""
+        queue = CommandQueue(service)
+        with pytest.raises(ValueError, match="Unknown command"):
+            _submit(queue, "A", 1, command="bogus")
+
+    @pytest.mark.asyncio
+    async def test_cancel_pending_and_running(self, service):
+        """Test cancelled jobs are recorded and never applied."""
+        queue = CommandQueue(service, max_workers=1)
+        running = _submit(queue, "A", 1)
+        pending = _submit(queue, "A", 2)
+        await _settle()
+
+        assert await queue.cancel(pending["id"])
+        assert service.records[pending["id"]]["status"] == "cancelled"
+
+        assert await queue.cancel(running["id"])
+        assert service.records[running["id"]]["status"] == "cancelled"
+        assert "commit_hash" not in service.records[running["id"]]
+        assert service.started == [1]
+        assert not await queue.cancel(running["id"])
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_cannot_cancel_while_applying(self, service):
+        """Test a job committing its changes refuses cancellation."""
+        queue = CommandQueue(service)
+        record = _submit(queue, "A", 1)
+        await _settle()
+        queue._jobs[record["id"]].applying = True
+
+        with pytest.raises(CommandNotCancellableError):
+            await queue.cancel(record["id"])
+        queue._jobs[record["id"]].applying = False
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_failures_are_recorded(self, service):
+        """Test propose errors mark the command failed with a message."""
+        queue = CommandQueue(service)
+        service.fail.add(1)
+        record = _submit(queue, "A", 1)
+        service.finish(1)
+        await _settle()
+
+        assert service.records[record["id"]]["status"] == "failed"
+        assert service.records[record["id"]]["error_message"] == "LLM unavailable"
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_finishes_applies_and_cancels_the_rest(self, service):
+        """Test shutdown commits applying jobs and settles every other job."""
+        queue = CommandQueue(service, max_workers=2)
+        service.applying["p1"] = asyncio.Event()
+        applying = _submit(queue, "A", 1)
+        waiting = _submit(queue, "A", 2)
+        proposing = _submit(queue, "B", 3)
+        service.finish(1)
+        await _settle()
+        assert queue._jobs[applying["id"]].applying
+
+        stopping = asyncio.ensure_future(queue.stop())
+        await _settle()
+        assert service.records[waiting["id"]]["status"] == "cancelled"
+        assert service.records[proposing["id"]]["status"] == "cancelled"
+        assert not stopping.done()
+
+        service.applying["p1"].set()
+        await stopping
+        assert service.records[applying["id"]]["status"] == "success"
+        assert service.started == [1, 3]
+
+    def test_recover_fails_commands_of_dead_processes(self, service):
+        """Test orphaned commands are failed and live owners are left alone."""
+        host = socket.gethostname()
+        owners = {
+            "orphan": f"{host}:{2**22 + 1}",
+            "legacy": None,
+            "live": f"{host}:{os.getppid()}",
+            "remote": "other-host:1",
+        }
+        for command_id, owner in owners.items():
+            service.records[command_id] = {
+                "id": command_id,
+                "project_key": "A",
+                "status": "running" if command_id == "orphan" else "pending",
+                "worker": owner,
+            }
+
+        assert CommandQueue(service).recover(Mock()) == 2
+        statuses = {k: r["status"] for k, r in service.records.items()}
+        assert statuses == {
+            "orphan": "failed",
+            "legacy": "failed",
+            "live": "pending",
+            "remote": "pending",
+        }
@@ -5,25 +5,119 @@ Unit tests for Command Service.
 import pytest
 from unittest.mock import Mock, AsyncMock
 from apps.api.services.command_service import CommandService
+from apps.api.services.command_proposal_cache import CommandProposalCache
+
+
+@pytest.fixture
+def proposal_cache(tmp_path):
+    """Create a proposal cache backed by a temporary SQLite file."""
+    cache = CommandProposalCache(tmp_path / "proposals.sqlite3")
+    yield cache
+    cache.close()
 
 
 class TestCommandServiceInit:
     """Test command service initialization."""
 
-    def test_init_creates_empty_proposals(self):
-        """Test that initialization creates empty proposals dict."""
+    def test_init_creates_empty_proposals(self, proposal_cache):
+        """Test that initialization creates an empty proposal cache."""
+        service = CommandService(proposal_cache)
+        assert isinstance(service.proposals, CommandProposalCache)
+        assert service.proposals.memory_size() == 0
+
+    def test_init_uses_environment_cache(self, tmp_path, monkeypatch):
+        """Test the default cache location follows COMMAND_PROPOSAL_DB."""
+        monkeypatch.setenv("COMMAND_PROPOSAL_DB", str(tmp_path / "env.sqlite3"))
         service = CommandService()
-        assert service.proposals == {}
-        assert isinstance(service.proposals, dict)
+        assert service.proposals.path == tmp_path / "env.sqlite3"
+
+
+class TestCommandProposalCache:
+    """Test the bounded, durable proposal cache."""
+
+    def test_put_get_pop(self, proposal_cache):
+        """Test basic round trip through the cache."""
+        proposal_cache.put("p1", {"proposal_id": "p1"})
+
+        assert proposal_cache.get("p1") == {"proposal_id": "p1"}
+        assert "p1" in proposal_cache
+        assert proposal_cache.pop("p1") == {"proposal_id": "p1"}
+        assert proposal_cache.get("p1") is None
+
+    def test_survives_restart(self, tmp_path):
+        """Test proposals are read back by a new cache instance."""
+        path = tmp_path / "proposals.sqlite3"
+        first = CommandProposalCache(path)
+        first.put("p1", {"proposal_id": "p1", "params": {"a": 1}})
+        first.close()
+
+        second = CommandProposalCache(path)
+        assert second.get("p1") == {"proposal_id": "p1", "params": {"a": 1}}
+        second.close()
+
+    def test_shared_between_instances(self, tmp_path):
+        """Test a proposal stored by one worker is removable by another."""
+        path = tmp_path / "proposals.sqlite3"
+        worker_a = CommandProposalCache(path)
+        worker_b = CommandProposalCache(path)
+
+        worker_a.put("p1", {"proposal_id": "p1"})
+        assert worker_b.pop("p1") == {"proposal_id": "p1"}
+
+        worker_a.close()
+        worker_b.close()
+
+    def test_memory_hit_not_served_after_other_worker_pops(self, tmp_path):
+        """Test the store, not the memory tier, decides whether a proposal exists."""
+        path = tmp_path / "proposals.sqlite3"
+        worker_a = CommandProposalCache(path)
+        worker_b = CommandProposalCache(path)
+
+        worker_a.put("p1", {"proposal_id": "p1"})
+        assert worker_b.pop("p1") == {"proposal_id": "p1"}
+
+        assert worker_a.get("p1") is None
+        assert worker_a.memory_size() == 0
+        assert worker_a.pop("p1") is None
+
+        worker_a.close()
+        worker_b.close()
+
+    def test_memory_tier_is_bounded(self, tmp_path):
+        """Test LRU eviction keeps evicted proposals in the store."""
+        cache = CommandProposalCache(tmp_path / "p.sqlite3", max_memory_entries=2)
+        for i in range(5):
+            cache.put(f"p{i}", {"proposal_id": f"p{i}"})
+
+        assert cache.memory_size() == 2
+        assert cache.get("p0") == {"proposal_id": "p0"}
+        cache.close()
+
+    def test_expired_proposals_are_dropped(self, tmp_path):
+        """Test proposals past their TTL are not returned."""
+        cache = CommandProposalCache(tmp_path / "p.sqlite3", ttl_seconds=-1)
+        cache.put("p1", {"proposal_id": "p1"})
+
+        assert cache.get("p1") is None
+        cache.close()
+
+    def test_memory_only_fallback(self, tmp_path):
+        """Test an unusable store path degrades to memory-only."""
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+        cache = CommandProposalCache(blocker / "p.sqlite3")
+
+        cache.put("p1", {"proposal_id": "p1"})
+        assert cache.get("p1") == {"proposal_id": "p1"}
 
 
 class TestProposeCommand:
     """Test command proposal functionality."""
 
     @pytest.fixture
-    def command_service(self):
+    def command_service(self, proposal_cache):
         """Create a command service instance."""
-        return CommandService()
+        return CommandService(proposal_cache)
 
     @pytest.fixture
     def mock_git_manager(self):
@@ -122,14 +216,52 @@ class TestProposeCommand:
         assert len(result["file_changes"]) == 1
         assert result["file_changes"][0]["path"] == "artifacts/schedule.md"
 
+    @pytest.mark.asyncio
+    async def test_propose_command_stream(
+        self, command_service, mock_git_manager, mock_llm_service
+    ):
+        """Test streamed proposals yield tokens, then the stored proposal."""
+
+        async def stream(messages, temperature=None, max_tokens=None, use_cache=True):
+            for chunk in ("LLM ", "response"):
+                yield chunk
+
+        mock_llm_service.chat_completion_stream = stream
+
+        events = [
+            event
+            async for event in command_service.propose_command_stream(
+                "TEST001", "assess_gaps", {}, mock_llm_service, mock_git_manager
+            )
+        ]
+
+        assert events[:2] == [("token", "LLM "), ("token", "response")]
+        kind, proposal = events[2]
+        assert kind == "proposal"
+        assert proposal["command"] == "assess_gaps"
+        assert command_service.proposals[proposal["proposal_id"]] == proposal
+        context = mock_llm_service.render_output.call_args[0][1]
+        assert "LLM response" in context.values()
+
+    @pytest.mark.asyncio
+    async def test_propose_command_stream_raises_errors(
+        self, command_service, mock_git_manager, mock_llm_service
+    ):
+        """Test proposal errors surface from the stream."""
+        with pytest.raises(ValueError, match="Unknown command"):
+            async for _ in command_service.propose_command_stream(
+                "TEST001", "invalid_command", {}, mock_llm_service, mock_git_manager
+            ):
+                pass
+
 
 class TestApplyProposal:
     """Test proposal application functionality."""
 
     @pytest.fixture
-    def command_service(self):
+    def command_service(self, proposal_cache):
         """Create a command service with a stored proposal."""
-        service = CommandService()
+        service = CommandService(proposal_cache)
         # Pre-populate with a test proposal
         service.proposals["test-proposal-id"] = {
             "proposal_id": "test-proposal-id",
@@ -158,9 +290,11 @@ class TestApplyProposal:
         return mock
 
     @pytest.mark.asyncio
-    async def test_apply_nonexistent_proposal_raises_error(self, mock_git_manager):
+    async def test_apply_nonexistent_proposal_raises_error(
+        self, mock_git_manager, proposal_cache
+    ):
         """Test that applying nonexistent proposal raises ValueError."""
-        service = CommandService()
+        service = CommandService(proposal_cache)
 
         with pytest.raises(ValueError, match="Proposal nonexistent not found"):
             await service.apply_proposal("nonexistent", mock_git_manager)
@@ -188,6 +322,32 @@ class TestApplyProposal:
         # Verify proposal was removed
         assert "test-proposal-id" not in command_service.proposals
 
+    @pytest.mark.asyncio
+    async def test_apply_proposal_only_once_across_workers(
+        self, command_service, mock_git_manager, tmp_path
+    ):
+        """Test a proposal applied by one worker is not applied by another."""
+        other = CommandService(CommandProposalCache(tmp_path / "proposals.sqlite3"))
+        # Memory tier of the first worker still holds the proposal
+        assert "test-proposal-id" in command_service.proposals
+
+        await other.apply_proposal("test-proposal-id", mock_git_manager)
+        with pytest.raises(ValueError, match="not found"):
+            await command_service.apply_proposal("test-proposal-id", mock_git_manager)
+
+        mock_git_manager.commit_changes.assert_called_once()
+        other.proposals.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_apply_keeps_proposal(self, command_service, mock_git_manager):
+        """Test a proposal whose commit fails can be applied again."""
+        mock_git_manager.commit_changes.side_effect = RuntimeError("index locked")
+
+        with pytest.raises(RuntimeError):
+            await command_service.apply_proposal("test-proposal-id", mock_git_manager)
+
+        assert "test-proposal-id" in command_service.proposals
+
     @pytest.mark.asyncio
     async def test_apply_proposal_with_content_logging(
         self, command_service, mock_git_manager
@@ -225,9 +385,11 @@ class TestApplyProposal:
         assert "message" not in log_call_args
 
     @pytest.mark.asyncio
-    async def test_apply_proposal_multiple_files(self, mock_git_manager):
+    async def test_apply_proposal_multiple_files(
+        self, mock_git_manager, proposal_cache
+    ):
         """Test applying proposal with multiple file changes."""
-        service = CommandService()
+        service = CommandService(proposal_cache)
         service.proposals["multi-file"] = {
             "proposal_id": "multi-file",
             "project_key": "TEST001",
@@ -250,3 +412,172 @@ class TestApplyProposal:
 
         # Verify all files were written
         assert mock_git_manager.write_file.call_count == 3
+
+
+class TestCommandHistoryStore:
+    """Test command history persistence with append-only updates."""
+
+    @pytest.fixture
+    def git_manager(self, tmp_path):
+        """Create a git manager with a project."""
+        from apps.api.services.git_manager import GitManager
+
+        manager = GitManager(str(tmp_path / "docs"))
+        manager.ensure_repository()
+        manager.create_project("TEST001", {"key": "TEST001", "name": "Test"})
+        return manager
+
+    def test_update_command_merges_on_read(self, git_manager, proposal_cache):
+        """Test status updates are visible through every read path."""
+        service = CommandService(proposal_cache)
+        command = {"id": "cmd-1", "project_key": "TEST001", "status": "running"}
+        service.log_command(command, git_manager)
+
+        service.update_command("cmd-1", {**command, "status": "completed"}, git_manager)
+
+        assert service.load_command("cmd-1", git_manager)["status"] == "completed"
+        assert [c["status"] for c in service.load_commands("TEST001", git_manager)] == [
+            "completed"
+        ]
+        log_path = git_manager.get_project_path("TEST001") / "commands/commands.ndjson"
+        assert len(log_path.read_text().splitlines()) == 2
+
+    def test_update_unknown_command_is_ignored(self, git_manager, proposal_cache):
+        """Test updating a command that was never logged is a no-op."""
+        service = CommandService(proposal_cache)
+        service.update_command(
+            "ghost", {"id": "ghost", "project_key": "TEST001"}, git_manager
+        )
+        assert service.load_commands("TEST001", git_manager) == []
+
+    def test_update_proposal_appends_update(self, git_manager, proposal_cache):
+        """Test proposal updates merge over the persisted proposal."""
+        service = CommandService(proposal_cache)
+        service.persist_proposal(
+            "TEST001", {"id": "p1", "status": "pending"}, git_manager
+        )
+        service.update_proposal(
+            "TEST001", "p1", {"id": "p1", "status": "applied"}, git_manager
+        )
+
+        assert service.load_proposal("TEST001", "p1", git_manager) == {
+            "id": "p1",
+            "status": "applied",
+        }
+        assert service.load_proposals("TEST001", git_manager) == [
+            {"id": "p1", "status": "applied"}
+        ]
+
+
+class TestCommandHistoryIndex:
+    """Test the global, cursor-paginated command history."""
+
+    @pytest.fixture
+    def git_manager(self, tmp_path):
+        """Create a git manager with two projects."""
+        from apps.api.services.git_manager import GitManager
+
+        manager = GitManager(str(tmp_path / "docs"))
+        manager.ensure_repository()
+        for key in ("TEST001", "TEST002"):
+            manager.create_project(key, {"key": key, "name": key})
+        return manager
+
+    def _log(self, service, git_manager, count):
+        for i in range(count):
+            service.log_command(
+                {
+                    "id": f"cmd-{i}",
+                    "project_key": "TEST001" if i % 2 else "TEST002",
+                    "command": "assess_gaps" if i % 3 else "generate_plan",
+                    "params": {"n": i},
+                    "status": "running",
+                    "created_at": f"2026-01-01T00:00:{i:02d}Z",
+                },
+                git_manager,
+            )
+
+    def test_load_command_reads_only_its_project_log(
+        self, git_manager, proposal_cache, monkeypatch
+    ):
+        """Test a lookup by id opens just the project named by the index."""
+        service = CommandService(proposal_cache)
+        self._log(service, git_manager, 4)
+        opened = []
+        commands_store = service._commands_store
+
+        def tracking_store(project_key, manager):
+            opened.append(project_key)
+            return commands_store(project_key, manager)
+
+        monkeypatch.setattr(service, "_commands_store", tracking_store)
+
+        assert service.load_command("cmd-3", git_manager)["params"] == {"n": 3}
+        assert service.load_command("missing", git_manager) is None
+        assert opened == ["TEST001"]
+
+    def test_pages_newest_first_across_projects(self, git_manager, proposal_cache):
+        """Test cursor pagination walks the whole history exactly once."""
+        service = CommandService(proposal_cache)
+        self._log(service, git_manager, 10)
+
+        ids, cursor = [], None
+        while True:
+            page, cursor = service.list_commands_page(git_manager, 4, cursor)
+            assert len(page) <= 4
+            ids.extend(c["id"] for c in page)
+            if cursor is None:
+                break
+
+        assert ids == [f"cmd-{i}" for i in reversed(range(10))]
+        # Full records come from the project logs
+        assert page[-1]["params"] == {"n": 0}
+
+    def test_filters_by_project_command_and_status(self, git_manager, proposal_cache):
+        """Test filters apply to index rows, including updated status."""
+        service = CommandService(proposal_cache)
+        self._log(service, git_manager, 10)
+        service.update_command(
+            "cmd-3", {"project_key": "TEST001", "status": "success"}, git_manager
+        )
+
+        page, _ = service.list_commands_page(git_manager, project_key="TEST001")
+        assert [c["id"] for c in page] == ["cmd-9", "cmd-7", "cmd-5", "cmd-3", "cmd-1"]
+
+        page, _ = service.list_commands_page(git_manager, command="generate_plan")
+        assert [c["id"] for c in page] == ["cmd-9", "cmd-6", "cmd-3", "cmd-0"]
+
+        page, cursor = service.list_commands_page(git_manager, 1, status="success")
+        assert [(c["id"], c["status"]) for c in page] == [("cmd-3", "success")]
+        assert cursor is None
+
+    def test_builds_index_from_existing_logs(self, git_manager, proposal_cache):
+        """Test a missing index is rebuilt from the project command logs."""
+        from apps.api.services.command_index import INDEX_LOG
+
+        service = CommandService(proposal_cache)
+        self._log(service, git_manager, 3)
+        index_path = git_manager.base_path / INDEX_LOG
+        index_path.unlink()
+
+        other = CommandService(proposal_cache)
+        page, _ = other.list_commands_page(git_manager)
+
+        assert [c["id"] for c in page] == ["cmd-2", "cmd-1", "cmd-0"]
+        assert len(index_path.read_text().splitlines()) == 3
+
+    def test_index_is_not_untracked_in_git(self, git_manager, proposal_cache):
+        """Test the derived index under .cache/ stays out of git status."""
+        service = CommandService(proposal_cache)
+        self._log(service, git_manager, 2)
+
+        assert (git_manager.base_path / ".cache").is_dir()
+        assert not [
+            f for f in git_manager.repo.untracked_files if f.startswith(".cache/")
+        ]
+
+    def test_invalid_cursor(self, git_manager, proposal_cache):
+        """Test malformed cursors are rejected."""
+        service = CommandService(proposal_cache)
+        with pytest.raises(ValueError):
+            service.list_commands_page(git_manager, 5, "not-a-cursor")
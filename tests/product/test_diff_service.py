@@ -10,6 +10,7 @@ import os
 # Add apps/api to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../apps/api"))
 
+from services.diff_cache import DiffCache  # noqa: E402
 from services.diff_service import DiffService  # noqa: E402
 
 
@@ -177,3 +178,135 @@ class TestDiffService:
         assert len(diff_3_ctx) > len(diff_1_ctx)
         assert "Line 5 Modified" in diff_3_ctx
         assert "Line 5 Modified" in diff_1_ctx
+
+
+class TestLargeDiffs:
+    """Test the fast paths used for large documents."""
+
+    @staticmethod
+    def _document(lines):
+        return "\n".join(f"Line {i}: body text" for i in range(lines)) + "\n"
+
+    def test_identical_content_short_circuits(self):
+        """Test identical content yields an empty diff with zero stats."""
+        content = self._document(5000)
+        result = DiffService().compute_diff(content, content)
+
+        assert result == {"diff": "", "added": 0, "removed": 0, "summarized": False}
+
+    def test_large_document_diff_applies(self):
+        """Test a sparse edit of a large document round-trips through apply_diff."""
+        service = DiffService()
+        old_content = self._document(20000)
+        new_lines = old_content.splitlines()
+        for i in range(0, 20000, 1000):
+            new_lines[i] = f"Changed {i}"
+        new_lines.insert(15500, "Inserted line")
+        new_content = "\n".join(new_lines) + "\n"
+
+        result = service.compute_diff(old_content, new_content)
+
+        assert result["added"] == 21
+        assert result["removed"] == 20
+        assert not result["summarized"]
+        assert result["diff"].count("@@ -") == 21
+        assert service.apply_diff(old_content, result["diff"]) == new_content
+
+    def test_budget_summarizes_changed_region(self):
+        """Test changes beyond the budget become one exact replace hunk."""
+        service = DiffService(max_diff_lines=100)
+        old_content = self._document(3000)
+        new_content = old_content.replace("body text", "new text")
+
+        result = service.compute_diff(old_content, new_content)
+
+        assert result["summarized"]
+        assert result["diff"].count("@@ -") == 1
+        assert service.apply_diff(old_content, result["diff"]) == new_content
+
+
+class TestDiffCache:
+    """Test the content-addressed rendered diff cache."""
+
+    def test_repeat_diff_is_served_from_cache(self):
+        """Test the same contents are diffed once, whatever the file names."""
+        cache = DiffCache()
+        service = DiffService(cache=cache)
+        old_content = "Line 1\nLine 2\nLine 3\n"
+        new_content = "Line 1\nLine 2 Modified\nLine 3\n"
+
+        first = service.compute_diff(old_content, new_content)
+        second = DiffService(cache=cache).compute_diff(
+            old_content, new_content, fromfile="a/x.md", tofile="b/x.md"
+        )
+
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert second["diff"] == first["diff"].replace("artifact", "x.md")
+        assert (second["added"], second["removed"]) == (1, 1)
+
+    def test_key_includes_context_and_normalization(self):
+        """Test different rendering options are cached separately."""
+        cache = DiffCache()
+        service = DiffService(cache=cache)
+        old_content = "\n".join(f"Line {i}" for i in range(20)) + "\n"
+        new_content = old_content.replace("Line 10", "Line 10 ")
+
+        assert service.generate_diff(old_content, new_content) == ""
+        with_ws = service.generate_diff(
+            old_content, new_content, normalize_whitespace=False
+        )
+        one_ctx = service.generate_diff(
+            old_content, new_content, context_lines=1, normalize_whitespace=False
+        )
+
+        assert cache.misses == 3 and len(cache) == 3
+        assert len(one_ctx) < len(with_ws)
+
+    def test_memory_budget_evicts_least_recently_used(self):
+        """Test the cache stays within its byte budget."""
+        cache = DiffCache(max_bytes=20_000)
+        service = DiffService(cache=cache)
+        base = "x" * 4000 + "\n"
+        contents = [(base, f"{base}{n}\n") for n in range(10)]
+
+        for old_content, new_content in contents:
+            service.generate_diff(old_content, new_content)
+        service.generate_diff(*contents[-1])
+
+        assert cache.size_bytes <= 20_000
+        assert 0 < len(cache) < 10
+        assert cache.hits == 1
+
+    def test_disabled_cache_still_diffs(self):
+        """Test a zero budget disables caching."""
+        cache = DiffCache(max_bytes=0)
+        diff = DiffService(cache=cache).generate_diff("a\n", "b\n")
+
+        assert "+b" in diff and len(cache) == 0
+
+
+class TestMerge:
+    """Test three-way merges of concurrent edits."""
+
+    def test_merge_non_overlapping_edits(self):
+        """Test edits to different lines are combined."""
+        base = "A\nB\nC\nD\n"
+        result = DiffService().merge(base, "A1\nB\nC\nD\n", "A\nB\nC\nD1\n")
+
+        assert result == {"content": "A1\nB\nC\nD1\n", "conflicts": 0}
+
+    def test_merge_overlapping_edits_conflict(self):
+        """Test differing edits to the same line produce conflict markers."""
+        base = "A\nB\nC\n"
+        result = DiffService().merge(base, "A\nB1\nC\n", "A\nB2\nC\n")
+
+        assert result["conflicts"] == 1
+        assert result["content"] == (
+            "A\n<<<<<<< current\nB1\n=======\nB2\n>>>>>>> proposed\nC\n"
+        )
+
+    def test_merge_identical_edits(self):
+        """Test both sides making the same edit is not a conflict."""
+        result = DiffService().merge("A\nB\n", "A\nX\n", "A\nX\n")
+
+        assert result == {"content": "A\nX\n", "conflicts": 0}
@@ -74,6 +74,27 @@ class TestEnsureRepository:
         final_commits = len(list(git_manager.repo.iter_commits()))
         assert initial_commits == final_commits
 
+    def test_cache_dir_is_excluded_from_status(self, git_manager):
+        """Test files under .cache/ do not show up as untracked changes."""
+        cache_dir = git_manager.base_path / ".cache"
+        cache_dir.mkdir()
+        (cache_dir / "command_proposals.sqlite3").write_text("data")
+        git_manager.ensure_repository()
+
+        assert git_manager.get_sync_status()["untracked_changes"] == 0
+        exclude = Path(git_manager.repo.git_dir) / "info" / "exclude"
+        assert exclude.read_text().splitlines().count("/.cache/") == 1
+
+    def test_log_lock_files_are_excluded_from_status(self, git_manager):
+        """Test the lock files written next to project logs are not untracked."""
+        git_manager.create_project("TEST001", {"key": "TEST001", "name": "Test"})
+        git_manager.log_event("TEST001", {"event_type": "test"})
+
+        assert (
+            git_manager.base_path / "TEST001" / "events" / ".events.ndjson.lock"
+        ).exists()
+        assert not [f for f in git_manager.repo.untracked_files if f.endswith(".lock")]
+
 
 class TestProjectOperations:
     """Test project CRUD operations."""
@@ -247,6 +268,29 @@ class TestCommitOperations:
         assert commit_hash is not None
         assert len(commit_hash) == 40  # SHA-1 hash length
 
+    def test_concurrent_commits_stage_only_their_files(self, git_manager, test_project):
+        """Test commits from several threads each contain only their own file."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        # A second manager on the same repo, like the event log flusher's
+        other = GitManager(str(git_manager.base_path))
+        other.ensure_repository()
+        assert other.repo_lock is git_manager.repo_lock
+
+        def commit(i):
+            manager = git_manager if i % 2 else other
+            manager.write_file(test_project, f"file-{i}.md", f"content {i}")
+            return manager.commit_changes(
+                test_project, f"[TEST001] Add file {i}", [f"file-{i}.md"]
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            hashes = list(pool.map(commit, range(16)))
+
+        for i, hexsha in enumerate(hashes):
+            changed = list(git_manager.repo.commit(hexsha).stats.files)
+            assert changed == [f"{test_project}/file-{i}.md"]
+
     def test_get_last_commit(self, git_manager, test_project):
         """Test getting last commit info."""
         git_manager.write_file(test_project, "test.md", "Test")
@@ -288,6 +332,9 @@ class TestDiffOperations:
         diff = git_manager.get_diff(test_project, "test.md", new_content)
 
         assert diff is not None
+        assert diff.startswith(f"--- a/{test_project}/test.md")
+        assert "-Original content" in diff
+        assert "+Modified content" in diff
 
 
 class TestEventLogging:
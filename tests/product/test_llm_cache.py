@@ -0,0 +1,183 @@
+"""
+Unit tests for the LLM response cache.
+"""
+
+import json
+import time
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from apps.api.services.llm_cache import LLMResponseCache, cache_key
+from apps.api.services.llm_service import CircuitState, LLMService
+
+MESSAGES = [{"role": "user", "content": "Assess gaps"}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMResponseCache(path=tmp_path / "llm.sqlite3")
+    yield cache
+    cache.close()
+
+
+def _mock_client(*contents):
+    client = AsyncMock()
+    responses = []
+    for content in contents:
+        response = Mock()
+        response.json.return_value = {"choices": [{"message": {"content": content}}]}
+        response.raise_for_status = Mock()
+        responses.append(response)
+    client.post.side_effect = responses
+    return client
+
+
+class TestLLMResponseCache:
+    """Test cache tiers, TTL and size-based eviction."""
+
+    def test_key_covers_request_parameters(self):
+        """Test every request parameter changes the key."""
+        key = cache_key("model", MESSAGES, 0.7, 100)
+        assert key == cache_key("model", list(MESSAGES), 0.7, 100)
+        assert key != cache_key("other", MESSAGES, 0.7, 100)
+        assert key != cache_key("model", MESSAGES, 0.2, 100)
+        assert key != cache_key("model", MESSAGES, 0.7, 200)
+        assert key != cache_key("model", [{"role": "user", "content": "x"}], 0.7, 100)
+
+    def test_responses_survive_restart(self, tmp_path, cache):
+        """Test the disk tier serves responses to a new cache instance."""
+        cache.put("k", "Gap report", 4.2)
+        assert cache.get("k") == ("Gap report", 4.2)
+
+        reopened = LLMResponseCache(path=tmp_path / "llm.sqlite3")
+        assert reopened.get("k") == ("Gap report", 4.2)
+        reopened.close()
+
+    def test_fallbacks_are_never_cached(self, cache):
+        """Test fallback messages are rejected."""
+        assert not cache.put("k", "[LLM unavailable: timeout]", 1.0)
+        assert cache.get("k") is None
+
+    def test_expired_responses_are_misses(self, tmp_path):
+        """Test responses expire after the TTL."""
+        cache = LLMResponseCache(path=tmp_path / "llm.sqlite3", ttl_seconds=-1)
+        cache.put("k", "stale", 1.0)
+        assert cache.get("k") is None
+        cache.close()
+
+    def test_disk_tier_evicts_least_recently_used(self, tmp_path):
+        """Test the disk tier stays within its byte budget."""
+        cache = LLMResponseCache(
+            path=tmp_path / "llm.sqlite3", max_bytes=3000, max_memory_entries=0
+        )
+        for n in range(3):
+            cache.put(f"k{n}", str(n) * 1000, 1.0)
+        # Recently used entries are kept
+        assert cache.get("k0") is not None
+        cache.put("k3", "3" * 1000, 1.0)
+
+        assert cache.disk_size() <= 3000
+        assert cache.get("k1") is None
+        for key in ("k0", "k2", "k3"):
+            assert cache.get(key) is not None
+        cache.close()
+
+    def test_disabled_cache_stores_nothing(self, tmp_path):
+        """Test a disabled cache never hits."""
+        cache = LLMResponseCache(path=tmp_path / "llm.sqlite3", enabled=False)
+        assert not cache.put("k", "response", 1.0)
+        assert cache.get("k") is None
+
+
+class TestLLMServiceCaching:
+    """Test chat_completion with a response cache."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_hit_the_cache(self, cache):
+        """Test a repeated request is served without calling the LLM."""
+        client = _mock_client("first", "second")
+        with patch("httpx.AsyncClient", return_value=client):
+            service = LLMService(cache=cache)
+
+            assert await service.chat_completion(MESSAGES) == "first"
+            assert await service.chat_completion(MESSAGES) == "first"
+            assert client.post.call_count == 1
+
+            # Different parameters are a different request
+            assert await service.chat_completion(MESSAGES, max_tokens=10) == "second"
+
+    @pytest.mark.asyncio
+    async def test_responses_are_keyed_by_answering_model(self, cache, tmp_path):
+        """Test a response from one endpoint's model is not served for another."""
+        config_path = tmp_path / "llm.json"
+        config_path.write_text(
+            json.dumps(
+                {
+                    "endpoints": [
+                        {"name": "a", "base_url": "http://a/v1", "model": "model-a"},
+                        {"name": "b", "base_url": "http://b/v1", "model": "model-b"},
+                    ]
+                }
+            )
+        )
+        client_a, client_b = _mock_client("from a"), _mock_client("from b")
+        with patch.dict("os.environ", {"LLM_CONFIG_PATH": str(config_path)}), patch(
+            "httpx.AsyncClient", side_effect=[client_a, client_b]
+        ):
+            service = LLMService(cache=cache)
+        a, b = service.endpoints
+
+        # a is down: b answers and its response is cached for model-b
+        a.circuit_breaker.state = CircuitState.OPEN
+        a.circuit_breaker.last_failure_time = time.time()
+        assert await service.chat_completion(MESSAGES) == "from b"
+
+        # a is back and routed to first: model-b's response is not reused
+        a.circuit_breaker.state = CircuitState.CLOSED
+        assert service.endpoints.ranked()[0] is a
+        assert await service.chat_completion(MESSAGES) == "from a"
+        assert client_a.post.call_count == client_b.post.call_count == 1
+        assert cache.memory_size() == 2
+
+    @pytest.mark.asyncio
+    async def test_bypass_skips_the_cache(self, cache):
+        """Test use_cache=False always calls the LLM."""
+        client = _mock_client("first", "second")
+        with patch("httpx.AsyncClient", return_value=client):
+            service = LLMService(cache=cache)
+
+            assert await service.chat_completion(MESSAGES) == "first"
+            result = await service.chat_completion(MESSAGES, use_cache=False)
+            assert result == "second"
+            assert client.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, cache):
+        """Test fallback results are retried on the next call."""
+        client = AsyncMock()
+        client.post.side_effect = Exception("Network error")
+        with patch("httpx.AsyncClient", return_value=client):
+            service = LLMService(cache=cache)
+            result = await service.chat_completion(MESSAGES)
+            assert result.startswith("[LLM unavailable")
+
+        assert cache.memory_size() == 0
+        assert cache.disk_size() == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_metrics_recorded(self, cache):
+        """Test hits report the latency they saved."""
+        client = _mock_client("first")
+        with patch("httpx.AsyncClient", return_value=client), patch(
+            "apps.api.services.llm_service.MetricsCollector"
+        ) as metrics:
+            service = LLMService(cache=cache)
+            await service.chat_completion(MESSAGES)
+            await service.chat_completion(MESSAGES)
+
+        calls = metrics.record_llm_call.call_args_list
+        assert calls[0].kwargs["cache"] == "miss"
+        assert calls[1].args[2] == "cache_hit"
+        assert calls[1].kwargs["cache"] == "hit"
+        assert calls[1].kwargs["saved_seconds"] >= 0
@@ -0,0 +1,232 @@
+"""
+Unit tests for LLM request coalescing and concurrency limiting.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from apps.api.services.llm_concurrency import (
+    ConcurrencyLimiter,
+    LLMOverloadedError,
+    SingleFlight,
+)
+from apps.api.services.llm_service import LLMService
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestConcurrencyLimiter:
+    """Test global and per-model slots and the bounded wait queue."""
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_admitted_in_order(self):
+        """Test requests beyond the limit wait and run as slots free up."""
+        limiter = ConcurrencyLimiter(max_concurrency=1)
+        order = []
+
+        async def request(n):
+            async with limiter.slot("m"):
+                order.append(n)
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(request(n) for n in range(3)))
+
+        assert order == [0, 1, 2]
+        assert limiter.in_flight() == 0 and limiter.waiting() == 0
+
+    @pytest.mark.asyncio
+    async def test_new_requests_do_not_jump_the_queue(self):
+        """Test a freed slot goes to the oldest waiter, not a new caller."""
+        limiter = ConcurrencyLimiter(max_concurrency=1)
+        await limiter.acquire("m")
+        first = asyncio.ensure_future(limiter.acquire("m"))
+        await _settle()
+
+        limiter.release("m")
+        second = asyncio.ensure_future(limiter.acquire("m"))
+        await first
+        await _settle()
+
+        assert not second.done()
+        assert limiter.waiting() == 1
+        limiter.release("m")
+        await second
+        assert limiter.in_flight() == 1 and limiter.waiting() == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_is_full(self):
+        """Test overload fails fast with a retry hint."""
+        limiter = ConcurrencyLimiter(max_concurrency=1, max_queue=1, retry_after=7)
+        await limiter.acquire("m")
+        waiter = asyncio.ensure_future(limiter.acquire("m"))
+        await _settle()
+
+        with pytest.raises(LLMOverloadedError) as exc:
+            await limiter.acquire("m")
+        assert exc.value.retry_after == 7
+
+        limiter.release("m")
+        await waiter
+        assert limiter.in_flight("m") == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_after_queue_timeout(self):
+        """Test a request waiting longer than the queue timeout is rejected."""
+        limiter = ConcurrencyLimiter(max_concurrency=1, queue_timeout=0.01)
+        await limiter.acquire("m")
+
+        with pytest.raises(LLMOverloadedError, match="no slot"):
+            await limiter.acquire("m")
+        assert limiter.waiting() == 0
+
+        limiter.release("m")
+        assert limiter.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_per_model_limits(self):
+        """Test a saturated model does not block requests for other models."""
+        limiter = ConcurrencyLimiter(
+            max_concurrency=3, max_per_model=2, model_limits={"big": 1}
+        )
+        await limiter.acquire("big")
+        blocked = asyncio.ensure_future(limiter.acquire("big"))
+        await _settle()
+
+        await limiter.acquire("small")
+        assert not blocked.done()
+        assert limiter.in_flight("small") == 1
+
+        limiter.release("big")
+        await blocked
+        assert limiter.in_flight("big") == 1
+        assert limiter.limit_for("small") == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Test a cancelled waiter neither holds a slot nor blocks others."""
+        limiter = ConcurrencyLimiter(max_concurrency=1)
+        await limiter.acquire("m")
+        cancelled = asyncio.ensure_future(limiter.acquire("m"))
+        waiter = asyncio.ensure_future(limiter.acquire("m"))
+        await _settle()
+
+        cancelled.cancel()
+        await _settle()
+        limiter.release("m")
+        await waiter
+
+        assert limiter.in_flight() == 1
+        assert limiter.waiting() == 0
+
+    def test_from_env(self, monkeypatch):
+        """Test limits are read from the environment."""
+        monkeypatch.setenv("LLM_MAX_CONCURRENCY", "8")
+        monkeypatch.setenv("LLM_MAX_CONCURRENCY_PER_MODEL", "3")
+        monkeypatch.setenv("LLM_MODEL_CONCURRENCY", "a=1, b=2,bogus")
+        monkeypatch.setenv("LLM_QUEUE_MAX_DEPTH", "5")
+        monkeypatch.setenv("LLM_QUEUE_TIMEOUT_SECONDS", "2.5")
+
+        limiter = ConcurrencyLimiter.from_env()
+
+        assert limiter.max_concurrency == 8
+        assert limiter.model_limits == {"a": 1, "b": 2}
+        assert limiter.limit_for("c") == 3
+        assert limiter.max_queue == 5
+        assert limiter.queue_timeout == 2.5
+
+
+class TestSingleFlight:
+    """Test sharing of in-flight calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self):
+        """Test identical concurrent calls run once."""
+        flight = SingleFlight()
+        gate = asyncio.Event()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await gate.wait()
+            return "result"
+
+        first = asyncio.ensure_future(flight.do("k", work))
+        second = asyncio.ensure_future(flight.do("k", work))
+        await _settle()
+        gate.set()
+
+        assert await first == ("result", False)
+        assert await second == ("result", True)
+        assert calls == [1]
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test the shared call survives one caller going away."""
+        flight = SingleFlight()
+        gate = asyncio.Event()
+
+        async def work():
+            await gate.wait()
+            return "result"
+
+        first = asyncio.ensure_future(flight.do("k", work))
+        second = asyncio.ensure_future(flight.do("k", work))
+        await _settle()
+        first.cancel()
+        gate.set()
+
+        assert await second == ("result", True)
+
+
+class TestLLMServiceConcurrency:
+    """Test LLMService uses coalescing and the limiter."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_call(self):
+        """Test concurrent identical chat completions make one HTTP request."""
+        gate = asyncio.Event()
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.json.return_value = {"choices": [{"message": {"content": "ok"}}]}
+
+        async def post(*args, **kwargs):
+            await gate.wait()
+            return response
+
+        mock_client = AsyncMock()
+        mock_client.post.side_effect = post
+        messages = [{"role": "user", "content": "Hi"}]
+
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            service = LLMService(limiter=ConcurrencyLimiter(max_concurrency=1))
+            calls = [
+                asyncio.ensure_future(service.chat_completion(messages))
+                for _ in range(3)
+            ]
+            await _settle()
+            gate.set()
+            results = await asyncio.gather(*calls)
+
+        assert results == ["ok", "ok", "ok"]
+        assert mock_client.post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_overload_is_raised(self):
+        """Test overload is raised instead of returning a fallback message."""
+        mock_client = AsyncMock()
+
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            limiter = ConcurrencyLimiter(max_concurrency=1, max_queue=0)
+            service = LLMService(limiter=limiter)
+            await limiter.acquire(service.config["model"])
+
+            with pytest.raises(LLMOverloadedError):
+                await service.chat_completion([{"role": "user", "content": "Hi"}])
+
+        mock_client.post.assert_not_called()
@@ -13,7 +13,10 @@ from apps.api.services.llm_service import (
     CircuitBreaker,
     CircuitState,
     CircuitBreakerOpenError,
+    LLMEndpointPool,
+    TokenRelay,
 )
+from apps.api.services.llm_cache import LLMResponseCache
 
 
 class TestLLMServiceInit:
@@ -189,6 +192,318 @@ class TestChatCompletion:
             assert headers["Authorization"].startswith("Bearer ")
 
 
+class FakeStreamResponse:
+    """Streaming response yielding SSE lines, optionally failing midway."""
+
+    def __init__(self, lines, error=None):
+        self.lines = lines
+        self.error = error
+
+    def raise_for_status(self):
+        pass
+
+    async def aiter_lines(self):
+        for line in self.lines:
+            yield line
+        if self.error:
+            raise self.error
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _sse(*chunks):
+    lines = []
+    for chunk in chunks:
+        lines.append(
+            "data: " + json.dumps({"choices": [{"delta": {"content": chunk}}]})
+        )
+        lines.append("")
+    return lines + ["data: [DONE]"]
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class TestChatCompletionStream:
+    """Test streaming chat completion."""
+
+    @pytest.mark.asyncio
+    async def test_yields_chunks_in_order(self):
+        """Test deltas are yielded as they arrive and the request asks to stream."""
+        mock_client = AsyncMock()
+        mock_client.stream = Mock(
+            return_value=FakeStreamResponse(_sse("Hel", "lo", " world"))
+        )
+
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            service = LLMService()
+            chunks = await _collect(
+                service.chat_completion_stream([{"role": "user", "content": "Hi"}])
+            )
+
+        assert chunks == ["Hel", "lo", " world"]
+        args, kwargs = mock_client.stream.call_args
+        assert args[0] == "POST"
+        assert kwargs["json"]["stream"] is True
+        assert kwargs["headers"]["Authorization"].startswith("Bearer ")
+
+    @pytest.mark.asyncio
+    async def test_error_before_output_yields_fallback(self):
+        """Test a failed request yields the fallback message and counts a failure."""
+        mock_client = AsyncMock()
+        mock_client.stream = Mock(side_effect=Exception("Network error"))
+
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            service = LLMService()
+            chunks = await _collect(
+                service.chat_completion_stream([{"role": "user", "content": "Hi"}])
+            )
+
+        assert len(chunks) == 1
+        assert chunks[0].startswith("[LLM unavailable:")
+        assert service.circuit_breaker.failure_count == 1
+
+    @pytest.mark.asyncio
+    async def test_error_after_output_raises(self):
+        """Test a stream failing midway raises instead of truncating silently."""
+        mock_client = AsyncMock()
+        mock_client.stream = Mock(
+            return_value=FakeStreamResponse(
+                _sse("partial")[:1], error=Exception("Connection reset")
+            )
+        )
+
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            service = LLMService()
+            seen = []
+            with pytest.raises(Exception, match="Connection reset"):
+                async for chunk in service.chat_completion_stream(
+                    [{"role": "user", "content": "Hi"}]
+                ):
+                    seen.append(chunk)
+
+        assert seen == ["partial"]
+
+    @pytest.mark.asyncio
+    async def test_rejected_when_circuit_open(self):
+        """Test no request is made while the circuit breaker is open."""
+        mock_client = AsyncMock()
+        mock_client.stream = Mock()
+
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            service = LLMService()
+            service.circuit_breaker.state = CircuitState.OPEN
+            service.circuit_breaker.last_failure_time = time.time()
+            chunks = await _collect(
+                service.chat_completion_stream([{"role": "user", "content": "Hi"}])
+            )
+
+        assert chunks[0].startswith("[LLM unavailable - circuit breaker open:")
+        mock_client.stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_shares_response_cache(self):
+        """Test completed streams are cached and served to later requests."""
+        mock_client = AsyncMock()
+        mock_client.stream = Mock(return_value=FakeStreamResponse(_sse("a", "b")))
+        messages = [{"role": "user", "content": "Hi"}]
+
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            service = LLMService(cache=LLMResponseCache())
+            assert await _collect(service.chat_completion_stream(messages)) == [
+                "a",
+                "b",
+            ]
+            assert await _collect(service.chat_completion_stream(messages)) == ["ab"]
+            assert await service.chat_completion(messages) == "ab"
+
+        assert mock_client.stream.call_count == 1
+        mock_client.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_token_relay_returns_full_text(self):
+        """Test the relay returns the whole response and queues every chunk."""
+        mock_client = AsyncMock()
+        mock_client.stream = Mock(return_value=FakeStreamResponse(_sse("a", "b")))
+
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            relay = TokenRelay(LLMService())
+            result = await relay.chat_completion([{"role": "user", "content": "Hi"}])
+
+        assert result == "ab"
+        assert [relay.tokens.get_nowait() for _ in range(2)] == ["a", "b"]
+        assert relay.config is relay.llm_service.config
+
+
+def _ok_client(content="ok"):
+    client = AsyncMock()
+    response = Mock()
+    response.json.return_value = {"choices": [{"message": {"content": content}}]}
+    response.raise_for_status = Mock()
+    client.post.return_value = response
+    return client
+
+
+@pytest.fixture
+def multi_endpoint_config(tmp_path):
+    """Write an LLM config with two weighted endpoints."""
+    config_path = tmp_path / "llm.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "api_key": "shared-key",
+                "endpoints": [
+                    {"name": "a", "base_url": "http://a:1234/v1", "weight": 2},
+                    {"name": "b", "base_url": "http://b:1234/v1", "api_key": "b-key"},
+                ],
+            }
+        )
+    )
+    with patch.dict("os.environ", {"LLM_CONFIG_PATH": str(config_path)}):
+        yield config_path
+
+
+class TestEndpointRouting:
+    """Test load balancing and failover across endpoints."""
+
+    def test_single_endpoint_from_base_url(self):
+        """Test configs without endpoints keep using base_url."""
+        with patch.dict("os.environ", {"LLM_CONFIG_PATH": "/nonexistent/config.json"}):
+            service = LLMService()
+
+        assert len(service.endpoints) == 1
+        assert service.endpoints.primary.base_url == service.config["base_url"]
+        assert service.client is service.endpoints.primary.client
+
+    def test_endpoints_inherit_top_level_config(self, multi_endpoint_config):
+        """Test endpoint fields default to the top-level config."""
+        service = LLMService()
+        a, b = service.endpoints
+
+        assert (a.name, a.weight, a.api_key) == ("a", 2.0, "shared-key")
+        assert (b.name, b.weight, b.api_key) == ("b", 1.0, "b-key")
+        assert a.model == b.model == "local-model"
+        assert a.client is not b.client
+        assert a.circuit_breaker is not b.circuit_breaker
+
+    def test_unknown_routing_strategy(self):
+        """Test an unknown routing strategy is rejected."""
+        with pytest.raises(ValueError, match="Unknown LLM routing strategy"):
+            LLMEndpointPool.from_config(
+                {
+                    "base_url": "http://x",
+                    "api_key": "k",
+                    "model": "m",
+                    "routing": "random",
+                }
+            )
+
+    @pytest.mark.asyncio
+    async def test_requests_follow_weights(self, multi_endpoint_config):
+        """Test idle endpoints receive requests in proportion to their weight."""
+        client_a, client_b = _ok_client("a"), _ok_client("b")
+        with patch("httpx.AsyncClient", side_effect=[client_a, client_b]):
+            service = LLMService()
+            for n in range(6):
+                await service.chat_completion([{"role": "user", "content": str(n)}])
+
+        assert client_a.post.call_count == 4
+        assert client_b.post.call_count == 2
+        assert client_b.post.call_args[1]["headers"]["Authorization"] == "Bearer b-key"
+
+    @pytest.mark.asyncio
+    async def test_least_outstanding_requests(self, multi_endpoint_config):
+        """Test a busy endpoint is passed over."""
+        service = LLMService()
+        a, b = service.endpoints
+        a.outstanding = 3
+
+        assert service.endpoints.ranked() == [b, a]
+
+    def test_ewma_prefers_faster_endpoint(self, multi_endpoint_config):
+        """Test latency EWMA routing ranks slow endpoints last."""
+        service = LLMService()
+        service.endpoints.strategy = "ewma"
+        a, b = service.endpoints
+        for endpoint, duration in ((a, 4.0), (a, 2.0), (b, 1.0)):
+            endpoint.begin()
+            endpoint.finish("success", duration)
+
+        assert a.latency_ewma == pytest.approx(3.4)
+        assert service.endpoints.ranked() == [b, a]
+
+    @pytest.mark.asyncio
+    async def test_fails_over_to_next_endpoint(self, multi_endpoint_config):
+        """Test a failed call is retried once on another healthy endpoint."""
+        client_a, client_b = AsyncMock(), _ok_client("from b")
+        client_a.post.side_effect = Exception("Connection refused")
+        with patch("httpx.AsyncClient", side_effect=[client_a, client_b]):
+            service = LLMService()
+            result = await service.chat_completion([{"role": "user", "content": "Hi"}])
+
+        a, b = service.endpoints
+        assert result == "from b"
+        assert client_a.post.call_count == 1  # no retries before failing over
+        assert a.circuit_breaker.failure_count == 1
+        assert b.circuit_breaker.failure_count == 0
+        assert a.outstanding == b.outstanding == 0
+
+    @pytest.mark.asyncio
+    async def test_skips_endpoints_with_open_circuit(self, multi_endpoint_config):
+        """Test endpoints with an open circuit are not called."""
+        client_a, client_b = _ok_client("from a"), _ok_client("from b")
+        with patch("httpx.AsyncClient", side_effect=[client_a, client_b]):
+            service = LLMService()
+            a, _ = service.endpoints
+            a.circuit_breaker.state = CircuitState.OPEN
+            a.circuit_breaker.last_failure_time = time.time()
+            result = await service.chat_completion([{"role": "user", "content": "Hi"}])
+
+        assert result == "from b"
+        client_a.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fallback_when_every_circuit_is_open(self, multi_endpoint_config):
+        """Test the fallback message once no endpoint accepts requests."""
+        service = LLMService()
+        for endpoint in service.endpoints:
+            endpoint.circuit_breaker.state = CircuitState.OPEN
+            endpoint.circuit_breaker.last_failure_time = time.time()
+
+        result = await service.chat_completion([{"role": "user", "content": "Hi"}])
+
+        assert result.startswith("[LLM unavailable - circuit breaker open:")
+
+    @pytest.mark.asyncio
+    async def test_stream_fails_over_before_output(self, multi_endpoint_config):
+        """Test a stream that fails to start is served by another endpoint."""
+        client_a, client_b = AsyncMock(), AsyncMock()
+        client_a.stream = Mock(side_effect=Exception("Connection refused"))
+        client_b.stream = Mock(return_value=FakeStreamResponse(_sse("b")))
+        with patch("httpx.AsyncClient", side_effect=[client_a, client_b]):
+            service = LLMService()
+            chunks = await _collect(
+                service.chat_completion_stream([{"role": "user", "content": "Hi"}])
+            )
+
+        assert chunks == ["b"]
+        assert service.endpoints.endpoints[0].circuit_breaker.failure_count == 1
+
+    def test_endpoint_metrics(self, multi_endpoint_config):
+        """Test per-endpoint state is exposed for monitoring."""
+        service = LLMService()
+        metrics = service.get_endpoint_metrics()
+
+        assert [m["name"] for m in metrics] == ["a", "b"]
+        assert metrics[0]["circuit_breaker"]["state"] == "closed"
+        assert metrics[0]["outstanding"] == 0
+
+
 class TestRenderPrompt:
     """Test prompt template rendering."""
 
@@ -222,6 +537,20 @@ class TestRenderPrompt:
         mock_template.render.assert_called_once_with(key="value", number=42)
 
 
+class TestWarmTemplates:
+    """Test template warm-up."""
+
+    def test_warm_templates_writes_bytecode(self, tmp_path, monkeypatch):
+        """Test warm-up compiles prompt templates into the bytecode cache."""
+        monkeypatch.setenv("JINJA_BYTECODE_CACHE_DIR", str(tmp_path))
+        service = LLMService()
+
+        loaded = service.warm_templates()
+
+        assert loaded > 0
+        assert len(list(tmp_path.iterdir())) == loaded
+
+
 class TestRenderOutput:
     """Test output template rendering."""
 
@@ -427,6 +756,24 @@ class TestCircuitBreaker:
         assert cb.success_count == 1
         assert cb.state == CircuitState.CLOSED
 
+    def test_circuit_breaker_records_results_from_outside_calls(self):
+        """Test record_failure/record_success apply the state transitions."""
+        cb = CircuitBreaker(failure_threshold=3)
+
+        cb.state = CircuitState.HALF_OPEN
+        cb.record_failure()
+        assert cb.state == CircuitState.OPEN
+        assert cb.failure_count == 1
+
+        cb.state = CircuitState.HALF_OPEN
+        cb.record_success()
+        assert cb.state == CircuitState.CLOSED
+        assert cb.failure_count == 0
+
+        for _ in range(3):
+            cb.record_failure()
+        assert cb.state == CircuitState.OPEN
+
     def test_circuit_breaker_get_metrics(self):
         """Test getting circuit breaker metrics."""
         cb = CircuitBreaker(failure_threshold=5, recovery_timeout=60)
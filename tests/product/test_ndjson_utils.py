@@ -0,0 +1,393 @@
+"""
+Unit tests for the NDJSON log utilities.
+"""
+
+import json
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+
+from apps.api.services.ndjson.follow import parse_appended_spans
+from apps.api.services.ndjson.reverse_reader import (
+    _iter_blocks_reversed,
+    iter_file_lines_reversed,
+    parse_ndjson_lines,
+)
+from apps.api.services.git_manager import GitManager
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for log files."""
+    path = tempfile.mkdtemp()
+    yield Path(path)
+    shutil.rmtree(path)
+
+
+def write_ndjson(path: Path, records, trailing_newline: bool = True):
+    """Write records as NDJSON lines."""
+    content = "\n".join(json.dumps(r) for r in records)
+    if trailing_newline:
+        content += "\n"
+    path.write_text(content)
+
+
+def reversed_lines(path: Path):
+    """Read a file's lines last-first."""
+    with path.open("rb") as f:
+        return list(iter_file_lines_reversed(f, path.stat().st_size))
+
+
+class TestReverseLines:
+    """Test raw reverse line iteration."""
+
+    def test_empty_file_yields_nothing(self, temp_dir):
+        """Test that an empty file yields no lines."""
+        path = temp_dir / "empty.ndjson"
+        path.write_text("")
+        assert reversed_lines(path) == []
+
+    def test_lines_in_reverse_order(self, temp_dir):
+        """Test lines are yielded last-first, skipping blank lines."""
+        path = temp_dir / "log.ndjson"
+        path.write_text("a\n\nb\nc")
+        assert reversed_lines(path) == [b"c", b"b", b"a"]
+
+    def test_block_fallback_matches_mmap(self, temp_dir):
+        """Test block-wise fallback handles lines spanning block boundaries."""
+        path = temp_dir / "log.ndjson"
+        write_ndjson(path, [{"seq": i, "pad": "x" * (i % 7)} for i in range(200)])
+
+        with path.open("rb") as f:
+            size = path.stat().st_size
+            blocks = list(_iter_blocks_reversed(f, size, block_size=16))
+
+        assert blocks == reversed_lines(path)
+
+    def test_parse_skips_malformed_and_partial_lines(self, temp_dir):
+        """Test malformed lines and an unterminated last line are skipped."""
+        path = temp_dir / "log.ndjson"
+        path.write_text('{"seq": 0}\nnot json\n{"seq": 1}\n{"seq": 2')
+
+        assert [r["seq"] for r in parse_ndjson_lines(reversed_lines(path))] == [1, 0]
+
+
+class TestGitManagerReadEvents:
+    """Test GitManager event log reads."""
+
+    def test_read_events_newest_first(self, temp_dir):
+        """Test events logged via log_event are read back newest first."""
+        manager = GitManager(str(temp_dir))
+        manager.ensure_repository()
+        manager.create_project("TEST001", {"key": "TEST001", "name": "Test"})
+
+        for i in range(5):
+            manager.log_event("TEST001", {"event_type": "test", "seq": i})
+
+        events = manager.read_events("TEST001", limit=2)
+        assert [e["seq"] for e in events] == [4, 3]
+
+    def test_sealed_segments_are_committed(self, temp_dir, monkeypatch):
+        """Test sealing commits the segment and manifest to git."""
+        monkeypatch.setenv("EVENT_LOG_SEGMENT_BYTES", "256")
+        manager = GitManager(str(temp_dir))
+        manager.ensure_repository()
+        manager.create_project("TEST001", {"key": "TEST001", "name": "Test"})
+
+        for i in range(20):
+            manager.log_event("TEST001", {"event_type": "test", "seq": i})
+
+        committed = manager.repo.git.ls_files("TEST001/events").splitlines()
+        assert "TEST001/events/events.ndjson.manifest.json" in committed
+        assert any(f.endswith("000001.ndjson.gz") for f in committed)
+        assert [e["seq"] for e in manager.read_events("TEST001", limit=20)] == list(
+            reversed(range(20))
+        )
+
+
+class TestParseAppendedSpans:
+    """Test forward parsing of appended bytes used for live tailing."""
+
+    def test_parses_only_complete_lines(self):
+        """Test offsets are reported and an unterminated line is left over."""
+        data = b'{"seq": 1}\n\n{"seq": 2}\n{"seq": 3'
+
+        records, consumed = parse_appended_spans(data, 100)
+
+        assert [(r["seq"], start, end) for r, start, end in records] == [
+            (1, 100, 111),
+            (2, 112, 123),
+        ]
+        assert consumed == 123
+
+
+class TestFileLock:
+    """Test the shared inter-process file lock."""
+
+    def test_creates_missing_parent_directory(self, temp_dir):
+        """Test the lock file and its directory are created on demand."""
+        from apps.api.services.ndjson import file_lock
+
+        lock_path = temp_dir / "events" / ".audit.ndjson.lock"
+        with file_lock(lock_path, exclusive=False):
+            assert lock_path.exists()
+
+    def test_degrades_without_platform_locking(self, temp_dir, monkeypatch):
+        """Test logs still work where neither fcntl nor msvcrt exists."""
+        from apps.api.services.ndjson import SegmentedLog
+        from apps.api.services.ndjson import locking
+
+        monkeypatch.setattr(locking, "fcntl", None)
+        monkeypatch.setattr(locking, "msvcrt", None)
+        log = SegmentedLog(temp_dir / "events" / "audit.ndjson")
+        log.append({"seq": 1})
+
+        assert log.tail(1) == [{"seq": 1}]
+
+
+class TestSegmentedLog:
+    """Test segmented, compressed log storage."""
+
+    def _log(self, temp_dir, **kwargs):
+        from apps.api.services.ndjson import SegmentedLog
+
+        return SegmentedLog(temp_dir / "events" / "audit.ndjson", **kwargs)
+
+    def _fill(self, log, count):
+        for i in range(count):
+            log.append({"seq": i, "timestamp": f"2026-01-01T00:00:{i:02d}Z"})
+
+    def test_seals_full_segments_into_gzip(self, temp_dir):
+        """Test the active segment is sealed and recorded in the manifest."""
+        sealed = []
+        log = self._log(temp_dir, max_segment_bytes=200, on_seal=sealed.append)
+        self._fill(log, 20)
+
+        segments = log.manifest()["segments"]
+        assert len(segments) >= 2
+        assert (
+            sum(s["count"] for s in segments)
+            + len(log.path.read_text().splitlines() if log.path.exists() else [])
+            == 20
+        )
+        assert segments[0]["first"] == "2026-01-01T00:00:00Z"
+        assert (log.path.parent / segments[0]["file"]).name.endswith(".ndjson.gz")
+        assert len(sealed) == len(segments)
+        assert log.manifest_path in sealed[0]
+
+    def test_reads_across_segments_in_order(self, temp_dir):
+        """Test forward, reverse and tail reads span sealed segments."""
+        log = self._log(temp_dir, max_segment_bytes=200)
+        self._fill(log, 20)
+
+        assert [r["seq"] for r in log.iter_records()] == list(range(20))
+        assert [r["seq"] for r in log.iter_reversed()] == list(reversed(range(20)))
+        assert [r["seq"] for r in log.tail(3)] == [19, 18, 17]
+
+    def test_time_window_skips_sealed_segments(self, temp_dir):
+        """Test segments outside the requested window are not read."""
+        log = self._log(temp_dir, max_segment_bytes=200)
+        self._fill(log, 20)
+
+        records = list(log.iter_records(since="2026-01-01T00:00:15Z"))
+        assert records[-1]["seq"] == 19
+        assert records[0]["seq"] > 0
+
+    def test_read_since_follows_rotation(self, temp_dir):
+        """Test a stream position survives the active segment being sealed."""
+        log = self._log(temp_dir, max_segment_bytes=200)
+        log.append({"seq": 0, "timestamp": "2026-01-01T00:00:00Z"})
+        position = log.end_position()
+
+        for i in range(1, 20):
+            log.append({"seq": i, "timestamp": f"2026-01-01T00:00:{i:02d}Z"})
+
+        records, new_position = log.read_since(position)
+        assert [r["seq"] for r, _ in records] == list(range(1, 20))
+        assert new_position == log.end_position()
+        assert log.read_since(new_position)[0] == []
+
+    def test_reversed_spans_resume_from_position(self, temp_dir):
+        """Test reverse scans report positions usable as resume points."""
+        log = self._log(temp_dir, max_segment_bytes=200)
+        self._fill(log, 20)
+
+        first = []
+        for record, position in log.iter_reversed_spans():
+            first.append(record["seq"])
+            if len(first) == 12:
+                break
+        rest = [r["seq"] for r, _ in log.iter_reversed_spans(before=position)]
+
+        assert first + rest == list(reversed(range(20)))
+        assert log.read_at([position])[0]["seq"] == 8
+
+
+class TestIndexedRecordStore:
+    """Test id-indexed records with append-only updates."""
+
+    def _store(self, temp_dir, **kwargs):
+        from apps.api.services.ndjson import (
+            IndexedRecordStore,
+            SegmentedLog,
+            fold_updates,
+        )
+
+        log = SegmentedLog(
+            temp_dir / "commands" / "commands.ndjson",
+            time_field="created_at",
+            compact=fold_updates,
+            **kwargs,
+        )
+        return IndexedRecordStore(log)
+
+    def test_update_appends_instead_of_rewriting(self, temp_dir):
+        """Test updates are appended and merged on read."""
+        store = self._store(temp_dir, max_segment_bytes=100_000)
+        store.put({"id": "a", "status": "running"})
+        store.put({"id": "b", "status": "running"})
+        size_before = store.log.path.stat().st_size
+
+        store.update("a", {"status": "completed"})
+
+        content = store.log.path.read_text()
+        assert content.startswith('{"id": "a", "status": "running"}')
+        assert store.log.path.stat().st_size > size_before
+        assert store.get("a") == {"id": "a", "status": "completed"}
+        assert store.load_all() == [
+            {"id": "a", "status": "completed"},
+            {"id": "b", "status": "running"},
+        ]
+
+    def test_get_reads_only_indexed_records(self, temp_dir, monkeypatch):
+        """Test get() reads the positions of one id, not the whole log."""
+        store = self._store(temp_dir, max_segment_bytes=100_000)
+        for i in range(50):
+            store.put({"id": f"c{i}", "status": "running"})
+        store.update("c7", {"status": "failed"})
+        store.get("c0")  # build the index
+
+        requested = []
+        read_at = store.log.read_at
+        monkeypatch.setattr(
+            store.log,
+            "read_at",
+            lambda positions: requested.append(list(positions))
+            or read_at(requested[-1]),
+        )
+
+        assert store.get("c7") == {"id": "c7", "status": "failed"}
+        assert len(requested[0]) == 2
+        assert store.get("missing") is None
+
+    def test_index_survives_sealing_and_compaction(self, temp_dir):
+        """Test updates are folded at seal time and lookups stay correct."""
+        store = self._store(temp_dir, max_segment_bytes=400)
+        for i in range(10):
+            store.put({"id": f"c{i}", "created_at": f"2026-01-01T00:00:{i:02d}Z"})
+            assert store.get(f"c{i}")["id"] == f"c{i}"
+            store.update(f"c{i}", {"status": "completed"})
+
+        segments = store.log.manifest()["segments"]
+        assert segments and any(s["compacted"] for s in segments)
+        for i in range(10):
+            assert store.get(f"c{i}")["status"] == "completed"
+        assert [r["id"] for r in store.load_all()] == [f"c{i}" for i in range(10)]
+
+    def test_fold_updates_keeps_updates_for_older_segments(self):
+        """Test compaction only folds updates whose base is in the segment."""
+        from apps.api.services.ndjson import fold_updates
+
+        records = [
+            {"id": "a", "status": "running"},
+            {"_update": "a", "fields": {"status": "done"}},
+            {"_update": "old", "fields": {"status": "done"}},
+        ]
+        assert fold_updates(records) == [
+            {"id": "a", "status": "done"},
+            {"_update": "old", "fields": {"status": "done"}},
+        ]
+        assert fold_updates(records[2:]) is None
+
+
+class TestBufferedLogWriter:
+    """Test buffered event log writes and durability policies."""
+
+    def _log(self, temp_dir):
+        from apps.api.services.ndjson import SegmentedLog
+
+        return SegmentedLog(temp_dir / "events" / "audit.ndjson")
+
+    def test_immediate_policy_writes_through(self, temp_dir):
+        """Test the default policy writes each record synchronously."""
+        from apps.api.services.ndjson import BufferedLogWriter, DurabilityPolicy
+
+        writer = BufferedLogWriter(DurabilityPolicy())
+        log = self._log(temp_dir)
+        writer.append(log, {"seq": 1})
+
+        assert writer.depth() == 0
+        assert log.tail(1) == [{"seq": 1}]
+
+    def test_buffered_policy_flushes_on_batch_size(self, temp_dir):
+        """Test records are held until the batch size is reached."""
+        from apps.api.services.ndjson import BufferedLogWriter, DurabilityPolicy
+
+        writer = BufferedLogWriter(
+            DurabilityPolicy(mode="buffered", interval_ms=60_000, batch_size=3)
+        )
+        log = self._log(temp_dir)
+        try:
+            writer.append(log, {"seq": 1})
+            writer.append(log, {"seq": 2})
+            assert writer.depth() == 2
+            assert not log.path.exists()
+
+            writer.append(log, {"seq": 3})
+            assert writer.depth() == 0
+            assert [r["seq"] for r in log.iter_records()] == [1, 2, 3]
+        finally:
+            writer.close()
+
+    def test_buffered_policy_flushes_on_interval_and_close(self, temp_dir):
+        """Test the background flusher and close() write pending records."""
+        import time
+        from apps.api.services.ndjson import BufferedLogWriter, DurabilityPolicy
+
+        writer = BufferedLogWriter(
+            DurabilityPolicy(mode="buffered", interval_ms=20, batch_size=100)
+        )
+        log = self._log(temp_dir)
+        writer.append(log, {"seq": 1})
+
+        # depth() drops before the write lands, so wait for the record itself
+        deadline = time.time() + 2
+        while not log.tail(1) and time.time() < deadline:
+            time.sleep(0.01)
+        assert log.tail(1) == [{"seq": 1}]
+
+        writer.append(log, {"seq": 2})
+        writer.close()
+        assert [r["seq"] for r in log.iter_records()] == [1, 2]
+
+    def test_invalid_env_settings_fall_back_to_defaults(self, monkeypatch):
+        """Test malformed EVENT_LOG_* values do not break the writer."""
+        from apps.api.services.ndjson import DurabilityPolicy
+
+        monkeypatch.setenv("EVENT_LOG_DURABILITY", "sometimes")
+        monkeypatch.setenv("EVENT_LOG_FLUSH_INTERVAL_MS", "fast")
+        monkeypatch.setenv("EVENT_LOG_BATCH_SIZE", "1e3")
+
+        policy = DurabilityPolicy.from_env()
+
+        assert policy.mode == DurabilityPolicy.IMMEDIATE
+        assert policy.interval_ms == 200
+        assert policy.batch_size == 100
+
+    def test_invalid_mode_rejected(self):
+        """Test unknown durability modes raise ValueError."""
+        from apps.api.services.ndjson import DurabilityPolicy
+
+        with pytest.raises(ValueError):
+            DurabilityPolicy(mode="sometimes")
@@ -0,0 +1,93 @@
+"""
+Unit tests for the template/blueprint registry cache.
+"""
+
+import json
+import os
+
+from apps.api.domain.templates.models import Template
+from apps.api.services.registry_cache import JsonRegistry, get_registry
+
+
+def _write(directory, template_id, artifact_type="pmp", name="Plan"):
+    (directory / f"{template_id}.json").write_text(
+        json.dumps(
+            {
+                "id": template_id,
+                "name": name,
+                "description": "d",
+                "schema": {"type": "object"},
+                "markdown_template": "# {{ project_key }}",
+                "artifact_type": artifact_type,
+            }
+        )
+    )
+
+
+class TestJsonRegistry:
+    """Test entities are parsed once and reloaded on change."""
+
+    def test_files_are_parsed_once(self, tmp_path):
+        """Test repeated lookups are served from memory."""
+        _write(tmp_path, "tpl-1")
+        registry = JsonRegistry(tmp_path, Template, index_field="artifact_type")
+
+        for _ in range(3):
+            assert registry.get("tpl-1").name == "Plan"
+            assert len(registry.all()) == 1
+
+        assert registry.loads == 1
+
+    def test_directory_change_reloads_changed_files_only(self, tmp_path):
+        """Test a new file is picked up without re-parsing the others."""
+        _write(tmp_path, "tpl-1")
+        registry = JsonRegistry(tmp_path, Template)
+        registry.all()
+
+        _write(tmp_path, "tpl-2", artifact_type="raid")
+
+        assert [t.id for t in registry.all()] == ["tpl-1", "tpl-2"]
+        assert registry.loads == 2
+
+    def test_invalidate_rereads_in_place_edits(self, tmp_path):
+        """Test an in-place rewrite is visible after invalidation."""
+        _write(tmp_path, "tpl-1", name="Plan")
+        registry = JsonRegistry(tmp_path, Template)
+        registry.get("tpl-1")
+
+        _write(tmp_path, "tpl-1", name="Edit")
+        registry.invalidate()
+
+        assert registry.get("tpl-1").name == "Edit"
+
+    def test_in_place_rewrite_by_another_worker_is_seen(self, tmp_path):
+        """Test a rewrite that keeps the directory mtime is picked up."""
+        _write(tmp_path, "tpl-1", name="Plan")
+        registry = JsonRegistry(tmp_path, Template)
+        assert registry.get("tpl-1").name == "Plan"
+        dir_stat = os.stat(tmp_path)
+
+        # Another worker's registry wrote the file; this one was not told
+        _write(tmp_path, "tpl-1", name="Edited plan")
+        os.utime(tmp_path, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+
+        assert registry.get("tpl-1").name == "Edited plan"
+        assert registry.loads == 2
+
+    def test_index_and_invalid_files(self, tmp_path):
+        """Test lookups by index field and skipping of unreadable files."""
+        _write(tmp_path, "tpl-1", artifact_type="pmp")
+        _write(tmp_path, "tpl-2", artifact_type="raid")
+        (tmp_path / "broken.json").write_text("{not json")
+        registry = JsonRegistry(tmp_path, Template, index_field="artifact_type")
+
+        assert [t.id for t in registry.find_by("raid")] == ["tpl-2"]
+        assert registry.find_by("charter") == []
+        assert set(registry.snapshot()) == {"tpl-1", "tpl-2"}
+
+    def test_missing_directory_is_empty(self, tmp_path):
+        """Test a directory that does not exist yet holds no entities."""
+        registry = get_registry(tmp_path / "missing", Template)
+
+        assert registry.all() == []
+        assert get_registry(tmp_path / "missing", Template) is registry
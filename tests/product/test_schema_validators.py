@@ -0,0 +1,74 @@
+"""
+Unit tests for the compiled JSON Schema validator cache.
+"""
+
+import jsonschema
+import pytest
+from unittest.mock import patch
+
+from apps.api.domain.shared.schema_validators import (
+    SchemaValidatorCache,
+    schema_hash,
+)
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "due_date": {"type": "string", "format": "date"},
+    },
+    "required": ["name"],
+}
+
+
+class TestSchemaValidatorCache:
+    """Test validators are built once per schema and reused."""
+
+    def test_equal_schemas_share_a_validator(self):
+        """Test key order does not matter and the schema is checked once."""
+        cache = SchemaValidatorCache()
+        reordered = {"required": ["name"], **SCHEMA}
+
+        with patch.object(
+            jsonschema.Draft7Validator,
+            "check_schema",
+            wraps=jsonschema.Draft7Validator.check_schema,
+        ) as check:
+            first = cache.get(SCHEMA)
+            second = cache.get(reordered)
+
+        assert first is second
+        assert schema_hash(SCHEMA) == schema_hash(reordered)
+        assert check.call_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_invalid_schema_is_not_cached(self):
+        """Test an invalid schema raises and is not remembered."""
+        cache = SchemaValidatorCache()
+
+        with pytest.raises(jsonschema.SchemaError):
+            cache.get({"type": "not-a-type"})
+        assert len(cache) == 0
+
+    def test_validate_reports_errors_and_formats(self):
+        """Test instance errors are raised, including format violations."""
+        cache = SchemaValidatorCache()
+
+        cache.validate({"name": "Plan", "due_date": "2026-01-31"}, SCHEMA)
+        with pytest.raises(jsonschema.ValidationError, match="'name' is a required"):
+            cache.validate({}, SCHEMA)
+        with pytest.raises(jsonschema.ValidationError, match="is not a 'date'"):
+            cache.validate({"name": "Plan", "due_date": "soon"}, SCHEMA)
+
+    def test_lru_eviction(self):
+        """Test the least recently used validator is evicted."""
+        cache = SchemaValidatorCache(max_entries=2)
+        schemas = [{"type": t} for t in ("string", "integer", "boolean")]
+        cache.get(schemas[0])
+        cache.get(schemas[1])
+        cache.get(schemas[0])
+        cache.get(schemas[2])
+
+        assert len(cache) == 2
+        cache.get(schemas[1])
+        assert cache.misses == 4
@@ -0,0 +1,87 @@
+"""
+Unit tests for the compiled template cache.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from jinja2 import FileSystemBytecodeCache, TemplateSyntaxError
+
+from apps.api.services.template_cache import (
+    CompiledTemplateCache,
+    bytecode_cache_from_env,
+)
+
+
+def _template(template_id, source):
+    return SimpleNamespace(id=template_id, markdown_template=source)
+
+
+class TestCompiledTemplateCache:
+    """Test compiled template reuse and invalidation."""
+
+    def test_same_source_compiles_once(self):
+        """Test repeated lookups return the same compiled template."""
+        cache = CompiledTemplateCache()
+        first = cache.get("t1", "Hello {{ name }}")
+        second = cache.get("t1", "Hello {{ name }}")
+
+        assert first is second
+        assert first.render(name="World") == "Hello World"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_changed_source_replaces_entry(self):
+        """Test an edited template is recompiled and the old one dropped."""
+        cache = CompiledTemplateCache()
+        cache.get("t1", "old")
+        compiled = cache.get("t1", "new")
+
+        assert compiled.render() == "new"
+        assert len(cache) == 1
+
+    def test_bounded_by_max_entries(self):
+        """Test least recently used templates are evicted."""
+        cache = CompiledTemplateCache(max_entries=2)
+        cache.get("a", "a")
+        cache.get("b", "b")
+        cache.get("a", "a")
+        cache.get("c", "c")
+
+        assert len(cache) == 2
+        cache.get("b", "b")
+        assert cache.misses == 4
+
+    def test_syntax_errors_are_raised(self):
+        """Test invalid sources raise and are not cached."""
+        cache = CompiledTemplateCache()
+        with pytest.raises(TemplateSyntaxError):
+            cache.get("bad", "{% if %}")
+        assert len(cache) == 0
+
+    def test_warm_skips_invalid_templates(self):
+        """Test warm-up compiles valid templates and skips broken ones."""
+        cache = CompiledTemplateCache()
+        compiled = cache.warm(
+            [_template("ok", "{{ x }}"), _template("bad", "{% for %}")]
+        )
+
+        assert compiled == 1
+        cache.get("ok", "{{ x }}")
+        assert cache.hits == 1
+
+
+class TestBytecodeCache:
+    """Test bytecode cache configuration."""
+
+    def test_uses_configured_directory(self, tmp_path, monkeypatch):
+        """Test JINJA_BYTECODE_CACHE_DIR selects the cache directory."""
+        monkeypatch.setenv("JINJA_BYTECODE_CACHE_DIR", str(tmp_path / "jinja"))
+        cache = bytecode_cache_from_env()
+
+        assert isinstance(cache, FileSystemBytecodeCache)
+        assert cache.directory == str(tmp_path / "jinja")
+
+    def test_can_be_disabled(self, monkeypatch):
+        """Test the bytecode cache can be turned off."""
+        monkeypatch.setenv("JINJA_BYTECODE_CACHE_DIR", "off")
+        assert bytecode_cache_from_env() is None
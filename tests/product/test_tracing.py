@@ -0,0 +1,130 @@
+"""
+Unit tests for sampled request tracing.
+"""
+
+import json
+import uuid
+
+import pytest
+
+from apps.api.services.git_manager import GitManager
+from apps.api.services.tracing import (
+    NOOP_SPAN,
+    JsonFileSpanExporter,
+    Tracer,
+    span,
+    traced,
+)
+
+
+class _ListExporter:
+    def __init__(self):
+        self.payloads = []
+
+    def export(self, payload):
+        self.payloads.append(payload)
+
+
+def _spans(payload):
+    return payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+
+
+class TestTracer:
+    """Test sampling, span nesting and OTLP export."""
+
+    def test_unsampled_requests_use_noop_spans(self):
+        """Test nothing is recorded when tracing is disabled."""
+        tracer = Tracer(sample_rate=0.0, exporter=_ListExporter())
+
+        root = tracer.start_trace(str(uuid.uuid4()), "GET /")
+        with root:
+            assert span("fs.read") is NOOP_SPAN
+
+        assert root is NOOP_SPAN
+        assert span("fs.read") is NOOP_SPAN
+
+    def test_sampling_is_deterministic(self):
+        """Test the same trace id always gets the same decision."""
+        tracer = Tracer(sample_rate=0.5)
+
+        assert tracer.sampled("00000000" + "0" * 24)
+        assert not tracer.sampled("ffffffff" + "0" * 24)
+
+    def test_nested_spans_are_exported_with_the_root(self):
+        """Test child spans link to their parent and share the trace id."""
+        exporter = _ListExporter()
+        tracer = Tracer(sample_rate=1.0, exporter=exporter, service_name="test")
+        correlation_id = str(uuid.uuid4())
+
+        @traced("git.commit_changes")
+        def commit():
+            with span("git.index.add", files=2):
+                pass
+
+        with tracer.start_trace(correlation_id, "POST /raid") as root:
+            commit()
+            root.update_name("POST /projects/{project_key}/raid")
+        tracer.flush()
+
+        assert len(exporter.payloads) == 1
+        payload = exporter.payloads[0]
+        resource = payload["resourceSpans"][0]["resource"]
+        assert resource["attributes"][0]["value"] == {"stringValue": "test"}
+
+        by_name = {s["name"]: s for s in _spans(payload)}
+        root_span = by_name["POST /projects/{project_key}/raid"]
+        commit_span = by_name["git.commit_changes"]
+        add_span = by_name["git.index.add"]
+        assert {s["traceId"] for s in by_name.values()} == {
+            correlation_id.replace("-", "")
+        }
+        assert "parentSpanId" not in root_span
+        assert commit_span["parentSpanId"] == root_span["spanId"]
+        assert add_span["parentSpanId"] == commit_span["spanId"]
+        assert add_span["attributes"] == [{"key": "files", "value": {"intValue": "2"}}]
+        assert add_span["status"] == {"code": 1}
+
+    def test_errors_are_recorded_on_the_span(self):
+        """Test an exception marks the span as failed and propagates."""
+        exporter = _ListExporter()
+        tracer = Tracer(sample_rate=1.0, exporter=exporter)
+
+        with pytest.raises(ValueError):
+            with tracer.start_trace(str(uuid.uuid4()), "GET /"):
+                with span("json.parse"):
+                    raise ValueError("bad json")
+        tracer.flush()
+
+        statuses = {s["name"]: s["status"] for s in _spans(exporter.payloads[0])}
+        assert statuses["json.parse"] == {"code": 2, "message": "ValueError: bad json"}
+
+    def test_json_file_exporter_appends_lines(self, tmp_path):
+        """Test each finished trace is written as one OTLP JSON line."""
+        path = tmp_path / "traces" / "traces.jsonl"
+        tracer = Tracer(sample_rate=1.0, exporter=JsonFileSpanExporter(path))
+
+        for _ in range(2):
+            with tracer.start_trace(str(uuid.uuid4()), "GET /health"):
+                pass
+        tracer.flush()
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        assert _spans(json.loads(lines[0]))[0]["name"] == "GET /health"
+
+    def test_default_export_path_stays_out_of_git(self, tmp_path, monkeypatch):
+        """Test the default traces file under .cache/ is not untracked in git."""
+        manager = GitManager(base_path=str(tmp_path / "projectDocs"))
+        manager.ensure_repository()
+        monkeypatch.setenv("PROJECT_DOCS_PATH", str(manager.base_path))
+        monkeypatch.setenv("TRACING_SAMPLE_RATE", "1")
+        monkeypatch.delenv("TRACING_EXPORT_PATH", raising=False)
+        monkeypatch.delenv("TRACING_OTLP_ENDPOINT", raising=False)
+        tracer = Tracer.from_env()
+
+        with tracer.start_trace(str(uuid.uuid4()), "GET /health"):
+            pass
+        tracer.flush()
+
+        assert (manager.base_path / ".cache" / "traces.jsonl").is_file()
+        assert not manager.repo.untracked_files